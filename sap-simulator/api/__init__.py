@@ -0,0 +1,20 @@
+"""
+SAP simulator REST API
+
+The API uses scripts of the surrounding repository: status_list, vc_cbor
+and ktdde_ontology from tools/ and the trade scenario
+(scenario_gluelam_timber_full.py) from the repository root. They are
+plain scripts shared with the command-line tools, not an installable
+package, so both directories are put on sys.path here, once, for every
+module of the API. They are appended, so they cannot shadow the standard
+library, installed packages or the simulator's own packages.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+for _directory in (os.path.join(REPO_ROOT, "tools"), REPO_ROOT):
+    if _directory not in sys.path:
+        sys.path.append(_directory)
@@ -0,0 +1,210 @@
+"""
+Per-Actor Credential Views for the SAP API Simulator
+
+ACTOR_VIEWS (scenario_gluelam_timber_full.py) lists the documents each
+trade party (buyer, seller, bank, carrier, customs, chamber, certifier)
+may see. The demo filters them in the browser; ViewStore serves each
+party only what it may see:
+
+- ViewIndex inverts ACTOR_VIEWS once: document type → the actors
+  allowed to see it
+- a shipment's bundles (actor → document type → credential) are
+  materialized the first time any actor asks for one, from the
+  scenario's credentials; each credential is placed in the bundles of
+  the actors the index names, and nowhere else
+- publish() adds a newly issued credential to a shipment: only the
+  bundles of the actors allowed to see it change, and only their
+  versions move on
+- each bundle keeps its serialized response body until its version
+  changes; versions are never reused and make the response's ETag, so a
+  party polling its view gets 304s until something it may see is issued
+
+Shipments are kept in an LRU (max_shipments). An evicted shipment is
+materialized again on its next request, with its published credentials
+applied over the scenario's. Published credentials are kept in an LRU
+of their own (max_published shipments, never fewer than max_shipments),
+refreshed whenever their shipment is requested; a shipment dropped from
+it comes back with the scenario's credentials only.
+
+Usage:
+    curl localhost:5000/vc/api/v1/views
+    curl localhost:5000/vc/api/v1/scenarios/<scenario_id>/views/bank
+    curl -X POST -H 'Content-Type: application/json' -d @bill_of_lading.json \\
+        localhost:5000/vc/api/v1/scenarios/<scenario_id>/documents/bill_of_lading
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# SAP scenario credential names (convert_sap_scenario_to_vcs keys, without
+# "_vc") that differ from the document types of ACTOR_VIEWS
+DOCUMENT_ALIASES = {"customs_declaration": "customs_declaration_export"}  # the mapper declares exports
+
+
+class ViewError(ValueError):
+    """Unknown actor, or a document no actor may see"""
+
+
+def document_type(name: str) -> str:
+    """ACTOR_VIEWS document type of a credential name ("bill_of_lading_vc" → "bill_of_lading")"""
+    if name.endswith("_vc"):
+        name = name[:-3]
+    return DOCUMENT_ALIASES.get(name, name)
+
+
+class ViewIndex:
+    """ACTOR_VIEWS and its inverse: document type → actors allowed to see it"""
+
+    def __init__(self, views: Dict[str, Iterable[str]]):
+        self.views: Dict[str, Tuple[str, ...]] = {actor: tuple(documents) for actor, documents in views.items()}
+        readers: Dict[str, List[str]] = {}
+        for actor, documents in self.views.items():
+            for document in documents:
+                readers.setdefault(document, []).append(actor)
+        self.readers: Dict[str, Tuple[str, ...]] = {document: tuple(actors) for document, actors in readers.items()}
+
+    def actors(self, document: str) -> Tuple[str, ...]:
+        return self.readers.get(document_type(document), ())
+
+    def allowed(self, actor: str, document: str) -> bool:
+        return actor in self.actors(document)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"actors": {actor: list(documents) for actor, documents in self.views.items()},
+                "documents": {document: list(actors) for document, actors in sorted(self.readers.items())}}
+
+
+def default_index() -> ViewIndex:
+    """ViewIndex of the trade scenario's ACTOR_VIEWS"""
+    from scenario_gluelam_timber_full import ACTOR_VIEWS
+    return ViewIndex(ACTOR_VIEWS)
+
+
+class ShipmentViews:
+    """One shipment's bundles, their versions and serialized bodies"""
+
+    __slots__ = ("bundles", "versions", "bodies")
+
+    def __init__(self, actors: Iterable[str]):
+        self.bundles: Dict[str, Dict[str, Any]] = {actor: {} for actor in actors}
+        self.versions: Dict[str, int] = {actor: 0 for actor in self.bundles}
+        self.bodies: Dict[str, Tuple[int, bytes]] = {}  # actor → (version, body)
+
+    def add(self, document: str, credential: Dict[str, Any], actors: Tuple[str, ...], version: int) -> None:
+        for actor in actors:
+            self.bundles[actor][document] = credential
+            self.versions[actor] = version
+            self.bodies.pop(actor, None)
+
+
+class ViewStore:
+    """Per-actor bundles of each shipment, materialized once and updated on publish"""
+
+    def __init__(self, index: ViewIndex, load: Callable[[str], Dict[str, Any]], max_shipments: int = 1024,
+                 max_published: int = 4096):
+        self.index = index
+        self.load = load  # shipment id → credential name → credential
+        self.max_shipments = max_shipments
+        self.max_published = max(max_published, max_shipments)
+        self.hits = 0  # bodies served as serialized
+        self.misses = 0
+        self.materialized = 0
+        self.published = 0
+        self._shipments: 'OrderedDict[str, ShipmentViews]' = OrderedDict()
+        # shipment → document → credential, least recently used first
+        self._published: 'OrderedDict[str, Dict[str, Dict[str, Any]]]' = OrderedDict()
+        self._versions = itertools.count(1)  # store-wide, so a rematerialized bundle never reuses one
+        self._lock = threading.Lock()
+
+    def _check_actor(self, actor: str) -> None:
+        if actor not in self.index.views:
+            raise ViewError(f"Unknown actor {actor}; actors: {', '.join(self.index.views)}")
+
+    def _shipment(self, shipment_id: str) -> ShipmentViews:
+        with self._lock:
+            shipment = self._shipments.get(shipment_id)
+            if shipment is not None:
+                self._shipments.move_to_end(shipment_id)
+                if shipment_id in self._published:
+                    self._published.move_to_end(shipment_id)
+                return shipment
+        credentials = self.load(shipment_id)
+        built = ShipmentViews(self.index.views)
+        with self._lock:
+            shipment = self._shipments.get(shipment_id)
+            if shipment is not None:  # materialized meanwhile by another request
+                return shipment
+            version = next(self._versions)
+            for name, credential in credentials.items():
+                built.add(document_type(name), credential, self.index.actors(name), version)
+            if shipment_id in self._published:
+                self._published.move_to_end(shipment_id)
+                for document, credential in self._published[shipment_id].items():
+                    built.add(document, credential, self.index.actors(document), next(self._versions))
+            self._shipments[shipment_id] = built
+            self.materialized += 1
+            while len(self._shipments) > self.max_shipments:
+                self._shipments.popitem(last=False)
+        return built
+
+    def view(self, shipment_id: str, actor: str) -> Tuple[int, Dict[str, Any]]:
+        """(version, document type → credential) of what actor may see of a shipment"""
+        self._check_actor(actor)
+        shipment = self._shipment(shipment_id)
+        with self._lock:
+            return shipment.versions[actor], dict(shipment.bundles[actor])
+
+    def body(self, shipment_id: str, actor: str,
+             serialize: Callable[[int, Dict[str, Any]], bytes]) -> Tuple[int, bytes]:
+        """(version, serialize(version, bundle)), serialized once per bundle version"""
+        self._check_actor(actor)
+        shipment = self._shipment(shipment_id)
+        with self._lock:
+            version = shipment.versions[actor]
+            cached = shipment.bodies.get(actor)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached
+            self.misses += 1
+            bundle = dict(shipment.bundles[actor])
+        body = serialize(version, bundle)
+        with self._lock:
+            if shipment.versions[actor] == version:
+                shipment.bodies[actor] = (version, body)
+        return version, body
+
+    def publish(self, shipment_id: str, document: str, credential: Dict[str, Any]) -> Dict[str, int]:
+        """Add an issued credential to a shipment; the actors who now see it → their new versions"""
+        document = document_type(document)
+        actors = self.index.actors(document)
+        if not actors:
+            raise ViewError(f"No actor may see {document}")
+        with self._lock:
+            self._published.setdefault(shipment_id, {})[document] = credential
+            self._published.move_to_end(shipment_id)
+            while len(self._published) > self.max_published:
+                self._published.popitem(last=False)
+            self.published += 1
+            shipment = self._shipments.get(shipment_id)
+            if shipment is None:  # applied when the shipment is materialized
+                return {actor: 0 for actor in actors}
+            shipment.add(document, credential, actors, next(self._versions))
+            return {actor: shipment.versions[actor] for actor in actors}
+
+    def versions(self, shipment_id: str) -> Optional[Dict[str, int]]:
+        with self._lock:
+            shipment = self._shipments.get(shipment_id)
+            return dict(shipment.versions) if shipment is not None else None
+
+    def clear(self) -> None:
+        """Drop the materialized bundles (published credentials are kept)"""
+        with self._lock:
+            self._shipments.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"shipments": len(self._shipments), "materialized": self.materialized,
+                "published": self.published, "published_shipments": len(self._published),
+                "hits": self.hits, "misses": self.misses}
+
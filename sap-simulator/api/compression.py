@@ -0,0 +1,255 @@
+"""
+HTTP Compression for the SAP API Simulator
+
+- Dynamic responses (OData lists, VC endpoints) are compressed with the
+  best encoding the client accepts (br, zstd, gzip) once they pass a
+  minimum size. Compressed bytes are cached by the SHA-256 of the
+  uncompressed body, so identical responses are compressed only once;
+  the same digest becomes a weak ETag for conditional requests.
+- Static artifacts (contexts/, credentials/, templates/) are served with
+  long-lived cache headers, preferring precompressed .br/.zst/.gz files
+  next to the originals. Run `precompress` at deploy time so a fronting
+  server (nginx gzip_static/brotli_static) can serve them without Python.
+
+brotli and zstd are used when the Brotli / zstandard packages are
+installed; gzip is always available.
+
+Usage:
+    python3 api/compression.py precompress     # write .gz/.br/.zst variants
+    python3 api/compression.py clean          # remove them
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATIC_ROOTS = ('contexts', 'credentials', 'templates')
+STATIC_MAX_AGE = 7 * 24 * 3600
+
+MIN_COMPRESS_SIZE = 1024
+COMPRESSIBLE_TYPES = ('application/json', 'application/ld+json', 'application/vc+ld+json',
+                      'application/cbor', 'text/')
+
+# Every variant suffix, whether or not its encoder is installed
+VARIANT_SUFFIXES = ('.br', '.zst', '.gz')
+
+_mimetypes_ready = False
+
+
+def guess_type(path: str) -> Optional[str]:
+    """MIME type by file extension, .jsonld included
+
+    The system MIME tables are read on first use rather than at import
+    (mimetypes.init takes several ms).
+    """
+    global _mimetypes_ready
+    if not _mimetypes_ready:
+        mimetypes.add_type('application/ld+json', '.jsonld')
+        _mimetypes_ready = True
+    return mimetypes.guess_type(path)[0]
+
+
+def _encoders(static: bool) -> Dict[str, Tuple[str, Callable[[bytes], bytes]]]:
+    """encoding → (file suffix, compress function); preferred encoding first
+
+    Static artifacts use maximum compression levels since they are
+    compressed once at deploy time.
+    """
+    encoders = OrderedDict()
+    if brotli is not None:
+        quality = 11 if static else 5
+        encoders['br'] = ('.br', lambda data: brotli.compress(data, quality=quality))
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=19 if static else 3)
+        encoders['zstd'] = ('.zst', compressor.compress)
+    level = 9 if static else 6
+    encoders['gzip'] = ('.gz', lambda data: gzip.compress(data, compresslevel=level, mtime=0))
+    return encoders
+
+
+DYNAMIC_ENCODERS = _encoders(static=False)
+STATIC_ENCODERS = _encoders(static=True)
+
+
+def is_compressible(mimetype: str) -> bool:
+    return any(mimetype.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+
+
+class CompressionCache:
+    """LRU of compressed bodies keyed by (body digest, encoding)"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[bytes, str], bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[bytes, str], compress: Callable[[], bytes]) -> bytes:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        data = compress()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = data
+                self.size += len(data)
+                while self.size > self.max_bytes and self._entries:
+                    _, evicted = self._entries.popitem(last=False)
+                    self.size -= len(evicted)
+        return data
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "bytes": self.size,
+                "hits": self.hits, "misses": self.misses}
+
+
+compression_cache = CompressionCache()
+
+
+def compress_response(response, request, cache: Optional[CompressionCache] = None):
+    """after_request hook: ETag/304 and content negotiation for dynamic bodies
+
+    cache defaults to compression_cache (the API passes the tenant's)
+    """
+    if (request.method != 'GET' or response.status_code != 200
+            or response.direct_passthrough or 'Content-Encoding' in response.headers
+            or not is_compressible(response.mimetype or '')):
+        return response
+
+    body = response.get_data()
+    digest = hashlib.sha256(body).digest()
+    etag, weak = response.get_etag()
+    # One resource, several encodings: only weak ETags stay valid across them
+    response.set_etag(etag or digest[:16].hex(), weak=True)
+    response.make_conditional(request)
+    if response.status_code != 200 or len(body) < MIN_COMPRESS_SIZE:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(list(DYNAMIC_ENCODERS))
+    if encoding is None:
+        return response
+    compress = DYNAMIC_ENCODERS[encoding][1]
+    response.set_data((cache or compression_cache).get((digest, encoding), lambda: compress(body)))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+# ============================================================================
+# Static artifacts
+# ============================================================================
+
+def static_path(root: str, filename: str) -> Optional[str]:
+    """Absolute path of a servable static file, None if outside the roots"""
+    if root not in STATIC_ROOTS:
+        return None
+    base = os.path.join(REPO_ROOT, root)
+    path = os.path.realpath(os.path.join(base, filename))
+    if not path.startswith(os.path.realpath(base) + os.sep) or not os.path.isfile(path):
+        return None
+    if path.endswith(VARIANT_SUFFIXES):
+        return None  # variants are only served through negotiation
+    return path
+
+
+def static_variant(path: str, accept_encodings) -> Tuple[str, Optional[str]]:
+    """(file to send, Content-Encoding) for the best precompressed variant
+
+    Falls back to the original when no acceptable variant exists on disk
+    or the variant is older than the original.
+    """
+    if os.path.getsize(path) < MIN_COMPRESS_SIZE:
+        return path, None
+    mtime = os.path.getmtime(path)
+    available = []
+    for encoding, (suffix, _) in STATIC_ENCODERS.items():
+        variant = path + suffix
+        if os.path.exists(variant) and os.path.getmtime(variant) >= mtime:
+            available.append(encoding)
+    encoding = accept_encodings.best_match(available) if available else None
+    if encoding is None:
+        return path, None
+    return path + STATIC_ENCODERS[encoding][0], encoding
+
+
+def iter_static_files() -> List[str]:
+    files = []
+    for root in STATIC_ROOTS:
+        for directory, _, names in os.walk(os.path.join(REPO_ROOT, root)):
+            for name in sorted(names):
+                path = os.path.join(directory, name)
+                if static_path(root, os.path.relpath(path, os.path.join(REPO_ROOT, root))):
+                    files.append(path)
+    return files
+
+
+def precompress(force: bool = False) -> Tuple[int, int, int]:
+    """Write compressed variants of every static file; returns (files, written, bytes saved)"""
+    files = written = saved = 0
+    for path in iter_static_files():
+        if os.path.getsize(path) < MIN_COMPRESS_SIZE or not is_compressible(
+                guess_type(path) or ''):
+            continue
+        files += 1
+        with open(path, 'rb') as f:
+            data = f.read()
+        for suffix, compress in STATIC_ENCODERS.values():
+            variant = path + suffix
+            if not force and os.path.exists(variant) and \
+                    os.path.getmtime(variant) >= os.path.getmtime(path):
+                continue
+            compressed = compress(data)
+            with open(variant, 'wb') as f:
+                f.write(compressed)
+            written += 1
+            saved += len(data) - len(compressed)
+    return files, written, saved
+
+
+def clean() -> int:
+    removed = 0
+    for root in STATIC_ROOTS:
+        for directory, _, names in os.walk(os.path.join(REPO_ROOT, root)):
+            for name in names:
+                if name.endswith(VARIANT_SUFFIXES):
+                    os.remove(os.path.join(directory, name))
+                    removed += 1
+    return removed
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('precompress', 'clean'):
+        print(__doc__)
+        sys.exit(1)
+    if sys.argv[1] == 'clean':
+        print(f"🧹 Removed {clean()} precompressed files")
+        return
+    files, written, saved = precompress(force='--force' in sys.argv)
+    print(f"✅ {files} static files, {written} variants written "
+          f"({', '.join(STATIC_ENCODERS)}), {saved / 1024:.0f} KB saved")
+
+
+if __name__ == '__main__':
+    main()
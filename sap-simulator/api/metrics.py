@@ -0,0 +1,310 @@
+"""
+Prometheus Metrics for the SAP API Simulator
+
+Request counts, error counts and latency histograms per route, mapper
+time per document type, serialization and compression time, and cache
+hit ratios, rendered at /metrics in the Prometheus text format (0.0.4).
+
+Recording takes no lock: every thread writes to its own shard of each
+metric (a dict of label values → count, or → bucket counts for
+histograms), and a scrape sums the shards. Histogram buckets are fixed,
+so an observation is one bisect and two additions. Shards of finished
+threads are folded into a base shard at scrape time, which keeps the
+shard count bounded with thread-per-request servers.
+
+Cache statistics are read at scrape time from the caches' own stats().
+
+Usage:
+    from api import metrics
+    metrics.instrument_app(app)        # per-route requests, errors, latency
+    metrics.instrument_mapper(mapper)  # time per map_* document type
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; request and mapper latencies of this simulator sit between 50 µs and 1 s
+DEFAULT_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+                   0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+class _Sharded:
+    """Per-thread value dicts; the owning thread is the only writer"""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, dict]] = []
+        self._base: dict = {}
+        self._lock = threading.Lock()  # shard creation and scrapes only
+
+    def _shard(self) -> dict:
+        values = self._local.__dict__.get("values")
+        if values is None:
+            values = self._local.values = {}
+            with self._lock:
+                self._shards.append((threading.current_thread(), values))
+        return values
+
+    def _collect(self) -> List[dict]:
+        """Fold finished threads into the base shard; live shards are copied"""
+        with self._lock:
+            live = []
+            for thread, values in self._shards:
+                if thread.is_alive():
+                    live.append((thread, values))
+                else:
+                    self._merge(self._base, values)
+            self._shards = live
+            return [self._base] + [dict(values) for _, values in live]
+
+    def _merge(self, into: dict, values: dict) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        values = self._shard()
+        values[labels] = values.get(labels, 0) + amount
+
+    def _merge(self, into: dict, values: dict) -> None:
+        for labels, value in values.items():
+            into[labels] = into.get(labels, 0) + value
+
+    def samples(self) -> Dict[Labels, float]:
+        totals: Dict[Labels, float] = {}
+        for shard in self._collect():
+            self._merge(totals, shard)
+        return totals
+
+    def render(self) -> Iterable[str]:
+        for labels, value in sorted(self.samples().items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class Histogram(_Sharded):
+    """Fixed buckets; a shard holds [count per bucket..., +Inf count, sum] per label set"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        values = self._shard()
+        counts = values.get(labels)
+        if counts is None:
+            counts = values[labels] = [0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def time(self, labels: Labels = ()) -> 'Timer':
+        return Timer(self, labels)
+
+    def _merge(self, into: dict, values: dict) -> None:
+        for labels, counts in values.items():
+            total = into.get(labels)
+            if total is None:
+                into[labels] = list(counts)
+            else:
+                for position, count in enumerate(counts):
+                    total[position] += count
+
+    def samples(self) -> Dict[Labels, List[float]]:
+        totals: Dict[Labels, List[float]] = {}
+        for shard in self._collect():
+            self._merge(totals, shard)
+        return totals
+
+    def render(self) -> Iterable[str]:
+        for labels, counts in sorted(self.samples().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                yield f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {repr(float(counts[-1]))}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}"
+
+
+class Timer:
+    """with histogram.time(labels): ... observes the elapsed seconds"""
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> 'Timer':
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, self.labels)
+
+
+class Registry:
+    """Metrics plus scrape-time collectors, rendered in registration order"""
+
+    def __init__(self):
+        self.metrics: List[_Sharded] = []
+        self.collectors: List[Callable[[], Iterable[str]]] = []
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self.metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, collect: Callable[[], Iterable[str]]) -> Callable[[], Iterable[str]]:
+        """Register a function yielding exposition lines at scrape time"""
+        self.collectors.append(collect)
+        return collect
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for collect in self.collectors:
+            lines.extend(collect())
+        return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# Simulator metrics
+# ============================================================================
+
+REGISTRY = Registry()
+START_TIME = time.time()
+
+REQUESTS = REGISTRY.counter(
+    "sap_api_requests_total", "HTTP requests by route template, method and status",
+    ("route", "method", "status"))
+ERRORS = REGISTRY.counter(
+    "sap_api_request_errors_total", "HTTP responses with status 400 or above",
+    ("route", "method", "status"))
+LATENCY = REGISTRY.histogram(
+    "sap_api_request_duration_seconds", "Request handling time, compression included",
+    ("route", "method"))
+MAPPER = REGISTRY.histogram(
+    "sap_mapper_duration_seconds", "SAP → VC mapping time per document type", ("document",))
+SERIALIZATION = REGISTRY.histogram(
+    "sap_api_serialization_duration_seconds", "Credential response encoding time", ("format",))
+COMPRESSION = REGISTRY.histogram(
+    "sap_api_compression_duration_seconds", "Response compression and ETag time")
+
+# name → object whose stats() returns hits / misses, or a function returning them
+CACHES: Dict[str, object] = {}
+
+
+@REGISTRY.collector
+def _cache_metrics() -> Iterable[str]:
+    stats = {name: cache.stats() if hasattr(cache, "stats") else cache()
+             for name, cache in CACHES.items()}
+    for metric, kind, help in (("hits", "counter", "Cache hits"),
+                               ("misses", "counter", "Cache misses"),
+                               ("hit_ratio", "gauge", "Cache hits / lookups since start")):
+        yield f"# HELP sap_cache_{metric}{'_total' if kind == 'counter' else ''} {help}"
+        yield f"# TYPE sap_cache_{metric}{'_total' if kind == 'counter' else ''} {kind}"
+        for name, values in sorted(stats.items()):
+            hits, misses = values.get("hits", 0), values.get("misses", 0)
+            if metric == "hit_ratio":
+                value = hits / (hits + misses) if hits + misses else 0.0
+                yield f'sap_cache_hit_ratio{{cache="{name}"}} {value:.6f}'
+            else:
+                yield f'sap_cache_{metric}_total{{cache="{name}"}} {values.get(metric, 0)}'
+
+
+@REGISTRY.collector
+def _process_metrics() -> Iterable[str]:
+    yield "# HELP process_start_time_seconds Start time of the process since the Unix epoch"
+    yield "# TYPE process_start_time_seconds gauge"
+    yield f"process_start_time_seconds {START_TIME:.3f}"
+
+
+def render() -> str:
+    return REGISTRY.render()
+
+
+def instrument_app(app) -> None:
+    """
+    Count and time every request per route template
+
+    Call before registering other after_request hooks: Flask runs them
+    in reverse order, so the latency then includes their work.
+    """
+    from flask import g, request
+
+    @app.before_request
+    def _start_timer():
+        g._metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _record(response):
+        start = g.pop("_metrics_start", None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+            status = str(response.status_code)
+            REQUESTS.inc((route, request.method, status))
+            if response.status_code >= 400:
+                ERRORS.inc((route, request.method, status))
+            LATENCY.observe(time.perf_counter() - start, (route, request.method))
+        return response
+
+
+def instrument_mapper(mapper) -> None:
+    """Time every map_* method of a mapper instance, labelled by document type"""
+    for name in dir(type(mapper)):
+        if name.startswith("map_"):
+            setattr(mapper, name, _timed(getattr(mapper, name), (name[len("map_"):],)))
+
+
+def _timed(method, labels: Labels):
+    observe, clock = MAPPER.observe, time.perf_counter
+
+    def timed(*args, **kwargs):
+        start = clock()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            observe(clock() - start, labels)
+
+    timed.__wrapped__ = method
+    timed.__name__ = method.__name__
+    timed.__doc__ = method.__doc__
+    return timed
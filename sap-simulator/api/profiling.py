@@ -0,0 +1,344 @@
+"""
+Request Profiling for the SAP API Simulator
+
+Off unless the API is started with SAP_API_PROFILING=1. Then a VC
+request (/vc/...) carrying `X-Profile: <mode>` or `?profile=<mode>` is
+profiled from the start of the request until its response is serialized
+(compression excluded):
+
+- cprofile: deterministic cProfile of the request thread
+- sample:   wall-clock stack samples of the request thread every
+            SAMPLE_INTERVAL, as collapsed stacks for flame graph tools
+- spans:    mapper phase timers only
+
+Every mode records the SAPToVCMapper phase spans (amounts, shipment,
+assembly, status per document). The profile is stored under an id the
+server generates, returned in the X-Profile-Id header and served from
+/admin/profiles/<id>; a client cannot choose it, so it cannot overwrite
+or guess another request's profile. The client's X-Request-ID, if
+usable, is kept as the profile's requestId for finding it again. The
+last MAX_PROFILES profiles are kept.
+
+Spans cost nothing measurable outside profiled requests: the mapper
+returns a shared no-op timer when it has no recorder, and the recorder
+does the same when the current request is not being profiled.
+
+Usage:
+    SAP_API_PROFILING=1 python3 api/sap_api.py
+    curl -i -H 'X-Profile: cprofile' localhost:5000/vc/api/v1/invoices/9000000789/vc
+    curl localhost:5000/admin/profiles?requestId=<X-Request-ID> # summaries, newest first
+    curl localhost:5000/admin/profiles/<id>                     # spans, top functions
+    curl localhost:5000/admin/profiles/<id>?format=pstats > invoice.prof
+    curl localhost:5000/admin/profiles/<id>?format=collapsed    # sample mode
+"""
+
+import contextvars
+import cProfile
+import io
+import marshal
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextlib import nullcontext
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+MODES = ("cprofile", "sample", "spans")
+HEADER = "X-Profile"
+ROUTE_PREFIX = "/vc/"
+MAX_PROFILES = 100
+SAMPLE_INTERVAL = 0.001  # seconds
+FORMATS = ("json", "text", "pstats", "collapsed")
+
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+_NO_SPAN = nullcontext()
+
+# Profile of the request being handled in this context, if any
+_current: contextvars.ContextVar = contextvars.ContextVar("sap_api_profile", default=None)
+
+# cProfile cannot profile two threads at once on Python 3.12+ (sys.monitoring
+# is process-wide); a concurrent cprofile request falls back to spans
+_cprofile_lock = threading.Lock()
+
+
+class ProfilingError(ValueError):
+    """Export not available for the mode a request was profiled with"""
+
+
+class _Span:
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile: 'Profile', name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> '_Span':
+        self.start = time.perf_counter_ns()
+        self.profile._depth += 1
+        return self
+
+    def __exit__(self, *exc) -> None:
+        profile = self.profile
+        profile._depth -= 1
+        profile.spans.append((self.name, self.start - profile._start,
+                              time.perf_counter_ns() - self.start, profile._depth))
+
+
+class SpanRecorder:
+    """Phase timers for SAPToVCMapper.spans; record into the current request's profile"""
+
+    def span(self, *name: str):
+        profile = _current.get()
+        if profile is None:
+            return _NO_SPAN
+        return _Span(profile, ".".join(name))
+
+
+SPANS = SpanRecorder()
+
+
+class _Sampler(threading.Thread):
+    """Counts the stacks of one thread every interval seconds"""
+
+    def __init__(self, watched: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.watched = watched
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._done = threading.Event()
+        self._labels: Dict[Any, str] = {}
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.watched)
+            if frame is not None:
+                self.stacks[self._stack(frame)] += 1
+
+    def _stack(self, frame) -> Tuple[str, ...]:
+        labels, stack = self._labels, []
+        while frame is not None:
+            code = frame.f_code
+            label = labels.get(code)
+            if label is None:
+                label = labels[code] = (f"{code.co_name} "
+                                        f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            stack.append(label)
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def stop(self) -> Counter:
+        self._done.set()
+        self.join()
+        return self.stacks
+
+
+class Profile:
+    """One profiled request: spans plus a cProfile or sampled stacks"""
+
+    def __init__(self, mode: str, method: str, path: str, request_id: Optional[str] = None):
+        self.id = uuid.uuid4().hex
+        self.request_id = request_id  # the client's X-Request-ID; not unique, not a key
+        self.mode = mode
+        self.method = method
+        self.path = path
+        self.created = datetime.now(timezone.utc)
+        self.status: Optional[int] = None
+        self.duration_ns = 0
+        self.note: Optional[str] = None
+        # (name, start ns from request start, duration ns, nesting depth), in completion order
+        self.spans: List[Tuple[str, int, int, int]] = []
+        self.profiler: Optional[cProfile.Profile] = None
+        self.samples: Optional[Counter] = None
+        self._sampler: Optional[_Sampler] = None
+        self._depth = 0
+        self._start = 0
+
+    def start(self) -> None:
+        if self.mode == "cprofile":
+            if _cprofile_lock.acquire(blocking=False):
+                self.profiler = cProfile.Profile()
+            else:
+                self.note = "another request was being profiled with cProfile; spans only"
+        elif self.mode == "sample":
+            self._sampler = _Sampler(threading.get_ident(), SAMPLE_INTERVAL)
+            self._sampler.start()
+        self._start = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def stop(self, status: int) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+            _cprofile_lock.release()
+            self.profiler.create_stats()
+        self.duration_ns = time.perf_counter_ns() - self._start
+        if self._sampler is not None:
+            self.samples = self._sampler.stop()
+            self._sampler = None
+        self.status = status
+
+    # ------------------------------------------------------------------
+    # Exports
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "requestId": self.request_id,
+            "mode": self.mode,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "created": self.created.isoformat(timespec="milliseconds"),
+            "durationMs": round(self.duration_ns / 1e6, 3),
+        }
+
+    def to_dict(self, top: int = 25) -> Dict[str, Any]:
+        result = self.summary()
+        if self.note:
+            result["note"] = self.note
+        result["spans"] = [
+            {"name": name, "startMs": round(start / 1e6, 3),
+             "durationMs": round(duration / 1e6, 3), "depth": depth}
+            for name, start, duration, depth in sorted(self.spans, key=lambda span: span[1])]
+        if self.profiler is not None:
+            result["functions"] = self.functions(top)
+        if self.samples is not None:
+            result["samples"] = {
+                "intervalMs": SAMPLE_INTERVAL * 1000,
+                "count": sum(self.samples.values()),
+                "stacks": [{"stack": list(stack), "count": count}
+                           for stack, count in self.samples.most_common(top)],
+            }
+        return result
+
+    def functions(self, top: int = 25) -> List[Dict[str, Any]]:
+        """Functions by cumulative time"""
+        rows = []
+        for (filename, line, name), (_, calls, total, cumulative, _) in self.profiler.stats.items():
+            location = f"{os.path.basename(filename)}:{line}" if line else filename
+            rows.append({"function": f"{name} ({location})", "calls": calls,
+                         "totalMs": round(total * 1000, 3), "cumulativeMs": round(cumulative * 1000, 3)})
+        rows.sort(key=lambda row: -row["cumulativeMs"])
+        return rows[:top]
+
+    def text(self, top: int = 40) -> str:
+        """pstats report (cprofile) or collapsed stacks (sample) plus the span tree"""
+        out = io.StringIO()
+        out.write(f"{self.method} {self.path} → {self.status} in {self.duration_ns / 1e6:.3f} ms "
+                  f"({self.mode})\n")
+        if self.note:
+            out.write(f"note: {self.note}\n")
+        for name, start, duration, depth in sorted(self.spans, key=lambda span: span[1]):
+            out.write(f"{'  ' * (depth + 1)}{name:<{40 - 2 * depth}s} "
+                      f"+{start / 1e6:8.3f} ms {duration / 1e6:8.3f} ms\n")
+        if self.profiler is not None:
+            import pstats  # ~4 ms to import; only text reports need it
+
+            out.write("\n")
+            pstats.Stats(self.profiler, stream=out).sort_stats("cumulative").print_stats(top)
+        elif self.samples is not None:
+            out.write("\n" + self.collapsed())
+        return out.getvalue()
+
+    def pstats_bytes(self) -> bytes:
+        """Loadable with pstats.Stats(path), snakeviz or gprof2dot"""
+        if self.profiler is None:
+            raise ProfilingError(f"profile {self.id} has no cProfile data (mode {self.mode})")
+        return marshal.dumps(self.profiler.stats)
+
+    def collapsed(self) -> str:
+        """One `frame;frame;frame count` line per stack (flamegraph.pl, speedscope)"""
+        if self.samples is None:
+            raise ProfilingError(f"profile {self.id} has no stack samples (mode {self.mode})")
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.most_common())
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+_profiles: 'OrderedDict[str, Profile]' = OrderedDict()
+_lock = threading.Lock()
+
+
+def store(profile: Profile) -> None:
+    with _lock:
+        _profiles[profile.id] = profile
+        while len(_profiles) > MAX_PROFILES:
+            _profiles.popitem(last=False)
+
+
+def get_profile(profile_id: str) -> Optional[Profile]:
+    with _lock:
+        return _profiles.get(profile_id)
+
+
+def list_profiles(request_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Summaries, newest first; only those of one X-Request-ID if given"""
+    with _lock:
+        profiles = list(_profiles.values())
+    return [profile.summary() for profile in reversed(profiles)
+            if request_id is None or profile.request_id == request_id]
+
+
+def clear() -> None:
+    with _lock:
+        _profiles.clear()
+
+
+# ============================================================================
+# Flask hooks
+# ============================================================================
+
+def install(app, mapper=None, prefix: str = ROUTE_PREFIX) -> None:
+    """
+    Profile requests under prefix that ask for it; time mapper phases
+
+    Call after the compression hook is registered: Flask runs
+    after_request hooks in reverse order, so the profile then ends
+    before compression starts.
+    """
+    from flask import g, request
+
+    if mapper is not None:
+        mapper.spans = SPANS
+
+    @app.before_request
+    def _start_profile():
+        mode = request.headers.get(HEADER) or request.args.get("profile")
+        if not mode or not request.path.startswith(prefix):
+            return None
+        if mode not in MODES:
+            return {"error": {"code": "400",
+                              "message": f"Unknown profile mode {mode!r}; use one of {', '.join(MODES)}"}}, 400
+        request_id = request.headers.get("X-Request-ID", "")
+        profile = Profile(mode, request.method, request.full_path.rstrip("?"),
+                          request_id if _REQUEST_ID.match(request_id) else None)
+        g._profile, g._profile_token = profile, _current.set(profile)
+        profile.start()
+        return None
+
+    @app.after_request
+    def _finish_profile(response):
+        profile = g.pop("_profile", None)
+        if profile is not None:
+            _finish(profile, response.status_code)
+            response.headers["X-Profile-Id"] = profile.id
+        return response
+
+    @app.teardown_request
+    def _abandon_profile(exc):
+        # after_request did not run (the error was not turned into a response)
+        profile = g.pop("_profile", None)
+        if profile is not None:
+            _finish(profile, 500)
+
+    def _finish(profile: Profile, status: int) -> None:
+        profile.stop(status)
+        _current.reset(g.pop("_profile_token"))
+        store(profile)
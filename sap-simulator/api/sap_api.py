@@ -8,34 +8,90 @@ Simulates SAP ERP OData services for:
 - Billing Documents / Invoices (SD)
 - Documentary Credits (Banking)
 
-Supports both SAP format responses and W3C VC conversion.
+Supports both SAP format responses and W3C VC conversion. Documents are
+partitioned by company code (api/tenancy.py): X-SAP-Company-Code or
+?bukrs= confines a request to one tenant.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
 from dataclasses import asdict
+from datetime import date
+from decimal import Decimal
 from typing import Dict, Any, List
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":  # python3 api/sap_api.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data.sample_data import (
-    get_all_scenarios, get_partner, get_material,
+    get_partner, get_material,
     PARTNERS, MATERIALS
 )
+from data.store import DataStore
 from mappings.sap_to_vc import SAPToVCMapper, convert_sap_scenario_to_vcs
+from mappings.mapping_specs import COMPILED
+from mappings.fx import FXError
+from api import actor_views, compression, metrics, profiling, tenancy, tracing
+
+# Repository tools, on sys.path through api/__init__.py (the CBOR codec
+# and the KTDDE ontology are imported on first use)
+from status_list import StatusListError, StatusListService
+
+CBOR_MEDIA_TYPE = 'application/cbor'  # vc_cbor.MEDIA_TYPE
 
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for cross-origin requests
+metrics.instrument_app(app)  # first, so request latency includes the hooks below
 
-# Global mapper instance
-vc_mapper = SAPToVCMapper()
+# Distributed tracing, configured by OTEL_* variables (off unless an exporter is set)
+tracer = tracing.from_environment()
+if tracer is not None:
+    tracing.instrument_app(app, tracer)
+
+
+@app.after_request
+def compress(response):
+    """gzip/br/zstd negotiation and ETags for dynamic responses"""
+    with metrics.COMPRESSION.time():
+        return compression.compress_response(
+            response, request, tenancy.current_cache("compression", compression.compression_cache))
+
+# Opt-in request profiling (X-Profile header on /vc/ routes, /admin/profiles)
+PROFILING = os.environ.get("SAP_API_PROFILING", "") not in ("", "0")
 
-# Store scenarios in memory (simulated SAP database)
-SCENARIOS_DB = {s["scenario"]: s for s in get_all_scenarios()}
+# Status lists for issued credentials (revocation / suspension)
+STATUS_LIST_BASE_URL = "http://localhost:5000/vc/api/v1/status-lists"
+status_service = StatusListService(STATUS_LIST_BASE_URL, issuer_did="did:example:sap-simulator")
+
+# Global mapper instance
+vc_mapper = SAPToVCMapper(status_service=status_service)
+metrics.instrument_mapper(vc_mapper)
+if tracer is not None:
+    tracing.instrument_mapper(vc_mapper, tracer)
+    tracing.instrument_lookups(COMPILED.namespaces(), ("get_partner", "get_material"), tracer)
+if PROFILING:
+    profiling.install(app, vc_mapper)  # after compress, so profiles end before compression
+
+# Simulated SAP database: sample data or SAP_SIM_SNAPSHOT, loaded on first use,
+# partitioned by company code with per-tenant indexes and cache quotas
+data_store = DataStore.from_environment()
+SCENARIOS_DB = data_store.scenarios
+tenants = tenancy.TenantStore(data_store, tenancy.quotas_from_environment())
+tenancy.install(app, tenants, vc_mapper)
+
+# Per-actor views of each scenario's credentials (ACTOR_VIEWS), materialized on first request
+views = actor_views.ViewStore(
+    actor_views.default_index(), lambda scenario_id: convert_sap_scenario_to_vcs(tenants.scenario(scenario_id), vc_mapper))
+
+metrics.CACHES.update({
+    "actor_views": views,
+    "compression": lambda: tenants.cache_stats("compression", compression.compression_cache),
+    "derived_data": vc_mapper.derived_data,
+    "fx_rates": lambda: vc_mapper.rates.stats(),
+})
 
 
 # ============================================================================
@@ -73,6 +129,24 @@ def success_response(data: Any, message: str = "Success") -> Dict[str, Any]:
     }
 
 
+def vc_response(payload: Dict[str, Any]):
+    """
+    Credential response, negotiated on the Accept header:
+    application/json (default) or application/cbor (term-dictionary CBOR)
+    """
+    best = request.accept_mimetypes.best_match(['application/json', CBOR_MEDIA_TYPE])
+    if best == CBOR_MEDIA_TYPE:
+        import vc_cbor
+
+        with metrics.SERIALIZATION.time(("cbor",)), profiling.SPANS.span("serialization", "cbor"):
+            response = Response(vc_cbor.get_codec().encode(payload), mimetype=CBOR_MEDIA_TYPE)
+    else:
+        with metrics.SERIALIZATION.time(("json",)), profiling.SPANS.span("serialization", "json"):
+            response = jsonify(payload)
+    response.vary.add('Accept')
+    return response
+
+
 def error_response(message: str, code: int = 400) -> tuple:
     """Standard error response"""
     return jsonify({
@@ -91,7 +165,7 @@ def error_response(message: str, code: int = 400) -> tuple:
 def get_scenarios():
     """List all available trade scenarios"""
     scenarios_list = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         scenarios_list.append({
             "scenario_id": scenario_id,
             "description": scenario.get("description", ""),
@@ -105,7 +179,7 @@ def get_scenarios():
 def get_purchase_orders():
     """Get all purchase orders (EKKO)"""
     pos = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         if "purchase_order" in scenario:
             po = scenario["purchase_order"]
             po_dict = dataclass_to_dict(po["header"])
@@ -116,17 +190,17 @@ def get_purchase_orders():
 
 
 @app.route('/sap/opu/odata/sap/api/v1/purchase-orders/<ebeln>', methods=['GET'])
+@tenancy.routed("purchase_order", "ebeln")
 def get_purchase_order(ebeln: str):
     """Get specific purchase order with items"""
-    for scenario in SCENARIOS_DB.values():
-        if "purchase_order" in scenario:
-            po = scenario["purchase_order"]
-            if po["header"].EBELN == ebeln:
-                result = {
-                    "header": dataclass_to_dict(po["header"]),
-                    "items": [dataclass_to_dict(item) for item in po["items"]],
-                }
-                return jsonify(success_response(result))
+    scenario = tenants.find("purchase_order", ebeln)
+    if scenario is not None:
+        po = scenario["purchase_order"]
+        result = {
+            "header": dataclass_to_dict(po["header"]),
+            "items": [dataclass_to_dict(item) for item in po["items"]],
+        }
+        return jsonify(success_response(result))
     return error_response(f"Purchase Order {ebeln} not found", 404)
 
 
@@ -134,7 +208,7 @@ def get_purchase_order(ebeln: str):
 def get_sales_orders():
     """Get all sales orders (VBAK)"""
     sos = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         if "sales_order" in scenario:
             so = scenario["sales_order"]
             so_dict = dataclass_to_dict(so["header"])
@@ -145,17 +219,17 @@ def get_sales_orders():
 
 
 @app.route('/sap/opu/odata/sap/api/v1/sales-orders/<vbeln>', methods=['GET'])
+@tenancy.routed("sales_order", "vbeln")
 def get_sales_order(vbeln: str):
     """Get specific sales order with items"""
-    for scenario in SCENARIOS_DB.values():
-        if "sales_order" in scenario:
-            so = scenario["sales_order"]
-            if so["header"].VBELN == vbeln:
-                result = {
-                    "header": dataclass_to_dict(so["header"]),
-                    "items": [dataclass_to_dict(item) for item in so["items"]],
-                }
-                return jsonify(success_response(result))
+    scenario = tenants.find("sales_order", vbeln)
+    if scenario is not None:
+        so = scenario["sales_order"]
+        result = {
+            "header": dataclass_to_dict(so["header"]),
+            "items": [dataclass_to_dict(item) for item in so["items"]],
+        }
+        return jsonify(success_response(result))
     return error_response(f"Sales Order {vbeln} not found", 404)
 
 
@@ -163,7 +237,7 @@ def get_sales_order(vbeln: str):
 def get_deliveries():
     """Get all deliveries (LIKP)"""
     deliveries = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         if "delivery" in scenario:
             delivery = scenario["delivery"]
             del_dict = dataclass_to_dict(delivery["header"])
@@ -174,17 +248,17 @@ def get_deliveries():
 
 
 @app.route('/sap/opu/odata/sap/api/v1/deliveries/<vbeln>', methods=['GET'])
+@tenancy.routed("delivery", "vbeln")
 def get_delivery(vbeln: str):
     """Get specific delivery with items"""
-    for scenario in SCENARIOS_DB.values():
-        if "delivery" in scenario:
-            delivery = scenario["delivery"]
-            if delivery["header"].VBELN == vbeln:
-                result = {
-                    "header": dataclass_to_dict(delivery["header"]),
-                    "items": [dataclass_to_dict(item) for item in delivery["items"]],
-                }
-                return jsonify(success_response(result))
+    scenario = tenants.find("delivery", vbeln)
+    if scenario is not None:
+        delivery = scenario["delivery"]
+        result = {
+            "header": dataclass_to_dict(delivery["header"]),
+            "items": [dataclass_to_dict(item) for item in delivery["items"]],
+        }
+        return jsonify(success_response(result))
     return error_response(f"Delivery {vbeln} not found", 404)
 
 
@@ -192,7 +266,7 @@ def get_delivery(vbeln: str):
 def get_invoices():
     """Get all billing documents (VBRK)"""
     invoices = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         if "invoice" in scenario:
             invoice = scenario["invoice"]
             inv_dict = dataclass_to_dict(invoice["header"])
@@ -203,17 +277,17 @@ def get_invoices():
 
 
 @app.route('/sap/opu/odata/sap/api/v1/invoices/<vbeln>', methods=['GET'])
+@tenancy.routed("invoice", "vbeln")
 def get_invoice(vbeln: str):
     """Get specific invoice with items"""
-    for scenario in SCENARIOS_DB.values():
-        if "invoice" in scenario:
-            invoice = scenario["invoice"]
-            if invoice["header"].VBELN == vbeln:
-                result = {
-                    "header": dataclass_to_dict(invoice["header"]),
-                    "items": [dataclass_to_dict(item) for item in invoice["items"]],
-                }
-                return jsonify(success_response(result))
+    scenario = tenants.find("invoice", vbeln)
+    if scenario is not None:
+        invoice = scenario["invoice"]
+        result = {
+            "header": dataclass_to_dict(invoice["header"]),
+            "items": [dataclass_to_dict(item) for item in invoice["items"]],
+        }
+        return jsonify(success_response(result))
     return error_response(f"Invoice {vbeln} not found", 404)
 
 
@@ -221,7 +295,7 @@ def get_invoice(vbeln: str):
 def get_documentary_credits():
     """Get all documentary credits"""
     lcs = []
-    for scenario_id, scenario in SCENARIOS_DB.items():
+    for scenario_id, scenario in tenants.scenarios():
         if "documentary_credit" in scenario:
             lc = scenario["documentary_credit"]
             lc_dict = dataclass_to_dict(lc)
@@ -231,13 +305,12 @@ def get_documentary_credits():
 
 
 @app.route('/sap/opu/odata/sap/api/v1/documentary-credits/<lcnum>', methods=['GET'])
+@tenancy.routed("documentary_credit", "lcnum")
 def get_documentary_credit(lcnum: str):
     """Get specific documentary credit"""
-    for scenario in SCENARIOS_DB.values():
-        if "documentary_credit" in scenario:
-            lc = scenario["documentary_credit"]
-            if lc.LCNUM == lcnum:
-                return jsonify(success_response(dataclass_to_dict(lc)))
+    scenario = tenants.find("documentary_credit", lcnum)
+    if scenario is not None:
+        return jsonify(success_response(dataclass_to_dict(scenario["documentary_credit"])))
     return error_response(f"Documentary Credit {lcnum} not found", 404)
 
 
@@ -246,78 +319,239 @@ def get_documentary_credit(lcnum: str):
 # ============================================================================
 
 @app.route('/vc/api/v1/scenarios/<scenario_id>/verifiable-credentials', methods=['GET'])
+@tenancy.routed(tenancy.SCENARIO, "scenario_id")
 def get_scenario_vcs(scenario_id: str):
     """
     Get all W3C Verifiable Credentials for a scenario
     
     Query params:
     - format: 'vc' (default) or 'sap' (original SAP format)
+    
+    Accept: application/cbor returns the credentials as term-dictionary CBOR
     """
-    if scenario_id not in SCENARIOS_DB:
+    scenario = tenants.scenario(scenario_id)
+    if scenario is None:
         return error_response(f"Scenario {scenario_id} not found", 404)
     
-    scenario = SCENARIOS_DB[scenario_id]
-    vcs = convert_sap_scenario_to_vcs(scenario)
+    vcs = convert_sap_scenario_to_vcs(scenario, vc_mapper)
     
-    return jsonify({
+    return vc_response({
         "scenario": scenario_id,
         "description": scenario.get("description", ""),
         "credentials": vcs,
     })
 
 
+@app.route('/vc/api/v1/scenarios/<scenario_id>/examination', methods=['GET'])
+@tenancy.routed(tenancy.SCENARIO, "scenario_id")
+def get_scenario_examination(scenario_id: str):
+    """
+    Examine a scenario's credentials against its documentary credit (UCP 600)
+    
+    Query params:
+    - presented: presentation date, YYYY-MM-DD (default today)
+    """
+    scenario = tenants.scenario(scenario_id)
+    if scenario is None:
+        return error_response(f"Scenario {scenario_id} not found", 404)
+    try:
+        presented = date.fromisoformat(request.args['presented']) if 'presented' in request.args else None
+    except ValueError as e:
+        return error_response(str(e))
+    
+    from compliance.lc_examination import examine_scenario
+
+    examination = examine_scenario(scenario, presented, vc_mapper)
+    return jsonify(success_response(dict(asdict(examination), complying=examination.complying)))
+
+
+@app.route('/vc/api/v1/views', methods=['GET'])
+def get_actor_views():
+    """Actors and the documents each may see, and the inverse"""
+    return jsonify(views.index.to_dict())
+
+
+@app.route('/vc/api/v1/scenarios/<scenario_id>/views/<actor>', methods=['GET'])
+@tenancy.routed(tenancy.SCENARIO, "scenario_id")
+def get_scenario_actor_view(scenario_id: str, actor: str):
+    """
+    The credentials of a scenario one actor may see, in one response
+    
+    The JSON body is serialized once per version of the actor's bundle;
+    the version is the ETag (If-None-Match → 304 until it changes).
+    Accept: application/cbor returns the bundle as term-dictionary CBOR
+    """
+    if tenants.scenario(scenario_id) is None:
+        return error_response(f"Scenario {scenario_id} not found", 404)
+
+    def payload(version: int, bundle: Dict[str, Any]) -> Dict[str, Any]:
+        return {"scenario": scenario_id, "actor": actor, "version": version, "credentials": bundle}
+
+    try:
+        if request.accept_mimetypes.best_match(['application/json', CBOR_MEDIA_TYPE]) == CBOR_MEDIA_TYPE:
+            version, bundle = views.view(scenario_id, actor)
+            response = vc_response(payload(version, bundle))
+        else:
+            version, body = views.body(scenario_id, actor,
+                                       lambda version, bundle: app.json.dumps(payload(version, bundle)).encode())
+            response = Response(body, mimetype='application/json')
+            response.vary.add('Accept')
+    except actor_views.ViewError as e:
+        return error_response(str(e), 404)
+    response.set_etag(f"{scenario_id}/{actor}/{version}")
+    return response
+
+
+@app.route('/vc/api/v1/scenarios/<scenario_id>/documents/<document>', methods=['POST'])
+@tenancy.routed(tenancy.SCENARIO, "scenario_id")
+def publish_scenario_document(scenario_id: str, document: str):
+    """
+    Publish a newly issued credential to a scenario
+    
+    Body: the credential (JSON object). Only the views of the actors
+    allowed to see the document change.
+    """
+    if tenants.scenario(scenario_id) is None:
+        return error_response(f"Scenario {scenario_id} not found", 404)
+    credential = request.get_json(silent=True)
+    if not isinstance(credential, dict):
+        return error_response("The body must be a credential (JSON object)")
+    try:
+        versions = views.publish(scenario_id, document, credential)
+    except actor_views.ViewError as e:
+        return error_response(str(e))
+    return jsonify(success_response({"scenario": scenario_id, "document": actor_views.document_type(document),
+                                     "actors": versions},
+                                    f"{document} published to {len(versions)} actor views"))
+
+
 @app.route('/vc/api/v1/purchase-orders/<ebeln>/vc', methods=['GET'])
+@tenancy.routed("purchase_order", "ebeln")
 def get_purchase_order_vc(ebeln: str):
     """Convert purchase order to W3C VC"""
-    for scenario in SCENARIOS_DB.values():
-        if "purchase_order" in scenario:
-            po = scenario["purchase_order"]
-            if po["header"].EBELN == ebeln:
-                vc = vc_mapper.map_purchase_order(po["header"], po["items"])
-                return jsonify(vc)
+    scenario = tenants.find("purchase_order", ebeln)
+    if scenario is not None:
+        po = scenario["purchase_order"]
+        vc = vc_mapper.map_purchase_order(po["header"], po["items"])
+        return vc_response(vc)
     return error_response(f"Purchase Order {ebeln} not found", 404)
 
 
 @app.route('/vc/api/v1/invoices/<vbeln>/vc', methods=['GET'])
+@tenancy.routed("invoice", "vbeln")
 def get_invoice_vc(vbeln: str):
     """Convert invoice to W3C VC"""
-    for scenario in SCENARIOS_DB.values():
-        if "invoice" in scenario:
-            invoice = scenario["invoice"]
-            if invoice["header"].VBELN == vbeln:
-                vc = vc_mapper.map_commercial_invoice(
-                    invoice["header"], invoice["items"]
-                )
-                return jsonify(vc)
+    scenario = tenants.find("invoice", vbeln)
+    if scenario is not None:
+        invoice = scenario["invoice"]
+        vc = vc_mapper.map_commercial_invoice(
+            invoice["header"], invoice["items"]
+        )
+        return vc_response(vc)
     return error_response(f"Invoice {vbeln} not found", 404)
 
 
 @app.route('/vc/api/v1/deliveries/<vbeln>/vc', methods=['GET'])
+@tenancy.routed("delivery", "vbeln")
 def get_delivery_vc(vbeln: str):
     """Convert delivery to Bill of Lading VC"""
-    for scenario in SCENARIOS_DB.values():
-        if "delivery" in scenario:
-            delivery = scenario["delivery"]
-            if delivery["header"].VBELN == vbeln:
-                vc = vc_mapper.map_bill_of_lading(
-                    delivery["header"], delivery["items"]
-                )
-                return jsonify(vc)
+    scenario = tenants.find("delivery", vbeln)
+    if scenario is not None:
+        delivery = scenario["delivery"]
+        vc = vc_mapper.map_bill_of_lading(
+            delivery["header"], delivery["items"]
+        )
+        return vc_response(vc)
+    return error_response(f"Delivery {vbeln} not found", 404)
+
+
+SHIPMENT_DOCUMENTS = {
+    "packing-list": "map_packing_list",
+    "insurance-certificate": "map_insurance_certificate",
+    "customs-declaration": "map_customs_declaration",
+}
+
+
+@app.route('/vc/api/v1/deliveries/<vbeln>/<any("packing-list", "insurance-certificate", '
+           '"customs-declaration"):document>/vc', methods=['GET'])
+@tenancy.routed("delivery", "vbeln")
+def get_shipment_document_vc(vbeln: str, document: str):
+    """Convert delivery + invoice to packing list, insurance certificate or customs declaration VC"""
+    scenario = tenants.find("delivery", vbeln)
+    if scenario is not None and "invoice" in scenario:
+        delivery, invoice = scenario["delivery"], scenario["invoice"]
+        vc = getattr(vc_mapper, SHIPMENT_DOCUMENTS[document])(
+            delivery["header"], delivery["items"],
+            invoice["header"], invoice["items"]
+        )
+        return vc_response(vc)
     return error_response(f"Delivery {vbeln} not found", 404)
 
 
 @app.route('/vc/api/v1/documentary-credits/<lcnum>/vc', methods=['GET'])
+@tenancy.routed("documentary_credit", "lcnum")
 def get_lc_vc(lcnum: str):
     """Convert documentary credit to W3C VC"""
-    for scenario in SCENARIOS_DB.values():
-        if "documentary_credit" in scenario:
-            lc = scenario["documentary_credit"]
-            if lc.LCNUM == lcnum:
-                vc = vc_mapper.map_documentary_credit(lc)
-                return jsonify(vc)
+    scenario = tenants.find("documentary_credit", lcnum)
+    if scenario is not None:
+        vc = vc_mapper.map_documentary_credit(scenario["documentary_credit"])
+        return vc_response(vc)
+    return error_response(f"Documentary Credit {lcnum} not found", 404)
+
+
+@app.route('/vc/api/v1/documentary-credits/<lcnum>/coverage', methods=['GET'])
+@tenancy.routed("documentary_credit", "lcnum")
+def get_lc_coverage(lcnum: str):
+    """Invoices drawn under a documentary credit, converted to its currency"""
+    try:
+        tolerance = Decimal(request.args.get('tolerance', '0'))
+    except ArithmeticError:
+        tolerance = None
+    if tolerance is None or not tolerance.is_finite() or tolerance < 0:  # NaN and sNaN are not finite
+        return error_response("tolerance must be a non-negative decimal fraction, e.g. 0.10")
+    scenario = tenants.find("documentary_credit", lcnum)
+    if scenario is not None:
+        invoice = (scenario.get("invoice") or {}).get("header")
+        if invoice is None:
+            return error_response(f"No invoice drawn under Documentary Credit {lcnum}", 404)
+        lc = scenario["documentary_credit"]
+        try:
+            coverage = vc_mapper.check_credit_coverage(lc, invoice, tolerance)
+        except FXError as e:
+            return error_response(str(e), 422)
+        return jsonify(success_response(dict(asdict(coverage), valid=coverage.valid)))
     return error_response(f"Documentary Credit {lcnum} not found", 404)
 
 
+@app.route('/vc/api/v1/fx/rates/<source>/<target>', methods=['GET'])
+def get_fx_rate(source: str, target: str):
+    """Reference rate source → target on ?date= (default today)"""
+    try:
+        day = date.fromisoformat(request.args['date']) if 'date' in request.args else date.today()
+        rate = vc_mapper.rates.rate(source.upper(), target.upper(), day)
+    except ValueError as e:  # bad date, or FXError
+        return error_response(str(e), 404 if isinstance(e, FXError) else 400)
+    return jsonify(success_response({
+        "source": rate.source,
+        "target": rate.target,
+        "rate": str(rate.value),
+        "fixingDate": rate.fixing_date.isoformat(),
+        "date": day.isoformat(),
+    }))
+
+
+@app.route('/vc/api/v1/cbor/dictionary', methods=['GET'])
+def get_cbor_dictionary():
+    """Term dictionary used for application/cbor credential responses"""
+    import vc_cbor
+
+    dictionary = vc_cbor.get_codec().dictionary
+    return jsonify(success_response({
+        "id": dictionary.id.hex(),
+        "terms": dictionary.terms,
+    }))
+
+
 # ============================================================================
 # Master Data Endpoints
 # ============================================================================
@@ -325,6 +559,7 @@ def get_lc_vc(lcnum: str):
 @app.route('/sap/opu/odata/sap/api/v1/partners', methods=['GET'])
 def get_partners():
     """Get all business partners"""
+    data_store.load()  # master data may come from the snapshot
     partners_list = [dataclass_to_dict(p) for p in PARTNERS.values()]
     return jsonify(success_response(partners_list))
 
@@ -332,6 +567,7 @@ def get_partners():
 @app.route('/sap/opu/odata/sap/api/v1/partners/<partner_num>', methods=['GET'])
 def get_partner_by_num(partner_num: str):
     """Get specific business partner"""
+    data_store.load()  # master data may come from the snapshot
     partner = get_partner(partner_num)
     if partner:
         return jsonify(success_response(dataclass_to_dict(partner)))
@@ -341,6 +577,7 @@ def get_partner_by_num(partner_num: str):
 @app.route('/sap/opu/odata/sap/api/v1/materials', methods=['GET'])
 def get_materials():
     """Get all materials"""
+    data_store.load()  # master data may come from the snapshot
     materials_list = [dataclass_to_dict(m) for m in MATERIALS.values()]
     return jsonify(success_response(materials_list))
 
@@ -348,12 +585,100 @@ def get_materials():
 @app.route('/sap/opu/odata/sap/api/v1/materials/<matnr>', methods=['GET'])
 def get_material_by_num(matnr: str):
     """Get specific material"""
+    data_store.load()  # master data may come from the snapshot
     material = get_material(matnr)
     if material:
         return jsonify(success_response(dataclass_to_dict(material)))
     return error_response(f"Material {matnr} not found", 404)
 
 
+# ============================================================================
+# Credential Status Endpoints
+# ============================================================================
+
+@app.route('/vc/api/v1/status-lists', methods=['GET'])
+def get_status_lists():
+    """Allocation and set-bit counts per status list"""
+    return jsonify(success_response(status_service.stats()))
+
+
+@app.route('/vc/api/v1/status-lists/<purpose>/<int:number>', methods=['GET'])
+def get_status_list_credential(purpose: str, number: int):
+    """BitstringStatusListCredential (cached until a status changes, ETag-aware)"""
+    published = status_service.published(purpose, number)
+    if published is None:
+        return error_response(f"Status list {purpose}/{number} not found", 404)
+    body, etag = published
+    response = Response(body, mimetype='application/vc+ld+json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = status_service.ttl_ms // 1000
+    return response.make_conditional(request)
+
+
+@app.route('/vc/api/v1/credentials/status', methods=['GET'])
+def get_credential_status():
+    """Current revocation/suspension status of an issued credential (?id=...)"""
+    credential_id = request.args.get('id', '')
+    status = status_service.status(credential_id)
+    if status is None:
+        return error_response(f"No status entry for credential {credential_id}", 404)
+    return jsonify(success_response({"id": credential_id, **status}))
+
+
+@app.route('/vc/api/v1/credentials/status', methods=['POST'])
+def update_credential_status():
+    """
+    Bulk status change
+    
+    Body: {"action": "revoke" | "suspend" | "reinstate", "credentialIds": [...]}
+    """
+    body = request.get_json(silent=True) or {}
+    credential_ids = body.get("credentialIds")
+    if not isinstance(credential_ids, list):
+        return error_response("credentialIds must be a list of credential ids")
+    try:
+        result = status_service.update(credential_ids, body.get("action", ""))
+    except StatusListError as e:
+        return error_response(str(e))
+    return jsonify(success_response(result, f"{result['changed']} credential statuses changed"))
+
+
+# ============================================================================
+# KTDDE Ontology Endpoints
+# ============================================================================
+
+@app.route('/vc/api/v1/ontology/terms/<path:term>', methods=['GET'])
+def get_ontology_term(term: str):
+    """Resolve a KTDDE class or property by IRI or local name"""
+    from ktdde_ontology import get_ontology
+
+    result = get_ontology().term(term)
+    if result:
+        return jsonify(success_response(result))
+    return error_response(f"Ontology term {term} not found", 404)
+
+
+# ============================================================================
+# Static Artifacts (JSON-LD contexts, JSON schemas, templates)
+# ============================================================================
+
+@app.route('/<any(contexts, credentials, templates):root>/<path:filename>', methods=['GET'])
+def get_static_artifact(root: str, filename: str):
+    """Serve a repository artifact, precompressed variant if available"""
+    path = compression.static_path(root, filename)
+    if path is None:
+        return error_response(f"{root}/{filename} not found", 404)
+    variant, encoding = compression.static_variant(path, request.accept_encodings)
+    response = send_file(variant, mimetype=compression.guess_type(path),
+                         conditional=True, max_age=compression.STATIC_MAX_AGE)
+    response.cache_control.public = True
+    response.vary.add('Accept-Encoding')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+
 # ============================================================================
 # Root and Health Check
 # ============================================================================
@@ -378,10 +703,39 @@ def root():
             },
             "vc_format": {
                 "scenario_vcs": "/vc/api/v1/scenarios/{scenario_id}/verifiable-credentials",
+                "scenario_examination": "/vc/api/v1/scenarios/{scenario_id}/examination?presented=YYYY-MM-DD",
+                "actor_views": "/vc/api/v1/views",
+                "scenario_actor_view": "/vc/api/v1/scenarios/{scenario_id}/views/{actor}",
+                "publish_document": "POST /vc/api/v1/scenarios/{scenario_id}/documents/{document}",
                 "purchase_order_vc": "/vc/api/v1/purchase-orders/{ebeln}/vc",
                 "invoice_vc": "/vc/api/v1/invoices/{vbeln}/vc",
                 "delivery_vc": "/vc/api/v1/deliveries/{vbeln}/vc",
+                "shipment_document_vc": "/vc/api/v1/deliveries/{vbeln}/{packing-list|insurance-certificate|customs-declaration}/vc",
                 "documentary_credit_vc": "/vc/api/v1/documentary-credits/{lcnum}/vc",
+                "documentary_credit_coverage": "/vc/api/v1/documentary-credits/{lcnum}/coverage?tolerance=0.10",
+                "fx_rate": "/vc/api/v1/fx/rates/{source}/{target}?date=YYYY-MM-DD",
+                "cbor_dictionary": "/vc/api/v1/cbor/dictionary",
+            },
+            "credential_status": {
+                "status_lists": "/vc/api/v1/status-lists",
+                "status_list_credential": "/vc/api/v1/status-lists/{revocation|suspension}/{n}",
+                "credential_status": "/vc/api/v1/credentials/status?id={credential_id}",
+                "update_status": "POST /vc/api/v1/credentials/status",
+            },
+            "static": {
+                "contexts": "/contexts/{name}-context.jsonld",
+                "schemas": "/credentials/{name}-schema.json",
+                "templates": "/templates/{empty|examples}/{name}.jsonld",
+            },
+            "ontology": {
+                "term": "/vc/api/v1/ontology/terms/{iri_or_local_name}",
+            },
+            "operations": {
+                "health": "/health",
+                "metrics": "/metrics",
+                "profiles": "/admin/profiles?requestId={X-Request-ID}",
+                "profile": "/admin/profiles/{X-Profile-Id}?format=json|text|pstats|collapsed",
+                "tenants": "/admin/tenants",
             }
         },
         "demo_scenarios": list(SCENARIOS_DB.keys()),
@@ -394,6 +748,51 @@ def health():
     return jsonify({"status": "healthy", "service": "SAP API Simulator"})
 
 
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus text exposition: per-route requests/errors/latency, mapper and cache metrics"""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
+@app.route('/admin/tenants', methods=['GET'])
+def get_tenants():
+    """Company-code tenants: scenario and document counts, cache quotas and usage"""
+    return jsonify({"header": tenancy.HEADER, "tenants": tenants.stats()})
+
+
+@app.route('/admin/profiles', methods=['GET'])
+def get_profiles():
+    """Recently profiled requests, newest first (?requestId=: those of one X-Request-ID)"""
+    if not PROFILING:
+        return error_response("Profiling is disabled; start the API with SAP_API_PROFILING=1", 404)
+    return jsonify({"modes": list(profiling.MODES),
+                    "profiles": profiling.list_profiles(request.args.get('requestId'))})
+
+
+@app.route('/admin/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id: str):
+    """One request profile: spans and top functions, or a pstats / collapsed-stack export"""
+    if not PROFILING:
+        return error_response("Profiling is disabled; start the API with SAP_API_PROFILING=1", 404)
+    profile = profiling.get_profile(profile_id)
+    if profile is None:
+        return error_response(f"Profile {profile_id} not found", 404)
+    format = request.args.get('format', 'json')
+    try:
+        if format == 'json':
+            return jsonify(profile.to_dict(top=int(request.args.get('top', 25))))
+        if format == 'text':
+            return Response(profile.text(), mimetype='text/plain')
+        if format == 'pstats':
+            return Response(profile.pstats_bytes(), mimetype='application/octet-stream', headers={
+                'Content-Disposition': f'attachment; filename="{profile.id}.prof"'})
+        if format == 'collapsed':
+            return Response(profile.collapsed(), mimetype='text/plain')
+    except ValueError as error:
+        return error_response(str(error))
+    return error_response(f"Unknown format {format!r}; use one of {', '.join(profiling.FORMATS)}")
+
+
 # ============================================================================
 # Run Server
 # ============================================================================
@@ -0,0 +1,310 @@
+"""
+Company-Code Tenancy for the SAP API Simulator
+
+The simulator serves several company codes (BUKRS) from one data store.
+TenantStore partitions the scenarios by company code (data.store
+scenario_keys: the purchase order's BUKRS, else the sales organization's)
+and gives every tenant its own:
+
+- document index: document number → scenario, per document type, so a
+  document route is a dict lookup instead of a scan of every scenario
+- derived data cache (shipment aggregates) and compression cache
+- decoded-scenario LRU when the store is a snapshot (the snapshot's own
+  LRU is shared; this one keeps the tenant's hot scenarios decoded, and
+  their identity stable for the derived data cache)
+
+each bounded by the tenant's TenantQuota, so a tenant issuing many
+credentials evicts only its own entries, never another tenant's hot ones.
+
+install() resolves the tenant once per request, before the view runs:
+from the X-SAP-Company-Code header or ?bukrs= when given (an unknown
+company code is a 404), else from the document the route names (views
+marked with @routed). The tenant is held in a context variable until
+the request is torn down; find(), scenario() and scenarios() read it, so
+an explicit company code also confines a request to its own documents.
+Requests that name no tenant (list routes without a company code) see
+every tenant and use the shared caches.
+
+Quotas come from SAP_SIM_TENANT_QUOTAS, a JSON object of company code
+(or "*" for the default) → quota fields.
+
+Usage:
+    SAP_SIM_TENANT_QUOTAS='{"*": {"derived_data": 64}, "2000": {"scenarios": 1024}}' \\
+        python3 api/sap_api.py
+    curl -H 'X-SAP-Company-Code: 1000' localhost:5000/sap/opu/odata/sap/api/v1/invoices
+    curl localhost:5000/admin/tenants
+"""
+
+import contextvars
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from api.compression import CompressionCache
+from data.store import DOCUMENT_NUMBERS, DataStore
+from mappings.derived_data import DerivedDataCache
+
+HEADER = "X-SAP-Company-Code"
+QUERY_PARAMETER = "bukrs"
+QUOTAS_ENV = "SAP_SIM_TENANT_QUOTAS"
+SCENARIO = "scenario"  # @routed document for routes naming a scenario id
+
+# Tenant of the request being handled in this context, if any
+_current: contextvars.ContextVar = contextvars.ContextVar("sap_api_tenant", default=None)
+
+
+@dataclass(frozen=True)
+class TenantQuota:
+    """Cache bounds of one tenant"""
+    scenarios: int = 256  # decoded scenarios kept (snapshot stores only)
+    derived_data: int = 1024  # shipment aggregates and document amounts
+    compression_bytes: int = 8 * 1024 * 1024  # compressed response bodies
+
+
+def quotas_from_environment() -> Dict[str, TenantQuota]:
+    """Company code (or "*") → TenantQuota from SAP_SIM_TENANT_QUOTAS"""
+    raw = os.environ.get(QUOTAS_ENV, "")
+    if not raw:
+        return {}
+    try:
+        return {code: TenantQuota(**fields) for code, fields in json.loads(raw).items()}
+    except (TypeError, ValueError, AttributeError) as e:
+        raise ValueError(f"{QUOTAS_ENV}: {e}") from None
+
+
+class Tenant:
+    """One company code: its scenarios, document index and caches"""
+
+    def __init__(self, company_code: str, quota: TenantQuota, decode: bool):
+        self.company_code = company_code
+        self.quota = quota
+        self.scenario_ids: List[str] = []
+        self.documents: Dict[str, Dict[str, str]] = {document: {} for document in DOCUMENT_NUMBERS}
+        self.derived_data = DerivedDataCache(quota.derived_data)
+        self.compression = CompressionCache(quota.compression_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._decoded: Optional['OrderedDict[str, Dict[str, Any]]'] = OrderedDict() if decode else None
+        self._lock = threading.Lock()
+
+    def scenario(self, scenario_id: str, load: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        if self._decoded is None:
+            return load(scenario_id)
+        with self._lock:
+            scenario = self._decoded.get(scenario_id)
+            if scenario is not None:
+                self._decoded.move_to_end(scenario_id)
+                self.hits += 1
+                return scenario
+            self.misses += 1
+        scenario = load(scenario_id)
+        with self._lock:
+            scenario = self._decoded.setdefault(scenario_id, scenario)
+            while len(self._decoded) > self.quota.scenarios:
+                self._decoded.popitem(last=False)
+        return scenario
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "company_code": self.company_code,
+            "scenarios": len(self.scenario_ids),
+            "documents": {document: len(index) for document, index in self.documents.items()},
+            "quota": asdict(self.quota),
+            "caches": {
+                "scenarios": {"entries": len(self._decoded or ()), "hits": self.hits, "misses": self.misses},
+                "derived_data": self.derived_data.stats(),
+                "compression": self.compression.stats(),
+            },
+        }
+
+
+class TenantStore:
+    """DataStore partitioned by company code; partitions are built on first use"""
+
+    def __init__(self, store: DataStore, quotas: Optional[Dict[str, TenantQuota]] = None):
+        self.store = store
+        self.quotas = dict(quotas or {})
+        self.resolutions = 0
+        self._tenants: Optional[Dict[str, Tenant]] = None
+        self._owners: Dict[str, str] = {}  # scenario id → company code
+        self._documents: Dict[Tuple[str, str], str] = {}  # (document, number) → company code
+        self._lock = threading.Lock()
+
+    def quota(self, company_code: str) -> TenantQuota:
+        return self.quotas.get(company_code) or self.quotas.get("*") or TenantQuota()
+
+    @property
+    def tenants(self) -> Dict[str, Tenant]:
+        tenants = self._tenants
+        if tenants is None:
+            with self._lock:
+                tenants = self._tenants
+                if tenants is None:
+                    tenants = self._tenants = self._build()
+        return tenants
+
+    def _build(self) -> Dict[str, Tenant]:
+        decode = not isinstance(self.store.load(), dict)
+        tenants: Dict[str, Tenant] = {}
+        for scenario_id, keys in self.store.document_keys():
+            code = keys["company_code"]
+            tenant = tenants.get(code)
+            if tenant is None:
+                tenant = tenants[code] = Tenant(code, self.quota(code), decode)
+            tenant.scenario_ids.append(scenario_id)
+            self._owners[scenario_id] = code
+            for document in DOCUMENT_NUMBERS:
+                number = keys.get(document)
+                if number is not None:
+                    tenant.documents[document].setdefault(number, scenario_id)
+                    self._documents.setdefault((document, number), code)
+        return tenants
+
+    def tenant(self, company_code: str) -> Optional[Tenant]:
+        return self.tenants.get(company_code)
+
+    def owner(self, document: str, key: str) -> Optional[Tenant]:
+        """Tenant holding a scenario id (document SCENARIO) or document number"""
+        tenants = self.tenants
+        code = self._owners.get(key) if document == SCENARIO else self._documents.get((document, key))
+        return tenants[code] if code is not None else None
+
+    def resolve(self, company_code: Optional[str],
+                routed: Optional[Tuple[str, str]] = None) -> Tuple[bool, Optional[Tenant]]:
+        """
+        (known, tenant) for a request: the named company code, else the
+        owner of the routed (document, key); known is False only for a
+        company code that has no tenant
+        """
+        self.resolutions += 1
+        if company_code:
+            tenant = self.tenant(company_code)
+            return tenant is not None, tenant
+        if routed is not None:
+            return True, self.owner(*routed)
+        return True, None
+
+    # ------------------------------------------------------------------
+    # Lookups, confined to the current tenant when there is one
+    # ------------------------------------------------------------------
+
+    def scenario(self, scenario_id: str) -> Optional[Dict[str, Any]]:
+        tenant = _current.get() or self.owner(SCENARIO, scenario_id)
+        if tenant is None or self._owners.get(scenario_id) != tenant.company_code:
+            return None
+        return tenant.scenario(scenario_id, self.store.scenarios.__getitem__)
+
+    def find(self, document: str, number: str) -> Optional[Dict[str, Any]]:
+        """The scenario holding a document, by its number (index lookup)"""
+        tenant = _current.get() or self.owner(document, number)
+        if tenant is None:
+            return None
+        scenario_id = tenant.documents[document].get(number)
+        if scenario_id is None:
+            return None
+        return tenant.scenario(scenario_id, self.store.scenarios.__getitem__)
+
+    def scenarios(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """(scenario id, scenario) of the current tenant, or of every tenant"""
+        tenant = _current.get()
+        if tenant is None:
+            return self.store.scenarios.items()
+        load = self.store.scenarios.__getitem__
+        return ((scenario_id, tenant.scenario(scenario_id, load)) for scenario_id in tenant.scenario_ids)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [tenant.stats() for _, tenant in sorted(self.tenants.items())]
+
+    def cache_stats(self, name: str, shared) -> Dict[str, int]:
+        """A cache's stats summed over the shared instance and every built tenant's"""
+        caches = [shared] + [getattr(tenant, name) for tenant in (self._tenants or {}).values()]
+        total: Dict[str, int] = {}
+        for cache in caches:
+            for key, value in cache.stats().items():
+                total[key] = total.get(key, 0) + value
+        return total
+
+
+def current() -> Optional[Tenant]:
+    """Tenant of the request being handled, if it has one"""
+    return _current.get()
+
+
+@contextmanager
+def use(tenant: Optional[Tenant]):
+    """Make tenant current outside a request (batch jobs, benchmarks)"""
+    token = _current.set(tenant)
+    try:
+        yield tenant
+    finally:
+        _current.reset(token)
+
+
+def current_cache(name: str, shared):
+    """The current tenant's derived_data / compression cache, else shared"""
+    tenant = _current.get()
+    return shared if tenant is None else getattr(tenant, name)
+
+
+class PartitionedDerivedData:
+    """DerivedDataCache stand-in for the mapper: the current tenant's cache, else the shared one"""
+
+    def __init__(self, shared: DerivedDataCache, tenants: TenantStore):
+        self.shared = shared
+        self.tenants = tenants
+
+    def get(self, *sources):
+        return current_cache("derived_data", self.shared).get(*sources)
+
+    def derived(self, compute, *sources):
+        return current_cache("derived_data", self.shared).derived(compute, *sources)
+
+    def clear(self) -> None:
+        self.shared.clear()
+        for tenant in (self.tenants._tenants or {}).values():
+            tenant.derived_data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.tenants.cache_stats("derived_data", self.shared)
+
+
+def routed(document: str, view_arg: str):
+    """Mark a view whose view_arg is a document number (or, for SCENARIO, a scenario id)"""
+    def mark(view):
+        view.tenant_route = (document, view_arg)
+        return view
+    return mark
+
+
+def install(app, tenants: TenantStore, mapper=None) -> None:
+    """Resolve each request's tenant before its view runs; partition the mapper's derived data"""
+    from flask import g, request
+
+    if mapper is not None:
+        mapper.derived_data = PartitionedDerivedData(mapper.derived_data, tenants)
+
+    @app.before_request
+    def _resolve_tenant():
+        company_code = request.headers.get(HEADER) or request.args.get(QUERY_PARAMETER)
+        route = getattr(app.view_functions.get(request.endpoint), "tenant_route", None)
+        if not company_code and route is None:
+            return None
+        routed = None
+        if route is not None and request.view_args and route[1] in request.view_args:
+            routed = (route[0], request.view_args[route[1]])
+        known, tenant = tenants.resolve(company_code, routed)
+        if not known:
+            return {"error": {"code": "404", "message": f"Company code {company_code} not found"}}, 404
+        if tenant is not None:
+            g._tenant_token = _current.set(tenant)
+        return None
+
+    @app.teardown_request
+    def _reset_tenant(exc):
+        token = g.pop("_tenant_token", None)
+        if token is not None:
+            _current.reset(token)
@@ -0,0 +1,632 @@
+"""
+Distributed Tracing for the SAP API Simulator
+
+OpenTelemetry-compatible spans without the OpenTelemetry SDK: W3C
+traceparent propagation, the standard OTEL_* sampler and exporter
+variables, and OTLP/JSON output that an OpenTelemetry Collector reads
+(otlp receiver over HTTP, or otlpjsonfile for the file exporter).
+
+Traced: the route (one SERVER span per request), every SAPToVCMapper
+map_* call, the partner/material master data lookups inside compiled
+mappings, and DualTrackIssuer canonicalization and signing when it is
+given the tracer.
+
+Sampling is decided once per trace at the root: a request whose
+traceparent says sampled (or not) follows its caller; otherwise the
+trace id ratio applies. Unsampled requests create no span objects;
+child spans check a context variable and return a shared no-op.
+Finished spans are queued and exported in batches by a background
+thread; a full queue drops spans (counted) rather than blocking a
+request.
+
+Configuration (environment):
+    OTEL_TRACES_EXPORTER        none (default) | file | otlp
+    OTEL_TRACES_SAMPLER         parentbased_traceidratio (default) |
+                                parentbased_always_on | parentbased_always_off |
+                                traceidratio | always_on | always_off
+    OTEL_TRACES_SAMPLER_ARG     sampling ratio, default 0.01
+    OTEL_SERVICE_NAME           default sap-simulator
+    OTEL_EXPORTER_OTLP_ENDPOINT default http://localhost:4318 (http/json only)
+    SAP_API_TRACE_FILE          file exporter output, default traces.jsonl
+    OTEL_BSP_SCHEDULE_DELAY, OTEL_BSP_MAX_QUEUE_SIZE, OTEL_BSP_MAX_EXPORT_BATCH_SIZE
+
+Usage:
+    OTEL_TRACES_EXPORTER=file OTEL_TRACES_SAMPLER_ARG=1 python3 api/sap_api.py
+    python3 api/tracing.py summary traces.jsonl          # latency per span name
+    python3 api/tracing.py summary traces.jsonl --trace <trace id>
+    python3 api/tracing.py collect --port 4318 --file traces.jsonl   # collector stand-in
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SERVICE_NAME = "sap-simulator"
+SCOPE = {"name": "sap-simulator", "version": "1.0.0"}
+
+# OTLP SpanKind / StatusCode
+INTERNAL, SERVER, CLIENT = 1, 2, 3
+UNSET, OK, ERROR = 0, 1, 2
+
+MAX_SPANS_PER_TRACE = 1000
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_NO_SPAN = nullcontext()
+_random = random.Random()
+
+# Recording span of the current context; None outside sampled traces
+_current: contextvars.ContextVar = contextvars.ContextVar("sap_api_span", default=None)
+
+
+class TracingError(ValueError):
+    """Unknown sampler or exporter configuration"""
+
+
+# ============================================================================
+# Spans
+# ============================================================================
+
+class _Trace:
+    """Per-trace bookkeeping shared by all spans of a trace"""
+    __slots__ = ("spans", "dropped")
+
+    def __init__(self):
+        self.spans = 0
+        self.dropped = 0
+
+
+class Span:
+    __slots__ = ("tracer", "trace", "trace_id", "span_id", "parent_id", "name", "kind",
+                 "start_ns", "end_ns", "_clock", "attributes", "events", "status", "message")
+
+    def __init__(self, tracer: 'Tracer', trace: _Trace, trace_id: int, parent_id: int,
+                 name: str, kind: int, attributes: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.trace = trace
+        self.trace_id = trace_id
+        self.span_id = _random.getrandbits(64) or 1
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.events: List[Tuple[str, int, Dict[str, Any]]] = []
+        self.status = UNSET
+        self.message = ""
+        self.end_ns = 0
+        self.start_ns = time.time_ns()
+        self._clock = time.perf_counter_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_status(self, status: int, message: str = "") -> None:
+        self.status = status
+        self.message = message
+
+    def record_exception(self, error: BaseException) -> None:
+        self.events.append(("exception", time.time_ns(), {
+            "exception.type": type(error).__name__, "exception.message": str(error)}))
+        self.set_status(ERROR, str(error))
+
+    def end(self) -> None:
+        # Wall-clock start plus monotonic duration
+        self.end_ns = self.start_ns + time.perf_counter_ns() - self._clock
+        self.tracer.processor.on_end(self)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id:032x}-{self.span_id:016x}-01"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": f"{self.trace_id:032x}",
+            "spanId": f"{self.span_id:016x}",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": _attributes(self.attributes),
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = f"{self.parent_id:016x}"
+        if self.message:
+            span["status"]["message"] = self.message
+        if self.events:
+            span["events"] = [{"name": name, "timeUnixNano": str(at), "attributes": _attributes(attributes)}
+                              for name, at, attributes in self.events]
+        return span
+
+
+class _Active:
+    """with: makes a span current, ends it on exit (recording the exception, if any)"""
+    __slots__ = ("span", "token")
+
+    def __init__(self, span: Span):
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, kind, error, traceback) -> None:
+        if error is not None:
+            self.span.record_exception(error)
+        _current.reset(self.token)
+        self.span.end()
+
+
+def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded = {"boolValue": value}
+        elif isinstance(value, int):
+            encoded = {"intValue": str(value)}
+        elif isinstance(value, float):
+            encoded = {"doubleValue": value}
+        else:
+            encoded = {"stringValue": str(value)}
+        result.append({"key": key, "value": encoded})
+    return result
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[int, int, bool]]:
+    """(trace id, parent span id, sampled) from a W3C traceparent header"""
+    match = _TRACEPARENT.match(header.strip().lower()) if header else None
+    if match is None or match.group(1) == "ff":
+        return None
+    trace_id, parent_id = int(match.group(2), 16), int(match.group(3), 16)
+    if not trace_id or not parent_id:
+        return None
+    return trace_id, parent_id, bool(int(match.group(4), 16) & 1)
+
+
+# ============================================================================
+# Sampling
+# ============================================================================
+
+class Sampler:
+    """
+    Root sampling decision
+
+    ratio:        share of traces sampled, by trace id (so every service
+                  sampling the same trace at the same ratio agrees)
+    parent_based: follow the caller's sampled flag when a traceparent is given
+    """
+
+    def __init__(self, ratio: float = 1.0, parent_based: bool = True):
+        if not 0.0 <= ratio <= 1.0:
+            raise TracingError(f"sampling ratio must be between 0 and 1, got {ratio}")
+        self.ratio = ratio
+        self.parent_based = parent_based
+        self._bound = int(ratio * (1 << 64))
+
+    def sample(self, trace_id: int, parent: Optional[Tuple[int, int, bool]] = None) -> bool:
+        if parent is not None and self.parent_based:
+            return parent[2]
+        return (trace_id & 0xFFFFFFFFFFFFFFFF) < self._bound
+
+    def __repr__(self) -> str:
+        return f"Sampler(ratio={self.ratio}, parent_based={self.parent_based})"
+
+
+SAMPLERS = {
+    "always_on": (1.0, False), "always_off": (0.0, False), "traceidratio": (None, False),
+    "parentbased_always_on": (1.0, True), "parentbased_always_off": (0.0, True),
+    "parentbased_traceidratio": (None, True),
+}
+
+
+def sampler_from_environment(environ=os.environ) -> Sampler:
+    name = environ.get("OTEL_TRACES_SAMPLER", "parentbased_traceidratio").strip().lower()
+    if name not in SAMPLERS:
+        raise TracingError(f"unknown OTEL_TRACES_SAMPLER {name!r}; use one of {', '.join(SAMPLERS)}")
+    ratio, parent_based = SAMPLERS[name]
+    if ratio is None:
+        try:
+            ratio = float(environ.get("OTEL_TRACES_SAMPLER_ARG", "0.01"))
+        except ValueError:
+            raise TracingError("OTEL_TRACES_SAMPLER_ARG must be a number between 0 and 1")
+    return Sampler(ratio, parent_based)
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+class FileExporter:
+    """One OTLP/JSON ExportTraceServiceRequest per line (collector otlpjsonfile format)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, payload: bytes) -> None:
+        with self._lock, open(self.path, "ab") as out:
+            out.write(payload + b"\n")
+
+
+class OTLPHttpExporter:
+    """POST OTLP/JSON to <endpoint>/v1/traces"""
+
+    def __init__(self, endpoint: str = "http://localhost:4318", timeout: float = 10.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    def export(self, payload: bytes) -> None:
+        request = urllib.request.Request(self.url, data=payload, method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class BatchProcessor:
+    """Queues finished spans; a daemon thread exports them in batches"""
+
+    def __init__(self, exporter, resource: Dict[str, Any], schedule_delay: float = 5.0,
+                 max_queue_size: int = 2048, max_batch_size: int = 512):
+        self.exporter = exporter
+        self.resource = {"attributes": _attributes(resource)}
+        self.schedule_delay = schedule_delay
+        self.max_queue_size = max_queue_size
+        self.max_batch_size = max_batch_size
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+        self._queue: List[Span] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flushed = threading.Condition(self._lock)
+        self._exporting = False
+        self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.force_flush)
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size:
+                self.dropped += 1
+                return
+            self._queue.append(span)
+            full = len(self._queue) >= self.max_batch_size
+        if full:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.schedule_delay)
+            self._wake.clear()
+            self._export_pending()
+
+    def _export_pending(self) -> None:
+        while True:
+            with self._lock:
+                if not self._queue or self._exporting:
+                    return
+                batch = self._queue[:self.max_batch_size]
+                del self._queue[:self.max_batch_size]
+                self._exporting = True
+            try:
+                self.exporter.export(self.encode(batch))
+                self.exported += len(batch)
+            except Exception as error:  # the collector being down must not break requests
+                self.failed += len(batch)
+                print(f"⚠️  Trace export failed ({len(batch)} spans): {error}", file=sys.stderr)
+            finally:
+                with self._lock:
+                    self._exporting = False
+                    self._flushed.notify_all()
+
+    def encode(self, spans: List[Span]) -> bytes:
+        return json.dumps({"resourceSpans": [{
+            "resource": self.resource,
+            "scopeSpans": [{"scope": SCOPE, "spans": [span.to_otlp() for span in spans]}],
+        }]}, separators=(",", ":")).encode("utf-8")
+
+    def force_flush(self) -> None:
+        """Export everything queued so far (waits for an export in progress)"""
+        with self._lock:
+            while self._exporting:
+                self._flushed.wait()
+        self._export_pending()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            queued = len(self._queue)
+        return {"queued": queued, "exported": self.exported, "dropped": self.dropped,
+                "failed": self.failed}
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+class Tracer:
+    def __init__(self, processor: BatchProcessor, sampler: Optional[Sampler] = None,
+                 max_spans_per_trace: int = MAX_SPANS_PER_TRACE):
+        self.processor = processor
+        self.sampler = sampler or Sampler()
+        self.max_spans_per_trace = max_spans_per_trace
+
+    def start_trace(self, name: str, traceparent: Optional[str] = None, kind: int = SERVER,
+                    attributes: Optional[Dict[str, Any]] = None) -> Optional[Span]:
+        """Root span of this service, or None when the sampler drops the trace"""
+        parent = parse_traceparent(traceparent)
+        trace_id = parent[0] if parent else _random.getrandbits(128) or 1
+        if not self.sampler.sample(trace_id, parent):
+            return None
+        trace = _Trace()
+        trace.spans = 1
+        return Span(self, trace, trace_id, parent[1] if parent else 0, name, kind, attributes)
+
+    def trace(self, name: str, attributes: Optional[Dict[str, Any]] = None,
+              traceparent: Optional[str] = None, kind: int = INTERNAL):
+        """with tracer.trace(...): root span for batch jobs and scripts (sampled)"""
+        span = self.start_trace(name, traceparent, kind, attributes)
+        return _NO_SPAN if span is None else _Active(span)
+
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: int = INTERNAL):
+        """with tracer.span(...): child of the current span; a no-op outside sampled traces"""
+        parent = _current.get()
+        if parent is None:
+            return _NO_SPAN
+        trace = parent.trace
+        if trace.spans >= self.max_spans_per_trace:
+            trace.dropped += 1
+            return _NO_SPAN
+        trace.spans += 1
+        return _Active(Span(self, trace, parent.trace_id, parent.span_id, name, kind, attributes))
+
+    def traced(self, name: str, attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+        """Decorator: span per call; attributes(*args, **kwargs) → span attributes"""
+        def decorate(function):
+            def traced(*args, **kwargs):
+                if _current.get() is None:
+                    return function(*args, **kwargs)
+                with self.span(name, attributes(*args, **kwargs) if attributes else None):
+                    return function(*args, **kwargs)
+            traced.__wrapped__ = function
+            traced.__name__ = function.__name__
+            traced.__doc__ = function.__doc__
+            return traced
+        return decorate
+
+
+def from_environment(environ=os.environ) -> Optional[Tracer]:
+    """Tracer configured by OTEL_* variables; None when OTEL_TRACES_EXPORTER is none/unset"""
+    kind = environ.get("OTEL_TRACES_EXPORTER", "none").strip().lower()
+    if kind in ("", "none"):
+        return None
+    if kind == "file":
+        exporter = FileExporter(environ.get("SAP_API_TRACE_FILE", "traces.jsonl"))
+    elif kind == "otlp":
+        protocol = environ.get("OTEL_EXPORTER_OTLP_PROTOCOL", "http/json")
+        if protocol != "http/json":
+            raise TracingError(f"OTEL_EXPORTER_OTLP_PROTOCOL {protocol!r} is not supported; use http/json")
+        exporter = OTLPHttpExporter(environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"))
+    else:
+        raise TracingError(f"unknown OTEL_TRACES_EXPORTER {kind!r}; use none, file or otlp")
+    processor = BatchProcessor(
+        exporter, {"service.name": environ.get("OTEL_SERVICE_NAME", SERVICE_NAME)},
+        schedule_delay=int(environ.get("OTEL_BSP_SCHEDULE_DELAY", "5000")) / 1000,
+        max_queue_size=int(environ.get("OTEL_BSP_MAX_QUEUE_SIZE", "2048")),
+        max_batch_size=int(environ.get("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "512")))
+    return Tracer(processor, sampler_from_environment(environ))
+
+
+# ============================================================================
+# Instrumentation
+# ============================================================================
+
+def instrument_app(app, tracer: Tracer) -> None:
+    """
+    SERVER span per request, named "<method> <route template>"
+
+    The span ends at teardown, after every after_request hook
+    (compression included).
+    """
+    from flask import g, request
+
+    @app.before_request
+    def _start_span():
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        span = tracer.start_trace(f"{request.method} {route}", request.headers.get("traceparent"),
+                                  attributes={"http.request.method": request.method,
+                                              "http.route": route, "url.path": request.path})
+        if span is not None:
+            g._trace_span, g._trace_token = span, _current.set(span)
+
+    @app.after_request
+    def _end_span(response):
+        span = g.get("_trace_span")
+        if span is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.set_status(ERROR)
+            response.headers["traceresponse"] = span.traceparent
+        return response
+
+    @app.teardown_request
+    def _finish_span(error):
+        span = g.pop("_trace_span", None)
+        if span is not None:
+            if error is not None:
+                span.record_exception(error)
+            if span.trace.dropped:
+                span.set_attribute("sap.dropped_spans", span.trace.dropped)
+            _current.reset(g.pop("_trace_token"))
+            span.end()
+
+
+def instrument_mapper(mapper, tracer: Tracer) -> None:
+    """Span per map_* call of a mapper instance, with the document type and line count"""
+    for name in dir(type(mapper)):
+        if name.startswith("map_"):
+            document = name[len("map_"):]
+            setattr(mapper, name, tracer.traced(name, _mapper_attributes(document))(getattr(mapper, name)))
+
+
+def _mapper_attributes(document: str) -> Callable[..., Dict[str, Any]]:
+    def attributes(*args, **kwargs) -> Dict[str, Any]:
+        result = {"sap.document": document}
+        lines = next((arg for arg in args if isinstance(arg, list)), None)
+        if lines is not None:
+            result["sap.line_items"] = len(lines)
+        return result
+    return attributes
+
+
+def instrument_lookups(namespaces: Iterable[Dict[str, Any]], names: Iterable[str], tracer: Tracer) -> int:
+    """
+    Span per master data lookup called from compiled mappings
+
+    Compiled mappings call lookups (get_partner, get_material) through
+    their module namespace, so the traced version replaces the name
+    there. Pass the functions dict mappings are compiled with (covers
+    mappings compiled later) and the globals of those already compiled.
+    Returns the number of replacements.
+    """
+    names = tuple(names)
+    replaced = 0
+    for namespace in namespaces:
+        for name in names:
+            lookup = namespace.get(name)
+            if lookup is not None and not hasattr(lookup, "__wrapped__"):
+                namespace[name] = tracer.traced(f"sap.{name}", lambda key: {"sap.key": key})(lookup)
+                replaced += 1
+    return replaced
+
+
+# ============================================================================
+# Collector stand-in and latency summary
+# ============================================================================
+
+def read_spans(path: str) -> List[Dict[str, Any]]:
+    spans = []
+    with open(path, encoding="utf-8") as lines:
+        for line in lines:
+            if line.strip():
+                for resource in json.loads(line)["resourceSpans"]:
+                    for scope in resource["scopeSpans"]:
+                        spans.extend(scope["spans"])
+    return spans
+
+
+def summarize(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Per span name: count, duration percentiles and self time (minus child spans)"""
+    durations = {span["spanId"]: int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])
+                 for span in spans}
+    children: Dict[str, int] = {}
+    for span in spans:
+        parent = span.get("parentSpanId")
+        if parent in durations:
+            children[parent] = children.get(parent, 0) + durations[span["spanId"]]
+    by_name: Dict[str, List[Tuple[int, int]]] = {}
+    for span in spans:
+        duration = durations[span["spanId"]]
+        by_name.setdefault(span["name"], []).append((duration, duration - children.get(span["spanId"], 0)))
+    rows = []
+    for name, values in by_name.items():
+        ordered = sorted(duration for duration, _ in values)
+        rows.append({
+            "name": name, "count": len(values),
+            "mean_us": sum(ordered) / len(ordered) / 1000,
+            "p50_us": ordered[len(ordered) // 2] / 1000,
+            "p95_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] / 1000,
+            "self_us": sum(own for _, own in values) / 1000,
+        })
+    return sorted(rows, key=lambda row: -row["self_us"])
+
+
+def print_tree(spans: List[Dict[str, Any]], trace_id: str) -> None:
+    spans = [span for span in spans if span["traceId"] == trace_id]
+    ids = {span["spanId"] for span in spans}
+    kids: Dict[str, list] = {}
+    for span in sorted(spans, key=lambda span: int(span["startTimeUnixNano"])):
+        parent = span.get("parentSpanId")
+        kids.setdefault(parent if parent in ids else None, []).append(span)
+    start = min((int(span["startTimeUnixNano"]) for span in spans), default=0)
+
+    def show(span, depth):
+        begin, end = int(span["startTimeUnixNano"]), int(span["endTimeUnixNano"])
+        print(f"  {'  ' * depth}{span['name']:<{50 - 2 * depth}s} +{(begin - start) / 1e6:8.3f} ms "
+              f"{(end - begin) / 1e6:8.3f} ms")
+        for child in kids.get(span["spanId"], []):
+            show(child, depth + 1)
+
+    for root in kids.get(None, []):
+        show(root, 0)
+
+
+def collector(port: int, path: str):
+    """Minimal OTLP/HTTP JSON receiver appending requests to a file (call serve_forever())"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    exporter = FileExporter(path)
+
+    class Receiver(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != "/v1/traces":
+                self.send_error(404)
+                return
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                json.loads(body)
+            except ValueError:
+                self.send_error(400, "expected OTLP/JSON")
+                return
+            exporter.export(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(("0.0.0.0", port), Receiver)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Trace summary and OTLP collector stand-in")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary = commands.add_parser("summary", help="latency per span name from an OTLP/JSON lines file")
+    summary.add_argument("file")
+    summary.add_argument("--trace", help="print one trace as a tree")
+    receiver = commands.add_parser("collect", help="receive OTLP/HTTP JSON and append it to a file")
+    receiver.add_argument("--port", type=int, default=4318)
+    receiver.add_argument("--file", default="traces.jsonl")
+    args = parser.parse_args()
+
+    if args.command == "collect":
+        server = collector(args.port, args.file)
+        print(f"OTLP/HTTP JSON receiver on :{args.port}/v1/traces → {args.file}")
+        server.serve_forever()
+        return
+    spans = read_spans(args.file)
+    if args.trace:
+        print_tree(spans, args.trace)
+        return
+    print(f"{len(spans)} spans in {len({span['traceId'] for span in spans})} traces\n")
+    print(f"  {'span':50s} {'count':>7s} {'mean µs':>9s} {'p50 µs':>9s} {'p95 µs':>9s} {'self ms':>9s}")
+    for row in summarize(spans):
+        print(f"  {row['name'][:50]:50s} {row['count']:7d} {row['mean_us']:9.1f} {row['p50_us']:9.1f} "
+              f"{row['p95_us']:9.1f} {row['self_us'] / 1000:9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,494 @@
+"""
+Documentary Credit Examination
+
+Checks the credentials of a trade scenario (convert_sap_scenario_to_vcs)
+against each other and against the DocumentaryCredit, the way a bank
+examines a presentation under UCP 600: required documents, amounts and
+currency, parties, shipment and presentation dates, partial shipments,
+and data consistency across invoice, bill of lading, certificate of
+origin, packing list and insurance certificate.
+
+A Presentation groups the credentialSubjects by document type; each
+(document type, property path) a rule asks for is resolved once and
+memoized, as are line items grouped by goods description, so examining
+a scenario is linear in the size of its credentials. Each rule is timed;
+resolving a path counts towards the first rule that reads it.
+examine_many() runs scenarios in worker processes, because mapping
+dominates and it is CPU-bound Python.
+
+To add a rule: write a function taking a Presentation and yielding
+(document type, message) for each discrepancy, and decorate it with
+@rule(id, UCP 600 article). A rule yields Unverified(document type,
+message) instead for what the credentials cannot show either way, such
+as the placeholder parties the SAP mappings emit where company code
+master data would go; those are listed apart and do not make a
+presentation discrepant.
+
+Usage:
+    python3 compliance/lc_examination.py [--presented 2026-11-01]
+"""
+
+import os
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Document names used in ZBANKF.DOCS_REQUIRED → credentialSubject types
+DOCUMENT_TYPES = {
+    "commercial invoice": "CommercialInvoice",
+    "bill of lading": "BillOfLading",
+    "certificate of origin": "CertificateOfOrigin",
+    "packing list": "PackingList",
+    "insurance certificate": "InsuranceCertificate",
+    "insurance policy": "InsuranceCertificate",
+    "customs declaration": "CustomsDeclaration",
+    "purchase order": "PurchaseOrder",
+}
+
+CREDIT = "DocumentaryCredit"
+INVOICE = "CommercialInvoice"
+TRANSPORT = "BillOfLading"
+ORIGIN = "CertificateOfOrigin"
+PACKING = "PackingList"
+INSURANCE = "InsuranceCertificate"
+CUSTOMS = "CustomsDeclaration"
+
+DEFAULT_PRESENTATION_DAYS = 21  # UCP 600 article 14(c)
+PARTIAL_DRAWING_TOLERANCE = Decimal("0.05")  # article 30(c)
+MINIMUM_INSURANCE = Decimal("1.10")  # article 28(f)(ii)
+
+# Party names mappings/mapping_specs.py puts where master data that is not
+# simulated (company codes, carriers, chambers, insurers) would go; they
+# name no one. Normalized.
+PLACEHOLDER_PARTIES = frozenset({"buyer company", "seller company", "carrier company",
+                                 "chamber of commerce", "authorized official", "cargo insurer"})
+
+
+# ============================================================================
+# Presentation index
+# ============================================================================
+
+class Presentation:
+    """The credentials of one scenario, indexed by document type and property path"""
+
+    def __init__(self, credentials: Dict[str, Dict[str, Any]], presented: Optional[date] = None):
+        self.presented = presented or date.today()
+        self.documents: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._fields: Dict[Tuple[str, str], List[Any]] = {}
+        self._lines: Dict[Tuple[str, str, str], Dict[str, List[Dict[str, Any]]]] = {}
+        for credential in credentials.values():
+            subject = credential.get("credentialSubject", credential)
+            self.documents[subject.get("type")].append(subject)
+
+    def _resolve(self, kind: str, path: str) -> List[Any]:
+        """Leaf values at a dotted path in every document of a type; lists fan out"""
+        nodes: List[Any] = list(self.documents.get(kind, ()))
+        for key in path.split("."):
+            found = []
+            for node in nodes:
+                value = node.get(key) if isinstance(node, dict) else None
+                if isinstance(value, list):
+                    found.extend(value)
+                elif value is not None:
+                    found.append(value)
+            nodes = found
+        return [node for node in nodes if not isinstance(node, dict)]
+
+    def has(self, kind: str) -> bool:
+        return kind in self.documents
+
+    def values(self, kind: str, path: str) -> List[Any]:
+        values = self._fields.get((kind, path))
+        if values is None:
+            values = self._fields[(kind, path)] = self._resolve(kind, path)
+        return values
+
+    def value(self, kind: str, path: str) -> Any:
+        values = self.values(kind, path)
+        return values[0] if values else None
+
+    def amount(self, kind: str, path: str) -> Optional[Decimal]:
+        return _decimal(self.value(kind, path))
+
+    def date(self, kind: str, path: str) -> Optional[date]:
+        return _date(self.value(kind, path))
+
+    def shipment_date(self) -> Optional[date]:
+        """On-board date if the transport document has one, else its issue date (article 20(a)(ii))"""
+        return self.date(TRANSPORT, "actualDepartureDateTime") or self.date(TRANSPORT, "issueDate")
+
+    def lines(self, kind: str, items: str, description: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Line items of a document grouped by goods description"""
+        key = (kind, items, description)
+        grouped = self._lines.get(key)
+        if grouped is None:
+            grouped = self._lines[key] = defaultdict(list)
+            for subject in self.documents.get(kind, ()):
+                for item in subject.get(items) or ():
+                    grouped[_normalized(item.get(description))].append(item)
+        return grouped
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+def _date(value: Any) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _normalized(text: Optional[str]) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+# ============================================================================
+# Rules
+# ============================================================================
+
+Finding = Tuple[Optional[str], str]  # (document type, message)
+
+
+class Unverified(NamedTuple):
+    """A check the credentials cannot decide; reported, but not a discrepancy"""
+    document: Optional[str]
+    message: str
+
+
+@dataclass(frozen=True)
+class Rule:
+    id: str
+    article: str  # UCP 600 reference
+    description: str
+    check: Callable[[Presentation], Iterable[Finding]]
+
+
+RULES: List[Rule] = []
+
+
+def rule(rule_id: str, article: str):
+    """Register a rule; its docstring's first line is the description"""
+    def register(check: Callable[[Presentation], Iterable[Finding]]):
+        RULES.append(Rule(rule_id, article, (check.__doc__ or "").strip().splitlines()[0], check))
+        return check
+    return register
+
+
+@rule("documents-presented", "Art. 14(a)")
+def documents_presented(p: Presentation):
+    """Every document the credit requires is presented"""
+    for name in p.values(CREDIT, "requiresDocument.documentType"):
+        kind = DOCUMENT_TYPES.get(_normalized(name))
+        if kind is None:
+            yield None, f"required document '{name}' has no credential type"
+        elif not p.has(kind):
+            yield kind, f"required document '{name}' not presented"
+
+
+@rule("credit-reference", "Art. 14(d)")
+def credit_reference(p: Presentation):
+    """The invoice refers to this credit"""
+    number = p.value(CREDIT, "creditNumber")
+    referenced = p.value(INVOICE, "relatesToDocumentaryCredit.creditNumber")
+    if p.has(INVOICE) and number and referenced != number:
+        yield INVOICE, f"refers to credit {referenced}, presented under {number}"
+
+
+@rule("invoice-parties", "Art. 18(a)(i)-(ii)")
+def invoice_parties(p: Presentation):
+    """The invoice is issued by the beneficiary and made out to the applicant"""
+    if not p.has(INVOICE):
+        return
+    for invoice_path, credit_path, role in (("sellerParty.partyName", "beneficiaryParty.partyName", "beneficiary"),
+                                            ("buyerParty.partyName", "applicantParty.partyName", "applicant")):
+        expected, actual = p.value(CREDIT, credit_path), p.value(INVOICE, invoice_path)
+        party = invoice_path.split('.')[0]
+        if not expected:
+            continue
+        if _normalized(actual) in PLACEHOLDER_PARTIES:
+            yield Unverified(INVOICE, f"{party} '{actual}' is a placeholder, cannot be checked against the {role} '{expected}'")
+        elif _normalized(actual) != _normalized(expected):
+            yield INVOICE, f"{party} '{actual}' is not the {role} '{expected}'"
+
+
+@rule("invoice-amount", "Art. 18(a)(iii), 18(b)")
+def invoice_amount(p: Presentation):
+    """The invoice is in the credit currency and does not exceed the credit amount"""
+    if not p.has(INVOICE) or not p.has(CREDIT):
+        return
+    currency = p.value(CREDIT, "creditAmount.currencyCode")
+    invoiced_currency = p.value(INVOICE, "totalAmount.currencyCode")
+    if currency != invoiced_currency:
+        yield INVOICE, f"invoice in {invoiced_currency}, credit in {currency}"
+        return
+    credit, invoiced = p.amount(CREDIT, "creditAmount.amountValue"), p.amount(INVOICE, "totalAmount.amountValue")
+    if credit is not None and invoiced is not None and invoiced > credit:
+        yield INVOICE, f"amount {invoiced} {currency} exceeds the credit amount {credit} {currency}"
+
+
+@rule("partial-drawing", "Art. 30(c), 31")
+def partial_drawing(p: Presentation):
+    """Without partial shipments, the invoice draws the credit amount (5% less allowed)"""
+    if p.value(CREDIT, "partialShipmentAllowed") is not False:
+        return
+    credit, invoiced = p.amount(CREDIT, "creditAmount.amountValue"), p.amount(INVOICE, "totalAmount.amountValue")
+    if credit is not None and invoiced is not None and invoiced < credit * (1 - PARTIAL_DRAWING_TOLERANCE):
+        yield INVOICE, f"draws {invoiced} of {credit} but partial shipments are not allowed"
+    if len(p.documents.get(TRANSPORT, ())) > 1:
+        yield TRANSPORT, "several transport documents but partial shipments are not allowed"
+
+
+@rule("latest-shipment", "Art. 20(a)(ii)")
+def latest_shipment(p: Presentation):
+    """Goods are shipped no later than the latest shipment date"""
+    latest, shipped = p.date(CREDIT, "latestShipmentDate"), p.shipment_date()
+    if latest and shipped and shipped > latest:
+        yield TRANSPORT, f"shipped {shipped}, latest shipment date {latest}"
+
+
+@rule("presentation-period", "Art. 6(d), 14(c)")
+def presentation_period(p: Presentation):
+    """Presented within the presentation period and before expiry"""
+    expiry, shipped = p.date(CREDIT, "expiryDate"), p.shipment_date()
+    if expiry and p.presented > expiry:
+        yield CREDIT, f"presented {p.presented}, credit expired {expiry}"
+    if shipped:
+        days = p.value(CREDIT, "presentationPeriodDays") or DEFAULT_PRESENTATION_DAYS
+        if (p.presented - shipped).days > days:
+            yield TRANSPORT, f"presented {(p.presented - shipped).days} days after shipment, period is {days} days"
+
+
+@rule("document-dates", "Art. 14(i)")
+def document_dates(p: Presentation):
+    """No document is dated after the presentation"""
+    for kind, path in ((INVOICE, "invoiceDate"), (TRANSPORT, "issueDate"), (ORIGIN, "issueDate"),
+                       (PACKING, "hasIssueDate"), (INSURANCE, "hasIssueDate"), (CUSTOMS, "hasDeclarationDate")):
+        issued = p.date(kind, path)
+        if issued and issued > p.presented:
+            yield kind, f"dated {issued}, after the presentation on {p.presented}"
+
+
+@rule("transport-document-number", "Art. 14(d)")
+def transport_document_number(p: Presentation):
+    """Documents cite the transport document that was presented"""
+    number = p.value(TRANSPORT, "documentIdentifier")
+    if not number:
+        return
+    for kind, path in ((INVOICE, "relatesToTransportDocument.documentIdentifier"),
+                       (ORIGIN, "transportDocumentNumber"),
+                       (INSURANCE, "hasTransportDetails.transportDocumentNumber")):
+        cited = p.value(kind, path)
+        if cited and cited != number:
+            yield kind, f"cites transport document {cited}, presented {number}"
+
+
+@rule("goods-description", "Art. 14(e), 18(c)")
+def goods_description(p: Presentation):
+    """Goods in the other documents are goods on the invoice"""
+    invoiced = set(map(_normalized, p.values(INVOICE, "hasInvoiceLine.productDescription")))
+    if not invoiced:
+        return
+    for kind, path in ((TRANSPORT, "hasGoodsItem.descriptionOfGoodsText"), (ORIGIN, "hasGoodsItem.descriptionOfGoods"),
+                       (PACKING, "hasGoodsItem.descriptionOfGoods"), (CUSTOMS, "hasGoodsItem.descriptionOfGoods")):
+        for description in p.values(kind, path):
+            if _normalized(description) not in invoiced:
+                yield kind, f"goods '{description}' are not on the invoice"
+
+
+@rule("quantities", "Art. 14(d)")
+def quantities(p: Presentation):
+    """Quantities per product agree between invoice and transport, packing and customs documents"""
+    invoiced = _quantities(p.lines(INVOICE, "hasInvoiceLine", "productDescription"))
+    if not invoiced:
+        return
+    for kind, description in ((TRANSPORT, "descriptionOfGoodsText"), (PACKING, "descriptionOfGoods"),
+                              (CUSTOMS, "descriptionOfGoods")):
+        for product, quantity in _quantities(p.lines(kind, "hasGoodsItem", description)).items():
+            if product in invoiced and quantity != invoiced[product]:
+                yield kind, f"'{product}': {quantity[0]} {quantity[1]}, invoiced {invoiced[product][0]} {invoiced[product][1]}"
+
+
+def _quantities(lines: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Tuple[Decimal, Optional[str]]]:
+    totals = {}
+    for product, items in lines.items():
+        values = [item.get("quantity") or {} for item in items]
+        if all("quantityValue" in value for value in values):
+            totals[product] = (sum((_decimal(value["quantityValue"]) or Decimal(0) for value in values), Decimal(0)),
+                               values[0].get("unitCode"))
+    return totals
+
+
+@rule("gross-weight", "Art. 14(d)")
+def gross_weight(p: Presentation):
+    """Total gross weight agrees across transport, packing and insurance documents"""
+    weights = [(kind, _decimal(p.value(kind, path + ".quantityValue")), p.value(kind, path + ".unitCode"))
+               for kind, path in ((TRANSPORT, "totalGrossWeight"), (PACKING, "hasTotalGrossWeight"),
+                                  (INSURANCE, "hasTransportDetails.totalGrossWeight"))]
+    weights = [weight for weight in weights if weight[1] is not None]
+    for kind, weight, unit in weights[1:]:
+        if (weight, unit) != weights[0][1:]:
+            yield kind, f"gross weight {weight} {unit}, {weights[0][0]} states {weights[0][1]} {weights[0][2]}"
+
+
+@rule("origin", "Art. 14(d)")
+def origin(p: Presentation):
+    """The certificate of origin agrees with the invoiced origin per product"""
+    invoiced = {product: {item.get("originCountry", {}).get("countryCode") for item in items}
+                for product, items in p.lines(INVOICE, "hasInvoiceLine", "productDescription").items()}
+    for product, items in p.lines(ORIGIN, "hasGoodsItem", "descriptionOfGoods").items():
+        for item in items:
+            country = item.get("originCountry", {}).get("countryCode")
+            if product in invoiced and country not in invoiced[product]:
+                yield ORIGIN, f"'{product}' originates in {country}, invoiced origin {sorted(filter(None, invoiced[product]))}"
+
+
+@rule("delivery-terms", "Art. 14(d)")
+def delivery_terms(p: Presentation):
+    """The invoice and transport document show the credit's Incoterms"""
+    terms = p.value(CREDIT, "deliveryTerms.incotermsCode")
+    if not terms:
+        return
+    invoiced = p.value(INVOICE, "deliveryTerms.incotermsCode")
+    if invoiced and invoiced != terms:
+        yield INVOICE, f"Incoterms {invoiced}, credit requires {terms}"
+    text = p.value(TRANSPORT, "deliveryTermsText")
+    if text and not text.startswith(terms):
+        yield TRANSPORT, f"delivery terms '{text}', credit requires {terms}"
+
+
+@rule("insurance-cover", "Art. 28(e), 28(f)")
+def insurance_cover(p: Presentation):
+    """Insurance covers 110% of the invoice, in its currency, from the shipment date"""
+    if not p.has(INSURANCE):
+        return
+    insured, currency = p.amount(INSURANCE, "hasInsuredAmount.amountValue"), p.value(INSURANCE, "hasInsuredAmount.currencyCode")
+    invoiced, invoice_currency = p.amount(INVOICE, "totalAmount.amountValue"), p.value(INVOICE, "totalAmount.currencyCode")
+    if invoiced is not None and insured is not None:
+        if currency != invoice_currency:
+            yield INSURANCE, f"cover in {currency}, credit drawn in {invoice_currency}"
+        elif insured < invoiced * MINIMUM_INSURANCE:
+            yield INSURANCE, f"insured {insured} {currency}, at least {invoiced * MINIMUM_INSURANCE:.2f} required"
+    issued, shipped = p.date(INSURANCE, "hasIssueDate"), p.shipment_date()
+    if issued and shipped and issued > shipped:
+        yield INSURANCE, f"dated {issued}, after shipment on {shipped}"
+
+
+# ============================================================================
+# Examination
+# ============================================================================
+
+@dataclass
+class Discrepancy:
+    rule: str
+    article: str
+    document: Optional[str]
+    message: str
+
+
+@dataclass
+class Examination:
+    """Outcome of examining one presentation"""
+    scenario: str
+    credit: Optional[str]
+    presented: str
+    discrepancies: List[Discrepancy] = field(default_factory=list)
+    unverified: List[Discrepancy] = field(default_factory=list)  # findings yielded as Unverified
+    timings: Dict[str, int] = field(default_factory=dict)  # rule id → ns ("index": grouping documents)
+
+    @property
+    def complying(self) -> bool:
+        return not self.discrepancies
+
+
+def examine(credentials: Dict[str, Dict[str, Any]], scenario: str = "",
+            presented: Optional[date] = None, rules: Optional[List[Rule]] = None) -> Examination:
+    """Run every rule on one scenario's credentials"""
+    clock = time.perf_counter_ns
+    start = clock()
+    presentation = Presentation(credentials, presented)
+    result = Examination(scenario, presentation.value(CREDIT, "creditNumber"),
+                         presentation.presented.isoformat())
+    result.timings["index"] = clock() - start
+    for check in rules or RULES:
+        start = clock()
+        for finding in check.check(presentation):
+            found = result.unverified if isinstance(finding, Unverified) else result.discrepancies
+            found.append(Discrepancy(check.id, check.article, *finding))
+        result.timings[check.id] = clock() - start
+    return result
+
+
+def examine_scenario(scenario: Dict[str, Any], presented: Optional[date] = None, mapper=None) -> Examination:
+    """
+    Map an SAP scenario to credentials with mapper (the API passes its own,
+    with the tenant's caches, status entries and instrumentation; default a
+    new SAPToVCMapper) and examine them
+    """
+    from mappings.sap_to_vc import convert_sap_scenario_to_vcs
+
+    return examine(convert_sap_scenario_to_vcs(scenario, mapper), scenario.get("scenario", ""), presented)
+
+
+def examine_many(scenarios: List[Dict[str, Any]], presented: Optional[date] = None,
+                 workers: Optional[int] = None, chunksize: int = 16) -> List[Examination]:
+    """
+    Examine scenarios in worker processes (workers=1: in this process), in
+    input order; each process maps with its own SAPToVCMapper
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(scenarios) <= 1:
+        return [examine_scenario(scenario, presented) for scenario in scenarios]
+    from concurrent.futures import ProcessPoolExecutor  # ~10 ms to import; only batch runs need it
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(examine_scenario, scenarios, [presented] * len(scenarios),
+                             chunksize=chunksize))
+
+
+def rule_timings(examinations: Iterable[Examination]) -> Dict[str, Dict[str, float]]:
+    """Per rule: total and mean µs, and discrepancies found, over many examinations"""
+    totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0, 0])
+    for examination in examinations:
+        for rule_id, ns in examination.timings.items():
+            totals[rule_id][0] += ns
+            totals[rule_id][1] += 1
+        for discrepancy in examination.discrepancies:
+            totals[discrepancy.rule][2] += 1
+    return {rule_id: {"total_us": ns / 1000, "mean_us": ns / 1000 / count if count else 0.0,
+                      "discrepancies": found}
+            for rule_id, (ns, count, found) in totals.items()}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from data.sample_data import get_all_scenarios
+
+    parser = argparse.ArgumentParser(description="Examine the sample scenarios under their credits")
+    parser.add_argument("--presented", type=date.fromisoformat, default=None,
+                        help="presentation date (default today)")
+    args = parser.parse_args()
+
+    for examination in examine_many(get_all_scenarios(), args.presented, workers=1):
+        status = "✅ complying" if examination.complying else f"❌ {len(examination.discrepancies)} discrepancies"
+        print(f"\n{examination.scenario} (credit {examination.credit}, presented {examination.presented}): {status}")
+        for d in examination.discrepancies:
+            print(f"  - [{d.rule}, UCP 600 {d.article}] {d.document or '-'}: {d.message}")
+        for d in examination.unverified:
+            print(f"  ? [{d.rule}, UCP 600 {d.article}] {d.document or '-'}: {d.message}")
+        slowest = sorted(examination.timings.items(), key=lambda item: -item[1])[:3]
+        print("  slowest: " + ", ".join(f"{rule_id} {ns / 1000:.1f} µs" for rule_id, ns in slowest))
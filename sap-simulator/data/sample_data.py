@@ -16,8 +16,8 @@ from typing import Dict, List
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":  # python3 data/sample_data.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.sap_structures import (
     EKKO, EKPO, VBAK, VBAP, LIKP, LIPS, VBRK, VBRP,
@@ -204,6 +204,15 @@ MATERIALS: Dict[str, Material] = {
 }
 
 
+# ============================================================================
+# ORGANIZATION - Sales organization → company code (TVKO)
+# ============================================================================
+
+SALES_ORGANIZATIONS: Dict[str, str] = {
+    "1000": "1000",
+}
+
+
 # ============================================================================
 # SCENARIO 1: EU → Singapore Export (Machinery)
 # ============================================================================
@@ -621,6 +630,18 @@ def get_material(matnr: str) -> Material:
     return MATERIALS.get(matnr)
 
 
+def set_master_data(partners: Dict[str, Partner], materials: Dict[str, Material]) -> None:
+    """Replace the partner and material master data (e.g. from a data.store snapshot)
+
+    Updates PARTNERS and MATERIALS in place, so modules that imported
+    them see the new data.
+    """
+    PARTNERS.clear()
+    PARTNERS.update(partners)
+    MATERIALS.clear()
+    MATERIALS.update(materials)
+
+
 if __name__ == "__main__":
     # Demo: Print scenario summary
     for scenario in get_all_scenarios():
@@ -0,0 +1,587 @@
+"""
+Memory-Mapped Dataset Snapshots
+
+A snapshot holds a dataset of scenarios plus the partner and material
+master data in a file that is read through mmap, not loaded: opening
+one reads only a small directory, and records are decoded into the SAP
+dataclasses when a scenario is accessed. The pages are the operating
+system's page cache, so worker processes serving the same snapshot
+share one copy of the data.
+
+Layout (little-endian, sections 8-byte aligned):
+
+    preamble    magic, format version, directory offset and length
+    strings     count + 1 offsets (u64), then the UTF-8 data; numbered
+                most used first
+    lists       u32 string ids for List[str] fields
+    tables      one per dataclass: fixed-size records, one slot per field
+                  str / Decimal  u32 string id (Decimal as its exact text)
+                  date           i32 ordinal
+                  int            i64
+                  bool           u8
+                  List[str]      u32 start and count in lists
+                (all-ones / 0 / min int / 2 mark None)
+    scenarios   (id, skeleton, keys) string ids per scenario, then
+                positions sorted by id for lookup by binary search
+    directory   JSON: section offsets, each table's fields and slot types
+
+A scenario's skeleton is its dict with SAP records replaced by
+references ({"@": "VBRK", "i": 7}; lists of records are stored
+consecutively: {"@": "VBRP", "i": 12, "n": 3}). Snapshots are refused
+when the dataclass fields no longer match the tables they were written
+with.
+
+Decoded scenarios are kept in an LRU (the mapper's derived data cache is
+keyed by document identity), and the HOT_STRINGS most used strings
+(units, currencies, partner numbers) and their Decimal values once
+decoded; everything else stays in the mapping.
+
+Usage:
+    python3 data/snapshot.py write sap-sim.snap                 # sample data
+    python3 data/snapshot.py write big.snap --source mymodule:build_scenarios
+    python3 data/snapshot.py info sap-sim.snap
+    python3 data/snapshot.py verify sap-sim.snap [--source module:function]
+"""
+
+import dataclasses
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import typing
+from collections import Counter, OrderedDict
+from collections.abc import ItemsView, Mapping, ValuesView
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+if __name__ == "__main__":  # python3 data/snapshot.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import sap_structures
+from data.store import scenario_keys
+
+MAGIC = b"SAPSIMDB"
+FORMAT = 3  # 1 was the pickle snapshot; 2 had no scenario keys
+PREAMBLE = struct.Struct("<8sIIQQ")  # magic, format, reserved, directory offset, length
+_SPAN = struct.Struct("<QQ")  # a string's start and end in the string data
+_ROW = struct.Struct("<III")  # scenario id, skeleton, keys (string ids)
+
+NONE_ID = 0xFFFFFFFF
+NONE_INT = -2 ** 63
+NONE_BOOL = 2
+
+# Strings are numbered most used first; readers keep this many decoded
+HOT_STRINGS = 4096
+
+# Slot type → struct codes
+SLOTS = {"str": "I", "decimal": "I", "date": "i", "int": "q", "bool": "B", "list": "II"}
+
+SNAPSHOT_CLASSES = {
+    name: cls for name, cls in vars(sap_structures).items()
+    if dataclasses.is_dataclass(cls) and isinstance(cls, type) and cls.__module__ == sap_structures.__name__
+}
+
+
+class SnapshotError(ValueError):
+    """Snapshot file missing, damaged, or written for other SAP structures"""
+
+
+def _slot(annotation) -> str:
+    if typing.get_origin(annotation) is typing.Union:
+        arguments = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(arguments) == 1:
+            annotation = arguments[0]
+    if annotation is str:
+        return "str"
+    if annotation is Decimal:
+        return "decimal"
+    if annotation is date:
+        return "date"
+    if annotation is bool:
+        return "bool"
+    if annotation is int:
+        return "int"
+    if typing.get_origin(annotation) is list and typing.get_args(annotation) == (str,):
+        return "list"
+    raise SnapshotError(f"no snapshot slot for field type {annotation!r}")
+
+
+def layout(cls) -> List[List[str]]:
+    """[field name, slot type] per dataclass field, in constructor order"""
+    hints = typing.get_type_hints(cls)
+    return [[f.name, _slot(hints[f.name])] for f in dataclasses.fields(cls)]
+
+
+def _align(out: bytearray) -> int:
+    out.extend(b"\0" * (-len(out) % 8))
+    return len(out)
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+class _Writer:
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.lists: List[int] = []
+        self.records: Dict[str, List[Any]] = {}
+
+    def number_strings(self, others: List[str]) -> None:
+        """String ids by number of uses, most used first (readers keep the first HOT_STRINGS decoded)"""
+        uses = Counter()
+        for name, records in self.records.items():
+            fields = layout(SNAPSHOT_CLASSES[name])
+            for value in records:
+                for field_name, slot in fields:
+                    item = getattr(value, field_name)
+                    if item is None or slot in ("date", "int", "bool"):
+                        continue
+                    if slot == "list":
+                        uses.update(item)
+                    else:
+                        uses[item if slot == "str" else str(item)] += 1
+        uses.update(others)
+        self.strings = {value: index for index, (value, _) in enumerate(uses.most_common())}
+
+    def string(self, value: Optional[str]) -> int:
+        return NONE_ID if value is None else self.strings[value]
+
+    def record(self, value) -> int:
+        name = type(value).__name__
+        if SNAPSHOT_CLASSES.get(name) is not type(value):
+            raise SnapshotError(f"{name} is not an SAP structure from models.sap_structures")
+        records = self.records.setdefault(name, [])
+        records.append(value)
+        return len(records) - 1
+
+    def skeleton(self, value) -> Any:
+        if dataclasses.is_dataclass(value):
+            return {"@": type(value).__name__, "i": self.record(value)}
+        if isinstance(value, list) and value and dataclasses.is_dataclass(value[0]):
+            if any(type(item) is not type(value[0]) for item in value):
+                raise SnapshotError("a list of SAP records must hold one structure")
+            indexes = [self.record(item) for item in value]
+            return {"@": type(value[0]).__name__, "i": indexes[0], "n": len(indexes)}
+        if isinstance(value, dict):
+            if "@" in value:
+                raise SnapshotError("'@' is reserved in snapshot skeletons")
+            return {key: self.skeleton(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self.skeleton(item) for item in value]
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value
+        raise SnapshotError(f"cannot snapshot a {type(value).__name__} outside an SAP record")
+
+    def pack(self, name: str) -> bytes:
+        fields = layout(SNAPSHOT_CLASSES[name])
+        record = struct.Struct("<" + "".join(SLOTS[slot] for _, slot in fields))
+        out = bytearray(record.size * len(self.records[name]))
+        for position, value in enumerate(self.records[name]):
+            slots = []
+            for field_name, slot in fields:
+                item = getattr(value, field_name)
+                if slot == "str":
+                    slots.append(self.string(item))
+                elif slot == "decimal":
+                    slots.append(self.string(None if item is None else str(item)))
+                elif slot == "date":
+                    slots.append(0 if item is None else item.toordinal())
+                elif slot == "int":
+                    slots.append(NONE_INT if item is None else item)
+                elif slot == "bool":
+                    slots.append(NONE_BOOL if item is None else int(item))
+                elif item is None:
+                    slots.extend((NONE_ID, 0))
+                else:
+                    slots.extend((len(self.lists), len(item)))
+                    self.lists.extend(self.string(entry) for entry in item)
+            record.pack_into(out, position * record.size, *slots)
+        return bytes(out)
+
+
+def write(path: str, scenarios: List[Dict[str, Any]], partners: Dict[str, Any],
+          materials: Dict[str, Any]) -> int:
+    """Write a snapshot (atomically); returns its size in bytes"""
+    writer = _Writer()
+    skeletons = []
+    for scenario in scenarios:
+        skeletons.append((scenario["scenario"], json.dumps(writer.skeleton(scenario), separators=(",", ":"))))
+    if len({scenario_id for scenario_id, _ in skeletons}) != len(skeletons):
+        raise SnapshotError("scenario ids are not unique")
+    keys_json = [json.dumps(scenario_keys(scenario), separators=(",", ":")) for scenario in scenarios]
+    master = json.dumps(writer.skeleton({"partners": partners, "materials": materials}),
+                        separators=(",", ":"))
+    writer.number_strings([value for skeleton in skeletons for value in skeleton] + keys_json + [master])
+    rows = [(writer.string(scenario_id), writer.string(skeleton), writer.string(keys))
+            for (scenario_id, skeleton), keys in zip(skeletons, keys_json)]
+    master_id = writer.string(master)
+    tables = {name: writer.pack(name) for name in writer.records}
+
+    out = bytearray(PREAMBLE.size)
+    directory: Dict[str, Any] = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "master": master_id,
+    }
+
+    encoded = [value.encode("utf-8") for value in writer.strings]
+    directory["strings"] = {"offset": _align(out), "count": len(encoded)}
+    offsets, total = [], 0
+    for value in encoded:
+        offsets.append(total)
+        total += len(value)
+    offsets.append(total)
+    out += struct.pack(f"<{len(offsets)}Q", *offsets)
+    out += b"".join(encoded)
+
+    directory["lists"] = {"offset": _align(out), "count": len(writer.lists)}
+    out += struct.pack(f"<{len(writer.lists)}I", *writer.lists)
+
+    directory["tables"] = {}
+    for name, data in tables.items():
+        directory["tables"][name] = {"offset": _align(out), "count": len(writer.records[name]),
+                                     "fields": layout(SNAPSHOT_CLASSES[name])}
+        out += data
+
+    directory["scenarios"] = {"offset": _align(out), "count": len(rows)}
+    out += b"".join(_ROW.pack(*row) for row in rows)
+    order = sorted(range(len(rows)), key=lambda position: scenarios[position]["scenario"])
+    directory["scenarios"]["index"] = _align(out)
+    out += struct.pack(f"<{len(order)}I", *order)
+
+    directory_offset = _align(out)
+    data = json.dumps(directory).encode("utf-8")
+    out += data
+    PREAMBLE.pack_into(out, 0, MAGIC, FORMAT, 0, directory_offset, len(data))
+
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as f:
+        f.write(out)
+    os.replace(temporary, path)
+    return len(out)
+
+
+# ============================================================================
+# Reading
+# ============================================================================
+
+def _decoder(cls, fields: List[List[str]]) -> Callable:
+    """Straight-line decode function for one table (raw slots → dataclass)"""
+    arguments, position = [], 0
+    for _, slot in fields:
+        value = f"raw[{position}]"
+        if slot == "str":
+            arguments.append(f"None if {value} == NONE_ID else string({value})")
+        elif slot == "decimal":
+            arguments.append(f"None if {value} == NONE_ID else decimal({value})")
+        elif slot == "date":
+            arguments.append(f"None if {value} == 0 else fromordinal({value})")
+        elif slot == "int":
+            arguments.append(f"None if {value} == NONE_INT else {value}")
+        elif slot == "bool":
+            arguments.append(f"None if {value} == NONE_BOOL else {value} == 1")
+        else:
+            arguments.append(f"None if {value} == NONE_ID else strings({value}, raw[{position + 1}])")
+            position += 1
+        position += 1
+    source = f"def decode(raw, string, decimal, strings):\n    return cls({', '.join(arguments)})\n"
+    namespace = {"cls": cls, "fromordinal": date.fromordinal,
+                 "NONE_ID": NONE_ID, "NONE_INT": NONE_INT, "NONE_BOOL": NONE_BOOL}
+    exec(compile(source, f"<snapshot {cls.__name__}>", "exec"), namespace)
+    return namespace["decode"]
+
+
+class _Table:
+    """Decoder for one record table"""
+
+    def __init__(self, snapshot: 'Snapshot', name: str, entry: Dict[str, Any]):
+        cls = SNAPSHOT_CLASSES.get(name)
+        if cls is None or layout(cls) != entry["fields"]:
+            raise SnapshotError(f"{snapshot.path}: table {name} was written for other SAP structures; "
+                                f"rewrite the snapshot")
+        self.cls = cls
+        self.offset = entry["offset"]
+        self.count = entry["count"]
+        self.record = struct.Struct("<" + "".join(SLOTS[slot] for _, slot in entry["fields"]))
+        self._decode = _decoder(cls, entry["fields"])
+
+    def decode(self, snapshot: 'Snapshot', index: int):
+        if not 0 <= index < self.count:
+            raise SnapshotError(f"{snapshot.path}: {self.cls.__name__} record {index} out of range")
+        raw = self.record.unpack_from(snapshot._map, self.offset + index * self.record.size)
+        return self._decode(raw, snapshot.string, snapshot.decimal, snapshot._list)
+
+
+class Snapshot(Mapping):
+    """Scenario id → scenario dict, decoded from a memory-mapped snapshot on access"""
+
+    def __init__(self, path: str, cache_size: int = 256):
+        self.path = path
+        self.cache_size = cache_size
+        try:
+            with open(path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise SnapshotError(f"cannot map snapshot {path}: {e}") from e
+        try:
+            magic, version, _, offset, length = PREAMBLE.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise SnapshotError(f"{path} is not a simulator snapshot")
+            if version != FORMAT:
+                raise SnapshotError(f"{path} has snapshot format {version}, expected {FORMAT}")
+            directory = json.loads(self._map[offset:offset + length])
+        except (struct.error, ValueError) as e:
+            self._map.close()
+            raise SnapshotError(f"damaged snapshot {path}: {e}") from e
+        self.created: str = directory["created"]
+        self.size = len(self._map)
+        strings = directory["strings"]
+        self._strings_offset = strings["offset"]
+        self._strings_count = strings["count"]
+        self._strings_data = strings["offset"] + 8 * (strings["count"] + 1)
+        self._hot: List[Optional[str]] = [None] * min(HOT_STRINGS, self._strings_count)
+        self._hot_decimals: List[Optional[Decimal]] = [None] * min(HOT_STRINGS, self._strings_count)
+        self._lists_offset = directory["lists"]["offset"]
+        self._tables = {name: _Table(self, name, entry) for name, entry in directory["tables"].items()}
+        scenarios = directory["scenarios"]
+        self._scenarios_offset = scenarios["offset"]
+        self._index_offset = scenarios["index"]
+        self._count = scenarios["count"]
+        self._master = directory["master"]
+        self._cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Primitives
+    # ------------------------------------------------------------------
+
+    def string(self, index: int) -> str:
+        if index < HOT_STRINGS:
+            value = self._hot[index]
+            if value is not None:
+                return value
+        start, end = _SPAN.unpack_from(self._map, self._strings_offset + 8 * index)
+        value = str(self._map[self._strings_data + start:self._strings_data + end], "utf-8")
+        if index < HOT_STRINGS:
+            self._hot[index] = value
+        return value
+
+    def decimal(self, index: int) -> Decimal:
+        if index < HOT_STRINGS:
+            value = self._hot_decimals[index]
+            if value is None:
+                value = self._hot_decimals[index] = Decimal(self.string(index))
+            return value
+        return Decimal(self.string(index))
+
+    def _list(self, start: int, count: int) -> List[str]:
+        ids = struct.unpack_from(f"<{count}I", self._map, self._lists_offset + 4 * start)
+        return [self.string(index) for index in ids]
+
+    def _resolve(self, value) -> Any:
+        if isinstance(value, dict):
+            name = value.get("@")
+            if name is None:
+                return {key: self._resolve(item) for key, item in value.items()}
+            table = self._tables[name]
+            if "n" in value:
+                return [table.decode(self, index) for index in range(value["i"], value["i"] + value["n"])]
+            return table.decode(self, value["i"])
+        if isinstance(value, list):
+            return [self._resolve(item) for item in value]
+        return value
+
+    # ------------------------------------------------------------------
+    # Scenarios
+    # ------------------------------------------------------------------
+
+    def _row(self, position: int) -> Tuple[int, int, int]:
+        return _ROW.unpack_from(self._map, self._scenarios_offset + _ROW.size * position)
+
+    def scenario_id(self, position: int) -> str:
+        return self.string(self._row(position)[0])
+
+    def position(self, scenario_id: str) -> Optional[int]:
+        """File position of a scenario (binary search over the sorted index)"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = struct.unpack_from("<I", self._map, self._index_offset + 4 * middle)[0]
+            if self.scenario_id(candidate) < scenario_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            candidate = struct.unpack_from("<I", self._map, self._index_offset + 4 * low)[0]
+            if self.scenario_id(candidate) == scenario_id:
+                return candidate
+        return None
+
+    def keys(self, position: int) -> Dict[str, str]:
+        """data.store.scenario_keys of a scenario, as written (nothing is decoded)"""
+        return json.loads(self.string(self._row(position)[2]))
+
+    def document_keys(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        return ((self.scenario_id(position), self.keys(position)) for position in range(self._count))
+
+    def scenario(self, position: int) -> Dict[str, Any]:
+        return self._decoded(self.scenario_id(position), position)
+
+    def _cached(self, scenario_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            scenario = self._cache.get(scenario_id)
+            if scenario is not None:
+                self._cache.move_to_end(scenario_id)
+                self.hits += 1
+            return scenario
+
+    def _decoded(self, scenario_id: str, position: int) -> Dict[str, Any]:
+        scenario = self._cached(scenario_id)
+        if scenario is not None:
+            return scenario
+        scenario = self._resolve(json.loads(self.string(self._row(position)[1])))
+        with self._lock:
+            self.misses += 1
+            # Another thread may have decoded it meanwhile; keep one object per scenario
+            scenario = self._cache.setdefault(scenario_id, scenario)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return scenario
+
+    def __getitem__(self, scenario_id: str) -> Dict[str, Any]:
+        scenario = self._cached(scenario_id)
+        if scenario is not None:
+            return scenario
+        position = self.position(scenario_id)
+        if position is None:
+            raise KeyError(scenario_id)
+        return self._decoded(scenario_id, position)
+
+    def __contains__(self, scenario_id) -> bool:
+        return isinstance(scenario_id, str) and self.position(scenario_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.scenario_id(position) for position in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> '_Items':
+        return _Items(self)
+
+    def values(self) -> '_Values':
+        return _Values(self)
+
+    # ------------------------------------------------------------------
+
+    def master_data(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """(partners, materials), decoded in full"""
+        master = self._resolve(json.loads(self.string(self._master)))
+        return master["partners"], master["materials"]
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "created": self.created,
+            "bytes": self.size,
+            "scenarios": self._count,
+            "strings": self._strings_count,
+            "records": {name: table.count for name, table in self._tables.items()},
+        }
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self._map.close()
+
+
+class _Items(ItemsView):
+    def __iter__(self):
+        snapshot = self._mapping
+        for position in range(len(snapshot)):
+            scenario_id = snapshot.scenario_id(position)
+            yield scenario_id, snapshot._decoded(scenario_id, position)
+
+
+class _Values(ValuesView):
+    def __iter__(self):
+        snapshot = self._mapping
+        for position in range(len(snapshot)):
+            yield snapshot.scenario(position)
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def load_source(source: str) -> Callable[[], List[Dict[str, Any]]]:
+    """`module:function` → the function (called without arguments)"""
+    import importlib
+
+    module, _, name = source.partition(":")
+    if not name:
+        raise SnapshotError(f"source {source!r} is not module:function")
+    return getattr(importlib.import_module(module), name)
+
+
+def _source_data(source: str):
+    from data import sample_data
+
+    scenarios = load_source(source)()
+    # The source may have replaced the master data (sample_data.set_master_data)
+    return scenarios, sample_data.PARTNERS, sample_data.MATERIALS
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Write, describe and verify simulator dataset snapshots")
+    parser.add_argument("command", choices=("write", "info", "verify"))
+    parser.add_argument("path")
+    parser.add_argument("--source", default="data.sample_data:get_all_scenarios",
+                        help="module:function returning the scenarios (default: the sample data)")
+    args = parser.parse_args()
+    try:
+        if args.command == "write":
+            start = time.perf_counter()
+            scenarios, partners, materials = _source_data(args.source)
+            size = write(args.path, scenarios, partners, materials)
+            print(f"Wrote {args.path}: {len(scenarios):,} scenarios, {size:,} bytes "
+                  f"in {time.perf_counter() - start:.2f} s")
+        elif args.command == "info":
+            snapshot = Snapshot(args.path)
+            info = snapshot.info()
+            print(f"{info['path']}: format {FORMAT}, written {info['created']}, {info['bytes']:,} bytes")
+            print(f"  {info['scenarios']:,} scenarios, {info['strings']:,} distinct strings")
+            for name, count in info["records"].items():
+                print(f"  {name:8s} {count:>9,} records")
+        else:
+            snapshot = Snapshot(args.path)
+            start = time.perf_counter()
+            decoded = {scenario_id: scenario for scenario_id, scenario in snapshot.items()}
+            partners, materials = snapshot.master_data()
+            elapsed = time.perf_counter() - start
+            if any(keys != scenario_keys(decoded[scenario_id]) for scenario_id, keys in snapshot.document_keys()):
+                print(f"❌ {args.path}: scenario keys differ from the scenarios")
+                sys.exit(1)
+            if "--source" in sys.argv:
+                scenarios, expected_partners, expected_materials = _source_data(args.source)
+                expected = {scenario["scenario"]: scenario for scenario in scenarios}
+                if (decoded != expected or partners != dict(expected_partners)
+                        or materials != dict(expected_materials)):
+                    print(f"❌ {args.path} differs from {args.source}")
+                    sys.exit(1)
+            print(f"✅ {len(decoded):,} scenarios, {len(partners)} partners, {len(materials)} materials "
+                  f"decoded in {elapsed:.2f} s")
+    except SnapshotError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
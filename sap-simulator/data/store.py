@@ -0,0 +1,136 @@
+"""
+Simulated SAP Database
+
+DataStore holds the scenarios the API serves and is loaded on first
+access, not at import: starting the API and answering a request that
+needs no SAP data (health, metrics, static artifacts) never builds it.
+The data comes from data.sample_data, or from a memory-mapped snapshot
+(data/snapshot.py) when SAP_SIM_SNAPSHOT names one. A snapshot is not
+read into memory: scenarios are decoded when requested, and worker
+processes serving the same file share its pages.
+
+Each scenario also has keys: its company code (BUKRS) and document
+numbers, which api/tenancy.py partitions and indexes by. A snapshot
+stores them beside each scenario, so the index is built without
+decoding any.
+
+Usage:
+    python3 data/snapshot.py write /tmp/sap-sim.snap
+    SAP_SIM_SNAPSHOT=/tmp/sap-sim.snap python3 api/sap_api.py
+"""
+
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+SNAPSHOT_ENV = "SAP_SIM_SNAPSHOT"
+
+# Scenario document → where its number is (record key, or None for the
+# document itself) and the number field
+DOCUMENT_NUMBERS = {
+    "purchase_order": ("header", "EBELN"),
+    "sales_order": ("header", "VBELN"),
+    "delivery": ("header", "VBELN"),
+    "invoice": ("header", "VBELN"),
+    "documentary_credit": (None, "LCNUM"),
+}
+
+
+def company_code(scenario: Dict[str, Any]) -> str:
+    """BUKRS of a scenario: the purchase order's, else its sales organization's"""
+    from data.sample_data import SALES_ORGANIZATIONS
+
+    if "purchase_order" in scenario:
+        return scenario["purchase_order"]["header"].BUKRS
+    if "sales_order" in scenario:
+        return SALES_ORGANIZATIONS.get(scenario["sales_order"]["header"].VKORG, "")
+    return ""
+
+
+def scenario_keys(scenario: Dict[str, Any]) -> Dict[str, str]:
+    """Company code and document numbers of a scenario"""
+    keys = {"company_code": company_code(scenario)}
+    for document, (record, field) in DOCUMENT_NUMBERS.items():
+        if document in scenario:
+            value = scenario[document] if record is None else scenario[document][record]
+            keys[document] = getattr(value, field)
+    return keys
+
+
+class DataStore:
+    """Scenarios by id, built (or mapped from a snapshot) on first access"""
+
+    def __init__(self, snapshot: Optional[str] = None):
+        self.snapshot = snapshot
+        self.source: Optional[str] = None
+        self._scenarios: Optional[Mapping] = None
+        self._lock = threading.Lock()
+        self.scenarios = _ScenarioView(self)
+
+    @classmethod
+    def from_environment(cls) -> 'DataStore':
+        return cls(os.environ.get(SNAPSHOT_ENV) or None)
+
+    @property
+    def loaded(self) -> bool:
+        return self._scenarios is not None
+
+    def load(self) -> Mapping:
+        """Scenario id → scenario: a dict, or the open data.snapshot.Snapshot"""
+        scenarios = self._scenarios
+        if scenarios is None:
+            with self._lock:
+                scenarios = self._scenarios
+                if scenarios is None:
+                    scenarios = self._scenarios = self._build()
+        return scenarios
+
+    def _build(self) -> Mapping:
+        from data import sample_data
+
+        if self.snapshot:
+            from data.snapshot import Snapshot
+
+            snapshot = Snapshot(self.snapshot)
+            sample_data.set_master_data(*snapshot.master_data())
+            self.source = f"snapshot {self.snapshot} ({snapshot.created})"
+            return snapshot
+        self.source = "data.sample_data"
+        return {scenario["scenario"]: scenario for scenario in sample_data.get_all_scenarios()}
+
+    def document_keys(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """(scenario id, scenario_keys) for every scenario, in store order"""
+        scenarios = self.load()
+        if isinstance(scenarios, dict):
+            return ((scenario_id, scenario_keys(scenario)) for scenario_id, scenario in scenarios.items())
+        return scenarios.document_keys()
+
+
+class _ScenarioView(Mapping):
+    """Read-only dict view of a DataStore; the first lookup loads it"""
+
+    def __init__(self, store: DataStore):
+        self._store = store
+
+    def __getitem__(self, scenario_id: str) -> Dict[str, Any]:
+        return self._store.load()[scenario_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.load())
+
+    def __len__(self) -> int:
+        return len(self._store.load())
+
+    def __contains__(self, scenario_id) -> bool:
+        return scenario_id in self._store.load()
+
+    # The backend's own views: a snapshot decodes in file order, without a lookup per key
+    def items(self):
+        return self._store.load().items()
+
+    def values(self):
+        return self._store.load().values()
+
+    def keys(self):
+        return self._store.load().keys()
@@ -0,0 +1,370 @@
+"""
+Exact Amount Arithmetic
+
+Monetary and quantity values stay Decimal end to end; nothing goes
+through float. A document's amounts are processed as columns: line
+amounts (quantity × price / price unit), rounding to the currency's
+decimals, tax and per-currency totals run as map() pipelines over the
+columns, so the per-line loop executes inside the C decimal module, under
+a context wide enough that sums never round.
+
+Results are canonical decimal strings with the currency's number of
+decimals ("125000.00", "1500" for JPY). Strings are also the right
+JSON-LD form: the KTDDE contexts type amountValue as xsd:decimal, and a
+JSON number would become a double lexical value.
+
+Amount fields (CURR) with more decimals than their currency allows are
+not rounded silently: the document functions round them half-even to the
+currency and record a mismatch, which DocumentAmounts.check() (the
+mapper's strict_totals) raises as AmountError. Computed line amounts are
+rounded half away from zero, as SAP does. Documents are validated by
+comparing header totals (EKKO-KTWRT, VBRK-NETWR, VBRK-MWSBK) with the
+summed lines; given an fx.RateTable, lines in another currency are
+converted at the document date first. credit_coverage() checks an
+invoice against its documentary credit, in either currency.
+
+Usage:
+    python3 mappings/amounts.py          # validate the sample scenarios
+"""
+
+import decimal
+import operator
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from itertools import compress, repeat
+from typing import Dict, List, Optional
+import sys
+import os
+
+if __name__ == "__main__":  # python3 mappings/amounts.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.sap_structures import EKKO, EKPO, VBRK, VBRP, ZBANKF
+
+# ISO 4217 minor units that differ from 2
+CURRENCY_DECIMALS = {
+    "JPY": 0, "KRW": 0, "CLP": 0, "ISK": 0, "VND": 0, "XOF": 0, "XAF": 0,
+    "BHD": 3, "IQD": 3, "JOD": 3, "KWD": 3, "LYD": 3, "OMR": 3, "TND": 3,
+}
+DEFAULT_CURRENCY_DECIMALS = 2
+
+# 60 digits: sums of any realistic number of CURR 23,2 values stay exact
+CONTEXT = decimal.Context(prec=60, rounding=decimal.ROUND_HALF_UP,
+                          traps=[decimal.InvalidOperation, decimal.DivisionByZero,
+                                 decimal.Overflow])
+ZERO = Decimal(0)
+ONE = Decimal(1)
+
+_QUANTA: Dict[Optional[str], Decimal] = {}
+
+
+class AmountError(ValueError):
+    """Amount with too many decimals, or header totals that do not match the lines"""
+
+
+def currency_decimals(currency: Optional[str]) -> int:
+    return CURRENCY_DECIMALS.get((currency or "").upper(), DEFAULT_CURRENCY_DECIMALS)
+
+
+def quantum(currency: Optional[str]) -> Decimal:
+    """Smallest unit of a currency as a Decimal exponent (0.01 for EUR)"""
+    unit = _QUANTA.get(currency)
+    if unit is None:
+        unit = _QUANTA[currency] = ONE.scaleb(-currency_decimals(currency))
+    return unit
+
+
+# ============================================================================
+# Columns
+# ============================================================================
+
+def round_column(values: List[Decimal], currencies: List[str]) -> List[Decimal]:
+    """Round each value to its currency's decimals (half away from zero)"""
+    if currencies.count(currencies[0]) == len(currencies):
+        return list(map(CONTEXT.quantize, values, repeat(quantum(currencies[0]))))
+    return list(map(CONTEXT.quantize, values, map(quantum, currencies)))
+
+
+def exact_column(values: List[Optional[Decimal]], currencies: List[str], name: str,
+                 mismatches: Optional[List[str]] = None) -> List[Decimal]:
+    """
+    Amount field column in canonical form. A value with more decimals than
+    its currency allows raises AmountError, or, given a mismatches list, is
+    rounded half-even to the currency and reported there.
+    """
+    if not values:
+        return []
+    if not all(map(operator.is_not, values, repeat(None))):  # `None in` calls Decimal.__eq__
+        values = [ZERO if value is None else value for value in values]
+    rounded = round_column(values, currencies)
+    if not all(map(operator.eq, rounded, values)):
+        if mismatches is None:
+            bad = next(value for value, exact in zip(values, rounded) if value != exact)
+            raise AmountError(f"{name} {bad} has more decimals than its currency allows")
+        for row, (value, exact) in enumerate(zip(values, rounded)):
+            if value != exact:
+                rounded[row] = value.quantize(quantum(currencies[row]), rounding=decimal.ROUND_HALF_EVEN,
+                                              context=CONTEXT)
+                mismatches.append(f"{name} {value} has more decimals than {currencies[row]} allows, "
+                                  f"rounded to {rounded[row]}")
+    return rounded
+
+
+def line_amounts(quantities: List[Decimal], prices: List[Decimal],
+                 price_units: List[Decimal], currencies: List[str]) -> List[Decimal]:
+    """quantity × price / price unit, rounded to the currency"""
+    if not quantities:
+        return []
+    products = list(map(CONTEXT.multiply, quantities, prices))
+    if price_units.count(ONE) != len(price_units):
+        if not all(map(operator.gt, price_units, repeat(ZERO))):
+            raise AmountError("price unit must be positive")
+        # Division is the costliest step; most lines are priced per 1
+        for row in compress(range(len(products)), map(operator.ne, price_units, repeat(ONE))):
+            products[row] = CONTEXT.divide(products[row], price_units[row])
+    return round_column(products, currencies)
+
+
+def total(values: List[Decimal]) -> Decimal:
+    """Exact sum of a column"""
+    with decimal.localcontext(CONTEXT):
+        return sum(values, ZERO)
+
+
+def format_amount(value: Optional[Decimal], currency: Optional[str]) -> Optional[str]:
+    """One Decimal → canonical string with the currency's decimals"""
+    if value is None:
+        return None
+    return str(CONTEXT.quantize(value, quantum(currency)))
+
+
+# ============================================================================
+# Document amounts
+# ============================================================================
+
+@dataclass
+class DocumentAmounts:
+    """Canonical line amounts, totals per currency and header checks"""
+    currency: str
+    lines: List[str]  # line net amounts, in document order
+    prices: List[str] = field(default_factory=list)  # unit prices (purchase orders)
+    net: str = "0"  # summed lines in the header currency
+    tax: Optional[str] = None  # summed line tax in the header currency
+    header_net: Optional[str] = None
+    header_tax: Optional[str] = None
+    totals: Dict[str, str] = field(default_factory=dict)  # currency → summed lines
+    converted: Dict[str, str] = field(default_factory=dict)  # foreign lines in the header currency
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.mismatches
+
+    def check(self) -> 'DocumentAmounts':
+        """Raise AmountError when header totals do not match the lines"""
+        if self.mismatches:
+            raise AmountError("; ".join(self.mismatches))
+        return self
+
+
+def _totals(currencies: List[str], amounts: List[Decimal]) -> Dict[str, Decimal]:
+    if not currencies:
+        return {}
+    if currencies.count(currencies[0]) == len(currencies):
+        return {currencies[0]: total(amounts)}
+    totals: Dict[str, Decimal] = {}
+    with decimal.localcontext(CONTEXT):
+        for currency, amount in zip(currencies, amounts):
+            totals[currency] = totals.get(currency, ZERO) + amount
+    return totals
+
+
+def _foreign(currency: str, currencies: List[str], amounts: List[Decimal],
+             rates, on: date) -> Dict[str, Decimal]:
+    """Lines not in the document currency, converted per line and summed per currency"""
+    rows = [row for row, code in enumerate(currencies) if code != currency]
+    sources = [currencies[row] for row in rows]
+    converted = rates.convert_many([amounts[row] for row in rows], sources, currency, on)
+    return _totals(sources, converted)
+
+
+def _document(document: str, currency: str, currencies: List[str], amounts: List[Decimal],
+              taxes: Optional[List[Decimal]], header_net: Optional[Decimal],
+              header_tax: Optional[Decimal], rates=None, on: Optional[date] = None,
+              mismatches: Optional[List[str]] = None) -> DocumentAmounts:
+    unit = quantum(currency)
+    totals = _totals(currencies, amounts)
+    foreign = sorted(code for code in totals if code != currency)
+    convert = bool(foreign) and rates is not None
+    net = totals.get(currency, ZERO)
+    result = DocumentAmounts(
+        currency=currency,
+        lines=list(map(str, amounts)),
+        totals={code: str(CONTEXT.quantize(value, quantum(code))) for code, value in totals.items()},
+        mismatches=[f"{document}: {mismatch}" for mismatch in mismatches or ()],
+    )
+    if convert:
+        try:
+            converted = _foreign(currency, currencies, amounts, rates, on)
+        except ValueError as e:  # fx.FXError (fx imports this module): no rate, or a stale one
+            result.mismatches.append(f"{document}: {e}")
+            convert = False
+    if convert:
+        result.converted = {code: str(value) for code, value in sorted(converted.items())}
+        net = CONTEXT.add(net, total(list(converted.values())))
+    net = CONTEXT.quantize(net, unit)
+    result.net = str(net)
+    checks = [("net value", "header_net", header_net, net)]
+    if taxes is not None:
+        tax = _totals(currencies, taxes).get(currency, ZERO)
+        if convert:
+            tax = CONTEXT.add(tax, total(list(_foreign(currency, currencies, taxes, rates, on).values())))
+        tax = CONTEXT.quantize(tax, unit)
+        result.tax = str(tax)
+        checks.append(("tax amount", "header_tax", header_tax, tax))
+
+    for label, attribute, header_value, summed in checks:
+        if header_value is None:
+            continue
+        expected = CONTEXT.quantize(header_value, unit)
+        setattr(result, attribute, str(expected))
+        if expected != header_value:
+            result.mismatches.append(
+                f"{document}: header {label} {header_value} has more decimals than {currency} allows")
+        elif expected != summed:
+            result.mismatches.append(
+                f"{document}: header {label} {expected} {currency} != sum of lines {summed} {currency}")
+
+    if foreign and not convert:
+        result.mismatches.append(f"{document}: lines in {', '.join(foreign)}, header in {currency}")
+    return result
+
+
+def purchase_order_amounts(header: EKKO, items: List[EKPO], rates=None) -> DocumentAmounts:
+    """EKPO line values (MENGE × NETPR / PEINH) checked against EKKO-KTWRT"""
+    currencies = [item.WAERS or header.WAERS for item in items]
+    rounded: List[str] = []
+    prices = exact_column(list(map(operator.attrgetter("NETPR"), items)), currencies, "EKPO-NETPR", rounded)
+    amounts = line_amounts(list(map(operator.attrgetter("MENGE"), items)), prices,
+                           list(map(operator.attrgetter("PEINH"), items)), currencies)
+    result = _document(f"purchase order {header.EBELN}", header.WAERS, currencies,
+                       amounts, None, header.KTWRT, None, rates, header.AEDAT, rounded)
+    result.prices = list(map(str, prices))
+    return result
+
+
+def invoice_amounts(header: VBRK, items: List[VBRP], rates=None) -> DocumentAmounts:
+    """VBRP net and tax values checked against VBRK-NETWR / VBRK-MWSBK"""
+    currencies = [item.WAERK or header.WAERK for item in items]
+    rounded: List[str] = []
+    return _document(f"invoice {header.VBELN}", header.WAERK, currencies,
+                     exact_column(list(map(operator.attrgetter("NETWR"), items)),
+                                  currencies, "VBRP-NETWR", rounded),
+                     exact_column(list(map(operator.attrgetter("MWSBP"), items)),
+                                  currencies, "VBRP-MWSBP", rounded),
+                     header.NETWR, header.MWSBK, rates, header.FKDAT, rounded)
+
+
+# ============================================================================
+# Invoice against documentary credit
+# ============================================================================
+
+@dataclass
+class CreditCoverage:
+    """Invoice total in the credit currency, compared with the credit amount"""
+    credit: str
+    invoice: str
+    currency: str  # credit currency
+    credit_amount: str
+    invoice_amount: str  # net + tax, in the invoice currency
+    invoice_currency: str
+    converted_amount: Optional[str] = None  # in the credit currency
+    rate: Optional[str] = None  # invoice → credit currency
+    fixing_date: Optional[str] = None
+    remaining: Optional[str] = None  # credit amount (with tolerance) minus invoice
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.mismatches
+
+
+def credit_coverage(credit: ZBANKF, invoice: VBRK, rates=None,
+                    tolerance: Decimal = ZERO) -> CreditCoverage:
+    """
+    Check that an invoice does not exceed its documentary credit
+
+    The invoice total (VBRK-NETWR + MWSBK) is converted to the credit
+    currency at the billing date when the currencies differ. tolerance is
+    a fraction of the credit amount, e.g. Decimal("0.10") for credits
+    stated as "about" an amount (UCP 600 article 30a).
+    """
+    invoice_total = CONTEXT.add(invoice.NETWR, invoice.MWSBK)
+    result = CreditCoverage(
+        credit=credit.LCNUM, invoice=invoice.VBELN, currency=credit.LCCURRENCY,
+        credit_amount=format_amount(credit.LCAMOUNT, credit.LCCURRENCY),
+        invoice_amount=format_amount(invoice_total, invoice.WAERK),
+        invoice_currency=invoice.WAERK,
+    )
+    if invoice.LCNUM and invoice.LCNUM != credit.LCNUM:
+        result.mismatches.append(f"invoice {invoice.VBELN} refers to credit {invoice.LCNUM}")
+
+    if invoice.WAERK == credit.LCCURRENCY:
+        converted = invoice_total
+    elif rates is None:
+        result.mismatches.append(f"invoice in {invoice.WAERK}, credit in {credit.LCCURRENCY}"
+                                 " and no exchange rates")
+        return result
+    else:
+        rate = rates.rate(invoice.WAERK, credit.LCCURRENCY, invoice.FKDAT)
+        converted = rates.convert(invoice_total, invoice.WAERK, credit.LCCURRENCY, invoice.FKDAT)
+        result.rate, result.fixing_date = str(rate.value), rate.fixing_date.isoformat()
+
+    limit = CONTEXT.quantize(CONTEXT.multiply(credit.LCAMOUNT, CONTEXT.add(ONE, tolerance)),
+                             quantum(credit.LCCURRENCY))
+    result.converted_amount = format_amount(converted, credit.LCCURRENCY)
+    result.remaining = format_amount(CONTEXT.subtract(limit, converted), credit.LCCURRENCY)
+    if converted > limit:
+        result.mismatches.append(
+            f"invoice {invoice.VBELN}: {result.converted_amount} {credit.LCCURRENCY} exceeds "
+            f"credit {credit.LCNUM} ({limit} {credit.LCCURRENCY})")
+    return result
+
+if __name__ == "__main__":
+    import dataclasses
+    from data.sample_data import get_all_scenarios
+    from mappings.fx import default_rates
+
+    for scenario in get_all_scenarios():
+        print(f"\n{scenario['scenario']}")
+        checks = []
+        if "purchase_order" in scenario:
+            po = scenario["purchase_order"]
+            checks.append(purchase_order_amounts(po["header"], po["items"]))
+        invoice = scenario["invoice"]
+        checks.append(invoice_amounts(invoice["header"], invoice["items"]))
+        coverage = credit_coverage(scenario["documentary_credit"], invoice["header"])
+        for amounts in checks:
+            status = "✅" if amounts.valid else "❌"
+            print(f"  {status} lines {amounts.lines} → {amounts.net} {amounts.currency}"
+                  f" (header {amounts.header_net})")
+            for mismatch in amounts.mismatches:
+                print(f"     {mismatch}")
+        status = "✅" if coverage.valid else "❌"
+        print(f"  {status} credit {coverage.credit}: {coverage.converted_amount} of "
+              f"{coverage.credit_amount} {coverage.currency} drawn")
+        for mismatch in coverage.mismatches:
+            print(f"     {mismatch}")
+
+    # The Japan invoice (EUR) against a credit opened in yen, dated within
+    # the sample rates (default_rates() refuses fixings over a week old)
+    scenario = get_all_scenarios()[1]
+    invoice = dataclasses.replace(scenario["invoice"]["header"], FKDAT=date(2024, 12, 20))
+    credit = dataclasses.replace(scenario["documentary_credit"], LCCURRENCY="JPY",
+                                 LCAMOUNT=Decimal("15000000"))
+    coverage = credit_coverage(credit, invoice, default_rates())
+    status = "✅" if coverage.valid else "❌"
+    print(f"\n{status} EUR invoice {coverage.invoice_amount} → {coverage.converted_amount} JPY "
+          f"(rate {coverage.rate}, fixing {coverage.fixing_date}), "
+          f"{coverage.remaining} JPY of credit {credit.LCAMOUNT} JPY left")
@@ -0,0 +1,206 @@
+"""
+Derived Shipment Data
+
+Aggregates that several credentials of one shipment need (total weights,
+package count, origin countries, HS codes, per-line values) computed from
+LIKP/LIPS and VBRK/VBRP. DerivedDataCache memoizes them per scenario, so
+issuing the packing list, insurance certificate and customs declaration
+for a shipment computes each aggregate once instead of once per document.
+The mapper keeps each document's exact amounts (mappings/amounts.py) in
+the same cache, so mapping a document again skips the Decimal arithmetic.
+
+Entries are keyed by the identity of the SAP document objects (the
+simulated SAP database keeps one object per document), and hold
+references to them so an id cannot be reused while cached.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from models.sap_structures import LIKP, LIPS, VBRK, VBRP
+from data.sample_data import get_material
+
+# Weight units → kilograms
+WEIGHT_FACTORS = {
+    "KG": Decimal("1"),
+    "G": Decimal("0.001"),
+    "TO": Decimal("1000"),
+    "LB": Decimal("0.45359237"),
+}
+
+# Units packed piece by piece; other units are one package per line.
+# Handling units (VEKP/VEPO) are not simulated.
+PIECE_UNITS = ("EA", "PC", "ST")
+
+# Incoterms under which the seller must insure the goods (Incoterms 2020),
+# for at least 110% of the contract value
+INSURED_INCOTERMS = ("CIF", "CIP")
+INSURANCE_MARGIN = Decimal("1.10")
+
+
+@dataclass(frozen=True)
+class ShipmentLine:
+    """One delivery line with master data and invoice value resolved"""
+    line_number: int
+    material: Optional[str]
+    description: str
+    quantity: Decimal
+    unit: str
+    gross_weight: Decimal  # line total, KG
+    net_weight: Decimal  # line total, KG
+    packages: int
+    origin_country: Optional[str]
+    hs_code: Optional[str]
+    value: Optional[Decimal]  # pro rata share of the invoiced amount
+    currency: Optional[str]
+
+
+@dataclass(frozen=True)
+class ShipmentAggregates:
+    """Totals for one delivery (and its invoice, when there is one)"""
+    delivery_number: str
+    invoice_number: Optional[str]
+    lines: Tuple[ShipmentLine, ...]
+    total_gross_weight: Decimal
+    total_net_weight: Decimal
+    weight_unit: str
+    total_volume: Optional[Decimal]
+    volume_unit: Optional[str]
+    package_count: int
+    origin_countries: Tuple[str, ...]
+    hs_codes: Tuple[str, ...]
+    goods_description: str
+    invoice_amount: Optional[Decimal]
+    currency: Optional[str]
+    insured_amount: Optional[Decimal]  # minimum cover, 110% of the invoice
+    insurance_required: bool  # seller insures under the agreed Incoterms
+
+
+def _kilograms(weight: Optional[Decimal], unit: Optional[str]) -> Decimal:
+    if not weight:
+        return Decimal("0")
+    return weight * WEIGHT_FACTORS.get((unit or "KG").upper(), Decimal("1"))
+
+
+def _unique(values) -> Tuple[str, ...]:
+    """Non-empty values, first occurrence order"""
+    return tuple(dict.fromkeys(value for value in values if value))
+
+
+def compute_aggregates(delivery_header: LIKP, delivery_items: List[LIPS],
+                       invoice_header: Optional[VBRK] = None,
+                       invoice_items: Optional[List[VBRP]] = None) -> ShipmentAggregates:
+    """
+    Derive shipment aggregates from a delivery and its invoice
+
+    LIPS weights are per sales unit (the sample data maintains LIKP.BTGEW
+    as quantity × item weight); missing item weights fall back to the
+    material master. A maintained LIKP.BTGEW wins over the item sum.
+    """
+    # Invoiced value and quantity per material, shared pro rata across
+    # the delivery lines of that material
+    invoiced: Dict[Optional[str], Decimal] = {}
+    for item in invoice_items or ():
+        invoiced[item.MATNR] = invoiced.get(item.MATNR, Decimal("0")) + item.NETWR
+    delivered: Dict[Optional[str], Decimal] = {}
+    for item in delivery_items:
+        delivered[item.MATNR] = delivered.get(item.MATNR, Decimal("0")) + item.LFIMG
+    currency = invoice_header.WAERK if invoice_header else None
+
+    lines = []
+    for item in delivery_items:
+        material = get_material(item.MATNR) if item.MATNR else None
+        gross = item.BRGEW if item.BRGEW is not None else (material.BRGEW if material else None)
+        net = item.NTGEW if item.NTGEW is not None else (material.NTGEW if material else None)
+        unit = item.GEWEI or (material.GEWEI if material else None)
+        value = None
+        if item.MATNR in invoiced and delivered[item.MATNR]:
+            value = (invoiced[item.MATNR] * item.LFIMG / delivered[item.MATNR]).quantize(Decimal("0.01"))
+        lines.append(ShipmentLine(
+            line_number=int(item.POSNR),
+            material=item.MATNR,
+            description=item.ARKTX or (material.MAKTX if material else ""),
+            quantity=item.LFIMG,
+            unit=item.VRKME,
+            gross_weight=_kilograms(gross, unit) * item.LFIMG,
+            net_weight=_kilograms(net, unit) * item.LFIMG,
+            packages=int(item.LFIMG) if item.VRKME in PIECE_UNITS else 1,
+            origin_country=item.HERKL or (material.HERKL if material else None),
+            hs_code=material.HSNCODE if material else None,
+            value=value,
+            currency=currency if value is not None else None,
+        ))
+
+    gross_total = sum((line.gross_weight for line in lines), Decimal("0"))
+    if delivery_header.BTGEW:
+        gross_total = _kilograms(delivery_header.BTGEW, delivery_header.GEWEI)
+
+    invoice_amount = invoice_header.NETWR if invoice_header else None
+    insured_amount = None
+    if invoice_amount is not None:
+        insured_amount = (invoice_amount * INSURANCE_MARGIN).quantize(Decimal("0.01"))
+    incoterms = (invoice_header.INCO1 if invoice_header else None) or delivery_header.INCO1
+
+    return ShipmentAggregates(
+        delivery_number=delivery_header.VBELN,
+        invoice_number=invoice_header.VBELN if invoice_header else None,
+        lines=tuple(lines),
+        total_gross_weight=gross_total,
+        total_net_weight=sum((line.net_weight for line in lines), Decimal("0")),
+        weight_unit="KG",
+        total_volume=delivery_header.VOLUM,
+        volume_unit=delivery_header.VOLEH if delivery_header.VOLUM else None,
+        package_count=sum(line.packages for line in lines),
+        origin_countries=_unique(line.origin_country for line in lines),
+        hs_codes=_unique(line.hs_code for line in lines),
+        goods_description="; ".join(_unique(line.description for line in lines)),
+        invoice_amount=invoice_amount,
+        currency=currency,
+        insured_amount=insured_amount,
+        insurance_required=incoterms in INSURED_INCOTERMS,
+    )
+
+
+class DerivedDataCache:
+    """LRU of derived values keyed by the function and the identity of the source documents"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, Tuple[tuple, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, delivery_header: LIKP, delivery_items: List[LIPS],
+            invoice_header: Optional[VBRK] = None,
+            invoice_items: Optional[List[VBRP]] = None) -> ShipmentAggregates:
+        return self.derived(compute_aggregates, delivery_header, delivery_items, invoice_header, invoice_items)
+
+    def derived(self, compute: Callable[..., Any], *sources) -> Any:
+        """compute(*sources), computed once while the same source objects are cached"""
+        key = (compute, *map(id, sources))  # unique: an entry keeps its sources alive
+        entry = self._entries.get(key)  # lookups are atomic; only writers take the lock
+        if entry is not None:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:  # evicted by another thread meanwhile
+                pass
+            self.hits += 1
+            return entry[1]
+        value = compute(*sources)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (sources, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry (after SAP documents are changed in place)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
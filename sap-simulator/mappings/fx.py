@@ -0,0 +1,311 @@
+"""
+Foreign Exchange Rates
+
+Euro reference rates loaded from ECB-style CSV files: the historical
+file (eurofxref-hist.csv / .zip: "Date,USD,JPY,...", one row per fixing,
+N/A where a currency was not quoted) or the daily file (eurofxref.csv).
+Each currency keeps its fixings as sorted date and rate columns, so the
+rate for a day is one bisect: the latest fixing on or before that day
+(no fixings on weekends and TARGET holidays). A fixing more than max_age
+days older than the day (DEFAULT_MAX_AGE: 7, five TARGET business days
+with the Easter closing) raises FXError instead of converting at a stale
+rate; max_age=None lifts the limit.
+
+Cross rates go through the euro like the ECB's own: source → target is
+target/EUR ÷ source/EUR. A Rate keeps both legs, so conversions multiply
+and divide exactly and round once, to the target currency. Resolved
+rates are cached per (source, target, day).
+
+convert_many() converts whole columns (amounts, currencies, dates) with
+each distinct rate resolved once; the mapper uses it to bring foreign
+currency lines into the document currency, and amounts.credit_coverage()
+to check invoices against documentary credits in another currency.
+
+The bundled data/eurofxref-sample.csv holds illustrative rates for a few
+December 2024 days, so documents dated later fail with FXError. Load the
+real history with RateTable.load("eurofxref-hist.zip") or
+set_default_rates().
+
+Usage:
+    python3 mappings/fx.py USD JPY [2024-12-20]   # rate lookup
+"""
+
+import csv
+import decimal
+import io
+import operator
+import threading
+import zipfile
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import compress, repeat
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import sys
+import os
+
+if __name__ == "__main__":  # python3 mappings/fx.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mappings.amounts import CONTEXT, ONE, round_column
+
+BASE_CURRENCY = "EUR"
+SAMPLE_RATES = Path(__file__).resolve().parent.parent / "data" / "eurofxref-sample.csv"
+MISSING = ("", "N/A", "n/a", "-")
+DEFAULT_MAX_AGE = 7  # days a fixing stays usable
+_DISPLAY = decimal.Context(prec=10)
+
+
+class FXError(ValueError):
+    """Unknown currency, or no recent enough fixing on or before the requested day"""
+
+
+@dataclass(frozen=True)
+class Rate:
+    """source → target: amount × numerator / denominator"""
+    source: str
+    target: str
+    numerator: Decimal  # target units per EUR
+    denominator: Decimal  # source units per EUR
+    fixing_date: date  # the older of the two fixings used
+
+    @property
+    def value(self) -> Decimal:
+        """Target units per source unit (cross rates to 10 significant digits)"""
+        if self.denominator == ONE:
+            return self.numerator
+        return _DISPLAY.divide(self.numerator, self.denominator)
+
+    def apply(self, amount: Decimal) -> Decimal:
+        """Exact converted amount, not yet rounded"""
+        product = CONTEXT.multiply(amount, self.numerator)
+        return product if self.denominator == ONE else CONTEXT.divide(product, self.denominator)
+
+
+def _parse_date(text: str) -> date:
+    text = text.strip()
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return datetime.strptime(text, "%d %B %Y").date()  # daily file: "20 December 2024"
+
+
+class RateTable:
+    """Euro reference rates per currency, indexed by fixing date"""
+
+    def __init__(self, base: str = BASE_CURRENCY, cache_size: int = 65536,
+                 max_age: Optional[int] = DEFAULT_MAX_AGE):
+        self.base = base
+        self.cache_size = cache_size
+        # Days a fixing stays usable (None: the latest fixing always applies)
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._fixings: Dict[str, Dict[int, Decimal]] = {}  # currency → ordinal → rate
+        self._index: Dict[str, Tuple[List[int], List[Decimal]]] = {}
+        self._cache: 'OrderedDict[Tuple[str, str, int], Rate]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, *paths: Union[str, Path], base: str = BASE_CURRENCY,
+             max_age: Optional[int] = DEFAULT_MAX_AGE) -> 'RateTable':
+        """Table from one or more CSV (or zipped CSV) files; later files win"""
+        table = cls(base, max_age=max_age)
+        for path in paths:
+            table.add_file(path)
+        return table
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def add_file(self, path: Union[str, Path]) -> int:
+        path = Path(path)
+        if path.suffix.lower() == ".zip":
+            with zipfile.ZipFile(path) as archive:
+                name = next(n for n in archive.namelist() if n.lower().endswith(".csv"))
+                return self.add_csv(archive.read(name).decode("utf-8-sig"))
+        return self.add_csv(path.read_text(encoding="utf-8-sig"))
+
+    def add_csv(self, text: str) -> int:
+        """Merge fixings from ECB CSV text; returns the number of rates read"""
+        rows = csv.reader(io.StringIO(text))
+        header = [column.strip().upper() for column in next(rows, [])]
+        if not header or header[0] != "DATE":
+            raise FXError("expected an ECB CSV header starting with 'Date'")
+        columns = [(position, currency) for position, currency in enumerate(header)
+                   if position and currency]
+        count = 0
+        for row in rows:
+            if not row or not row[0].strip():
+                continue
+            day = _parse_date(row[0]).toordinal()
+            for position, currency in columns:
+                value = row[position].strip() if position < len(row) else ""
+                if value in MISSING:
+                    continue
+                self._fixings.setdefault(currency, {})[day] = Decimal(value)
+                count += 1
+        with self._lock:
+            self._index.clear()
+            self._cache.clear()
+        return count
+
+    def add_rate(self, currency: str, day: date, rate: Decimal) -> None:
+        """One fixing (currency units per EUR)"""
+        self._fixings.setdefault(currency.upper(), {})[day.toordinal()] = rate
+        with self._lock:
+            self._index.pop(currency.upper(), None)
+            self._cache.clear()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def currencies(self) -> List[str]:
+        return sorted(set(self._fixings) | {self.base})
+
+    def date_range(self, currency: str) -> Tuple[date, date]:
+        days, _ = self._column(currency.upper())
+        return date.fromordinal(days[0]), date.fromordinal(days[-1])
+
+    def _column(self, currency: str) -> Tuple[List[int], List[Decimal]]:
+        column = self._index.get(currency)
+        if column is None:
+            fixings = self._fixings.get(currency)
+            if not fixings:
+                raise FXError(f"no rates for {currency}")
+            days = sorted(fixings)
+            column = self._index[currency] = (days, [fixings[day] for day in days])
+        return column
+
+    def _leg(self, currency: str, day: int) -> Tuple[Decimal, int]:
+        """currency per EUR on the latest fixing on or before day"""
+        if currency == self.base:
+            return ONE, day
+        days, rates = self._column(currency)
+        position = bisect_right(days, day) - 1
+        if position < 0:
+            raise FXError(f"no {currency} rate on or before {date.fromordinal(day)}")
+        if self.max_age is not None and day - days[position] > self.max_age:
+            raise FXError(f"latest {currency} rate before {date.fromordinal(day)} is from "
+                          f"{date.fromordinal(days[position])}, over {self.max_age} days old")
+        return rates[position], days[position]
+
+    def rate(self, source: str, target: str, on: date) -> Rate:
+        """Conversion rate source → target for a day, cached"""
+        source, target = source.upper(), target.upper()
+        key = (source, target, on.toordinal())
+        rate = self._cache.get(key)
+        if rate is not None:
+            self.hits += 1
+            return rate
+        self.misses += 1
+        if source == target:
+            rate = Rate(source, target, ONE, ONE, on)
+        else:
+            source_rate, source_day = self._leg(source, key[2])
+            target_rate, target_day = self._leg(target, key[2])
+            rate = Rate(source, target, target_rate, source_rate,
+                        date.fromordinal(min(source_day, target_day)))
+        with self._lock:  # bounded; the oldest entries go first
+            self._cache[key] = rate
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rate
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def convert(self, amount: Decimal, source: str, target: str, on: date) -> Decimal:
+        """One amount, rounded to the target currency"""
+        return round_column([self.rate(source, target, on).apply(amount)], [target])[0]
+
+    def convert_many(self, amounts: Sequence[Decimal], sources: Union[str, Sequence[str]],
+                     target: str, on: Union[date, Sequence[date]]) -> List[Decimal]:
+        """
+        Convert a column of amounts to target, rounded to its decimals
+
+        sources and on are one value for every amount or one per amount.
+        Each distinct (currency, day) is resolved once; the arithmetic runs
+        as map() pipelines over the columns.
+        """
+        if not amounts:
+            return []
+        count = len(amounts)
+        if isinstance(sources, str) and isinstance(on, date):
+            rate = self.rate(sources, target, on)
+            numerators, denominators = repeat(rate.numerator, count), repeat(rate.denominator, count)
+            divide = rate.denominator != ONE
+        else:
+            keys = list(zip(repeat(sources, count) if isinstance(sources, str) else sources,
+                            repeat(on, count) if isinstance(on, date) else on))
+            rates = {key: self.rate(key[0], target, key[1]) for key in dict.fromkeys(keys)}
+            resolved = list(map(rates.__getitem__, keys))
+            numerators = map(operator.attrgetter("numerator"), resolved)
+            denominators = list(map(operator.attrgetter("denominator"), resolved))
+            divide = denominators.count(ONE) != count
+        converted = map(CONTEXT.multiply, amounts, numerators)
+        if not divide:
+            return round_column(list(converted), [target])
+        denominators = list(denominators)
+        units = denominators.count(ONE)
+        if units * 2 < count:  # mostly foreign → the target: divide every row in C
+            return round_column(list(map(CONTEXT.divide, converted, denominators)), [target])
+        converted = list(converted)
+        for row in compress(range(count), map(operator.ne, denominators, repeat(ONE))):
+            converted[row] = CONTEXT.divide(converted[row], denominators[row])
+        return round_column(converted, [target])
+
+    def stats(self) -> Dict[str, int]:
+        return {"currencies": len(self._fixings), "cached_rates": len(self._cache),
+                "hits": self.hits, "misses": self.misses}
+
+
+# ============================================================================
+# Default table
+# ============================================================================
+
+_default: Optional[RateTable] = None
+_default_lock = threading.Lock()
+
+
+def default_rates() -> RateTable:
+    """The process-wide table, loaded from the bundled sample on first use"""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = RateTable.load(SAMPLE_RATES)
+    return _default
+
+
+def set_default_rates(table_or_paths: Union[RateTable, Iterable[Union[str, Path]]]) -> RateTable:
+    """Replace the process-wide table (e.g. with the full ECB history)"""
+    global _default
+    table = table_or_paths if isinstance(table_or_paths, RateTable) \
+        else RateTable.load(*table_or_paths)
+    with _default_lock:
+        _default = table
+    return table
+
+
+if __name__ == "__main__":
+    rates = default_rates()
+    if len(sys.argv) < 3:
+        print(f"Currencies: {', '.join(rates.currencies())}")
+        first, last = rates.date_range("USD")
+        print(f"USD fixings: {first} .. {last}")
+        sys.exit(0)
+    day = date.fromisoformat(sys.argv[3]) if len(sys.argv) > 3 else date.today()
+    try:
+        rate = rates.rate(sys.argv[1], sys.argv[2], day)
+    except FXError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"1 {rate.source} = {rate.value} {rate.target} (fixing {rate.fixing_date})")
+    print(f"1000 {rate.source} = {rates.convert(Decimal(1000), rate.source, rate.target, day)} {rate.target}")
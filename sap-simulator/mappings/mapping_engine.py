@@ -0,0 +1,399 @@
+"""
+Declarative SAP → VC Mapping Engine
+
+A mapping is a MappingSpec: the credential as a nested dict/list template
+whose leaves say where each value comes from:
+
+    Field("header.VBELN")                       SAP field
+    Field("header.KTWRT", "float", default=0.0) converter, default if empty
+    First("item.ARKTX", "material.MAKTX", default="")
+    Template("{base_url}/invoices/{header.VBELN}")
+    Lookup("get_material", "item.MATNR", Material)   (let bindings)
+    Each("items", {...}, var="item", let={...})      one entry per row
+    Each("items", {...}, index="position")           ... with the row index
+    When("header.ZTERM", {...})                      key only if truthy
+    Expr("header.FKDAT + timedelta(days=header.ZBD1T)", "str")
+
+compile_mapping() validates every field path against the SAP dataclasses
+and generates one straight-line Python function per spec (dict literals,
+plain loops, no interpretation at call time), so compiled mappings run
+as fast as hand-written ones. Key order in the output follows the spec.
+CompiledMappings compiles each spec on first use, keeping compilation
+out of process start-up; compile_all() validates every spec up front.
+
+Usage:
+    python3 mappings/mapping_engine.py              # print generated source
+"""
+
+import dataclasses
+import string
+import threading
+import typing
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+IDENTIFIER_PARAMS = ('issuer_did', 'base_url', 'context_base')
+
+_MISSING = object()
+
+
+class MappingSpecError(ValueError):
+    """Invalid mapping spec (unknown field, converter or variable)"""
+
+
+# ============================================================================
+# Spec nodes
+# ============================================================================
+
+@dataclasses.dataclass(frozen=True)
+class Field:
+    """Value of a field path; optional converter and default for empty values"""
+    path: str
+    convert: Optional[str] = None
+    default: Any = _MISSING
+
+
+@dataclasses.dataclass(frozen=True)
+class First:
+    """First non-empty field path (like `a or b`), else default"""
+    paths: Tuple[str, ...]
+    default: Any = _MISSING
+
+    def __init__(self, *paths: str, default: Any = _MISSING):
+        object.__setattr__(self, 'paths', paths)
+        object.__setattr__(self, 'default', default)
+
+
+@dataclasses.dataclass(frozen=True)
+class Template:
+    """String with {path} placeholders; named parts may be any node"""
+    format: str
+    parts: Tuple[Tuple[str, Any], ...] = ()
+
+    def __init__(self, format: str, **parts: Any):
+        object.__setattr__(self, 'format', format)
+        object.__setattr__(self, 'parts', tuple(parts.items()))
+
+
+@dataclasses.dataclass(frozen=True)
+class Lookup:
+    """function(path) if the field is set, else None (master data reads)"""
+    function: str
+    path: str
+    returns: Optional[type] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Each:
+    """List built from every element of a repeated field"""
+    source: str
+    template: Any
+    var: str = 'item'
+    let: Tuple[Tuple[str, Any], ...] = ()
+    index: Optional[str] = None
+
+    def __init__(self, source: str, template: Any, var: str = 'item',
+                 let: Optional[Dict[str, Any]] = None, index: Optional[str] = None):
+        object.__setattr__(self, 'source', source)
+        object.__setattr__(self, 'template', template)
+        object.__setattr__(self, 'var', var)
+        object.__setattr__(self, 'let', tuple((let or {}).items()))
+        object.__setattr__(self, 'index', index)
+
+
+@dataclasses.dataclass(frozen=True)
+class When:
+    """Dict entry present only when every condition path is truthy"""
+    condition: Any  # path or tuple of paths
+    value: Any
+
+
+@dataclasses.dataclass(frozen=True)
+class Expr:
+    """Python expression over the mapping variables (escape hatch)"""
+    code: str
+    convert: Optional[str] = None
+
+
+@dataclasses.dataclass
+class MappingSpec:
+    """One SAP document → credential mapping"""
+    name: str
+    inputs: Dict[str, Any]       # parameter → dataclass, [dataclass] for rows, or None
+    template: Dict[str, Any]
+    issuer_did: str = "did:example:issuer"
+    let: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+# ============================================================================
+# Compiler
+# ============================================================================
+
+class _Scope:
+    """Variables visible to a template: name → (dataclass or None, nullable)"""
+
+    def __init__(self, variables: Dict[str, Tuple[Optional[type], bool]]):
+        self.variables = dict(variables)
+
+    def child(self, **variables: Tuple[Optional[type], bool]) -> '_Scope':
+        scope = _Scope(self.variables)
+        scope.variables.update(variables)
+        return scope
+
+
+class _Compiler:
+    def __init__(self, spec: MappingSpec, functions: Dict[str, Callable]):
+        self.spec = spec
+        self.functions = functions
+        self.lines: List[str] = []
+        self.counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"_{prefix}{self.counter}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    # ------------------------------------------------------------- paths
+
+    def path(self, path: str, scope: _Scope, fallback: str = 'None') -> str:
+        root, _, attribute = path.partition('.')
+        if root not in scope.variables:
+            raise MappingSpecError(f"{self.spec.name}: unknown variable {root!r} in {path!r}")
+        cls, nullable = scope.variables[root]
+        if not attribute:
+            return root
+        if '.' in attribute or not attribute.isidentifier():
+            raise MappingSpecError(f"{self.spec.name}: unsupported path {path!r}")
+        if cls is not None and dataclasses.is_dataclass(cls) and \
+                attribute not in {f.name for f in dataclasses.fields(cls)}:
+            raise MappingSpecError(f"{self.spec.name}: {cls.__name__} has no field {attribute!r}")
+        if nullable:
+            return f"({path} if {root} is not None else {fallback})"
+        return path
+
+    def function(self, name: str) -> str:
+        if name in ('str', 'int', 'float', 'bool'):
+            return name
+        if name not in self.functions:
+            raise MappingSpecError(f"{self.spec.name}: unknown converter/function {name!r}")
+        return name
+
+    def condition(self, condition: Any, scope: _Scope) -> str:
+        paths = (condition,) if isinstance(condition, str) else tuple(condition)
+        return " and ".join(self.path(path, scope) for path in paths)
+
+    # ------------------------------------------------------------- nodes
+
+    def expr(self, node: Any, scope: _Scope, indent: int) -> str:
+        if isinstance(node, Field):
+            value = self.path(node.path, scope)
+            converted = f"{self.function(node.convert)}({value})" if node.convert else value
+            if node.default is _MISSING:
+                return converted
+            if not node.convert:
+                return f"({value} or {node.default!r})"
+            return f"({converted} if {value} else {node.default!r})"
+
+        if isinstance(node, First):
+            fallback = 'None' if node.default is _MISSING else repr(node.default)
+            parts = [self.path(path, scope) for path in node.paths[:-1]]
+            last = self.path(node.paths[-1], scope, fallback)
+            if node.default is not _MISSING and last == node.paths[-1]:
+                last = f"{last} or {fallback}"
+            return "(" + " or ".join(parts + [last]) + ")"
+
+        if isinstance(node, Template):
+            parts = dict(node.parts)
+            text = []
+            for literal, field_name, format_spec, _ in string.Formatter().parse(node.format):
+                text.append(literal.replace('{', '{{').replace('}', '}}'))
+                if field_name is None:
+                    continue
+                if field_name in parts:
+                    variable = self.fresh('t')
+                    self.emit(indent, f"{variable} = {self.expr(parts[field_name], scope, indent)}")
+                    text.append("{" + variable + "}")
+                else:
+                    path = self.path(field_name, scope)
+                    if path != field_name:  # nullable: bind first
+                        variable = self.fresh('t')
+                        self.emit(indent, f"{variable} = {path}")
+                        path = variable
+                    text.append("{" + path + (":" + format_spec if format_spec else "") + "}")
+            return "f" + repr("".join(text))
+
+        if isinstance(node, Lookup):
+            value = self.path(node.path, scope)
+            return f"({self.function(node.function)}({value}) if {value} else None)"
+
+        if isinstance(node, Expr):
+            code = f"({node.code})"
+            return f"{self.function(node.convert)}{code}" if node.convert else code
+
+        if isinstance(node, Each):
+            result = self.fresh('l')
+            source = self.path(node.source, scope)
+            element = self._element_type(node.source, scope)
+            self.emit(indent, f"{result} = []")
+            inner = scope.child(**{node.var: (element, False)})
+            if node.index:
+                self.emit(indent, f"for {node.index}, {node.var} in enumerate({source} or ()):")
+                inner = inner.child(**{node.index: (None, False)})
+            else:
+                self.emit(indent, f"for {node.var} in {source} or ():")
+            inner = self.let(dict(node.let), inner, indent + 1)
+            value = self.expr(node.template, inner, indent + 1)
+            self.emit(indent + 1, f"{result}.append({value})")
+            return result
+
+        if isinstance(node, When):
+            raise MappingSpecError(f"{self.spec.name}: When is only allowed as a dict value")
+
+        if isinstance(node, dict):
+            return self.mapping(node, scope, indent)
+
+        if isinstance(node, list):
+            return "[" + ", ".join(self.expr(item, scope, indent) for item in node) + "]"
+
+        if node is None or isinstance(node, (str, int, float, bool)):
+            return repr(node)
+
+        raise MappingSpecError(f"{self.spec.name}: unsupported node {node!r}")
+
+    def mapping(self, node: Dict[str, Any], scope: _Scope, indent: int) -> str:
+        keys = list(node)
+        split = next((i for i, key in enumerate(keys) if isinstance(node[key], When)), len(keys))
+        literal = "{" + ", ".join(
+            f"{key!r}: {self.expr(node[key], scope, indent)}" for key in keys[:split]) + "}"
+        if split == len(keys):
+            return literal
+
+        # Conditional entries: build in spec order so key order is preserved
+        result = self.fresh('d')
+        self.emit(indent, f"{result} = {literal}")
+        for key in keys[split:]:
+            value = node[key]
+            if isinstance(value, When):
+                self.emit(indent, f"if {self.condition(value.condition, scope)}:")
+                self.emit(indent + 1, f"{result}[{key!r}] = {self.expr(value.value, scope, indent + 1)}")
+            else:
+                self.emit(indent, f"{result}[{key!r}] = {self.expr(value, scope, indent)}")
+        return result
+
+    def let(self, bindings: Dict[str, Any], scope: _Scope, indent: int) -> _Scope:
+        for name, node in bindings.items():
+            if not name.isidentifier() or name in scope.variables:
+                raise MappingSpecError(f"{self.spec.name}: invalid or duplicate variable {name!r}")
+            self.emit(indent, f"{name} = {self.expr(node, scope, indent)}")
+            if isinstance(node, Lookup):
+                scope = scope.child(**{name: (node.returns, True)})
+            else:
+                scope = scope.child(**{name: (None, False)})
+        return scope
+
+    def _element_type(self, source: str, scope: _Scope) -> Optional[type]:
+        root, _, attribute = source.partition('.')
+        if not attribute:
+            declared = self.spec.inputs.get(root)
+            if isinstance(declared, list) and declared:
+                return declared[0]
+            return None
+        # List[X] / Tuple[X, ...] field of a dataclass
+        cls = scope.variables[root][0]
+        if cls is None or not dataclasses.is_dataclass(cls):
+            return None
+        hint = typing.get_type_hints(cls).get(attribute)
+        element = next(iter(typing.get_args(hint)), None)
+        return element if dataclasses.is_dataclass(element) else None
+
+    # ------------------------------------------------------------- function
+
+    def compile(self) -> str:
+        spec = self.spec
+        for name in spec.inputs:
+            if not name.isidentifier() or name in IDENTIFIER_PARAMS:
+                raise MappingSpecError(f"{spec.name}: invalid input name {name!r}")
+        scope = _Scope({name: (declared if not isinstance(declared, list) else None, False)
+                        for name, declared in spec.inputs.items()})
+        scope = scope.child(**{name: (None, False) for name in IDENTIFIER_PARAMS})
+
+        parameters = ", ".join(list(spec.inputs) + [
+            f"issuer_did={spec.issuer_did!r}", "base_url='https://example.com'",
+            "context_base=''"])
+        self.emit(0, f"def map_{spec.name}({parameters}):")
+        scope = self.let(spec.let, scope, 1)
+        result = self.expr(spec.template, scope, 1)
+        self.emit(1, f"return {result}")
+        return "\n".join(self.lines) + "\n"
+
+
+def generate_source(spec: MappingSpec, functions: Dict[str, Callable]) -> str:
+    """Python source of the specialized mapping function"""
+    return _Compiler(spec, functions).compile()
+
+
+def compile_mapping(spec: MappingSpec, functions: Dict[str, Callable]) -> Callable[..., Dict[str, Any]]:
+    """Compile a spec into a function(inputs..., issuer_did, base_url, context_base)"""
+    source = generate_source(spec, functions)
+    namespace = dict(functions)
+    exec(compile(source, f"<mapping {spec.name}>", "exec"), namespace)
+    function = namespace[f"map_{spec.name}"]
+    function.__source__ = source
+    return function
+
+
+class CompiledMappings(Mapping):
+    """Spec name → compiled function, compiled on first use"""
+
+    def __init__(self, specs: Dict[str, MappingSpec], functions: Dict[str, Callable]):
+        self.specs = specs
+        # Read at compile time: replacing an entry affects mappings compiled afterwards
+        self.functions = functions
+        self._compiled: Dict[str, Callable[..., Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> Callable[..., Dict[str, Any]]:
+        function = self._compiled.get(name)
+        if function is None:
+            spec = self.specs[name]
+            with self._lock:
+                function = self._compiled.get(name)
+                if function is None:
+                    function = self._compiled[name] = compile_mapping(spec, self.functions)
+        return function
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def compiled(self) -> Dict[str, Callable[..., Dict[str, Any]]]:
+        """The mappings compiled so far"""
+        return dict(self._compiled)
+
+    def namespaces(self) -> List[Dict[str, Any]]:
+        """Where compiled mappings resolve function names: the functions
+        dict (for mappings compiled later), then each compiled mapping's globals"""
+        return [self.functions, *(function.__globals__ for function in self.compiled().values())]
+
+    def compile_all(self) -> 'CompiledMappings':
+        """Compile every spec now (spec errors raise MappingSpecError here)"""
+        for name in self.specs:
+            self[name]
+        return self
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    # Import through the package so spec nodes and compiler share classes
+    from mappings import mapping_engine
+    from mappings.mapping_specs import FUNCTIONS, SPECS
+
+    for spec in SPECS.values():
+        print(mapping_engine.generate_source(spec, FUNCTIONS))
@@ -0,0 +1,575 @@
+"""
+SAP → KTDDE Mapping Specs
+
+Declarative mappings for every credential SAPToVCMapper produces. Each
+spec is the credential as a template: which SAP table field fills which
+KTDDE property, through which converter. mapping_engine.compile_mapping()
+turns each into a Python function the first time it is used; the
+mapping engine benchmark compiles and checks all of them.
+
+To add a document: write a MappingSpec, add it to SPECS and expose it on
+SAPToVCMapper.
+"""
+
+from datetime import datetime, date, timedelta
+from typing import Any, Dict, Optional
+from models.sap_structures import *
+from data.sample_data import get_partner, get_material
+from mappings.derived_data import ShipmentAggregates
+from mappings.amounts import DocumentAmounts, format_amount
+from mappings.mapping_engine import (
+    CompiledMappings, Each, Expr, Field, First, Lookup, MappingSpec, Template, When,
+)
+
+W3C_CREDENTIALS_V1 = "https://www.w3.org/2018/credentials/v1"
+
+
+# ============================================================================
+# Converters (referenced by name from the specs)
+# ============================================================================
+
+def format_datetime(dt) -> str:
+    """Format date/datetime to ISO 8601"""
+    if type(dt) is date:  # SAP date fields: midnight, as datetime.combine() would give
+        return f"{dt.isoformat()}T00:00:00Z"
+    if isinstance(dt, datetime):
+        return dt.isoformat() + "Z"
+    elif isinstance(dt, date):
+        return datetime.combine(dt, datetime.min.time()).isoformat() + "Z"
+    return str(dt)
+
+
+def map_party(partner: Optional[Partner]) -> Optional[Dict[str, Any]]:
+    """Map SAP Partner to KTDDE Party"""
+    if not partner:
+        return None
+
+    party = {
+        "type": "Party",
+        "partyName": partner.NAME1,
+        "hasAddress": {
+            "type": "Address",
+            "street": partner.STREET,
+            "city": partner.CITY,
+            "postalCode": partner.POST_CODE,
+            "country": {
+                "type": "Country",
+                "countryCode": partner.COUNTRY,
+            }
+        }
+    }
+
+    if partner.STCEG:
+        party["taxNumber"] = partner.STCEG
+
+    return party
+
+
+FUNCTIONS = {
+    "format_datetime": format_datetime,
+    "map_party": map_party,
+    "get_partner": get_partner,
+    "get_material": get_material,
+    "format_amount": format_amount,
+    "datetime": datetime,
+    "timedelta": timedelta,
+}
+
+
+# ============================================================================
+# Shared fragments
+# ============================================================================
+
+def credential_context(context_file: str) -> list:
+    return [W3C_CREDENTIALS_V1, Template("{context_base}/" + context_file)]
+
+
+def issuer(name: str) -> Dict[str, Any]:
+    return {"id": Field("issuer_did"), "name": name}
+
+
+def country(path: str) -> When:
+    return When(path, {"type": "Country", "countryCode": Field(path)})
+
+
+def weight(value: str, unit: str) -> Dict[str, Any]:
+    """Quantity of a weight field, "0" / KG when not maintained"""
+    return {
+        "type": "Quantity",
+        "quantityValue": Field(value, "str", default="0"),
+        "unitCode": Field(unit, default="KG"),
+    }
+
+
+def commodity_classification() -> When:
+    return When("material.HSNCODE", {
+        "type": "CommodityClassification",
+        "classificationCode": Field("material.HSNCODE"),
+    })
+
+
+def delivery_terms(prefix: str) -> When:
+    return When(f"{prefix}.INCO1", {
+        "type": "TradeDeliveryTerms",
+        "incotermsCode": Field(f"{prefix}.INCO1"),
+        "namedPlace": Field(f"{prefix}.INCO2"),
+    })
+
+
+MATERIAL = {"material": Lookup("get_material", "item.MATNR", Material)}
+
+
+# ============================================================================
+# PURCHASE ORDER (EKKO/EKPO) → PurchaseOrder VC
+# ============================================================================
+
+PURCHASE_ORDER = MappingSpec(
+    name="purchase_order",
+    inputs={"header": EKKO, "items": [EKPO], "amounts": DocumentAmounts},
+    issuer_did="did:example:buyer",
+    let={"vendor": Lookup("get_partner", "header.LIFNR", Partner)},
+    template={
+        "@context": credential_context("purchaseorder-context.jsonld"),
+        "id": Template("{base_url}/credentials/po/{header.EBELN}"),
+        "type": ["VerifiableCredential", "PurchaseOrderCredential"],
+        "issuer": issuer("Buyer Company"),  # Would come from BUKRS master data
+        "issuanceDate": Field("header.AEDAT", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/purchase-orders/{header.EBELN}"),
+            "type": "PurchaseOrder",
+            "orderIdentifier": Field("header.EBELN"),
+            "orderDate": Field("header.AEDAT", "str"),
+            "orderAmount": {
+                "type": "Amount",
+                "value": First("amounts.header_net", "amounts.net"),
+                "currencyCode": Field("header.WAERS"),
+            },
+            "buyerParty": {
+                "type": "Party",
+                "partyName": "Buyer Company",
+                "companyCode": Field("header.BUKRS"),
+            },
+            "sellerParty": Field("vendor", "map_party"),
+            "hasItem": Each("items", let=MATERIAL, index="position", template={
+                "type": "GoodsItem",
+                "lineNumber": Field("item.EBELP", "int"),
+                "productDescription": First("item.TXZ01", "material.MAKTX", default=""),
+                "quantity": {
+                    "type": "Quantity",
+                    "quantityValue": Field("item.MENGE", "str"),
+                    "unitCode": Field("item.MEINS"),
+                },
+                "unitPrice": {
+                    "type": "Amount",
+                    "value": Expr("amounts.prices[position]"),
+                    "currencyCode": Field("item.WAERS"),
+                },
+                "lineAmount": {
+                    "type": "Amount",
+                    "value": Expr("amounts.lines[position]"),
+                    "currencyCode": Field("item.WAERS"),
+                },
+                "originCountry": country("item.LAND1"),
+            }),
+            "definesPaymentTerms": When("header.ZTERM", {
+                "type": "PaymentTerms",
+                "paymentTermsCode": Field("header.ZTERM"),
+            }),
+            "deliveryTerms": delivery_terms("header"),
+        },
+    },
+)
+
+
+# ============================================================================
+# BILLING DOCUMENT (VBRK/VBRP) → CommercialInvoice VC
+# ============================================================================
+
+COMMERCIAL_INVOICE = MappingSpec(
+    name="commercial_invoice",
+    inputs={"header": VBRK, "items": [VBRP], "amounts": DocumentAmounts},
+    issuer_did="did:example:seller",
+    let={"customer": Lookup("get_partner", "header.KUNAG", Partner)},
+    template={
+        "@context": credential_context("commercialinvoice-context.jsonld"),
+        "id": Template("{base_url}/credentials/invoice/{header.VBELN}"),
+        "type": ["VerifiableCredential", "CommercialInvoiceCredential"],
+        "issuer": issuer("Seller Company"),
+        "issuanceDate": Field("header.FKDAT", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/invoices/{header.VBELN}"),
+            "type": "CommercialInvoice",
+            "invoiceNumber": Field("header.VBELN"),
+            "invoiceDate": Field("header.FKDAT", "str"),
+            "totalAmount": {
+                "type": "MonetaryAmount",
+                "amountValue": Field("amounts.header_net"),
+                "currencyCode": Field("header.WAERK"),
+            },
+            "buyerParty": Field("customer", "map_party"),
+            "sellerParty": {"type": "Party", "partyName": "Seller Company"},
+            "hasInvoiceLine": Each("items", let=MATERIAL, index="position", template={
+                "type": "InvoiceLine",
+                "lineNumber": Field("item.POSNR", "int"),
+                "productDescription": First("item.ARKTX", "material.MAKTX", default=""),
+                "quantity": {
+                    "type": "Quantity",
+                    "quantityValue": Field("item.FKIMG", "str"),
+                    "unitCode": Field("item.VRKME"),
+                },
+                "lineAmount": {
+                    "type": "MonetaryAmount",
+                    "amountValue": Expr("amounts.lines[position]"),
+                    "currencyCode": Field("item.WAERK"),
+                },
+                "originCountry": country("item.HERKL"),
+                "commodityClassification": commodity_classification(),
+            }),
+            "invoicePaymentTerms": When("header.ZTERM", {
+                "type": "PaymentTerms",
+                "paymentTermsCode": Field("header.ZTERM"),
+            }),
+            "paymentDueDate": When(("header.ZTERM", "header.ZBD1T"), Expr(
+                "header.FKDAT + timedelta(days=header.ZBD1T)", "str")),
+            "deliveryTerms": delivery_terms("header"),
+            "relatesToTransportDocument": When("header.BOLNR", {
+                "type": "TransportDocument",
+                "documentIdentifier": Field("header.BOLNR"),
+            }),
+            "relatesToDocumentaryCredit": When("header.LCNUM", {
+                "type": "DocumentaryCredit",
+                "creditNumber": Field("header.LCNUM"),
+            }),
+            "purchaseOrderNumber": When("header.VBELN_REF", Field("header.VBELN_REF")),
+        },
+    },
+)
+
+
+# ============================================================================
+# DELIVERY (LIKP/LIPS) → BillOfLading VC
+# ============================================================================
+
+BILL_OF_LADING = MappingSpec(
+    name="bill_of_lading",
+    inputs={"header": LIKP, "items": [LIPS]},
+    issuer_did="did:example:carrier",
+    let={
+        "customer": Lookup("get_partner", "header.KUNNR", Partner),
+        "document_id": First("header.BOLNR", "header.VBELN"),
+        "shipped": First("header.WADAT", "header.LFDAT"),
+    },
+    template={
+        "@context": credential_context("billoflading-context.jsonld"),
+        "id": Template("{base_url}/credentials/bol/{document_id}"),
+        "type": ["VerifiableCredential", "BillOfLadingCredential"],
+        "issuer": issuer("Carrier Company"),
+        "issuanceDate": Field("shipped", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/bills-of-lading/{document_id}"),
+            "type": "BillOfLading",
+            "documentIdentifier": Field("document_id"),
+            "issueDate": Field("shipped", "str"),
+            "consigneeParty": Field("customer", "map_party"),
+            "carrierParty": {
+                "type": "Party",
+                "partyName": "Carrier Company",  # Would come from carrier master
+            },
+            "hasGoodsItem": Each("items", let=MATERIAL, template={
+                "type": "GoodsItem",
+                "descriptionOfGoodsText": First("item.ARKTX", "material.MAKTX", default=""),
+                "grossWeight": weight("item.BRGEW", "item.GEWEI"),
+                "netWeight": weight("item.NTGEW", "item.GEWEI"),
+                "quantity": {
+                    "type": "Quantity",
+                    "quantityValue": Field("item.LFIMG", "str"),
+                    "unitCode": Field("item.VRKME"),
+                },
+                "originCountry": country("item.HERKL"),
+            }),
+            "totalGrossWeight": weight("header.BTGEW", "header.GEWEI"),
+            "deliveryTermsText": When("header.INCO1", Template(
+                "{header.INCO1} {place}", place=Field("header.INCO2", default=""))),
+            "actualDepartureDateTime": When("header.LFDAT", Field("header.LFDAT", "format_datetime")),
+        },
+    },
+)
+
+
+# ============================================================================
+# DELIVERY + BILLING DOCUMENT → CertificateOfOrigin VC
+# ============================================================================
+
+# Typically issued by chambers of commerce or customs authorities; derived
+# from delivery and invoice data.
+CERTIFICATE_OF_ORIGIN = MappingSpec(
+    name="certificate_of_origin",
+    inputs={"delivery_header": LIKP, "delivery_items": [LIPS], "invoice_header": VBRK},
+    issuer_did="did:example:authority",
+    let={
+        "exporter": Lookup("get_partner", "invoice_header.KUNAG", Partner),
+        "importer": Lookup("get_partner", "delivery_header.KUNNR", Partner),
+        "today": Expr("datetime.now().date()"),
+        "cert_number": Template("COO-{delivery_header.VBELN}-{stamp}",
+                                stamp=Expr("today.strftime('%Y%m%d')")),
+    },
+    template={
+        "@context": credential_context("certificateoforigin-context.jsonld"),
+        "id": Template("{base_url}/credentials/coo/{cert_number}"),
+        "type": ["VerifiableCredential", "CertificateOfOriginCredential"],
+        "issuer": issuer("Chamber of Commerce"),
+        "issuanceDate": Field("today", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/certificates-of-origin/{cert_number}"),
+            "type": "CertificateOfOrigin",
+            "certificateNumber": Field("cert_number"),
+            "issueDate": Field("today", "str"),
+            "exporterParty": Field("exporter", "map_party"),
+            "importerParty": Field("importer", "map_party"),
+            "issuingAuthorityParty": {"type": "Party", "partyName": "Chamber of Commerce"},
+            "issuerParty": {"type": "Party", "partyName": "Authorized Official"},
+            "hasGoodsItem": Each("delivery_items", let=MATERIAL, template={
+                "type": "GoodsItem",
+                "descriptionOfGoods": First("item.ARKTX", "material.MAKTX", default=""),
+                "grossWeight": weight("item.BRGEW", "item.GEWEI"),
+                "netWeight": weight("item.NTGEW", "item.GEWEI"),
+                "originCountry": country("item.HERKL"),
+                "commodityClassification": commodity_classification(),
+            }),
+            "invoiceNumber": When("invoice_header", Field("invoice_header.VBELN")),
+            "transportDocumentNumber": When("delivery_header.BOLNR", Field("delivery_header.BOLNR")),
+        },
+    },
+)
+
+
+# ============================================================================
+# DOCUMENTARY CREDIT (ZBANKF) → DocumentaryCredit VC
+# ============================================================================
+
+def bank(name: str, path: str) -> Dict[str, Any]:
+    return {"type": "Bank", "bankName": name, "swiftCode": Field(path)}
+
+
+DOCUMENTARY_CREDIT = MappingSpec(
+    name="documentary_credit",
+    inputs={"lc": ZBANKF},
+    issuer_did="did:example:bank",
+    let={
+        "applicant": Lookup("get_partner", "lc.APPLICANT", Partner),
+        "beneficiary": Lookup("get_partner", "lc.BENEFICIARY", Partner),
+    },
+    template={
+        "@context": credential_context("documentarycredit-context.jsonld"),
+        "id": Template("{base_url}/credentials/lc/{lc.LCNUM}"),
+        "type": ["VerifiableCredential", "DocumentaryCreditCredential"],
+        "issuer": issuer("Issuing Bank"),
+        "issuanceDate": Field("lc.ISSUE_DATE", "format_datetime"),
+        "expirationDate": Field("lc.EXPIRY_DATE", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/documentary-credits/{lc.LCNUM}"),
+            "type": "DocumentaryCredit",
+            "creditNumber": Field("lc.LCNUM"),
+            "issueDate": Field("lc.ISSUE_DATE", "str"),
+            "expiryDate": Field("lc.EXPIRY_DATE", "str"),
+            "creditAmount": {
+                "type": "MonetaryAmount",
+                "amountValue": Expr("format_amount(lc.LCAMOUNT, lc.LCCURRENCY)"),
+                "currencyCode": Field("lc.LCCURRENCY"),
+            },
+            "applicantParty": Field("applicant", "map_party"),
+            "beneficiaryParty": Field("beneficiary", "map_party"),
+            "issuingBankParty": bank("Issuing Bank", "lc.ISSUING_BANK"),
+            "partialShipmentAllowed": Field("lc.PARTIAL_SHIP"),
+            "transshipmentAllowed": Field("lc.TRANSHIP"),
+            "presentationPeriodDays": Field("lc.PRES_DAYS"),
+            "advisingBankParty": When("lc.ADVISING_BANK", bank("Advising Bank", "lc.ADVISING_BANK")),
+            "confirmingBankParty": When("lc.CONFIRMING_BANK",
+                                        bank("Confirming Bank", "lc.CONFIRMING_BANK")),
+            "deliveryTerms": delivery_terms("lc"),
+            "requiresDocument": When("lc.DOCS_REQUIRED", Each("lc.DOCS_REQUIRED", var="document", template={
+                "type": "DocumentRequirement",
+                "documentType": Field("document"),
+            })),
+            "latestShipmentDate": When("lc.LATEST_SHIP_DATE", Field("lc.LATEST_SHIP_DATE", "str")),
+        },
+    },
+)
+
+# ============================================================================
+# DELIVERY (LIKP/LIPS) + shipment aggregates → PackingList VC
+# ============================================================================
+
+SHIPPED = {"shipped": First("header.WADAT", "header.LFDAT")}
+
+
+def shipment_weight(path: str) -> Dict[str, Any]:
+    return weight(path, "shipment.weight_unit")
+
+
+def shipment_quantity(prefix: str) -> Dict[str, Any]:
+    return {
+        "type": "Quantity",
+        "quantityValue": Field(f"{prefix}.quantity", "str"),
+        "unitCode": Field(f"{prefix}.unit"),
+    }
+
+
+PACKING_LIST = MappingSpec(
+    name="packing_list",
+    inputs={"header": LIKP, "shipment": ShipmentAggregates},
+    issuer_did="did:example:seller",
+    let={"consignee": Lookup("get_partner", "header.KUNNR", Partner), **SHIPPED},
+    template={
+        "@context": credential_context("packinglist-context.jsonld"),
+        "id": Template("{base_url}/credentials/packing-list/{header.VBELN}"),
+        "type": ["VerifiableCredential", "PackingListCredential"],
+        "issuer": issuer("Seller Company"),
+        "issuanceDate": Field("shipped", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/packing-lists/{header.VBELN}"),
+            "type": "PackingList",
+            "hasPackingListNumber": Field("header.VBELN"),
+            "hasIssueDate": Field("shipped", "str"),
+            "hasShipper": {"type": "Party", "partyName": "Seller Company"},
+            "hasConsignee": Field("consignee", "map_party"),
+            "hasGoodsItem": Each("shipment.lines", var="line", template={
+                "type": "GoodsItem",
+                "lineNumber": Field("line.line_number"),
+                "descriptionOfGoods": Field("line.description"),
+                "quantity": shipment_quantity("line"),
+                "numberOfPackages": Field("line.packages"),
+                "grossWeight": shipment_weight("line.gross_weight"),
+                "netWeight": shipment_weight("line.net_weight"),
+                "originCountry": country("line.origin_country"),
+            }),
+            "hasPackage": {
+                "type": "Package",
+                "packageQuantity": Field("shipment.package_count"),
+            },
+            "hasTotalGrossWeight": shipment_weight("shipment.total_gross_weight"),
+            "hasTotalNetWeight": shipment_weight("shipment.total_net_weight"),
+            "hasTotalVolume": When("shipment.total_volume", {
+                "type": "Quantity",
+                "quantityValue": Field("shipment.total_volume", "str"),
+                "unitCode": Field("shipment.volume_unit"),
+            }),
+        },
+    },
+)
+
+
+# ============================================================================
+# DELIVERY + BILLING DOCUMENT → InsuranceCertificate VC
+# ============================================================================
+
+# Cargo insurance the seller arranges under CIF/CIP, covering the invoice
+# value plus 10%; issued under the seller's open cargo policy.
+INSURANCE_CERTIFICATE = MappingSpec(
+    name="insurance_certificate",
+    inputs={"header": LIKP, "invoice_header": VBRK, "shipment": ShipmentAggregates},
+    issuer_did="did:example:insurer",
+    let={"insured": Lookup("get_partner", "invoice_header.KUNAG", Partner), **SHIPPED},
+    template={
+        "@context": credential_context("insurancecertificate-context.jsonld"),
+        "id": Template("{base_url}/credentials/insurance/{invoice_header.VBELN}"),
+        "type": ["VerifiableCredential", "InsuranceCertificateCredential"],
+        "issuer": issuer("Cargo Insurer"),
+        "issuanceDate": Field("shipped", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/insurance-certificates/INS-{invoice_header.VBELN}"),
+            "type": "InsuranceCertificate",
+            "hasCertificateNumber": Template("INS-{invoice_header.VBELN}"),
+            "hasIssueDate": Field("shipped", "str"),
+            "hasInsurer": {"type": "Party", "partyName": "Cargo Insurer"},
+            "hasInsured": Field("insured", "map_party"),
+            "hasPolicyNumber": "OCP-SELLER-COMPANY",  # Would come from the open cargo policy
+            "hasInsuredAmount": {
+                "type": "MonetaryAmount",
+                "amountValue": Expr("format_amount(shipment.insured_amount, shipment.currency)"),
+                "currencyCode": Field("shipment.currency"),
+            },
+            "hasGoodsDescription": Field("shipment.goods_description"),
+            "hasTransportDetails": {
+                "type": "Shipment",
+                "totalPackageQuantity": Field("shipment.package_count"),
+                "totalGrossWeight": shipment_weight("shipment.total_gross_weight"),
+                "transportDocumentNumber": When("header.BOLNR", Field("header.BOLNR")),
+                "routeCode": When("header.ROUTE", Field("header.ROUTE")),
+                "deliveryTermsText": When("invoice_header.INCO1", Template(
+                    "{invoice_header.INCO1} {place}",
+                    place=Field("invoice_header.INCO2", default=""))),
+            },
+        },
+    },
+)
+
+
+# ============================================================================
+# DELIVERY + BILLING DOCUMENT → CustomsDeclaration VC (export)
+# ============================================================================
+
+CUSTOMS_DECLARATION = MappingSpec(
+    name="customs_declaration",
+    inputs={"header": LIKP, "invoice_header": VBRK, "shipment": ShipmentAggregates},
+    issuer_did="did:example:customs",
+    let={"importer": Lookup("get_partner", "header.KUNNR", Partner), **SHIPPED},
+    template={
+        "@context": credential_context("customsdeclaration-context.jsonld"),
+        "id": Template("{base_url}/credentials/customs/EX-{header.VBELN}"),
+        "type": ["VerifiableCredential", "CustomsDeclarationCredential"],
+        "issuer": issuer("Customs Authority"),
+        "issuanceDate": Field("shipped", "format_datetime"),
+        "credentialSubject": {
+            "id": Template("{base_url}/customs-declarations/EX-{header.VBELN}"),
+            "type": "CustomsDeclaration",
+            "hasDeclarationNumber": Template("EX-{header.VBELN}"),
+            "hasDeclarationType": "EX",  # SAD box 1: export
+            "hasDeclarationDate": Field("shipped", "str"),
+            "hasDeclarant": {"type": "Party", "partyName": "Seller Company"},
+            "hasExporter": {"type": "Party", "partyName": "Seller Company"},
+            "hasImporter": Field("importer", "map_party"),
+            "hasCustomsOffice": {
+                "type": "Location",
+                # Would come from the export office of the shipping point
+                "locationName": Template("Customs office for shipping point {header.VSTEL}"),
+            },
+            "hasGoodsItem": Each("shipment.lines", var="line", template={
+                "type": "GoodsItem",
+                "sequenceNumber": Field("line.line_number"),
+                "descriptionOfGoods": Field("line.description"),
+                "quantity": shipment_quantity("line"),
+                "grossWeight": shipment_weight("line.gross_weight"),
+                "netWeight": shipment_weight("line.net_weight"),
+                "originCountry": country("line.origin_country"),
+                "commodityClassification": When("line.hs_code", {
+                    "type": "CommodityClassification",
+                    "classificationCode": Field("line.hs_code"),
+                }),
+                "statisticalValueAmount": When("line.value", {
+                    "type": "MonetaryAmount",
+                    "amountValue": Expr("format_amount(line.value, line.currency)"),
+                    "currencyCode": Field("line.currency"),
+                }),
+            }),
+            "hasTotalInvoiceAmount": {
+                "type": "MonetaryAmount",
+                "amountValue": Expr("format_amount(invoice_header.NETWR, invoice_header.WAERK)"),
+                "currencyCode": Field("invoice_header.WAERK"),
+            },
+        },
+    },
+)
+
+
+
+SPECS = {
+    spec.name: spec
+    for spec in (PURCHASE_ORDER, COMMERCIAL_INVOICE, BILL_OF_LADING,
+                 CERTIFICATE_OF_ORIGIN, DOCUMENTARY_CREDIT, PACKING_LIST,
+                 INSURANCE_CERTIFICATE, CUSTOMS_DECLARATION)
+}
+
+# Compiled on first use per document; COMPILED.compile_all() surfaces spec
+# errors (unknown SAP fields etc.) for every document at once
+COMPILED = CompiledMappings(SPECS, FUNCTIONS)
@@ -3,27 +3,50 @@ SAP to W3C Verifiable Credential Mapping Engine
 
 Transforms SAP document structures into KTDDE-based W3C Verifiable Credentials.
 Uses the JSON-LD contexts and schemas generated from SHACL profiles.
+
+The field mappings themselves are declarative specs (mapping_specs.py),
+compiled into Python functions by mapping_engine.py.
 """
 
-from datetime import datetime, date, timedelta
-from decimal import Decimal
+from contextlib import nullcontext
 from typing import Dict, Any, Optional, List
 import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if __name__ == "__main__":  # python3 mappings/sap_to_vc.py: the simulator directory is not on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.sap_structures import *
-from data.sample_data import get_partner, get_material
+from mappings.mapping_specs import COMPILED
+from mappings.derived_data import DerivedDataCache, ShipmentAggregates
+from mappings.amounts import CreditCoverage, credit_coverage, invoice_amounts, purchase_order_amounts
+from mappings.fx import RateTable, default_rates
+
+# Phase timer used when no span recorder is configured (reusable, does nothing)
+_NO_SPAN = nullcontext()
 
 
 class SAPToVCMapper:
     """Maps SAP documents to W3C Verifiable Credentials"""
     
-    def __init__(self, base_url: str = "https://example.com"):
+    def __init__(self, base_url: str = "https://example.com", status_service=None,
+                 derived_data: Optional[DerivedDataCache] = None,
+                 strict_totals: bool = False, rates: Optional[RateTable] = None,
+                 spans=None):
         self.base_url = base_url
         self.context_base = "https://github.com/jgmikael/trade-automation/contexts"
+        # Optional tools/status_list.StatusListService; allocates credentialStatus
+        self.status_service = status_service
+        # Shipment aggregates shared by the packing list, insurance and customs VCs
+        self.derived_data = derived_data or DerivedDataCache()
+        # Raise amounts.AmountError when header totals differ from summed lines
+        self.strict_totals = strict_totals
+        # Exchange rates for foreign currency lines and credit checks
+        # (default: mappings/fx.default_rates(), loaded on first use)
+        self._rates = rates
+        # Optional api/profiling.SpanRecorder; times the mapping phases
+        # (amounts, shipment, assembly, status) of profiled requests
+        self.spans = spans
     
     # ========================================================================
     # PURCHASE ORDER → PurchaseOrder VC
@@ -34,87 +57,8 @@ class SAPToVCMapper:
         """
         Map SAP Purchase Order (EKKO/EKPO) to PurchaseOrder W3C VC
         """
-        vendor = get_partner(header.LIFNR)
-        
-        # Map items
-        vc_items = []
-        for item in items:
-            material = get_material(item.MATNR) if item.MATNR else None
-            
-            vc_item = {
-                "type": "GoodsItem",
-                "lineNumber": int(item.EBELP),
-                "productDescription": item.TXZ01 or (material.MAKTX if material else ""),
-                "quantity": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.MENGE),
-                    "unitCode": item.MEINS,
-                },
-                "unitPrice": {
-                    "type": "Amount",
-                    "value": float(item.NETPR),
-                    "currencyCode": item.WAERS,
-                },
-                "lineAmount": {
-                    "type": "Amount",
-                    "value": float(item.MENGE * item.NETPR),
-                    "currencyCode": item.WAERS,
-                },
-            }
-            
-            if item.LAND1:
-                vc_item["originCountry"] = {
-                    "type": "Country",
-                    "countryCode": item.LAND1,
-                }
-            
-            vc_items.append(vc_item)
-        
-        # Build credential
-        credential = {
-            "@context": [
-                "https://www.w3.org/2018/credentials/v1",
-                f"{self.context_base}/purchaseorder-context.jsonld",
-            ],
-            "id": f"{self.base_url}/credentials/po/{header.EBELN}",
-            "type": ["VerifiableCredential", "PurchaseOrderCredential"],
-            "issuer": {
-                "id": issuer_did,
-                "name": "Buyer Company",  # Would come from BUKRS master data
-            },
-            "issuanceDate": self._format_datetime(header.AEDAT),
-            "credentialSubject": {
-                "id": f"{self.base_url}/purchase-orders/{header.EBELN}",
-                "type": "PurchaseOrder",
-                "orderIdentifier": header.EBELN,
-                "orderDate": str(header.AEDAT),
-                "orderAmount": {
-                    "type": "Amount",
-                    "value": float(header.KTWRT) if header.KTWRT else 0.0,
-                    "currencyCode": header.WAERS,
-                },
-                "buyerParty": self._map_buyer_party(header.BUKRS),
-                "sellerParty": self._map_party(vendor) if vendor else None,
-                "hasItem": vc_items,
-            }
-        }
-        
-        # Add payment terms if present
-        if header.ZTERM:
-            credential["credentialSubject"]["definesPaymentTerms"] = {
-                "type": "PaymentTerms",
-                "paymentTermsCode": header.ZTERM,
-            }
-        
-        # Add delivery terms if present
-        if header.INCO1:
-            credential["credentialSubject"]["deliveryTerms"] = {
-                "type": "TradeDeliveryTerms",
-                "incotermsCode": header.INCO1,
-                "namedPlace": header.INCO2,
-            }
-        
-        return credential
+        amounts = self._amounts("purchase_order", purchase_order_amounts, header, items)
+        return self._assemble("purchase_order", header, items, amounts, issuer_did)
     
     # ========================================================================
     # COMMERCIAL INVOICE → CommercialInvoice VC
@@ -125,111 +69,8 @@ class SAPToVCMapper:
         """
         Map SAP Billing Document (VBRK/VBRP) to CommercialInvoice W3C VC
         """
-        customer = get_partner(header.KUNAG)
-        payer = get_partner(header.KUNRG)
-        
-        # Map invoice lines
-        vc_lines = []
-        for item in items:
-            material = get_material(item.MATNR) if item.MATNR else None
-            
-            vc_line = {
-                "type": "InvoiceLine",
-                "lineNumber": int(item.POSNR),
-                "productDescription": item.ARKTX or (material.MAKTX if material else ""),
-                "quantity": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.FKIMG),
-                    "unitCode": item.VRKME,
-                },
-                "lineAmount": {
-                    "type": "MonetaryAmount",
-                    "amountValue": float(item.NETWR),
-                    "currencyCode": item.WAERK,
-                },
-            }
-            
-            if item.HERKL:
-                vc_line["originCountry"] = {
-                    "type": "Country",
-                    "countryCode": item.HERKL,
-                }
-            
-            if material and material.HSNCODE:
-                vc_line["commodityClassification"] = {
-                    "type": "CommodityClassification",
-                    "classificationCode": material.HSNCODE,
-                }
-            
-            vc_lines.append(vc_line)
-        
-        # Build credential
-        credential = {
-            "@context": [
-                "https://www.w3.org/2018/credentials/v1",
-                f"{self.context_base}/commercialinvoice-context.jsonld",
-            ],
-            "id": f"{self.base_url}/credentials/invoice/{header.VBELN}",
-            "type": ["VerifiableCredential", "CommercialInvoiceCredential"],
-            "issuer": {
-                "id": issuer_did,
-                "name": "Seller Company",
-            },
-            "issuanceDate": self._format_datetime(header.FKDAT),
-            "credentialSubject": {
-                "id": f"{self.base_url}/invoices/{header.VBELN}",
-                "type": "CommercialInvoice",
-                "invoiceNumber": header.VBELN,
-                "invoiceDate": str(header.FKDAT),
-                "totalAmount": {
-                    "type": "MonetaryAmount",
-                    "amountValue": float(header.NETWR),
-                    "currencyCode": header.WAERK,
-                },
-                "buyerParty": self._map_party(customer) if customer else None,
-                "sellerParty": self._map_seller_party("SELLER"),
-                "hasInvoiceLine": vc_lines,
-            }
-        }
-        
-        # Add payment terms
-        if header.ZTERM:
-            credential["credentialSubject"]["invoicePaymentTerms"] = {
-                "type": "PaymentTerms",
-                "paymentTermsCode": header.ZTERM,
-            }
-            if header.ZBD1T:
-                credential["credentialSubject"]["paymentDueDate"] = str(
-                    header.FKDAT + timedelta(days=header.ZBD1T)
-                )
-        
-        # Add Incoterms
-        if header.INCO1:
-            credential["credentialSubject"]["deliveryTerms"] = {
-                "type": "TradeDeliveryTerms",
-                "incotermsCode": header.INCO1,
-                "namedPlace": header.INCO2,
-            }
-        
-        # Add Bill of Lading reference
-        if header.BOLNR:
-            credential["credentialSubject"]["relatesToTransportDocument"] = {
-                "type": "TransportDocument",
-                "documentIdentifier": header.BOLNR,
-            }
-        
-        # Add Letter of Credit reference
-        if header.LCNUM:
-            credential["credentialSubject"]["relatesToDocumentaryCredit"] = {
-                "type": "DocumentaryCredit",
-                "creditNumber": header.LCNUM,
-            }
-        
-        # Add sales order reference
-        if header.VBELN_REF:
-            credential["credentialSubject"]["purchaseOrderNumber"] = header.VBELN_REF
-        
-        return credential
+        amounts = self._amounts("commercial_invoice", invoice_amounts, header, items)
+        return self._assemble("commercial_invoice", header, items, amounts, issuer_did)
     
     # ========================================================================
     # DELIVERY → BillOfLading VC
@@ -240,82 +81,7 @@ class SAPToVCMapper:
         """
         Map SAP Delivery (LIKP/LIPS) to BillOfLading W3C VC
         """
-        customer = get_partner(header.KUNNR)
-        
-        # Map goods items
-        vc_goods = []
-        for item in items:
-            material = get_material(item.MATNR) if item.MATNR else None
-            
-            vc_good = {
-                "type": "GoodsItem",
-                "descriptionOfGoodsText": item.ARKTX or (material.MAKTX if material else ""),
-                "grossWeight": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.BRGEW) if item.BRGEW else "0",
-                    "unitCode": item.GEWEI or "KG",
-                },
-                "netWeight": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.NTGEW) if item.NTGEW else "0",
-                    "unitCode": item.GEWEI or "KG",
-                },
-                "quantity": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.LFIMG),
-                    "unitCode": item.VRKME,
-                },
-            }
-            
-            if item.HERKL:
-                vc_good["originCountry"] = {
-                    "type": "Country",
-                    "countryCode": item.HERKL,
-                }
-            
-            vc_goods.append(vc_good)
-        
-        # Build credential
-        credential = {
-            "@context": [
-                "https://www.w3.org/2018/credentials/v1",
-                f"{self.context_base}/billoflading-context.jsonld",
-            ],
-            "id": f"{self.base_url}/credentials/bol/{header.BOLNR or header.VBELN}",
-            "type": ["VerifiableCredential", "BillOfLadingCredential"],
-            "issuer": {
-                "id": issuer_did,
-                "name": "Carrier Company",
-            },
-            "issuanceDate": self._format_datetime(header.WADAT or header.LFDAT),
-            "credentialSubject": {
-                "id": f"{self.base_url}/bills-of-lading/{header.BOLNR or header.VBELN}",
-                "type": "BillOfLading",
-                "documentIdentifier": header.BOLNR or header.VBELN,
-                "issueDate": str(header.WADAT or header.LFDAT),
-                "consigneeParty": self._map_party(customer) if customer else None,
-                "carrierParty": {
-                    "type": "Party",
-                    "partyName": "Carrier Company",  # Would come from carrier master
-                },
-                "hasGoodsItem": vc_goods,
-                "totalGrossWeight": {
-                    "type": "Quantity",
-                    "quantityValue": str(header.BTGEW) if header.BTGEW else "0",
-                    "unitCode": header.GEWEI or "KG",
-                },
-            }
-        }
-        
-        # Add Incoterms
-        if header.INCO1:
-            credential["credentialSubject"]["deliveryTermsText"] = f"{header.INCO1} {header.INCO2 or ''}"
-        
-        # Add delivery date
-        if header.LFDAT:
-            credential["credentialSubject"]["actualDepartureDateTime"] = self._format_datetime(header.LFDAT)
-        
-        return credential
+        return self._assemble("bill_of_lading", header, items, issuer_did)
     
     # ========================================================================
     # CERTIFICATE OF ORIGIN → CertificateOfOrigin VC
@@ -330,92 +96,8 @@ class SAPToVCMapper:
         Certificate of Origin is typically issued by chambers of commerce or customs authorities.
         We derive it from delivery and invoice data.
         """
-        exporter = get_partner(invoice_header.KUNAG)
-        importer = get_partner(delivery_header.KUNNR)
-        
-        # Determine primary origin country from goods
-        origin_countries = set()
-        for item in delivery_items:
-            if item.HERKL:
-                origin_countries.add(item.HERKL)
-        
-        # Map goods
-        vc_goods = []
-        for item in delivery_items:
-            material = get_material(item.MATNR) if item.MATNR else None
-            
-            vc_good = {
-                "type": "GoodsItem",
-                "descriptionOfGoods": item.ARKTX or (material.MAKTX if material else ""),
-                "grossWeight": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.BRGEW) if item.BRGEW else "0",
-                    "unitCode": item.GEWEI or "KG",
-                },
-                "netWeight": {
-                    "type": "Quantity",
-                    "quantityValue": str(item.NTGEW) if item.NTGEW else "0",
-                    "unitCode": item.GEWEI or "KG",
-                },
-            }
-            
-            if item.HERKL:
-                vc_good["originCountry"] = {
-                    "type": "Country",
-                    "countryCode": item.HERKL,
-                }
-            
-            if material and material.HSNCODE:
-                vc_good["commodityClassification"] = {
-                    "type": "CommodityClassification",
-                    "classificationCode": material.HSNCODE,
-                }
-            
-            vc_goods.append(vc_good)
-        
-        # Build credential
-        cert_number = f"COO-{delivery_header.VBELN}-{datetime.now().strftime('%Y%m%d')}"
-        
-        credential = {
-            "@context": [
-                "https://www.w3.org/2018/credentials/v1",
-                f"{self.context_base}/certificateoforigin-context.jsonld",
-            ],
-            "id": f"{self.base_url}/credentials/coo/{cert_number}",
-            "type": ["VerifiableCredential", "CertificateOfOriginCredential"],
-            "issuer": {
-                "id": issuer_did,
-                "name": "Chamber of Commerce",
-            },
-            "issuanceDate": self._format_datetime(datetime.now().date()),
-            "credentialSubject": {
-                "id": f"{self.base_url}/certificates-of-origin/{cert_number}",
-                "type": "CertificateOfOrigin",
-                "certificateNumber": cert_number,
-                "issueDate": str(datetime.now().date()),
-                "exporterParty": self._map_party(exporter) if exporter else None,
-                "importerParty": self._map_party(importer) if importer else None,
-                "issuingAuthorityParty": {
-                    "type": "Party",
-                    "partyName": "Chamber of Commerce",
-                },
-                "issuerParty": {
-                    "type": "Party",
-                    "partyName": "Authorized Official",
-                },
-                "hasGoodsItem": vc_goods,
-            }
-        }
-        
-        # Add invoice reference
-        if invoice_header:
-            credential["credentialSubject"]["invoiceNumber"] = invoice_header.VBELN
-        
-        # Add transport document reference
-        if delivery_header.BOLNR:
-            credential["credentialSubject"]["transportDocumentNumber"] = delivery_header.BOLNR
-        
-        return credential
+        return self._assemble("certificate_of_origin",
+                              delivery_header, delivery_items, invoice_header, issuer_did)
     
     # ========================================================================
     # DOCUMENTARY CREDIT → DocumentaryCredit VC
@@ -426,149 +108,117 @@ class SAPToVCMapper:
         """
         Map SAP Documentary Credit to DocumentaryCredit W3C VC
         """
-        applicant = get_partner(lc.APPLICANT)
-        beneficiary = get_partner(lc.BENEFICIARY)
-        
-        # Build credential
-        credential = {
-            "@context": [
-                "https://www.w3.org/2018/credentials/v1",
-                f"{self.context_base}/documentarycredit-context.jsonld",
-            ],
-            "id": f"{self.base_url}/credentials/lc/{lc.LCNUM}",
-            "type": ["VerifiableCredential", "DocumentaryCreditCredential"],
-            "issuer": {
-                "id": issuer_did,
-                "name": "Issuing Bank",
-            },
-            "issuanceDate": self._format_datetime(lc.ISSUE_DATE),
-            "expirationDate": self._format_datetime(lc.EXPIRY_DATE),
-            "credentialSubject": {
-                "id": f"{self.base_url}/documentary-credits/{lc.LCNUM}",
-                "type": "DocumentaryCredit",
-                "creditNumber": lc.LCNUM,
-                "issueDate": str(lc.ISSUE_DATE),
-                "expiryDate": str(lc.EXPIRY_DATE),
-                "creditAmount": {
-                    "type": "MonetaryAmount",
-                    "amountValue": float(lc.LCAMOUNT),
-                    "currencyCode": lc.LCCURRENCY,
-                },
-                "applicantParty": self._map_party(applicant) if applicant else None,
-                "beneficiaryParty": self._map_party(beneficiary) if beneficiary else None,
-                "issuingBankParty": {
-                    "type": "Bank",
-                    "bankName": "Issuing Bank",
-                    "swiftCode": lc.ISSUING_BANK,
-                },
-                "partialShipmentAllowed": lc.PARTIAL_SHIP,
-                "transshipmentAllowed": lc.TRANSHIP,
-                "presentationPeriodDays": lc.PRES_DAYS,
-            }
-        }
-        
-        # Add advising bank
-        if lc.ADVISING_BANK:
-            credential["credentialSubject"]["advisingBankParty"] = {
-                "type": "Bank",
-                "bankName": "Advising Bank",
-                "swiftCode": lc.ADVISING_BANK,
-            }
-        
-        # Add confirming bank
-        if lc.CONFIRMING_BANK:
-            credential["credentialSubject"]["confirmingBankParty"] = {
-                "type": "Bank",
-                "bankName": "Confirming Bank",
-                "swiftCode": lc.CONFIRMING_BANK,
-            }
-        
-        # Add Incoterms
-        if lc.INCO1:
-            credential["credentialSubject"]["deliveryTerms"] = {
-                "type": "TradeDeliveryTerms",
-                "incotermsCode": lc.INCO1,
-                "namedPlace": lc.INCO2,
-            }
-        
-        # Add document requirements
-        if lc.DOCS_REQUIRED:
-            doc_reqs = []
-            for doc_name in lc.DOCS_REQUIRED:
-                doc_reqs.append({
-                    "type": "DocumentRequirement",
-                    "documentType": doc_name,
-                })
-            credential["credentialSubject"]["requiresDocument"] = doc_reqs
+        return self._assemble("documentary_credit", lc, issuer_did)
+    
+    # ========================================================================
+    # DELIVERY → PackingList VC
+    # ========================================================================
+    
+    def map_packing_list(self, delivery_header: LIKP, delivery_items: List[LIPS],
+                         invoice_header: Optional[VBRK] = None,
+                         invoice_items: Optional[List[VBRP]] = None,
+                         issuer_did: str = "did:example:seller") -> Dict[str, Any]:
+        """
+        Map SAP Delivery (LIKP/LIPS) to PackingList W3C VC
         
-        # Add latest shipment date
-        if lc.LATEST_SHIP_DATE:
-            credential["credentialSubject"]["latestShipmentDate"] = str(lc.LATEST_SHIP_DATE)
+        Pass the invoice as well when issuing the other shipment documents,
+        so all of them share one cached set of aggregates.
+        """
+        shipment = self.shipment(delivery_header, delivery_items, invoice_header, invoice_items)
+        return self._assemble("packing_list", delivery_header, shipment, issuer_did)
+    
+    # ========================================================================
+    # DELIVERY + INVOICE → InsuranceCertificate VC
+    # ========================================================================
+    
+    def map_insurance_certificate(self, delivery_header: LIKP, delivery_items: List[LIPS],
+                                  invoice_header: VBRK, invoice_items: List[VBRP],
+                                  issuer_did: str = "did:example:insurer") -> Dict[str, Any]:
+        """
+        Map SAP delivery and invoice to InsuranceCertificate W3C VC
         
-        return credential
+        Insured amount is the CIF/CIP minimum cover, 110% of the invoice value.
+        """
+        shipment = self.shipment(delivery_header, delivery_items, invoice_header, invoice_items)
+        return self._assemble("insurance_certificate", delivery_header, invoice_header, shipment, issuer_did)
+    
+    # ========================================================================
+    # DELIVERY + INVOICE → CustomsDeclaration VC
+    # ========================================================================
+    
+    def map_customs_declaration(self, delivery_header: LIKP, delivery_items: List[LIPS],
+                                invoice_header: VBRK, invoice_items: List[VBRP],
+                                issuer_did: str = "did:example:customs") -> Dict[str, Any]:
+        """
+        Map SAP delivery and invoice to an export CustomsDeclaration W3C VC
+        """
+        shipment = self.shipment(delivery_header, delivery_items, invoice_header, invoice_items)
+        return self._assemble("customs_declaration", delivery_header, invoice_header, shipment, issuer_did)
     
     # ========================================================================
     # Helper Methods
     # ========================================================================
     
-    def _map_party(self, partner: Optional[Partner]) -> Optional[Dict[str, Any]]:
-        """Map SAP Partner to KTDDE Party"""
-        if not partner:
-            return None
-        
-        party = {
-            "type": "Party",
-            "partyName": partner.NAME1,
-            "hasAddress": {
-                "type": "Address",
-                "street": partner.STREET,
-                "city": partner.CITY,
-                "postalCode": partner.POST_CODE,
-                "country": {
-                    "type": "Country",
-                    "countryCode": partner.COUNTRY,
-                }
-            }
-        }
-        
-        if partner.STCEG:
-            party["taxNumber"] = partner.STCEG
-        
-        return party
-    
-    def _map_buyer_party(self, bukrs: str) -> Dict[str, Any]:
-        """Map buyer party (would come from company code master)"""
-        return {
-            "type": "Party",
-            "partyName": "Buyer Company",
-            "companyCode": bukrs,
-        }
-    
-    def _map_seller_party(self, seller_id: str) -> Dict[str, Any]:
-        """Map seller party"""
-        return {
-            "type": "Party",
-            "partyName": "Seller Company",
-        }
-    
-    def _format_datetime(self, dt) -> str:
-        """Format date/datetime to ISO 8601"""
-        if isinstance(dt, datetime):
-            return dt.isoformat() + "Z"
-        elif isinstance(dt, date):
-            return datetime.combine(dt, datetime.min.time()).isoformat() + "Z"
-        return str(dt)
+    def shipment(self, delivery_header: LIKP, delivery_items: List[LIPS],
+                 invoice_header: Optional[VBRK] = None,
+                 invoice_items: Optional[List[VBRP]] = None) -> ShipmentAggregates:
+        """Cached shipment aggregates (weights, packages, origins, HS codes)"""
+        with self._span("shipment"):
+            return self.derived_data.get(delivery_header, delivery_items, invoice_header, invoice_items)
+    
+    @property
+    def rates(self) -> RateTable:
+        if self._rates is None:
+            self._rates = default_rates()
+        return self._rates
+    
+    def check_credit_coverage(self, credit: ZBANKF, invoice_header: VBRK,
+                              tolerance: Decimal = Decimal("0")) -> CreditCoverage:
+        """Invoice total, in the credit currency, against the L/C amount"""
+        return credit_coverage(credit, invoice_header, self.rates, tolerance)
+    
+    def _amounts(self, document: str, compute, header, items):
+        """Exact amounts of a document, cached with its SAP objects; checked under strict_totals"""
+        if self.spans is None:
+            amounts = self.derived_data.derived(compute, header, items, self.rates)
+        else:
+            with self.spans.span(document, "amounts"):
+                amounts = self.derived_data.derived(compute, header, items, self.rates)
+        return amounts.check() if self.strict_totals else amounts
+    
+    def _assemble(self, document: str, *args) -> Dict[str, Any]:
+        """Run the compiled mapping for document, then attach credential status"""
+        if self.spans is None:  # the common case, without the phase timers' context managers
+            credential = COMPILED[document](*args, self.base_url, self.context_base)
+            if self.status_service is not None:
+                self.status_service.attach(credential)
+            return credential
+        with self.spans.span(document, "assembly"):
+            credential = COMPILED[document](*args, self.base_url, self.context_base)
+        with self.spans.span(document, "status"):
+            return self._with_status(credential)
+    
+    def _span(self, *name: str):
+        """Timer for one mapping phase; a shared no-op unless spans are configured"""
+        return _NO_SPAN if self.spans is None else self.spans.span(*name)
+    
+    def _with_status(self, credential: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach a status list entry (revocation/suspension) if a service is configured"""
+        if self.status_service is not None:
+            self.status_service.attach(credential)
+        return credential
 
 
 # ============================================================================
 # Convenience Functions
 # ============================================================================
 
-def convert_sap_scenario_to_vcs(scenario: Dict[str, Any]) -> Dict[str, Any]:
+def convert_sap_scenario_to_vcs(scenario: Dict[str, Any],
+                                mapper: Optional[SAPToVCMapper] = None) -> Dict[str, Any]:
     """
     Convert an entire SAP trade scenario to W3C VCs
     """
-    mapper = SAPToVCMapper()
+    mapper = mapper or SAPToVCMapper()
     vcs = {}
     
     # Purchase Order
@@ -602,6 +252,18 @@ def convert_sap_scenario_to_vcs(scenario: Dict[str, Any]) -> Dict[str, Any]:
             scenario["invoice"]["header"],
         )
     
+    # Shipment documents (share one set of derived aggregates)
+    if "delivery" in scenario and "invoice" in scenario:
+        shipment_docs = (scenario["delivery"]["header"], scenario["delivery"]["items"],
+                         scenario["invoice"]["header"], scenario["invoice"]["items"])
+        vcs["packing_list_vc"] = mapper.map_packing_list(*shipment_docs)
+        if mapper.shipment(*shipment_docs).insurance_required:
+            vcs["insurance_certificate_vc"] = mapper.map_insurance_certificate(*shipment_docs)
+        vcs["customs_declaration_vc"] = mapper.map_customs_declaration(*shipment_docs)
+    elif "delivery" in scenario:
+        vcs["packing_list_vc"] = mapper.map_packing_list(
+            scenario["delivery"]["header"], scenario["delivery"]["items"])
+    
     # Documentary Credit
     if "documentary_credit" in scenario:
         vcs["documentary_credit_vc"] = mapper.map_documentary_credit(
@@ -166,18 +166,20 @@ class LIKP:
     LFART: str  # Delivery Type
     
     # References
-    VBTYP: str = "J"  # Sales Document Category (J=Delivery)
     VSTEL: str  # Shipping Point
     
     # Customer
     KUNNR: str  # Ship-to Party
-    KUNAG: Optional[str] = None  # Sold-to Party
     
     # Dates
     ERDAT: date  # Creation Date
     LFDAT: date  # Delivery Date
     WADAT: Optional[date] = None  # Goods Issue Date
     
+    # Defaulted references
+    VBTYP: str = "J"  # Sales Document Category (J=Delivery)
+    KUNAG: Optional[str] = None  # Sold-to Party
+    
     # Incoterms
     INCO1: Optional[str] = None  # Incoterms Part 1
     INCO2: Optional[str] = None  # Incoterms Part 2
@@ -312,6 +314,13 @@ class ZBANKF:
     
     # Banks
     ISSUING_BANK: str  # Issuing Bank Code
+    
+    # Dates
+    ISSUE_DATE: date  # Issue Date
+    EXPIRY_DATE: date  # Expiry Date
+    LATEST_SHIP_DATE: Optional[date] = None  # Latest Shipment Date
+    
+    # Optional banks
     ADVISING_BANK: Optional[str] = None  # Advising Bank Code
     CONFIRMING_BANK: Optional[str] = None  # Confirming Bank Code
     
@@ -319,11 +328,6 @@ class ZBANKF:
     LCAMOUNT: Decimal = Decimal("0")  # LC Amount
     LCCURRENCY: str = "EUR"  # LC Currency
     
-    # Dates
-    ISSUE_DATE: date  # Issue Date
-    EXPIRY_DATE: date  # Expiry Date
-    LATEST_SHIP_DATE: Optional[date] = None  # Latest Shipment Date
-    
     # Shipment Terms
     PARTIAL_SHIP: bool = False  # Partial Shipments Allowed
     TRANSHIP: bool = False  # Transshipment Allowed
@@ -354,15 +358,17 @@ class Partner:
     
     # Basic Data
     NAME1: str  # Name 1
-    NAME2: Optional[str] = None  # Name 2
-    NAME3: Optional[str] = None  # Name 3
     
     # Address
     STREET: str  # Street Address
     CITY: str  # City
     POST_CODE: str  # Postal Code
-    REGION: Optional[str] = None  # Region/State
     COUNTRY: str  # Country Code (ISO)
+    REGION: Optional[str] = None  # Region/State
+    
+    # Additional names
+    NAME2: Optional[str] = None  # Name 2
+    NAME3: Optional[str] = None  # Name 3
     
     # Contact
     TEL_NUMBER: Optional[str] = None  # Telephone
@@ -0,0 +1,7 @@
+"""
+Test setup: the simulator's packages are importable from sap-simulator/,
+and importing the api package puts the repository's tools/ and root
+scripts on sys.path (api/__init__.py), so tests import both as the API does.
+"""
+
+import api  # noqa: F401
@@ -0,0 +1,32 @@
+"""Proofs of JSON-LD credentials issued by tools/dual_track_issuer.py"""
+
+import pytest
+
+from dual_track_issuer import DualTrackIssuer, IssuanceError
+from jsonld_processor import CONTEXT_BASE_URL
+
+CONTEXT = f"{CONTEXT_BASE_URL}commercialinvoice-context.jsonld"
+UNAVAILABLE_CONTEXT = "https://example.com/contexts/unavailable.jsonld"
+
+
+def sign(hash_data: bytes) -> bytes:
+    return hash_data[:32]
+
+
+def test_signed_credential():
+    issuer = DualTrackIssuer("did:example:seller", "https://example.com/schemas", signer=sign)
+    credential = issuer.issue_jsonld_vc({"invoiceNumber": "A"}, "CommercialInvoice", CONTEXT)
+    assert "PLACEHOLDER" not in credential["proof"]["proofValue"]
+
+
+def test_credential_that_cannot_be_canonicalized_is_not_signed():
+    issuer = DualTrackIssuer("did:example:seller", "https://example.com/schemas", signer=sign)
+    with pytest.raises(IssuanceError):
+        issuer.issue_jsonld_vc({"invoiceNumber": "A"}, "CommercialInvoice", UNAVAILABLE_CONTEXT)
+
+
+def test_placeholder_proof_only_without_a_signer(caplog):
+    issuer = DualTrackIssuer("did:example:seller", "https://example.com/schemas")
+    credential = issuer.issue_jsonld_vc({"invoiceNumber": "A"}, "CommercialInvoice", UNAVAILABLE_CONTEXT)
+    assert "PLACEHOLDER" in credential["proof"]["proofValue"]
+    assert "Cannot canonicalize CommercialInvoice" in caplog.text
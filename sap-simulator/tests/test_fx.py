@@ -0,0 +1,17 @@
+"""Exchange rate lookups (mappings/fx.py)"""
+
+from datetime import date
+
+from mappings.fx import SAMPLE_RATES, RateTable
+
+
+def test_currency_case_shares_one_cache_entry():
+    rates = RateTable.load(SAMPLE_RATES)
+    day = date(2024, 12, 20)
+
+    upper = rates.rate("USD", "JPY", day)
+    mixed = rates.rate("usd", "Jpy", day)
+
+    assert mixed is upper
+    assert (mixed.source, mixed.target) == ("USD", "JPY")
+    assert (rates.misses, rates.hits) == (1, 1)
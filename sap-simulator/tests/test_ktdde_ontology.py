@@ -0,0 +1,56 @@
+"""KTDDE ontology snapshots (tools/ktdde_ontology.py)"""
+
+import os
+
+import pytest
+
+from ktdde_ontology import HEADER, DEFAULT_RDF, KTDDEOntology, write_snapshot
+
+
+@pytest.fixture(scope="module")
+def snapshot(tmp_path_factory):
+    """A valid snapshot of the repository's ontology, as bytes"""
+    return write_snapshot(str(DEFAULT_RDF), str(tmp_path_factory.mktemp("ktdde") / "built.snapshot"))
+
+
+def opened(path) -> KTDDEOntology:
+    ontology = KTDDEOntology(snapshot_path=str(path))
+    assert ontology.label("invoiceNumber")
+    return ontology
+
+
+def test_valid_snapshot_is_reused(tmp_path, snapshot):
+    path = tmp_path / "ktdde.snapshot"
+    path.write_bytes(snapshot)
+
+    ontology = opened(path)
+
+    assert not ontology.rebuilt
+    ontology.close()
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"",
+    lambda data: data[:HEADER.size - 1],
+    lambda data: data[:HEADER.size],
+    lambda data: data[:len(data) // 2],
+    lambda data: data[:-1],
+    lambda data: b"NOTKTDDE" + data[8:],
+], ids=["empty", "partial-header", "header-only", "half", "last-byte-missing", "bad-magic"])
+def test_damaged_snapshot_is_rebuilt(tmp_path, snapshot, damage):
+    path = tmp_path / "ktdde.snapshot"
+    path.write_bytes(damage(snapshot))
+
+    ontology = opened(path)
+
+    assert ontology.rebuilt
+    assert path.read_bytes() == snapshot
+    ontology.close()
+
+
+def test_write_leaves_no_temporary_files(tmp_path, snapshot):
+    path = tmp_path / "ktdde.snapshot"
+    write_snapshot(str(DEFAULT_RDF), str(path))
+
+    assert os.listdir(tmp_path) == ["ktdde.snapshot"]
+    assert path.read_bytes() == snapshot
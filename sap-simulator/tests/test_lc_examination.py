@@ -0,0 +1,62 @@
+"""UCP 600 examination of the sample scenarios (compliance/lc_examination.py)"""
+
+import dataclasses
+
+import pytest
+
+from compliance.lc_examination import PLACEHOLDER_PARTIES, examine, examine_scenario
+from data.sample_data import PARTNERS, get_all_scenarios
+from mappings.sap_to_vc import convert_sap_scenario_to_vcs
+
+SCENARIOS = get_all_scenarios()
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario["scenario"])
+def test_sample_scenarios_comply(scenario):
+    examination = examine_scenario(scenario)
+
+    assert examination.discrepancies == []
+    assert examination.complying
+    assert [(d.rule, d.document) for d in examination.unverified] == [("invoice-parties", "CommercialInvoice")]
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario["scenario"])
+def test_party_names_are_master_data_or_placeholders(scenario):
+    names = set()
+
+    def collect(node):
+        if isinstance(node, dict):
+            if node.get("type") == "Party" and node.get("partyName"):
+                names.add(node["partyName"])
+            for value in node.values():
+                collect(value)
+        elif isinstance(node, list):
+            for value in node:
+                collect(value)
+
+    collect(convert_sap_scenario_to_vcs(scenario))
+    unknown = names - {partner.NAME1 for partner in PARTNERS.values()}
+    assert {name.casefold() for name in unknown} <= PLACEHOLDER_PARTIES
+
+
+def test_invoice_to_another_applicant_is_a_discrepancy():
+    scenario = dict(SCENARIOS[0])
+    scenario["documentary_credit"] = dataclasses.replace(
+        scenario["documentary_credit"], APPLICANT=SCENARIOS[1]["documentary_credit"].APPLICANT)
+
+    examination = examine_scenario(scenario)
+
+    assert [d.rule for d in examination.discrepancies] == ["invoice-parties"]
+    assert "applicant" in examination.discrepancies[0].message
+
+
+def test_invoice_from_another_seller_is_a_discrepancy():
+    credentials = convert_sap_scenario_to_vcs(SCENARIOS[0])
+    invoice = next(credential["credentialSubject"] for credential in credentials.values()
+                   if credential["credentialSubject"].get("type") == "CommercialInvoice")
+    invoice["sellerParty"] = dict(invoice["sellerParty"], partyName=PARTNERS["300002"].NAME1)
+
+    examination = examine(credentials)
+
+    assert [d.rule for d in examination.discrepancies] == ["invoice-parties"]
+    assert examination.unverified == []
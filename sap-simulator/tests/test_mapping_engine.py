@@ -0,0 +1,54 @@
+"""Compiled mapping specs against the hand-written mappers (mappings/mapping_specs.py)"""
+
+import dataclasses
+import json
+from decimal import Decimal
+
+import pytest
+
+from benchmark_mapping_engine import INTENDED, calls, normalized, variants
+from data.sample_data import get_all_scenarios
+from mappings.mapping_specs import COMPILED
+from mappings.sap_to_vc import SAPToVCMapper
+from sap_to_vc_reference import ReferenceSAPToVCMapper
+
+CASES = [(scenario["scenario"], method, label, variant)
+         for scenario in get_all_scenarios()
+         for method, args in calls(scenario).items()
+         for label, variant in variants(args)]
+EQUIVALENT = [case for case in CASES if case[1:3] not in INTENDED]
+
+
+@pytest.fixture(scope="module")
+def compiled():
+    return SAPToVCMapper()
+
+
+def test_every_spec_compiles():
+    assert len(COMPILED.compile_all().compiled()) == len(COMPILED)
+
+
+@pytest.mark.parametrize("method, variant", [(case[1], case[3]) for case in EQUIVALENT],
+                         ids=["-".join(case[:3]) for case in EQUIVALENT])
+def test_compiled_mapping_matches_hand_written(compiled, method, variant):
+    expected = getattr(ReferenceSAPToVCMapper(), method)(*variant)
+    actual = normalized(getattr(compiled, method)(*variant))
+    assert json.dumps(actual) == json.dumps(expected)
+
+
+def test_every_intended_change_is_a_variant():
+    assert {case[1:3] for case in CASES} >= set(INTENDED)
+
+
+@pytest.mark.parametrize("scenario", get_all_scenarios(), ids=lambda scenario: scenario["scenario"])
+def test_purchase_order_without_header_total_sums_its_lines(compiled, scenario):
+    if "purchase_order" not in scenario:
+        pytest.skip("no purchase order in this scenario")
+    header = dataclasses.replace(scenario["purchase_order"]["header"], KTWRT=None)
+    items = scenario["purchase_order"]["items"]
+
+    subject = compiled.map_purchase_order(header, items)["credentialSubject"]
+
+    lines = sum(Decimal(item["lineAmount"]["value"]) for item in subject["hasItem"])
+    assert Decimal(subject["orderAmount"]["value"]) == lines != 0
+    assert subject["orderAmount"]["currencyCode"] == header.WAERS
@@ -0,0 +1,40 @@
+"""Request profiles (api/profiling.py)"""
+
+import pytest
+from flask import Flask
+
+from api import profiling
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    profiling.install(app)
+
+    @app.route("/vc/ping")
+    def ping():
+        return "pong"
+
+    profiling.clear()
+    yield app.test_client()
+    profiling.clear()
+
+
+def test_profiles_are_keyed_by_a_server_generated_id(client):
+    headers = {profiling.HEADER: "spans", "X-Request-ID": "same-id"}
+
+    first = client.get("/vc/ping", headers=headers).headers["X-Profile-Id"]
+    second = client.get("/vc/ping", headers=headers).headers["X-Profile-Id"]
+
+    assert len({first, second, "same-id"}) == 3
+    assert profiling.get_profile("same-id") is None
+    assert [summary["id"] for summary in profiling.list_profiles("same-id")] == [second, first]
+    assert profiling.get_profile(first).request_id == "same-id"
+
+
+def test_unusable_request_id_is_not_kept(client):
+    response = client.get("/vc/ping", headers={profiling.HEADER: "spans", "X-Request-ID": "a b/c"})
+
+    profile = profiling.get_profile(response.headers["X-Profile-Id"])
+    assert profile.request_id is None
+    assert profile.summary()["requestId"] is None
@@ -0,0 +1,27 @@
+"""REST API request validation (api/sap_api.py)"""
+
+import pytest
+
+from api.sap_api import app
+
+COVERAGE = "/vc/api/v1/documentary-credits/LC-HSBC-SG-2024-00789/coverage"
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize("tolerance", ["NaN", "-NaN", "sNaN", "Infinity", "-Infinity", "-0.10", "ten percent"])
+def test_coverage_rejects_a_tolerance_that_is_not_a_fraction(client, tolerance):
+    response = client.get(COVERAGE, query_string={"tolerance": tolerance})
+
+    assert response.status_code == 400
+    assert "tolerance" in response.get_json()["error"]["message"]
+
+
+@pytest.mark.parametrize("tolerance", ["0", "0.10"])
+def test_coverage_accepts_a_fraction(client, tolerance):
+    response = client.get(COVERAGE, query_string={"tolerance": tolerance})
+
+    assert response.status_code == 200
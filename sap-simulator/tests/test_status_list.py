@@ -0,0 +1,33 @@
+"""Status list entries of issued credentials (tools/status_list.py, tools/dual_track_issuer.py)"""
+
+import time
+
+from dual_track_issuer import DualTrackIssuer
+from jsonld_processor import CONTEXT_BASE_URL
+from status_list import StatusListService
+
+CONTEXT = f"{CONTEXT_BASE_URL}commercialinvoice-context.jsonld"
+
+
+def test_issuances_in_the_same_second_get_their_own_status_entries(monkeypatch):
+    service = StatusListService("https://example.com/status", seed=1)
+    issuer = DualTrackIssuer("did:example:seller", "https://example.com/schemas", status_service=service)
+    monkeypatch.setattr(time, "time", lambda: 1735689600.0)
+
+    a = issuer.issue_jsonld_vc({"invoiceNumber": "A"}, "CommercialInvoice", CONTEXT)
+    b = issuer.issue_jsonld_vc({"invoiceNumber": "B"}, "CommercialInvoice", CONTEXT)
+
+    assert a["id"] != b["id"]
+    indexes = {(entry["statusPurpose"], entry["statusListIndex"])
+               for credential in (a, b) for entry in credential["credentialStatus"]}
+    assert len(indexes) == 2 * len(service.purposes)
+
+    service.update([a["id"]], "revoke")
+    assert service.status(a["id"])["revocation"] is True
+    assert service.status(b["id"])["revocation"] is False
+
+
+def test_allocation_is_stable_for_one_credential_id():
+    service = StatusListService("https://example.com/status", seed=1)
+    assert service.allocate("urn:uuid:one") == service.allocate("urn:uuid:one")
+    assert service.allocate("urn:uuid:one") != service.allocate("urn:uuid:two")
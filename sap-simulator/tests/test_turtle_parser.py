@@ -0,0 +1,62 @@
+"""SHACL shapes read through the Turtle parser (tools/simple_shacl_to_sdjwt.py, tools/turtle_stream.py)"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from api import REPO_ROOT
+from benchmark_turtle_parser import SYNTHETIC_HEADER, write_synthetic
+from simple_shacl_to_sdjwt import camel_to_snake, parse_shacl_shape
+from turtle_stream import TurtleSyntaxError
+
+DATA = Path(__file__).parent / "data"
+SHAPES = sorted(path for path in Path(REPO_ROOT).rglob("*.ttl")
+                if "sh:NodeShape" in path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("path", SHAPES, ids=lambda path: path.name)
+def test_repo_shape_is_well_formed(path):
+    info = parse_shacl_shape(str(path))
+
+    assert info["target_class"]
+    assert info["properties"]
+    claims = [camel_to_snake(prop["path"]) for prop in info["properties"] if prop["path"]]
+    assert len(claims) == len(info["properties"]), "property without sh:path"
+    assert len(set(claims)) == len(claims), "duplicate claim names"
+    assert len(info["properties"]) == path.read_text(encoding="utf-8").count("sh:property")
+
+
+@pytest.mark.parametrize("expected", sorted(DATA.glob("webuild-*-shape.json")), ids=lambda path: path.stem)
+def test_repo_shape_parses_as_the_regex_parser_did(expected):
+    """tests/data holds the regex parser's output for the WE BUILD shapes"""
+    shape = Path(REPO_ROOT) / "analysis" / f"{expected.stem}.ttl"
+
+    assert parse_shacl_shape(str(shape)) == json.loads(expected.read_text(encoding="utf-8"))
+
+
+def test_nested_blank_nodes_strings_and_lists(tmp_path):
+    path = tmp_path / "synthetic.ttl"
+    count = write_synthetic(path, 0.01)
+
+    info = parse_shacl_shape(str(path))
+
+    assert info["uri"] == "bench:SyntheticShape"
+    assert info["label"] == "Synthetic Shape"
+    assert info["description"].startswith("Synthetic shape with many property constraints.\n")
+    assert len(info["properties"]) == count > 1
+    second = info["properties"][1]
+    assert second["path"] == "property2"
+    assert second["description"].startswith("Multi-line description for property 2,\n")
+    assert "[brackets] and (parentheses)" in second["description"]
+    assert second["in"] == ["CODE_A", "CODE_B", "CODE_2"]
+    assert (second["min_count"], second["max_count"]) == (0, 1)
+    assert second["skos_concept"] == "bench-vocab:c_property2"
+
+
+def test_unterminated_blank_node_is_a_syntax_error(tmp_path):
+    path = tmp_path / "broken.ttl"
+    path.write_text(SYNTHETIC_HEADER + "  sh:property [\n    sh:path bench:broken ;\n", encoding="utf-8")
+
+    with pytest.raises(TurtleSyntaxError):
+        parse_shacl_shape(str(path))
@@ -2,9 +2,35 @@
 """
 Complete Finland → Japan Gluelam Timber Export Scenario
 All 15 relevant documents for the trade
+
+TradeScenario builds the documents from its inputs (parties, products,
+dates, document numbers and costs) and computes nothing until asked:
+scenario.documents is a mapping that builds each document on first
+access, and the totals several documents share (goods value, invoice
+and L/C amounts, weight, volume, quantity) are computed once per
+scenario. scenarios() generates distinct shipments, with numbered
+documents and varied dates and quantities, for tests and demos.
+
+The module-level names (DOCUMENTS, TIMELINE, TOTAL_WEIGHT, LC_AMOUNT,
+SHIPMENT_DATE, ...) are those of the default scenario, built on first
+access rather than at import.
+
+Usage:
+    from scenario_gluelam_timber_full import DOCUMENTS, TIMELINE
+
+    from scenario_gluelam_timber_full import TradeScenario, scenarios
+    scenario = TradeScenario(shipment_date=datetime(2025, 3, 3), products=[...])
+    scenario.documents["bill_of_lading"]
+    for scenario in scenarios(1000, seed=1):
+        ...
+
+    python3 scenario_gluelam_timber_full.py [--count 1000]
 """
 
+from collections.abc import Mapping
 from datetime import datetime, timedelta
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional
 
 # Trade participants
 SELLER = {
@@ -41,12 +67,6 @@ FREIGHT_FORWARDER = {
     "contact": "operations@balticlogistics.fi"
 }
 
-# Trade details
-SHIPMENT_DATE = datetime.now() - timedelta(days=10)
-ARRIVAL_DATE = datetime.now() + timedelta(days=35)
-LC_ISSUE_DATE = datetime.now() - timedelta(days=30)
-PO_DATE = datetime.now() - timedelta(days=45)
-
 # Products
 PRODUCTS = [
     {
@@ -77,17 +97,17 @@ PRODUCTS = [
     }
 ]
 
-# Calculate totals
-TOTAL_GOODS_VALUE = sum(p["total"] for p in PRODUCTS)
+# Costs and packing
 FREIGHT_COST = 12000.00
 INSURANCE_COST = 2000.00
-TOTAL_INVOICE = TOTAL_GOODS_VALUE + FREIGHT_COST
-LC_AMOUNT = TOTAL_INVOICE + INSURANCE_COST
-
-TOTAL_WEIGHT = sum(p["quantity"] * p["weight_per_unit"] for p in PRODUCTS)
-TOTAL_VOLUME = sum(p["quantity"] * p["volume_per_unit"] for p in PRODUCTS)
 TOTAL_PACKAGES = 8  # 8 bundles
 
+# Default dates, relative to the shipment date (today - 10 days)
+SHIPMENT_DAYS_AGO = 10
+PO_DAYS_BEFORE_SHIPMENT = 35
+LC_DAYS_BEFORE_SHIPMENT = 20
+TRANSIT_DAYS = 45
+
 # Document IDs
 DOC_IDS = {
     "purchase_order": "4500001000",
@@ -107,538 +127,7 @@ DOC_IDS = {
     "payment_confirmation": "PAY-MUFG-2024-05678"
 }
 
-# All 15 documents for the gluelam timber trade
-DOCUMENTS = {
-    "purchase_order": {
-        "@type": "PurchaseOrder",
-        "purchaseOrderNumber": DOC_IDS["purchase_order"],
-        "issueDate": PO_DATE.strftime("%Y-%m-%d"),
-        "buyerParty": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"],
-            "country": {"@type": "Country", "countryCode": BUYER["country"]}
-        },
-        "sellerParty": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"],
-            "country": {"@type": "Country", "countryCode": SELLER["country"]}
-        },
-        "deliveryTerms": {
-            "@type": "TradeDeliveryTerms",
-            "incoterms": "CFR",
-            "namedPlace": "Tokyo Port, Japan"
-        },
-        "paymentTerms": {
-            "@type": "PaymentTerms",
-            "paymentMeans": "Letter of Credit",
-            "paymentDueDate": (SHIPMENT_DATE + timedelta(days=60)).strftime("%Y-%m-%d")
-        },
-        "goodsItems": [
-            {
-                "@type": "GoodsItem",
-                "itemNumber": str(i+1),
-                "description": prod["description"],
-                "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
-                "unitPrice": {"@type": "MonetaryAmount", "value": prod["unit_price"], "currency": "EUR"},
-                "totalAmount": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
-            } for i, prod in enumerate(PRODUCTS)
-        ],
-        "totalAmount": {
-            "@type": "MonetaryAmount",
-            "value": TOTAL_GOODS_VALUE,
-            "currency": "EUR"
-        }
-    },
-    
-    "documentary_credit": {
-        "@type": "DocumentaryCredit",
-        "creditNumber": DOC_IDS["documentary_credit"],
-        "issueDate": LC_ISSUE_DATE.strftime("%Y-%m-%d"),
-        "expiryDate": (LC_ISSUE_DATE + timedelta(days=90)).strftime("%Y-%m-%d"),
-        "applicant": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "beneficiary": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "issuingBank": {
-            "@type": "Bank",
-            "bankName": BUYER["bank"],
-            "swiftCode": BUYER["swift"]
-        },
-        "advisingBank": {
-            "@type": "Bank",
-            "bankName": SELLER["bank"],
-            "swiftCode": SELLER["swift"]
-        },
-        "creditAmount": {
-            "@type": "MonetaryAmount",
-            "value": LC_AMOUNT,
-            "currency": "EUR"
-        },
-        "creditType": "Confirmed Irrevocable",
-        "presentationPeriod": "21 days after shipment date",
-        "documentsRequired": [
-            "Commercial Invoice",
-            "Bill of Lading",
-            "Certificate of Origin",
-            "Packing List",
-            "Insurance Certificate",
-            "Phytosanitary Certificate"
-        ]
-    },
-    
-    "bill_of_lading": {
-        "@type": "BillOfLading",
-        "blNumber": DOC_IDS["bill_of_lading"],
-        "issueDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "carrierParty": {
-            "@type": "Party",
-            "partyName": CARRIER["name"]
-        },
-        "shipperParty": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "consigneeParty": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "notifyParty": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "contactInfo": BUYER["contact"]
-        },
-        "portOfLoading": {
-            "@type": "Location",
-            "locationName": "Rauma Port",
-            "countryCode": "FI"
-        },
-        "portOfDischarge": {
-            "@type": "Location",
-            "locationName": "Tokyo Port",
-            "countryCode": "JP"
-        },
-        "vessel": "MV Baltic Express",
-        "voyageNumber": "V2024-FI-123",
-        "goodsDescription": "Engineered Gluelam Timber Beams",
-        "numberOfPackages": TOTAL_PACKAGES,
-        "grossWeight": {
-            "@type": "Quantity",
-            "value": TOTAL_WEIGHT,
-            "unitCode": "KGM"
-        },
-        "volume": {
-            "@type": "Quantity",
-            "value": TOTAL_VOLUME,
-            "unitCode": "MTQ"
-        },
-        "freightPayable": "Prepaid",
-        "deliveryTerms": "CFR Tokyo Port"
-    },
-    
-    "commercial_invoice": {
-        "@type": "CommercialInvoice",
-        "invoiceNumber": DOC_IDS["commercial_invoice"],
-        "issueDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "sellerParty": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"],
-            "vatNumber": SELLER["vat"]
-        },
-        "buyerParty": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"],
-            "taxId": BUYER["tax_id"]
-        },
-        "invoiceLines": [
-            {
-                "@type": "InvoiceLine",
-                "lineNumber": str(i+1),
-                "productDescription": prod["description"],
-                "hsCode": prod["hs_code"],
-                "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
-                "unitPrice": {"@type": "MonetaryAmount", "value": prod["unit_price"], "currency": "EUR"},
-                "lineTotal": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
-            } for i, prod in enumerate(PRODUCTS)
-        ],
-        "subtotal": {"@type": "MonetaryAmount", "value": TOTAL_GOODS_VALUE, "currency": "EUR"},
-        "freightCharges": {"@type": "MonetaryAmount", "value": FREIGHT_COST, "currency": "EUR"},
-        "totalAmount": {"@type": "MonetaryAmount", "value": TOTAL_INVOICE, "currency": "EUR"},
-        "paymentTerms": "Letter of Credit No. " + DOC_IDS["documentary_credit"],
-        "deliveryTerms": "CFR Tokyo Port",
-        "referenceBL": DOC_IDS["bill_of_lading"],
-        "referenceLC": DOC_IDS["documentary_credit"]
-    },
-    
-    "certificate_of_origin": {
-        "@type": "CertificateOfOrigin",
-        "certificateNumber": DOC_IDS["certificate_of_origin"],
-        "issueDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "issuingAuthority": {
-            "@type": "Party",
-            "partyName": "Finnish Chamber of Commerce",
-            "postalAddress": "Helsinki, Finland"
-        },
-        "exporter": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "consignee": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "countryOfOrigin": {
-            "@type": "Country",
-            "countryCode": "FI",
-            "countryName": "Finland"
-        },
-        "goodsDescription": "Engineered Gluelam Timber Beams (GL30c, GL32h)",
-        "hsCode": "4418.91",
-        "referenceBL": DOC_IDS["bill_of_lading"],
-        "referenceInvoice": DOC_IDS["commercial_invoice"]
-    },
-    
-    "packing_list": {
-        "@type": "PackingList",
-        "packingListNumber": DOC_IDS["packing_list"],
-        "issueDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "shipper": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "consignee": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "packages": [
-            {
-                "@type": "Package",
-                "packageNumber": f"BUNDLE-{i+1:03d}",
-                "packageType": "Timber Bundle",
-                "contents": f"{PRODUCTS[i % len(PRODUCTS)]['description']} (x{PRODUCTS[i % len(PRODUCTS)]['quantity'] // (TOTAL_PACKAGES // len(PRODUCTS))})",
-                "grossWeight": {"@type": "Quantity", "value": TOTAL_WEIGHT / TOTAL_PACKAGES, "unitCode": "KGM"},
-                "dimensions": "Strapped timber bundle"
-            } for i in range(TOTAL_PACKAGES)
-        ],
-        "totalGrossWeight": {"@type": "Quantity", "value": TOTAL_WEIGHT, "unitCode": "KGM"},
-        "totalNetWeight": {"@type": "Quantity", "value": TOTAL_WEIGHT * 0.98, "unitCode": "KGM"},
-        "totalVolume": {"@type": "Quantity", "value": TOTAL_VOLUME, "unitCode": "MTQ"},
-        "referenceBL": DOC_IDS["bill_of_lading"],
-        "referenceInvoice": DOC_IDS["commercial_invoice"]
-    },
-    
-    "insurance_certificate": {
-        "@type": "InsuranceCertificate",
-        "certificateNumber": DOC_IDS["insurance_certificate"],
-        "issueDate": (SHIPMENT_DATE - timedelta(days=2)).strftime("%Y-%m-%d"),
-        "insurer": {
-            "@type": "Party",
-            "partyName": "Nordic Marine Insurance AS",
-            "postalAddress": "Oslo, Norway"
-        },
-        "insured": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "policyNumber": "NMI-2024-TIMBER-5678",
-        "insuredAmount": {"@type": "MonetaryAmount", "value": LC_AMOUNT * 1.1, "currency": "EUR"},
-        "coverage": "All Risks (Institute Cargo Clauses A)",
-        "goodsDescription": "Gluelam Timber Beams - 160 PCS total",
-        "voyage": "Rauma Port, Finland to Tokyo Port, Japan",
-        "vessel": "MV Baltic Express",
-        "referenceBL": DOC_IDS["bill_of_lading"]
-    },
-    
-    "phytosanitary_certificate": {
-        "@type": "PhytosanitaryCertificate",
-        "certificateNumber": DOC_IDS["phytosanitary_certificate"],
-        "issueDate": (SHIPMENT_DATE - timedelta(days=1)).strftime("%Y-%m-%d"),
-        "issuingAuthority": {
-            "@type": "Party",
-            "partyName": "Finnish Food Authority - Plant Health Unit",
-            "postalAddress": "Helsinki, Finland"
-        },
-        "exporter": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "consignee": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "placeOfOrigin": "Finland - Kainuu Region",
-        "declaredMeansOfConveyance": "Sea Freight - Container",
-        "pointOfEntry": "Tokyo Port, Japan",
-        "botanicalName": "Picea abies (Norway Spruce), Pinus sylvestris (Scots Pine)",
-        "treatment": "Heat treatment ISPM-15 compliant, Kiln dried to 12% moisture content",
-        "disinfestationMethod": "HT (Heat Treatment) 56°C for 30 minutes",
-        "additionalDeclaration": "Wood products free from bark, treated according to ISPM-15 standard",
-        "inspectionDate": (SHIPMENT_DATE - timedelta(days=2)).strftime("%Y-%m-%d"),
-        "inspectorName": "Dr. Matti Virtanen"
-    },
-    
-    "customs_declaration_export": {
-        "@type": "CustomsDeclaration",
-        "declarationNumber": DOC_IDS["customs_declaration_export"],
-        "declarationType": "Export Declaration",
-        "declarationDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "declarant": {
-            "@type": "Party",
-            "partyName": FREIGHT_FORWARDER["name"],
-            "postalAddress": FREIGHT_FORWARDER["address"]
-        },
-        "exporter": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"],
-            "eoriNumber": "FI" + SELLER["vat"]
-        },
-        "importer": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "customsOffice": {
-            "@type": "CustomsOffice",
-            "officeName": "Finnish Customs - Rauma",
-            "officeCode": "FI-RAU-001"
-        },
-        "goodsItems": [
-            {
-                "@type": "GoodsItem",
-                "itemNumber": str(i+1),
-                "description": prod["description"],
-                "hsCode": prod["hs_code"],
-                "origin": "FI",
-                "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
-                "value": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
-            } for i, prod in enumerate(PRODUCTS)
-        ],
-        "totalInvoiceAmount": {"@type": "MonetaryAmount", "value": TOTAL_GOODS_VALUE, "currency": "EUR"},
-        "destinationCountry": "JP",
-        "exportProcedure": "10 - Permanent export",
-        "referenceBL": DOC_IDS["bill_of_lading"],
-        "referenceInvoice": DOC_IDS["commercial_invoice"]
-    },
-    
-    "customs_declaration_import": {
-        "@type": "CustomsDeclaration",
-        "declarationNumber": DOC_IDS["customs_declaration_import"],
-        "declarationType": "Import Declaration",
-        "declarationDate": ARRIVAL_DATE.strftime("%Y-%m-%d"),
-        "declarant": {
-            "@type": "Party",
-            "partyName": "Tokyo Customs Broker KK",
-            "postalAddress": "Tokyo, Japan"
-        },
-        "exporter": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "importer": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"],
-            "customsId": BUYER["tax_id"]
-        },
-        "customsOffice": {
-            "@type": "CustomsOffice",
-            "officeName": "Japan Customs - Tokyo Port",
-            "officeCode": "JP-TYO-PORT"
-        },
-        "goodsItems": [
-            {
-                "@type": "GoodsItem",
-                "itemNumber": str(i+1),
-                "description": prod["description"],
-                "hsCode": prod["hs_code"],
-                "origin": "FI",
-                "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
-                "value": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
-            } for i, prod in enumerate(PRODUCTS)
-        ],
-        "totalInvoiceAmount": {"@type": "MonetaryAmount", "value": TOTAL_INVOICE, "currency": "EUR"},
-        "assessedDuties": {"@type": "MonetaryAmount", "value": 0.00, "currency": "JPY", "note": "Zero duty under EU-Japan EPA"},
-        "importProcedure": "40 - Release for free circulation",
-        "preferentialTreatment": "EU-Japan Economic Partnership Agreement (EPA)",
-        "referenceBL": DOC_IDS["bill_of_lading"],
-        "referenceInvoice": DOC_IDS["commercial_invoice"]
-    },
-    
-    "delivery_note": {
-        "@type": "DeliveryNote",
-        "deliveryNoteNumber": DOC_IDS["delivery_note"],
-        "deliveryDate": (ARRIVAL_DATE + timedelta(days=3)).strftime("%Y-%m-%d"),
-        "supplier": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "recipient": {
-            "@type": "Party",
-            "partyName": BUYER["name"],
-            "postalAddress": BUYER["address"]
-        },
-        "deliveryAddress": BUYER["address"] + " - Construction Site Warehouse",
-        "carrierParty": {
-            "@type": "Party",
-            "partyName": "Tokyo Logistics KK",
-            "vehicleRegistration": "Tokyo 500 た 1234"
-        },
-        "deliveryNoteLines": [
-            {
-                "@type": "DeliveryNoteLine",
-                "lineNumber": str(i+1),
-                "productDescription": prod["description"],
-                "deliveredQuantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
-                "condition": "Good"
-            } for i, prod in enumerate(PRODUCTS)
-        ],
-        "receivedBy": "Tanaka-san (Site Manager)",
-        "receivedDate": (ARRIVAL_DATE + timedelta(days=3)).strftime("%Y-%m-%d"),
-        "referencePO": DOC_IDS["purchase_order"],
-        "referenceBL": DOC_IDS["bill_of_lading"]
-    },
-    
-    "regulatory_certificate": {
-        "@type": "RegulatoryCertificate",
-        "certificateNumber": DOC_IDS["regulatory_certificate"],
-        "issueDate": (SHIPMENT_DATE - timedelta(days=5)).strftime("%Y-%m-%d"),
-        "issuingAuthority": {
-            "@type": "Party",
-            "partyName": "TÜV SÜD Finland Oy",
-            "postalAddress": "Helsinki, Finland"
-        },
-        "applicant": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "certificateType": "CE Marking - Structural Timber",
-        "productDescription": "Glued laminated timber (Glulam) structural beams",
-        "standard": "EN 14080:2013 - Timber structures - Glued laminated timber and glued solid timber",
-        "grades": "GL30c, GL32h",
-        "strengthClass": "GL30c (f_m,g,k = 30 N/mm²), GL32h (f_m,g,k = 32 N/mm²)",
-        "testResults": "All mechanical properties compliant with EN 14080:2013",
-        "factoryProductionControl": "ISO 9001:2015 certified",
-        "validityPeriod": "5 years from issue date",
-        "remarks": "Suitable for structural use in construction per Eurocode 5"
-    },
-    
-    "sea_cargo_manifest": {
-        "@type": "SeaCargoManifest",
-        "manifestNumber": DOC_IDS["sea_cargo_manifest"],
-        "issueDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "vessel": {
-            "@type": "TransportMeans",
-            "vesselName": "MV Baltic Express",
-            "imoNumber": "IMO9876543",
-            "flag": "Finland"
-        },
-        "voyage": "V2024-FI-123",
-        "portOfLoading": {
-            "@type": "Location",
-            "locationName": "Rauma Port",
-            "unlocode": "FIRAU"
-        },
-        "portOfDischarge": {
-            "@type": "Location",
-            "locationName": "Tokyo Port",
-            "unlocode": "JPTYO"
-        },
-        "carrierParty": {
-            "@type": "Party",
-            "partyName": CARRIER["name"]
-        },
-        "consignments": [
-            {
-                "@type": "Consignment",
-                "blNumber": DOC_IDS["bill_of_lading"],
-                "shipper": SELLER["name"],
-                "consignee": BUYER["name"],
-                "description": "Gluelam Timber Beams",
-                "packages": TOTAL_PACKAGES,
-                "weight": {"@type": "Quantity", "value": TOTAL_WEIGHT, "unitCode": "KGM"},
-                "volume": {"@type": "Quantity", "value": TOTAL_VOLUME, "unitCode": "MTQ"}
-            }
-        ],
-        "totalPackages": TOTAL_PACKAGES,
-        "totalWeight": {"@type": "Quantity", "value": TOTAL_WEIGHT, "unitCode": "KGM"}
-    },
-    
-    "warehouse_receipt": {
-        "@type": "WarehouseReceipt",
-        "receiptNumber": DOC_IDS["warehouse_receipt"],
-        "issueDate": (SHIPMENT_DATE - timedelta(days=3)).strftime("%Y-%m-%d"),
-        "warehouse": {
-            "@type": "Party",
-            "partyName": "Rauma Port Warehouse Services Oy",
-            "postalAddress": "Rauma Port Terminal, 26100 Rauma, Finland"
-        },
-        "depositor": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "postalAddress": SELLER["address"]
-        },
-        "goodsDescription": "Gluelam timber beams (160 pieces) ready for export",
-        "quantity": {
-            "@type": "Quantity",
-            "value": 160,
-            "unitCode": "PCS"
-        },
-        "weight": {"@type": "Quantity", "value": TOTAL_WEIGHT, "unitCode": "KGM"},
-        "storageLocation": "Export Warehouse Section B-12",
-        "storageStartDate": (SHIPMENT_DATE - timedelta(days=3)).strftime("%Y-%m-%d"),
-        "storageEndDate": SHIPMENT_DATE.strftime("%Y-%m-%d"),
-        "releaseCondition": "Released for shipment on B/L " + DOC_IDS["bill_of_lading"]
-    },
-    
-    "payment_confirmation": {
-        "@type": "PaymentConfirmation",
-        "confirmationNumber": DOC_IDS["payment_confirmation"],
-        "paymentDate": (SHIPMENT_DATE + timedelta(days=25)).strftime("%Y-%m-%d"),
-        "payer": {
-            "@type": "Party",
-            "partyName": BUYER["bank"],
-            "swiftCode": BUYER["swift"]
-        },
-        "payee": {
-            "@type": "Party",
-            "partyName": SELLER["name"],
-            "bankAccount": SELLER["iban"],
-            "swiftCode": SELLER["swift"]
-        },
-        "paymentAmount": {
-            "@type": "MonetaryAmount",
-            "value": TOTAL_INVOICE,
-            "currency": "EUR"
-        },
-        "paymentMethod": "Documentary Credit Settlement",
-        "referenceDocument": "L/C No. " + DOC_IDS["documentary_credit"],
-        "paymentStatus": "Completed",
-        "transactionId": "SWIFT-MT700-2024-05678",
-        "valueDate": (SHIPMENT_DATE + timedelta(days=25)).strftime("%Y-%m-%d")
-    }
-}
+DOCUMENT_TYPES = tuple(DOC_IDS)
 
 # Actor views - who sees which documents
 ACTOR_VIEWS = {
@@ -679,27 +168,762 @@ ACTOR_VIEWS = {
     ]
 }
 
-# Timeline events
-TIMELINE = [
-    {"date": (PO_DATE).strftime("%Y-%m-%d"), "event": "Purchase Order Issued", "actor": "Buyer", "doc": "purchase_order"},
-    {"date": (LC_ISSUE_DATE).strftime("%Y-%m-%d"), "event": "Letter of Credit Opened", "actor": "Bank", "doc": "documentary_credit"},
-    {"date": (SHIPMENT_DATE - timedelta(days=5)).strftime("%Y-%m-%d"), "event": "CE Certification Completed", "actor": "Certifier", "doc": "regulatory_certificate"},
-    {"date": (SHIPMENT_DATE - timedelta(days=3)).strftime("%Y-%m-%d"), "event": "Goods Stored at Port Warehouse", "actor": "Warehouse", "doc": "warehouse_receipt"},
-    {"date": (SHIPMENT_DATE - timedelta(days=2)).strftime("%Y-%m-%d"), "event": "Phytosanitary Inspection", "actor": "Authority", "doc": "phytosanitary_certificate"},
-    {"date": (SHIPMENT_DATE - timedelta(days=2)).strftime("%Y-%m-%d"), "event": "Insurance Certificate Issued", "actor": "Insurer", "doc": "insurance_certificate"},
-    {"date": (SHIPMENT_DATE - timedelta(days=1)).strftime("%Y-%m-%d"), "event": "Certificate of Origin Issued", "actor": "Chamber", "doc": "certificate_of_origin"},
-    {"date": SHIPMENT_DATE.strftime("%Y-%m-%d"), "event": "Goods Loaded & Shipped", "actor": "Carrier", "doc": "bill_of_lading"},
-    {"date": SHIPMENT_DATE.strftime("%Y-%m-%d"), "event": "Commercial Invoice Issued", "actor": "Seller", "doc": "commercial_invoice"},
-    {"date": SHIPMENT_DATE.strftime("%Y-%m-%d"), "event": "Packing List Created", "actor": "Seller", "doc": "packing_list"},
-    {"date": SHIPMENT_DATE.strftime("%Y-%m-%d"), "event": "Export Customs Clearance", "actor": "Customs", "doc": "customs_declaration_export"},
-    {"date": SHIPMENT_DATE.strftime("%Y-%m-%d"), "event": "Sea Cargo Manifest Filed", "actor": "Carrier", "doc": "sea_cargo_manifest"},
-    {"date": (SHIPMENT_DATE + timedelta(days=25)).strftime("%Y-%m-%d"), "event": "Payment Processed", "actor": "Bank", "doc": "payment_confirmation"},
-    {"date": ARRIVAL_DATE.strftime("%Y-%m-%d"), "event": "Vessel Arrives Tokyo Port", "actor": "Carrier", "doc": None},
-    {"date": ARRIVAL_DATE.strftime("%Y-%m-%d"), "event": "Import Customs Clearance", "actor": "Customs", "doc": "customs_declaration_import"},
-    {"date": (ARRIVAL_DATE + timedelta(days=3)).strftime("%Y-%m-%d"), "event": "Final Delivery to Buyer", "actor": "Logistics", "doc": "delivery_note"}
-]
+def day(value: datetime) -> str:
+    """YYYY-MM-DD (the documents' date format), without strftime's cost"""
+    return value.isoformat()[:10]
+
+
+class ScenarioDocuments(Mapping):
+    """Document type → document, each built on first access"""
+
+    def __init__(self, scenario: 'TradeScenario'):
+        self._scenario = scenario
+        self._built: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, document: str) -> Dict[str, Any]:
+        built = self._built.get(document)
+        if built is None:
+            if document not in DOC_IDS:
+                raise KeyError(document)
+            built = self._built[document] = getattr(self._scenario, "_" + document)()
+        return built
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(DOCUMENT_TYPES)
+
+    def __len__(self) -> int:
+        return len(DOCUMENT_TYPES)
+
+    def built(self) -> List[str]:
+        return list(self._built)
+
+
+class TradeScenario:
+    """One shipment of the trade; documents and totals are computed on demand"""
+
+    def __init__(self, seller: Optional[Dict[str, str]] = None, buyer: Optional[Dict[str, str]] = None,
+                 carrier: Optional[Dict[str, str]] = None, freight_forwarder: Optional[Dict[str, str]] = None,
+                 products: Optional[List[Dict[str, Any]]] = None, shipment_date: Optional[datetime] = None,
+                 po_date: Optional[datetime] = None, lc_issue_date: Optional[datetime] = None,
+                 arrival_date: Optional[datetime] = None, doc_ids: Optional[Dict[str, str]] = None,
+                 freight_cost: float = FREIGHT_COST, insurance_cost: float = INSURANCE_COST,
+                 packages: int = TOTAL_PACKAGES):
+        self.seller = seller or SELLER
+        self.buyer = buyer or BUYER
+        self.carrier = carrier or CARRIER
+        self.freight_forwarder = freight_forwarder or FREIGHT_FORWARDER
+        self.products = products or PRODUCTS
+        self.shipment_date = shipment_date or datetime.now() - timedelta(days=SHIPMENT_DAYS_AGO)
+        self.po_date = po_date or self.shipment_date - timedelta(days=PO_DAYS_BEFORE_SHIPMENT)
+        self.lc_issue_date = lc_issue_date or self.shipment_date - timedelta(days=LC_DAYS_BEFORE_SHIPMENT)
+        self.arrival_date = arrival_date or self.shipment_date + timedelta(days=TRANSIT_DAYS)
+        self.doc_ids = {**DOC_IDS, **(doc_ids or {})}
+        self.freight_cost = freight_cost
+        self.insurance_cost = insurance_cost
+        self.packages = packages
+        self.documents = ScenarioDocuments(self)
+
+    # ------------------------------------------------------------------
+    # Shared derived values, computed once
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def total_goods_value(self) -> float:
+        return sum(p["total"] for p in self.products)
+
+    @cached_property
+    def total_invoice(self) -> float:
+        return self.total_goods_value + self.freight_cost
+
+    @cached_property
+    def lc_amount(self) -> float:
+        return self.total_invoice + self.insurance_cost
+
+    @cached_property
+    def total_weight(self) -> float:
+        return sum(p["quantity"] * p["weight_per_unit"] for p in self.products)
+
+    @cached_property
+    def total_volume(self) -> float:
+        return sum(p["quantity"] * p["volume_per_unit"] for p in self.products)
+
+    @cached_property
+    def total_quantity(self) -> int:
+        return sum(p["quantity"] for p in self.products)
+
+    @cached_property
+    def grades(self) -> str:
+        return ", ".join(dict.fromkeys(p["grade"] for p in self.products))
+
+    @cached_property
+    def timeline(self) -> List[Dict[str, Any]]:
+        """Timeline events, in date order"""
+        shipment, arrival = self.shipment_date, self.arrival_date
+        return [
+            {"date": day(self.po_date), "event": "Purchase Order Issued", "actor": "Buyer", "doc": "purchase_order"},
+            {"date": day(self.lc_issue_date), "event": "Letter of Credit Opened", "actor": "Bank", "doc": "documentary_credit"},
+            {"date": day(shipment - timedelta(days=5)), "event": "CE Certification Completed", "actor": "Certifier", "doc": "regulatory_certificate"},
+            {"date": day(shipment - timedelta(days=3)), "event": "Goods Stored at Port Warehouse", "actor": "Warehouse", "doc": "warehouse_receipt"},
+            {"date": day(shipment - timedelta(days=2)), "event": "Phytosanitary Inspection", "actor": "Authority", "doc": "phytosanitary_certificate"},
+            {"date": day(shipment - timedelta(days=2)), "event": "Insurance Certificate Issued", "actor": "Insurer", "doc": "insurance_certificate"},
+            {"date": day(shipment - timedelta(days=1)), "event": "Certificate of Origin Issued", "actor": "Chamber", "doc": "certificate_of_origin"},
+            {"date": day(shipment), "event": "Goods Loaded & Shipped", "actor": "Carrier", "doc": "bill_of_lading"},
+            {"date": day(shipment), "event": "Commercial Invoice Issued", "actor": "Seller", "doc": "commercial_invoice"},
+            {"date": day(shipment), "event": "Packing List Created", "actor": "Seller", "doc": "packing_list"},
+            {"date": day(shipment), "event": "Export Customs Clearance", "actor": "Customs", "doc": "customs_declaration_export"},
+            {"date": day(shipment), "event": "Sea Cargo Manifest Filed", "actor": "Carrier", "doc": "sea_cargo_manifest"},
+            {"date": day(shipment + timedelta(days=25)), "event": "Payment Processed", "actor": "Bank", "doc": "payment_confirmation"},
+            {"date": day(arrival), "event": "Vessel Arrives Tokyo Port", "actor": "Carrier", "doc": None},
+            {"date": day(arrival), "event": "Import Customs Clearance", "actor": "Customs", "doc": "customs_declaration_import"},
+            {"date": day(arrival + timedelta(days=3)), "event": "Final Delivery to Buyer", "actor": "Logistics", "doc": "delivery_note"}
+        ]
+
+    def _bundle_contents(self, bundle: int) -> str:
+        product = self.products[bundle % len(self.products)]
+        bundles_per_product = max(1, self.packages // len(self.products))
+        return f"{product['description']} (x{product['quantity'] // bundles_per_product})"
+
+    # ------------------------------------------------------------------
+    # The 15 documents of the gluelam timber trade
+    # ------------------------------------------------------------------
+
+    def _purchase_order(self) -> Dict[str, Any]:
+        return {
+            "@type": "PurchaseOrder",
+            "purchaseOrderNumber": self.doc_ids["purchase_order"],
+            "issueDate": day(self.po_date),
+            "buyerParty": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"],
+                "country": {"@type": "Country", "countryCode": self.buyer["country"]}
+            },
+            "sellerParty": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"],
+                "country": {"@type": "Country", "countryCode": self.seller["country"]}
+            },
+            "deliveryTerms": {
+                "@type": "TradeDeliveryTerms",
+                "incoterms": "CFR",
+                "namedPlace": "Tokyo Port, Japan"
+            },
+            "paymentTerms": {
+                "@type": "PaymentTerms",
+                "paymentMeans": "Letter of Credit",
+                "paymentDueDate": day(self.shipment_date + timedelta(days=60))
+            },
+            "goodsItems": [
+                {
+                    "@type": "GoodsItem",
+                    "itemNumber": str(i+1),
+                    "description": prod["description"],
+                    "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
+                    "unitPrice": {"@type": "MonetaryAmount", "value": prod["unit_price"], "currency": "EUR"},
+                    "totalAmount": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
+                } for i, prod in enumerate(self.products)
+            ],
+            "totalAmount": {
+                "@type": "MonetaryAmount",
+                "value": self.total_goods_value,
+                "currency": "EUR"
+            }
+        }
+
+    def _documentary_credit(self) -> Dict[str, Any]:
+        return {
+            "@type": "DocumentaryCredit",
+            "creditNumber": self.doc_ids["documentary_credit"],
+            "issueDate": day(self.lc_issue_date),
+            "expiryDate": day(self.lc_issue_date + timedelta(days=90)),
+            "applicant": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "beneficiary": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "issuingBank": {
+                "@type": "Bank",
+                "bankName": self.buyer["bank"],
+                "swiftCode": self.buyer["swift"]
+            },
+            "advisingBank": {
+                "@type": "Bank",
+                "bankName": self.seller["bank"],
+                "swiftCode": self.seller["swift"]
+            },
+            "creditAmount": {
+                "@type": "MonetaryAmount",
+                "value": self.lc_amount,
+                "currency": "EUR"
+            },
+            "creditType": "Confirmed Irrevocable",
+            "presentationPeriod": "21 days after shipment date",
+            "documentsRequired": [
+                "Commercial Invoice",
+                "Bill of Lading",
+                "Certificate of Origin",
+                "Packing List",
+                "Insurance Certificate",
+                "Phytosanitary Certificate"
+            ]
+        }
+
+    def _bill_of_lading(self) -> Dict[str, Any]:
+        return {
+            "@type": "BillOfLading",
+            "blNumber": self.doc_ids["bill_of_lading"],
+            "issueDate": day(self.shipment_date),
+            "carrierParty": {
+                "@type": "Party",
+                "partyName": self.carrier["name"]
+            },
+            "shipperParty": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "consigneeParty": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "notifyParty": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "contactInfo": self.buyer["contact"]
+            },
+            "portOfLoading": {
+                "@type": "Location",
+                "locationName": "Rauma Port",
+                "countryCode": "FI"
+            },
+            "portOfDischarge": {
+                "@type": "Location",
+                "locationName": "Tokyo Port",
+                "countryCode": "JP"
+            },
+            "vessel": "MV Baltic Express",
+            "voyageNumber": "V2024-FI-123",
+            "goodsDescription": "Engineered Gluelam Timber Beams",
+            "numberOfPackages": self.packages,
+            "grossWeight": {
+                "@type": "Quantity",
+                "value": self.total_weight,
+                "unitCode": "KGM"
+            },
+            "volume": {
+                "@type": "Quantity",
+                "value": self.total_volume,
+                "unitCode": "MTQ"
+            },
+            "freightPayable": "Prepaid",
+            "deliveryTerms": "CFR Tokyo Port"
+        }
+
+    def _commercial_invoice(self) -> Dict[str, Any]:
+        return {
+            "@type": "CommercialInvoice",
+            "invoiceNumber": self.doc_ids["commercial_invoice"],
+            "issueDate": day(self.shipment_date),
+            "sellerParty": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"],
+                "vatNumber": self.seller["vat"]
+            },
+            "buyerParty": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"],
+                "taxId": self.buyer["tax_id"]
+            },
+            "invoiceLines": [
+                {
+                    "@type": "InvoiceLine",
+                    "lineNumber": str(i+1),
+                    "productDescription": prod["description"],
+                    "hsCode": prod["hs_code"],
+                    "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
+                    "unitPrice": {"@type": "MonetaryAmount", "value": prod["unit_price"], "currency": "EUR"},
+                    "lineTotal": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
+                } for i, prod in enumerate(self.products)
+            ],
+            "subtotal": {"@type": "MonetaryAmount", "value": self.total_goods_value, "currency": "EUR"},
+            "freightCharges": {"@type": "MonetaryAmount", "value": self.freight_cost, "currency": "EUR"},
+            "totalAmount": {"@type": "MonetaryAmount", "value": self.total_invoice, "currency": "EUR"},
+            "paymentTerms": "Letter of Credit No. " + self.doc_ids["documentary_credit"],
+            "deliveryTerms": "CFR Tokyo Port",
+            "referenceBL": self.doc_ids["bill_of_lading"],
+            "referenceLC": self.doc_ids["documentary_credit"]
+        }
+
+    def _certificate_of_origin(self) -> Dict[str, Any]:
+        return {
+            "@type": "CertificateOfOrigin",
+            "certificateNumber": self.doc_ids["certificate_of_origin"],
+            "issueDate": day(self.shipment_date),
+            "issuingAuthority": {
+                "@type": "Party",
+                "partyName": "Finnish Chamber of Commerce",
+                "postalAddress": "Helsinki, Finland"
+            },
+            "exporter": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "consignee": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "countryOfOrigin": {
+                "@type": "Country",
+                "countryCode": "FI",
+                "countryName": "Finland"
+            },
+            "goodsDescription": f"Engineered Gluelam Timber Beams ({self.grades})",
+            "hsCode": "4418.91",
+            "referenceBL": self.doc_ids["bill_of_lading"],
+            "referenceInvoice": self.doc_ids["commercial_invoice"]
+        }
+
+    def _packing_list(self) -> Dict[str, Any]:
+        return {
+            "@type": "PackingList",
+            "packingListNumber": self.doc_ids["packing_list"],
+            "issueDate": day(self.shipment_date),
+            "shipper": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "consignee": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "packages": [
+                {
+                    "@type": "Package",
+                    "packageNumber": f"BUNDLE-{i+1:03d}",
+                    "packageType": "Timber Bundle",
+                    "contents": self._bundle_contents(i),
+                    "grossWeight": {"@type": "Quantity", "value": self.total_weight / self.packages, "unitCode": "KGM"},
+                    "dimensions": "Strapped timber bundle"
+                } for i in range(self.packages)
+            ],
+            "totalGrossWeight": {"@type": "Quantity", "value": self.total_weight, "unitCode": "KGM"},
+            "totalNetWeight": {"@type": "Quantity", "value": self.total_weight * 0.98, "unitCode": "KGM"},
+            "totalVolume": {"@type": "Quantity", "value": self.total_volume, "unitCode": "MTQ"},
+            "referenceBL": self.doc_ids["bill_of_lading"],
+            "referenceInvoice": self.doc_ids["commercial_invoice"]
+        }
+
+    def _insurance_certificate(self) -> Dict[str, Any]:
+        return {
+            "@type": "InsuranceCertificate",
+            "certificateNumber": self.doc_ids["insurance_certificate"],
+            "issueDate": day(self.shipment_date - timedelta(days=2)),
+            "insurer": {
+                "@type": "Party",
+                "partyName": "Nordic Marine Insurance AS",
+                "postalAddress": "Oslo, Norway"
+            },
+            "insured": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "policyNumber": "NMI-2024-TIMBER-5678",
+            "insuredAmount": {"@type": "MonetaryAmount", "value": self.lc_amount * 1.1, "currency": "EUR"},
+            "coverage": "All Risks (Institute Cargo Clauses A)",
+            "goodsDescription": f"Gluelam Timber Beams - {self.total_quantity} PCS total",
+            "voyage": "Rauma Port, Finland to Tokyo Port, Japan",
+            "vessel": "MV Baltic Express",
+            "referenceBL": self.doc_ids["bill_of_lading"]
+        }
+
+    def _phytosanitary_certificate(self) -> Dict[str, Any]:
+        return {
+            "@type": "PhytosanitaryCertificate",
+            "certificateNumber": self.doc_ids["phytosanitary_certificate"],
+            "issueDate": day(self.shipment_date - timedelta(days=1)),
+            "issuingAuthority": {
+                "@type": "Party",
+                "partyName": "Finnish Food Authority - Plant Health Unit",
+                "postalAddress": "Helsinki, Finland"
+            },
+            "exporter": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "consignee": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "placeOfOrigin": "Finland - Kainuu Region",
+            "declaredMeansOfConveyance": "Sea Freight - Container",
+            "pointOfEntry": "Tokyo Port, Japan",
+            "botanicalName": "Picea abies (Norway Spruce), Pinus sylvestris (Scots Pine)",
+            "treatment": "Heat treatment ISPM-15 compliant, Kiln dried to 12% moisture content",
+            "disinfestationMethod": "HT (Heat Treatment) 56°C for 30 minutes",
+            "additionalDeclaration": "Wood products free from bark, treated according to ISPM-15 standard",
+            "inspectionDate": day(self.shipment_date - timedelta(days=2)),
+            "inspectorName": "Dr. Matti Virtanen"
+        }
+
+    def _customs_declaration_export(self) -> Dict[str, Any]:
+        return {
+            "@type": "CustomsDeclaration",
+            "declarationNumber": self.doc_ids["customs_declaration_export"],
+            "declarationType": "Export Declaration",
+            "declarationDate": day(self.shipment_date),
+            "declarant": {
+                "@type": "Party",
+                "partyName": self.freight_forwarder["name"],
+                "postalAddress": self.freight_forwarder["address"]
+            },
+            "exporter": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"],
+                "eoriNumber": "FI" + self.seller["vat"]
+            },
+            "importer": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "customsOffice": {
+                "@type": "CustomsOffice",
+                "officeName": "Finnish Customs - Rauma",
+                "officeCode": "FI-RAU-001"
+            },
+            "goodsItems": [
+                {
+                    "@type": "GoodsItem",
+                    "itemNumber": str(i+1),
+                    "description": prod["description"],
+                    "hsCode": prod["hs_code"],
+                    "origin": "FI",
+                    "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
+                    "value": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
+                } for i, prod in enumerate(self.products)
+            ],
+            "totalInvoiceAmount": {"@type": "MonetaryAmount", "value": self.total_goods_value, "currency": "EUR"},
+            "destinationCountry": "JP",
+            "exportProcedure": "10 - Permanent export",
+            "referenceBL": self.doc_ids["bill_of_lading"],
+            "referenceInvoice": self.doc_ids["commercial_invoice"]
+        }
+
+    def _customs_declaration_import(self) -> Dict[str, Any]:
+        return {
+            "@type": "CustomsDeclaration",
+            "declarationNumber": self.doc_ids["customs_declaration_import"],
+            "declarationType": "Import Declaration",
+            "declarationDate": day(self.arrival_date),
+            "declarant": {
+                "@type": "Party",
+                "partyName": "Tokyo Customs Broker KK",
+                "postalAddress": "Tokyo, Japan"
+            },
+            "exporter": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "importer": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"],
+                "customsId": self.buyer["tax_id"]
+            },
+            "customsOffice": {
+                "@type": "CustomsOffice",
+                "officeName": "Japan Customs - Tokyo Port",
+                "officeCode": "JP-TYO-PORT"
+            },
+            "goodsItems": [
+                {
+                    "@type": "GoodsItem",
+                    "itemNumber": str(i+1),
+                    "description": prod["description"],
+                    "hsCode": prod["hs_code"],
+                    "origin": "FI",
+                    "quantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
+                    "value": {"@type": "MonetaryAmount", "value": prod["total"], "currency": "EUR"}
+                } for i, prod in enumerate(self.products)
+            ],
+            "totalInvoiceAmount": {"@type": "MonetaryAmount", "value": self.total_invoice, "currency": "EUR"},
+            "assessedDuties": {"@type": "MonetaryAmount", "value": 0.00, "currency": "JPY", "note": "Zero duty under EU-Japan EPA"},
+            "importProcedure": "40 - Release for free circulation",
+            "preferentialTreatment": "EU-Japan Economic Partnership Agreement (EPA)",
+            "referenceBL": self.doc_ids["bill_of_lading"],
+            "referenceInvoice": self.doc_ids["commercial_invoice"]
+        }
+
+    def _delivery_note(self) -> Dict[str, Any]:
+        return {
+            "@type": "DeliveryNote",
+            "deliveryNoteNumber": self.doc_ids["delivery_note"],
+            "deliveryDate": day(self.arrival_date + timedelta(days=3)),
+            "supplier": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "recipient": {
+                "@type": "Party",
+                "partyName": self.buyer["name"],
+                "postalAddress": self.buyer["address"]
+            },
+            "deliveryAddress": self.buyer["address"] + " - Construction Site Warehouse",
+            "carrierParty": {
+                "@type": "Party",
+                "partyName": "Tokyo Logistics KK",
+                "vehicleRegistration": "Tokyo 500 た 1234"
+            },
+            "deliveryNoteLines": [
+                {
+                    "@type": "DeliveryNoteLine",
+                    "lineNumber": str(i+1),
+                    "productDescription": prod["description"],
+                    "deliveredQuantity": {"@type": "Quantity", "value": prod["quantity"], "unitCode": prod["unit"]},
+                    "condition": "Good"
+                } for i, prod in enumerate(self.products)
+            ],
+            "receivedBy": "Tanaka-san (Site Manager)",
+            "receivedDate": day(self.arrival_date + timedelta(days=3)),
+            "referencePO": self.doc_ids["purchase_order"],
+            "referenceBL": self.doc_ids["bill_of_lading"]
+        }
+
+    def _regulatory_certificate(self) -> Dict[str, Any]:
+        return {
+            "@type": "RegulatoryCertificate",
+            "certificateNumber": self.doc_ids["regulatory_certificate"],
+            "issueDate": day(self.shipment_date - timedelta(days=5)),
+            "issuingAuthority": {
+                "@type": "Party",
+                "partyName": "TÜV SÜD Finland Oy",
+                "postalAddress": "Helsinki, Finland"
+            },
+            "applicant": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "certificateType": "CE Marking - Structural Timber",
+            "productDescription": "Glued laminated timber (Glulam) structural beams",
+            "standard": "EN 14080:2013 - Timber structures - Glued laminated timber and glued solid timber",
+            "grades": self.grades,
+            "strengthClass": "GL30c (f_m,g,k = 30 N/mm²), GL32h (f_m,g,k = 32 N/mm²)",
+            "testResults": "All mechanical properties compliant with EN 14080:2013",
+            "factoryProductionControl": "ISO 9001:2015 certified",
+            "validityPeriod": "5 years from issue date",
+            "remarks": "Suitable for structural use in construction per Eurocode 5"
+        }
+
+    def _sea_cargo_manifest(self) -> Dict[str, Any]:
+        return {
+            "@type": "SeaCargoManifest",
+            "manifestNumber": self.doc_ids["sea_cargo_manifest"],
+            "issueDate": day(self.shipment_date),
+            "vessel": {
+                "@type": "TransportMeans",
+                "vesselName": "MV Baltic Express",
+                "imoNumber": "IMO9876543",
+                "flag": "Finland"
+            },
+            "voyage": "V2024-FI-123",
+            "portOfLoading": {
+                "@type": "Location",
+                "locationName": "Rauma Port",
+                "unlocode": "FIRAU"
+            },
+            "portOfDischarge": {
+                "@type": "Location",
+                "locationName": "Tokyo Port",
+                "unlocode": "JPTYO"
+            },
+            "carrierParty": {
+                "@type": "Party",
+                "partyName": self.carrier["name"]
+            },
+            "consignments": [
+                {
+                    "@type": "Consignment",
+                    "blNumber": self.doc_ids["bill_of_lading"],
+                    "shipper": self.seller["name"],
+                    "consignee": self.buyer["name"],
+                    "description": "Gluelam Timber Beams",
+                    "packages": self.packages,
+                    "weight": {"@type": "Quantity", "value": self.total_weight, "unitCode": "KGM"},
+                    "volume": {"@type": "Quantity", "value": self.total_volume, "unitCode": "MTQ"}
+                }
+            ],
+            "totalPackages": self.packages,
+            "totalWeight": {"@type": "Quantity", "value": self.total_weight, "unitCode": "KGM"}
+        }
+
+    def _warehouse_receipt(self) -> Dict[str, Any]:
+        return {
+            "@type": "WarehouseReceipt",
+            "receiptNumber": self.doc_ids["warehouse_receipt"],
+            "issueDate": day(self.shipment_date - timedelta(days=3)),
+            "warehouse": {
+                "@type": "Party",
+                "partyName": "Rauma Port Warehouse Services Oy",
+                "postalAddress": "Rauma Port Terminal, 26100 Rauma, Finland"
+            },
+            "depositor": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "postalAddress": self.seller["address"]
+            },
+            "goodsDescription": f"Gluelam timber beams ({self.total_quantity} pieces) ready for export",
+            "quantity": {
+                "@type": "Quantity",
+                "value": self.total_quantity,
+                "unitCode": "PCS"
+            },
+            "weight": {"@type": "Quantity", "value": self.total_weight, "unitCode": "KGM"},
+            "storageLocation": "Export Warehouse Section B-12",
+            "storageStartDate": day(self.shipment_date - timedelta(days=3)),
+            "storageEndDate": day(self.shipment_date),
+            "releaseCondition": "Released for shipment on B/L " + self.doc_ids["bill_of_lading"]
+        }
+
+    def _payment_confirmation(self) -> Dict[str, Any]:
+        return {
+            "@type": "PaymentConfirmation",
+            "confirmationNumber": self.doc_ids["payment_confirmation"],
+            "paymentDate": day(self.shipment_date + timedelta(days=25)),
+            "payer": {
+                "@type": "Party",
+                "partyName": self.buyer["bank"],
+                "swiftCode": self.buyer["swift"]
+            },
+            "payee": {
+                "@type": "Party",
+                "partyName": self.seller["name"],
+                "bankAccount": self.seller["iban"],
+                "swiftCode": self.seller["swift"]
+            },
+            "paymentAmount": {
+                "@type": "MonetaryAmount",
+                "value": self.total_invoice,
+                "currency": "EUR"
+            },
+            "paymentMethod": "Documentary Credit Settlement",
+            "referenceDocument": "L/C No. " + self.doc_ids["documentary_credit"],
+            "paymentStatus": "Completed",
+            "transactionId": "SWIFT-MT700-2024-05678",
+            "valueDate": day(self.shipment_date + timedelta(days=25))
+        }
+
+
+def numbered(doc_ids: Dict[str, str], number: int) -> Dict[str, str]:
+    """Document numbers of shipment number: each id's trailing digits advanced by number"""
+    numbers = {}
+    for document, doc_id in doc_ids.items():
+        prefix = doc_id.rstrip("0123456789")
+        digits = doc_id[len(prefix):]
+        numbers[document] = prefix + str(int(digits or 0) + number).zfill(len(digits))
+    return numbers
+
+
+def scenarios(count: int, seed: int = 0, first: int = 1, **inputs) -> Iterator[TradeScenario]:
+    """
+    count distinct scenarios: shipment number first, first + 1, ...
+    numbers every document (numbered), and each scenario ships within a
+    year of the given (or default) shipment date with product quantities
+    between half and one and a half times the given ones. Other inputs
+    are passed to every TradeScenario.
+    """
+    import random
+
+    rng = random.Random(seed)
+    latest = inputs.pop("shipment_date", None) or datetime.now() - timedelta(days=SHIPMENT_DAYS_AGO)
+    products = inputs.pop("products", None) or PRODUCTS
+    doc_ids = {**DOC_IDS, **inputs.pop("doc_ids", {})}
+    for number in range(first, first + count):
+        quantities = [max(1, round(p["quantity"] * rng.uniform(0.5, 1.5))) for p in products]
+        yield TradeScenario(
+            products=[{**p, "quantity": q, "total": q * p["unit_price"]} for p, q in zip(products, quantities)],
+            shipment_date=latest - timedelta(days=rng.randrange(365)),
+            doc_ids=numbered(doc_ids, number),
+            **inputs,
+        )
+
+
+# ----------------------------------------------------------------------
+# Module-level names of the default scenario, built on first access
+# ----------------------------------------------------------------------
+
+_default: Optional[TradeScenario] = None
+
+_DEFAULT_ATTRIBUTES = {
+    "DOCUMENTS": lambda scenario: dict(scenario.documents),
+    "TIMELINE": lambda scenario: scenario.timeline,
+    "SHIPMENT_DATE": lambda scenario: scenario.shipment_date,
+    "ARRIVAL_DATE": lambda scenario: scenario.arrival_date,
+    "LC_ISSUE_DATE": lambda scenario: scenario.lc_issue_date,
+    "PO_DATE": lambda scenario: scenario.po_date,
+    "TOTAL_GOODS_VALUE": lambda scenario: scenario.total_goods_value,
+    "TOTAL_INVOICE": lambda scenario: scenario.total_invoice,
+    "LC_AMOUNT": lambda scenario: scenario.lc_amount,
+    "TOTAL_WEIGHT": lambda scenario: scenario.total_weight,
+    "TOTAL_VOLUME": lambda scenario: scenario.total_volume,
+}
+
+
+def default_scenario() -> TradeScenario:
+    global _default
+    if _default is None:
+        _default = TradeScenario()
+    return _default
+
+
+def __getattr__(name: str):
+    attribute = _DEFAULT_ATTRIBUTES.get(name)
+    if attribute is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = attribute(default_scenario())
+    return value
+
+
+def main():
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build the gluelam timber trade scenario")
+    parser.add_argument("--count", type=int, default=0, help="also generate this many distinct scenarios")
+    args = parser.parse_args()
+
+    scenario = default_scenario()
+    print("✅ Complete Gluelam Timber Scenario Loaded")
+    print(f"   📦 {len(scenario.documents)} Documents")
+    print(f"   👥 {len(ACTOR_VIEWS)} Actor Views")
+    print(f"   ⏱️  {len(scenario.timeline)} Timeline Events")
+    if args.count:
+        start = time.perf_counter()
+        for generated in scenarios(args.count):
+            dict(generated.documents)
+        elapsed = time.perf_counter() - start
+        print(f"   🔁 {args.count:,} distinct scenarios with all documents in {elapsed * 1000:.0f} ms "
+              f"({args.count / elapsed:,.0f}/s)")
+
 
-print("✅ Complete Gluelam Timber Scenario Loaded")
-print(f"   📦 {len(DOCUMENTS)} Documents")
-print(f"   👥 {len(ACTOR_VIEWS)} Actor Views")
-print(f"   ⏱️  {len(TIMELINE)} Timeline Events")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-actor credential views (sap-simulator/api/actor_views.py)
+
+- the inverted index agrees with ACTOR_VIEWS both ways, and every
+  materialized bundle holds exactly what its actor may see
+- one actor's view of a scenario through the API, per request: every
+  credential of the scenario (mapped on each request) filtered by the
+  client, as the demo does, versus the materialized, pre-serialized
+  bundle, and a 304 for an unchanged ETag; /health gives the test
+  client's own per-request cost
+- publishing a credential: only the actors allowed to see it get a new
+  ETag, everyone else's is still current; publish cost per credential
+- a shipment evicted from the LRU comes back with its published
+  credentials; published credentials are bounded by their own LRU
+  (max_published), and a shipment dropped from it comes back without
+
+Usage:
+    python3 tools/benchmark_actor_views.py [--requests 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from api import actor_views, sap_api  # noqa: E402
+from mappings.sap_to_vc import convert_sap_scenario_to_vcs  # noqa: E402
+from scenario_gluelam_timber_full import ACTOR_VIEWS  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("PER-ACTOR VIEWS: INVERTED INDEX, MATERIALIZED BUNDLES")
+    print("=" * 72)
+    index = sap_api.views.index
+    pairs = {(actor, document) for actor, documents in ACTOR_VIEWS.items() for document in documents}
+    inverted = {(actor, document) for document, actors in index.readers.items() for actor in actors}
+    scenario_ids = list(sap_api.SCENARIOS_DB.keys())
+    bundles_exact = all(
+        set(sap_api.views.view(scenario_id, actor)[1])
+        == {actor_views.document_type(name) for name in convert_sap_scenario_to_vcs(sap_api.SCENARIOS_DB[scenario_id])
+            if index.allowed(actor, name)}
+        for scenario_id in scenario_ids for actor in ACTOR_VIEWS)
+    check = pairs == inverted and bundles_exact
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} {len(index.readers)} document types, {len(pairs)} actor/document pairs; "
+          f"{len(scenario_ids)} scenarios × {len(ACTOR_VIEWS)} actors, each bundle exactly its actor's documents")
+
+    # Per request
+    app = sap_api.app
+    client = app.test_client()
+    actors = list(ACTOR_VIEWS)
+    targets = [(scenario_id, actor) for scenario_id in scenario_ids for actor in actors]
+
+    def filtered(scenario_id: str, actor: str):
+        """Every credential of the scenario, filtered for the actor by the client (the demo)"""
+        credentials = client.get(f"/vc/api/v1/scenarios/{scenario_id}/verifiable-credentials").get_json()["credentials"]
+        return {actor_views.document_type(name): vc for name, vc in credentials.items() if index.allowed(actor, name)}
+
+    etags = {target: client.get(f"/vc/api/v1/scenarios/{target[0]}/views/{target[1]}").headers["ETag"]
+             for target in targets}
+    timings = {}
+    for label, request in (
+            ("request overhead (/health)", lambda target: client.get("/health")),
+            ("all credentials, filtered", lambda target: filtered(*target)),
+            ("materialized view", lambda target: client.get(f"/vc/api/v1/scenarios/{target[0]}/views/{target[1]}")),
+            ("materialized view, 304", lambda target: client.get(f"/vc/api/v1/scenarios/{target[0]}/views/{target[1]}",
+                                                                 headers={"If-None-Match": etags[target]}))):
+        start = time.perf_counter()
+        for i in range(args.requests):
+            response = request(targets[i % len(targets)])
+        timings[label] = (time.perf_counter() - start) * 1e6 / args.requests
+        if label.endswith("304"):
+            check = response.status_code == 304
+            ok = ok and check
+    print(f"\n  one actor's view of a scenario, {args.requests:,} requests over {len(targets)} scenario/actor pairs:")
+    for label, us in timings.items():
+        print(f"    {label:28s} {us:8.0f} µs/request")
+    overhead = timings["request overhead (/health)"]
+    filtered_us = timings["all credentials, filtered"] - overhead
+    view_us = max(timings["materialized view"] - overhead, 1.0)
+    check = check and timings["materialized view"] < timings["all credentials, filtered"]
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} beyond the request overhead: {view_us:.0f} µs per view against {filtered_us:.0f} µs "
+          f"mapping every credential per request ({filtered_us / view_us:.1f}x); unchanged views answer 304")
+
+    # Publishing
+    scenario_id = scenario_ids[0]
+    document = "phytosanitary_certificate"
+    credential = {"@context": ["https://www.w3.org/2018/credentials/v1"], "id": "urn:uuid:phyto-0001",
+                  "type": ["VerifiableCredential", "PhytosanitaryCertificate"]}
+    response = client.post(f"/vc/api/v1/scenarios/{scenario_id}/documents/{document}", json=credential)
+    published = set(response.get_json()["d"]["results"][0]["actors"])
+    current = {actor: client.get(f"/vc/api/v1/scenarios/{scenario_id}/views/{actor}",
+                                 headers={"If-None-Match": etags[(scenario_id, actor)]}).status_code
+               for actor in actors}
+    sees = {actor for actor in actors
+            if document in client.get(f"/vc/api/v1/scenarios/{scenario_id}/views/{actor}").get_json()["credentials"]}
+    check = (published == set(index.readers[document]) == sees
+             and all(status == (200 if actor in published else 304) for actor, status in current.items()))
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} {document} published: new view for {', '.join(sorted(published))}; "
+          f"{', '.join(actor for actor, status in current.items() if status == 304)} still current (304)")
+
+    store = actor_views.ViewStore(index, lambda shipment: convert_sap_scenario_to_vcs(sap_api.SCENARIOS_DB[shipment]))
+    store.view(scenario_id, "bank")
+    start = time.perf_counter()
+    for i in range(args.requests):
+        store.publish(scenario_id, document, dict(credential, id=f"urn:uuid:phyto-{i}"))
+    publish_us = (time.perf_counter() - start) * 1e6 / args.requests
+    start = time.perf_counter()
+    for _ in range(20):
+        store.clear()
+        store.view(scenario_id, "bank")
+    materialize_us = (time.perf_counter() - start) * 1e6 / 20
+    print(f"  publish {publish_us:.1f} µs per credential; materializing a scenario's bundles {materialize_us:.0f} µs")
+
+    # Eviction
+    small = actor_views.ViewStore(index, lambda shipment: convert_sap_scenario_to_vcs(sap_api.SCENARIOS_DB[shipment]),
+                                  max_shipments=1)
+    small.view(scenario_ids[0], "bank")
+    small.publish(scenario_ids[0], document, credential)
+    for other in scenario_ids[1:]:
+        small.view(other, "bank")
+    version, bundle = small.view(scenario_ids[0], "bank")
+    check = len(scenario_ids) < 2 or (bundle.get(document) == credential and small.stats()["materialized"] > 2)
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} evicted shipment rematerialized with its published {document}")
+
+    bounded = actor_views.ViewStore(index, lambda shipment: convert_sap_scenario_to_vcs(sap_api.SCENARIOS_DB[shipment]),
+                                    max_shipments=1, max_published=2)
+    bounded.publish(scenario_ids[0], document, credential)
+    bounded.view(scenario_ids[0], "bank")
+    for i in range(args.requests):  # shipments nobody requests
+        bounded.publish(f"shipment-{i}", document, credential)
+    for other in scenario_ids[1:]:
+        bounded.view(other, "bank")
+    version, bundle = bounded.view(scenario_ids[0], "bank")
+    check = (bounded.stats()["published_shipments"] == 2
+             and (len(scenario_ids) < 2 or bundle.get(document) != credential))
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} {args.requests:,} shipments published to, max_published=2: "
+          f"{bounded.stats()['published_shipments']} kept; the least recently used comes back without its {document}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
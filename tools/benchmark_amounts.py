@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exact amount columns versus per-line float and Decimal arithmetic
+
+Builds a purchase order and an invoice with --lines random lines
+(quantities with up to 3 decimals, cent prices, some price units of 100)
+whose header totals are the exact line sums, then computes line amounts,
+totals and the header check three ways:
+- float: float(MENGE * NETPR) per line, as the mappers used to
+- Decimal per line: the same checks and rounding in a Python loop
+- columns: mappings/amounts.py (map() pipelines in the C decimal module)
+
+Reports time per document and per line, whether line strings agree with
+the per-line Decimal reference, and how far the float total drifts. A
+second invoice with its header off by one cent must be flagged.
+
+Usage:
+    python3 tools/benchmark_amounts.py [--lines 100000] [--repeat 3]
+"""
+
+import argparse
+import dataclasses
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from data.sample_data import scenario_eu_singapore_export  # noqa: E402
+from mappings.amounts import (  # noqa: E402
+    CONTEXT, ZERO, AmountError, invoice_amounts, purchase_order_amounts, quantum,
+)
+
+CENT = quantum("EUR")
+
+
+def build_documents(lines: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    scenario = scenario_eu_singapore_export()
+    po, invoice = scenario["purchase_order"], scenario["invoice"]
+
+    po_items = []
+    for i in range(lines):
+        unit = Decimal(100) if i % 10 == 0 else Decimal(1)
+        po_items.append(dataclasses.replace(
+            po["items"][0], EBELP=f"{(i + 1) * 10:05d}",
+            MENGE=Decimal(rng.randint(1, 500_000)).scaleb(-3),
+            NETPR=Decimal(rng.randint(1, 10_000_000)).scaleb(-2),
+            PEINH=unit))
+    po_total = sum((CONTEXT.quantize(item.MENGE * item.NETPR / item.PEINH, CENT)
+                    for item in po_items), ZERO)
+
+    invoice_items = [dataclasses.replace(
+        invoice["items"][0], POSNR=f"{(i + 1) * 10:06d}",
+        NETWR=Decimal(rng.randint(1, 100_000_000)).scaleb(-2),
+        MWSBP=Decimal(rng.randint(0, 24_000_000)).scaleb(-2)) for i in range(lines)]
+    net = sum((item.NETWR for item in invoice_items), ZERO)
+    tax = sum((item.MWSBP for item in invoice_items), ZERO)
+
+    return {
+        "po_header": dataclasses.replace(po["header"], KTWRT=po_total),
+        "po_items": po_items,
+        "invoice_header": dataclasses.replace(invoice["header"], NETWR=net, MWSBK=tax),
+        "invoice_items": invoice_items,
+    }
+
+
+def po_float(header, items):
+    lines = [float(item.MENGE * item.NETPR / item.PEINH) for item in items]
+    return lines, sum(lines)
+
+
+def po_decimal(header, items):
+    lines, net = [], ZERO
+    for item in items:
+        unit = quantum(item.WAERS or header.WAERS)
+        price = CONTEXT.quantize(item.NETPR, unit)
+        if price != item.NETPR:
+            raise AmountError(f"EKPO-NETPR {item.NETPR} has more decimals than its currency allows")
+        amount = CONTEXT.quantize(CONTEXT.divide(CONTEXT.multiply(item.MENGE, price), item.PEINH), unit)
+        net = CONTEXT.add(net, amount)
+        lines.append(str(amount))
+    return lines, net == header.KTWRT
+
+
+def invoice_float(header, items):
+    lines = [float(item.NETWR) for item in items]
+    return lines, sum(lines)
+
+
+def invoice_decimal(header, items):
+    lines, net, tax = [], ZERO, ZERO
+    for item in items:
+        unit = quantum(item.WAERK or header.WAERK)
+        amount, item_tax = CONTEXT.quantize(item.NETWR, unit), CONTEXT.quantize(item.MWSBP, unit)
+        if amount != item.NETWR or item_tax != item.MWSBP:
+            raise AmountError(f"VBRP {item.POSNR} has more decimals than its currency allows")
+        net, tax = CONTEXT.add(net, amount), CONTEXT.add(tax, item_tax)
+        lines.append(str(amount))
+    return lines, net == header.NETWR and tax == header.MWSBK
+
+
+def timed(function, repeat: int, *args):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return result, (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"EXACT AMOUNTS: {args.lines:,} LINES PER DOCUMENT")
+    print("=" * 72)
+    documents = build_documents(args.lines)
+    ok = True
+
+    for name, header, items, float_path, decimal_path, columns, expected in (
+            ("purchase order", documents["po_header"], documents["po_items"],
+             po_float, po_decimal, purchase_order_amounts, documents["po_header"].KTWRT),
+            ("invoice", documents["invoice_header"], documents["invoice_items"],
+             invoice_float, invoice_decimal, invoice_amounts, documents["invoice_header"].NETWR)):
+        (_, float_total), float_ms = timed(float_path, args.repeat, header, items)
+        (reference, reference_valid), decimal_ms = timed(decimal_path, args.repeat, header, items)
+        amounts, columns_ms = timed(columns, args.repeat, header, items)
+
+        identical = amounts.lines == reference
+        ok = ok and identical and amounts.valid and reference_valid
+        drift = Decimal(float_total) - expected
+        print(f"\n  {name} (header {expected} EUR)")
+        for label, ms in (("float", float_ms), ("Decimal per line", decimal_ms),
+                          ("columns", columns_ms)):
+            print(f"    {label:18s} {ms:9.1f} ms  {ms * 1000 / args.lines:6.2f} µs/line")
+        print(f"    {'✅' if identical else '❌'} column line amounts identical to per-line Decimal")
+        print(f"    {'✅' if amounts.valid else '❌'} header total matches summed lines ({amounts.net})")
+        print(f"    float total drifts by {drift:.6f} EUR ({float_total!r})")
+
+    tampered = dataclasses.replace(documents["invoice_header"],
+                                   NETWR=documents["invoice_header"].NETWR + CENT)
+    mismatches = invoice_amounts(tampered, documents["invoice_items"]).mismatches
+    ok = ok and bool(mismatches)
+    print(f"\n  {'✅' if mismatches else '❌'} header off by 0.01 EUR flagged: "
+          f"{mismatches[0] if mismatches else 'not detected'}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
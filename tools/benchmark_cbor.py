@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: CBOR (term dictionary) versus JSON for credential transport
+
+Builds CommercialInvoice and BillOfLading credentials with a growing
+number of goods items (the sample scenario lines, repeated) and reports
+for each size:
+- bytes: compact JSON, CBOR, and both gzip-compressed
+- encode / decode time: json.dumps / json.loads versus vc_cbor
+
+Every CBOR round trip must reproduce the credential exactly.
+
+Usage:
+    python3 tools/benchmark_cbor.py [--items 1,10,100,1000] [--repeat 20]
+"""
+
+import argparse
+import dataclasses
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+from vc_cbor import get_codec
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from data.sample_data import scenario_eu_singapore_export  # noqa: E402
+from mappings.sap_to_vc import SAPToVCMapper  # noqa: E402
+
+
+def scaled_items(items: list, count: int) -> list:
+    """count line items cycling through the sample items, renumbered"""
+    return [dataclasses.replace(items[i % len(items)], POSNR=f"{(i + 1) * 10:06d}")
+            for i in range(count)]
+
+
+def build_credentials(count: int) -> dict:
+    scenario = scenario_eu_singapore_export()
+    mapper = SAPToVCMapper()
+    invoice, delivery = scenario["invoice"], scenario["delivery"]
+    return {
+        "commercial_invoice": mapper.map_commercial_invoice(
+            invoice["header"], scaled_items(invoice["items"], count)),
+        "bill_of_lading": mapper.map_bill_of_lading(
+            delivery["header"], scaled_items(delivery["items"], count)),
+    }
+
+
+def timed(function, argument, repeat: int) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function(argument)
+    return result, (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--items', default='1,10,100,1000',
+                        help='comma-separated goods item counts')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    codec = get_codec()
+    dictionary_ms = (time.perf_counter() - start) * 1000
+
+    print("=" * 96)
+    print("CBOR vs JSON CREDENTIAL ENCODING")
+    print("=" * 96)
+    print(f"Term dictionary {codec.dictionary.id.hex()}: {len(codec.dictionary)} terms "
+          f"(built in {dictionary_ms:.1f} ms)\n")
+    print(f"  {'credential':20s} {'items':>5s} {'JSON B':>9s} {'CBOR B':>9s} {'ratio':>6s} "
+          f"{'JSON.gz':>8s} {'CBOR.gz':>8s} {'enc ms J/C':>15s} {'dec ms J/C':>15s}")
+
+    mismatches = 0
+    for count in (int(n) for n in args.items.split(',')):
+        for name, credential in build_credentials(count).items():
+            json_bytes, json_enc = timed(
+                lambda c: json.dumps(c, separators=(',', ':')).encode('utf-8'), credential, args.repeat)
+            cbor_bytes, cbor_enc = timed(codec.encode, credential, args.repeat)
+            _, json_dec = timed(json.loads, json_bytes, args.repeat)
+            decoded, cbor_dec = timed(codec.decode, cbor_bytes, args.repeat)
+            if decoded != credential:
+                mismatches += 1
+
+            print(f"  {name:20s} {count:5d} {len(json_bytes):9d} {len(cbor_bytes):9d} "
+                  f"{len(cbor_bytes) / len(json_bytes):6.0%} "
+                  f"{len(gzip.compress(json_bytes)):8d} {len(gzip.compress(cbor_bytes)):8d} "
+                  f"{json_enc:7.3f}/{cbor_enc:7.3f} {json_dec:7.3f}/{cbor_dec:7.3f}")
+
+    if mismatches:
+        print(f"\n❌ {mismatches} CBOR round trips differ from the source credential")
+        sys.exit(1)
+    print("\n✅ All CBOR round trips identical")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SAP simulator cold start (import time and time to first response)
+
+- `python -X importtime -c "import api.sap_api"` in a fresh interpreter:
+  total import time and the modules with the most self time
+- time to first response: a fresh interpreter imports the API and
+  answers the first invoice VC request through the Flask test client,
+  measured from just before the process is spawned; each run is paired
+  with a bare Flask app answering one request. Interpreter start-up and
+  importing Flask take 150-270 ms on the same machine from one minute
+  to the next, so --target-ms bounds the simulator's share, the median
+  difference between the pairs: about 80 ms when the lazy loading was
+  introduced, 100 ms leaves room for noise but not for another eager
+  import of the data or the mappings
+- the bytecode of the simulator and the repository scripts it imports
+  is compiled first, as the Docker build does; without it (for example
+  under PYTHONDONTWRITEBYTECODE) every start compiles them again
+- laziness: after import the data store is not loaded, no mapping spec
+  is compiled, and the process pool, CBOR codec and KTDDE ontology
+  modules are not imported
+- time to first response with the data in a snapshot (data/snapshot.py),
+  and opening a snapshot of --scenarios scenarios versus constructing
+  them with sample_data
+
+Usage:
+    python3 tools/benchmark_cold_start.py [--runs 9] [--target-ms 100] [--scenarios 2000]
+"""
+
+import argparse
+import compileall
+import dataclasses
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SIMULATOR = REPO_ROOT / 'sap-simulator'
+sys.path.insert(0, str(SIMULATOR))
+
+from data import sample_data, snapshot, store  # noqa: E402
+
+INVOICE_URL = '/vc/api/v1/invoices/9000000789/vc'
+
+FIRST_RESPONSE = f"""
+import time
+from api.sap_api import app
+response = app.test_client().get({INVOICE_URL!r})
+assert response.status_code == 200, response.status_code
+print(time.time())
+"""
+
+BARE_FLASK = """
+import time
+from flask import Flask, jsonify
+from flask_cors import CORS
+app = Flask(__name__)
+CORS(app)
+app.add_url_rule('/', 'index', lambda: jsonify({}))
+app.test_client().get('/')
+print(time.time())
+"""
+
+LAZINESS = """
+import sys
+from api.sap_api import COMPILED, data_store
+print(data_store.loaded, len(COMPILED.compiled()), 'concurrent.futures.process' in sys.modules,
+      'vc_cbor' in sys.modules, 'ktdde_ontology' in sys.modules)
+"""
+
+
+def python(code: str, *options: str, env: dict = None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *options, "-c", code], cwd=SIMULATOR, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_times() -> tuple:
+    """(total µs, [(self µs, module)]) from -X importtime"""
+    modules, total = [], 0
+    for line in python("import api.sap_api", "-X", "importtime").stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        modules.append((int(self_us), name.strip()))
+        if name.strip() == "api.sap_api":
+            total = int(cumulative_us)
+    return total, sorted(modules, reverse=True)
+
+
+def first_response_ms(env: dict = None, code: str = FIRST_RESPONSE) -> float:
+    start = time.time()
+    finished = float(python(code, env=env).stdout.split()[-1])
+    return (finished - start) * 1000
+
+
+def median(timings: list) -> float:
+    return sorted(timings)[len(timings) // 2]
+
+
+def scaled_scenarios(count: int) -> list:
+    """count copies of the sample scenarios under distinct ids"""
+    scenarios = []
+    for i in range(count):
+        scenario = dict(sample_data.get_all_scenarios()[i % 2])
+        scenario["scenario"] = f"{scenario['scenario']}_{i:05d}"
+        scenario["invoice"] = dict(scenario["invoice"], header=dataclasses.replace(
+            scenario["invoice"]["header"], VBELN=f"{9100000000 + i}"))
+        scenarios.append(scenario)
+    return scenarios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--runs', type=int, default=9)
+    parser.add_argument('--target-ms', type=float, default=100)
+    parser.add_argument('--scenarios', type=int, default=2000)
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("COLD START: IMPORT TIME AND TIME TO FIRST RESPONSE")
+    print("=" * 72)
+    for path in (SIMULATOR, REPO_ROOT / 'tools', REPO_ROOT / 'scenario_gluelam_timber_full.py'):
+        compiled = compileall.compile_dir(path, quiet=1) if path.is_dir() else compileall.compile_file(path, quiet=1)
+        ok = ok and bool(compiled)
+    total, modules = import_times()
+    print(f"  import api.sap_api: {total / 1000:.1f} ms (-X importtime, one run)")
+    print(f"  {'self ms':>9s}  module")
+    for self_us, name in modules[:args.top]:
+        print(f"  {self_us / 1000:9.2f}  {name}")
+
+    pairs = [(first_response_ms(), first_response_ms(code=BARE_FLASK)) for _ in range(args.runs)]
+    timings, floors = [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+    overhead = median([simulator - bare for simulator, bare in pairs])
+    check = overhead <= args.target_ms
+    ok = ok and check
+    print(f"\n  time to first response (GET {INVOICE_URL}): median {median(timings):.0f} ms, "
+          f"best {min(timings):.0f} ms of {args.runs} runs")
+    print(f"  a bare Flask app answering one request: median {median(floors):.0f} ms, best {min(floors):.0f} ms")
+    print(f"  {'✅' if check else '❌'} the simulator's share: median {overhead:.0f} ms more than the bare app "
+          f"(target {args.target_ms:.0f} ms)")
+
+    loaded, compiled, pool, cbor, ontology = python(LAZINESS).stdout.split()
+    check = (loaded, compiled, pool, cbor, ontology) == ("False", "0", "False", "False", "False")
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} after import: store loaded {loaded}, {compiled} mappings compiled, "
+          f"process pool imported {pool}, CBOR codec imported {cbor}, ontology imported {ontology}")
+
+    # Snapshots
+    directory = tempfile.mkdtemp(prefix="sap-sim-")
+    path = os.path.join(directory, "sample.snap")
+    snapshot.write(path, sample_data.get_all_scenarios(), sample_data.PARTNERS, sample_data.MATERIALS)
+    env = dict(os.environ, **{store.SNAPSHOT_ENV: path})
+    timings = [first_response_ms(env) for _ in range(args.runs)]
+    print(f"\n  time to first response from a snapshot: median {median(timings):.0f} ms")
+
+    start = time.perf_counter()
+    scenarios = scaled_scenarios(args.scenarios)
+    build_ms = (time.perf_counter() - start) * 1000
+    big = os.path.join(directory, "scaled.snap")
+    snapshot.write(big, scenarios, sample_data.PARTNERS, sample_data.MATERIALS)
+    start = time.perf_counter()
+    mapped = store.DataStore(big).scenarios
+    count = len(mapped)
+    mapped[scenarios[-1]["scenario"]]
+    open_ms = (time.perf_counter() - start) * 1000
+    check = count == args.scenarios
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} {args.scenarios:,} scenarios: constructed in {build_ms:.1f} ms, "
+          f"{os.path.getsize(big) / 1e6:.1f} MB snapshot opened and one scenario decoded in {open_ms:.1f} ms")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
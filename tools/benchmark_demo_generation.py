@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: demo data generation (tools/generate_demo.py)
+
+- the payload demo-data.js defines is the scenario's data, with every
+  name demo.js reads from demoData; its .gz holds the same bytes
+- size and time against the previous generator, which rebuilt demo.js
+  as one string with every structure json.dumps(indent=2) and rewrote it
+- ChangedFileWriter: unchanged output leaves the file untouched (same
+  inode, same mtime); longer, shorter and edited content is written
+  exactly
+- --count scenario bundles: bundles per second on the first run, on a
+  rerun that writes nothing, and after one bundle was edited by hand,
+  which is the only one rewritten
+
+Usage:
+    python3 tools/benchmark_demo_generation.py [--count 1000]
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'tools'))
+
+from generate_demo import (DEMO_DIR, PAYLOAD_NAME, PAYLOAD_PREFIX, PAYLOAD_SUFFIX, ChangedFileWriter,  # noqa: E402
+                           bundle_name, demo_data, write_bundle, write_payload)
+from scenario_gluelam_timber_full import default_scenario, scenarios  # noqa: E402
+
+
+def previous_generator(data: dict, path: Path) -> int:
+    """demo.js's data as the previous generator wrote it: indented, one string, always rewritten"""
+    text = "".join(f"const {name} = {json.dumps(value, indent=2, ensure_ascii=False)};\n\n"
+                   for name, value in data.items())
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return len(text.encode('utf-8'))
+
+
+def payload(path: Path) -> dict:
+    text = path.read_text(encoding='utf-8')
+    return json.loads(text[len(PAYLOAD_PREFIX):-len(PAYLOAD_SUFFIX)])
+
+
+def snapshot(directory: Path) -> dict:
+    return {path: (path.stat().st_ino, path.stat().st_mtime_ns) for path in sorted(directory.rglob('*'))
+            if path.is_file()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--count', type=int, default=1000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("DEMO DATA GENERATION: MINIFIED PAYLOAD, UNCHANGED FILES SKIPPED")
+    print("=" * 72)
+    scenario = default_scenario()
+    data = demo_data(scenario)
+    names = set(re.search(r"const \{([^}]*)\} = demoData;", (DEMO_DIR / 'demo.js').read_text(encoding='utf-8'))
+                .group(1).replace(' ', '').split(','))
+
+    with tempfile.TemporaryDirectory() as temporary:
+        root = Path(temporary)
+
+        # The payload
+        outputs = write_payload(data, root)
+        raw = (root / PAYLOAD_NAME).read_bytes()
+        check = (payload(root / PAYLOAD_NAME) == json.loads(json.dumps(data)) and names == set(data)
+                 and gzip.decompress((root / f'{PAYLOAD_NAME}.gz').read_bytes()) == raw)
+        ok = ok and check
+        print(f"  {'✅' if check else '❌'} {PAYLOAD_NAME} holds the scenario's data and every name demo.js reads "
+              f"({', '.join(sorted(names))}); the .gz decompresses to it")
+
+        # Against the previous generator
+        rounds = 200
+        start = time.perf_counter()
+        for _ in range(rounds):
+            previous_size = previous_generator(demo_data(scenario), root / 'previous.js')
+        previous_ms = (time.perf_counter() - start) * 1000 / rounds
+        start = time.perf_counter()
+        for _ in range(rounds):
+            write_payload(demo_data(scenario), root / 'again')
+        current_ms = (time.perf_counter() - start) * 1000 / rounds
+        print(f"\n  {'':34s}{'bytes':>10s}{'ms/run':>10s}")
+        print(f"  {'indented, rebuilt and rewritten':34s}{previous_size:>10,}{previous_ms:>10.2f}")
+        print(f"  {'minified + .gz, streamed':34s}{outputs[0].size:>10,}{current_ms:>10.2f}")
+        print(f"  {'  precompressed (gzip -9)':34s}{outputs[1].size:>10,}")
+        check = outputs[0].size < previous_size * 0.8 and outputs[1].size < outputs[0].size / 3
+        ok = ok and check
+        print(f"  {'✅' if check else '❌'} payload {outputs[0].size / previous_size:.0%} of the indented data, "
+              f"{outputs[1].size / previous_size:.0%} precompressed")
+
+        # ChangedFileWriter
+        before = snapshot(root)
+        unchanged = write_payload(data, root)
+        check = not any(output.changed for output in unchanged) and snapshot(root) == before
+        path = root / 'edited.txt'
+        for content in (b'0123456789' * 10000, b'0123456789' * 20000, b'0123', b'0123456789' * 10000,
+                        b'0123456789' * 9999 + b'x123456789', b''):
+            with ChangedFileWriter(path) as writer:
+                for offset in range(0, len(content), 4096):
+                    writer.write(content[offset:offset + 4096])
+            check = check and path.read_bytes() == content
+        ok = ok and check
+        print(f"\n  {'✅' if check else '❌'} unchanged payload: no file written (same inode and mtime); "
+              f"longer, shorter and edited content written exactly")
+
+        # Scenario bundles
+        bundles = root / 'scenarios'
+        timings = {}
+        for label in ("first run", "rerun, nothing changed", "rerun, one bundle edited"):
+            if label.endswith("edited"):
+                edited = bundles / bundle_name(next(scenarios(1))) / PAYLOAD_NAME
+                edited.write_text(edited.read_text(encoding='utf-8').replace('Purchase Order', 'Purchase order'),
+                                  encoding='utf-8')
+            start = time.perf_counter()
+            written = [output.path for generated in scenarios(args.count)
+                       for output in write_bundle(generated, bundles / bundle_name(generated)) if output.changed]
+            timings[label] = (time.perf_counter() - start, len(written))
+        total = sum(path.stat().st_size for path in bundles.rglob('*') if path.is_file())
+        print(f"\n  {args.count:,} scenario bundles ({total / 1024 / 1024:.1f} MB):")
+        for label, (elapsed, written) in timings.items():
+            print(f"    {label:28s} {elapsed:6.2f} s  {args.count / elapsed:7,.0f} bundles/s  {written:6,} files written")
+        check = (timings["first run"][1] == 4 * args.count and timings["rerun, nothing changed"][1] == 0
+                 and timings["rerun, one bundle edited"][1] == 1
+                 and len({payload(path)["docIds"]["purchase_order"] for path in bundles.glob(f'*/{PAYLOAD_NAME}')})
+                 == args.count)
+        ok = ok and check
+        print(f"  {'✅' if check else '❌'} one bundle per scenario; reruns rewrite only what changed")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: issuing scenario documents as a dependency graph (tools/flow_scheduler.py)
+
+- DOCUMENT_FLOW as a DAG: levels and critical path
+- the gluelam timber document set issued with DualTrackIssuer and a
+  signer taking --latency-ms per signature: one at a time in flow order
+  versus FlowScheduler with --workers threads; wall time against the
+  critical path (the bound for any schedule)
+- --shipments document sets in one graph (independent flows, one worker
+  pool): wall time versus serial time and the critical path
+- a trigger closing a cycle is rejected naming the cycle; a failing
+  document skips exactly its downstream documents
+- scheduling cost per document with a no-op issue()
+
+Usage:
+    python3 tools/benchmark_flow_scheduler.py [--latency-ms 20] [--workers 4] [--shipments 10]
+"""
+
+import argparse
+import copy
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'tools'))
+
+from dual_track_issuer import DualTrackIssuer  # noqa: E402
+from flow_scheduler import FlowError, FlowGraph, FlowScheduler, credential_issuer  # noqa: E402
+from scenario_flow import DOCUMENT_FLOW  # noqa: E402
+from scenario_gluelam_timber_full import DOCUMENTS  # noqa: E402
+
+
+def shipments_graph(graph: FlowGraph, count: int) -> FlowGraph:
+    """count copies of a flow, documents named "<shipment>/<document>"""
+    return FlowGraph({f"{i:03d}/{document}": [f"{i:03d}/{p}" for p in graph.prerequisites[document]]
+                      for i in range(count) for document in graph.order})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--shipments', type=int, default=10)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("DOCUMENT FLOW SCHEDULER: DEPENDENCY-ORDERED CONCURRENT ISSUANCE")
+    print("=" * 72)
+    graph = FlowGraph.from_flow(DOCUMENT_FLOW)
+    levels = graph.levels()
+    print(f"  DOCUMENT_FLOW: {len(graph)} documents, {len(levels)} levels; issuable together: "
+          + "; ".join(", ".join(level) for level in levels if len(level) > 1))
+
+    def signer(data: bytes) -> bytes:
+        time.sleep(args.latency_ms / 1000)  # remote signer / HSM round trip
+        return hashlib.sha512(data).digest()
+
+    issuer = DualTrackIssuer("did:example:gluelam-trade", "https://example.com/schemas", signer=signer)
+    issue = credential_issuer(issuer, DOCUMENTS)
+    issue("purchase_order", {})  # contexts processed once, outside the timings
+
+    # One shipment
+    start = time.perf_counter()
+    serial = {document: issue(document, {}) for document in graph.order}
+    serial_s = time.perf_counter() - start
+    run = FlowScheduler(graph, issue, max_workers=args.workers).run()
+    check = (run.complete and set(run.credentials) == set(serial)
+             and all(credential["proof"]["proofValue"].startswith("z") for credential in run.credentials.values())
+             and run.wall_time <= run.critical_path_time * 1.1 + 0.005)
+    ok = ok and check
+    print(f"\n  one shipment, signer {args.latency_ms:.0f} ms:")
+    print(f"    in flow order, one at a time   {serial_s * 1000:7.1f} ms")
+    print(f"    FlowScheduler, {args.workers} workers       {run.wall_time * 1000:7.1f} ms "
+          f"(up to {run.max_concurrency} at once)")
+    print(f"  {'✅' if check else '❌'} {len(run.credentials)} credentials signed; wall time "
+          f"{run.wall_time * 1000:.1f} ms against a critical path of {run.critical_path_time * 1000:.1f} ms "
+          f"({len(run.critical_path)} of {len(graph)} documents)")
+
+    # Several shipments in one graph
+    batch = shipments_graph(graph, args.shipments)
+    workers = args.workers * 2
+
+    def issue_shipment_document(name: str, inputs: dict):
+        return issue(name.split("/", 1)[1], inputs)
+
+    start = time.perf_counter()
+    for _ in range(args.shipments):
+        for document in graph.order:
+            issue(document, {})
+    serial_s = time.perf_counter() - start
+    run = FlowScheduler(batch, issue_shipment_document, max_workers=workers).run()
+    speedup = serial_s / run.wall_time
+    check = run.complete and len(run.credentials) == len(batch) and speedup > 2
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} {args.shipments} shipments ({len(batch)} documents), {workers} workers: "
+          f"{run.wall_time * 1000:.0f} ms vs {serial_s * 1000:.0f} ms one at a time ({speedup:.1f}x), "
+          f"critical path {run.critical_path_time * 1000:.0f} ms")
+
+    # Cycles and failures
+    cyclic = copy.deepcopy(DOCUMENT_FLOW)
+    cyclic["delivery_note"]["triggers"] = ["purchase_order"]
+    try:
+        FlowGraph.from_flow(cyclic)
+        message = "accepted"
+    except FlowError as e:
+        message = str(e)
+    check = message.startswith("document flow has a cycle") and "delivery_note → purchase_order" in message
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} delivery_note triggering purchase_order: {message[:60]}…")
+
+    def failing(document: str, inputs: dict):
+        if document == "bill_of_lading":
+            raise RuntimeError("carrier system unavailable")
+        return document
+
+    run = FlowScheduler(graph, failing, max_workers=args.workers).run()
+    downstream = {"commercial_invoice", "customs_declaration_export", "sea_cargo_manifest",
+                  "payment_confirmation", "customs_declaration_import", "delivery_note"}
+    check = set(run.failed) == {"bill_of_lading"} and set(run.skipped) == downstream
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} bill_of_lading failing: {len(run.credentials)} issued, "
+          f"{len(run.skipped)} downstream skipped")
+
+    # Scheduling cost
+    noop = shipments_graph(graph, 100)
+    start = time.perf_counter()
+    run = FlowScheduler(noop, lambda document, inputs: None, max_workers=args.workers).run()
+    per_document_us = (time.perf_counter() - start) * 1e6 / len(noop)
+    print(f"\n  scheduling cost: {per_document_us:.0f} µs per document ({len(noop):,} no-op documents)")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
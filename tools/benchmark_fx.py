@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark: FX rate lookup and batch currency conversion (mappings/fx.py)
+
+Generates an ECB-style history (business days since 1999, --currencies
+quoted currencies, some introduced later) and measures:
+- loading the CSV into the per-currency date/rate columns
+- single lookups: bisect on the fixing dates, cold and cached, checked
+  against a linear scan for random days (weekends included)
+- --conversions amounts in random currencies and dates converted to EUR
+  and to USD (cross rates) with RateTable.convert_many in --batch sized
+  columns, versus a per-amount convert() loop on a sample, which must
+  give identical results
+
+Usage:
+    python3 tools/benchmark_fx.py [--conversions 2000000] [--batch 100000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from mappings.fx import RateTable  # noqa: E402
+
+FIRST_DAY = date(1999, 1, 4)
+LAST_DAY = date(2025, 12, 31)
+
+
+def history_csv(currencies: int, seed: int = 1999) -> tuple:
+    """ECB hist layout: newest row first, N/A before a currency is quoted"""
+    rng = random.Random(seed)
+    codes = [f"C{i:02d}" for i in range(currencies - 1)] + ["USD"]
+    days = [FIRST_DAY + timedelta(n) for n in range((LAST_DAY - FIRST_DAY).days + 1)]
+    days = [day for day in days if day.weekday() < 5]
+    start = {code: 0 if code == "USD" or rng.random() < 0.7 else rng.randrange(len(days) // 2)
+             for code in codes}
+    levels = {code: rng.uniform(0.5, 2000) for code in codes}
+    rows = []
+    for position, day in enumerate(days):
+        values = []
+        for code in codes:
+            levels[code] *= 1 + rng.gauss(0, 0.004)
+            values.append(f"{levels[code]:.5g}" if position >= start[code] else "N/A")
+        rows.append(f"{day.isoformat()},{','.join(values)},")
+    text = "Date," + ",".join(codes) + ",\n" + "\n".join(reversed(rows)) + "\n"
+    return text, codes, len(days)
+
+
+def linear_rate(text_rows: dict, code: str, day: date):
+    """Reference: scan every fixing for the latest on or before day"""
+    best = None
+    for fixing, value in text_rows[code]:
+        if fixing <= day and (best is None or fixing > best[0]):
+            best = (fixing, value)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--currencies', type=int, default=30)
+    parser.add_argument('--conversions', type=int, default=2_000_000)
+    parser.add_argument('--batch', type=int, default=100_000)
+    parser.add_argument('--days', type=int, default=250, help='distinct document dates')
+    parser.add_argument('--lookups', type=int, default=200_000)
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print("FX RATES: LOOKUP AND BATCH CONVERSION")
+    print("=" * 72)
+    text, codes, fixings = history_csv(args.currencies)
+    start = time.perf_counter()
+    table = RateTable()
+    count = table.add_csv(text)
+    load_ms = (time.perf_counter() - start) * 1000
+    print(f"  load      {count:,} rates ({fixings:,} fixing days × {len(codes)} currencies) "
+          f"in {load_ms:.0f} ms")
+
+    rng = random.Random(7)
+    span = (LAST_DAY - FIRST_DAY).days
+    ok = True
+
+    # Bisect versus linear scan
+    columns = {code: [] for code in codes}
+    for line in text.splitlines()[1:]:
+        cells = line.split(",")
+        day = date.fromisoformat(cells[0])
+        for code, value in zip(codes, cells[1:]):
+            if value != "N/A":
+                columns[code].append((day, Decimal(value)))
+    wrong = 0
+    for _ in range(500):
+        code, day = rng.choice(codes), FIRST_DAY + timedelta(rng.randrange(span + 1))
+        expected = linear_rate(columns, code, day)
+        if expected is None:
+            continue
+        rate = table.rate("EUR", code, day)
+        wrong += (rate.numerator, rate.fixing_date) != (expected[1], expected[0])
+    ok = ok and not wrong
+    print(f"  {'✅' if not wrong else '❌'} bisect lookups match a linear scan ({wrong} wrong of 500)")
+
+    # Single lookups
+    dates = [FIRST_DAY + timedelta(days=span - rng.randrange(3 * 365)) for _ in range(args.days)]
+    queries = [(rng.choice(codes), "USD", rng.choice(dates)) for _ in range(args.lookups)]
+    cache_size = table.cache_size
+    for label, size in (("bisect", 0), ("cached", cache_size)):
+        table.cache_size = size  # 0: every lookup resolves both legs
+        start = time.perf_counter()
+        for source, target, day in queries:
+            table.rate(source, target, day)
+        elapsed = time.perf_counter() - start
+        print(f"  rate()    {label:6s} {elapsed * 1e6 / args.lookups:6.2f} µs/lookup "
+              f"({args.lookups / elapsed:,.0f}/s)")
+
+    # Batch conversion
+    pool = [Decimal(rng.randint(1, 10_000_000)).scaleb(-2) for _ in range(10_000)]
+    batch = min(args.batch, args.conversions)
+    amounts = [rng.choice(pool) for _ in range(batch)]
+    sources = [rng.choice(codes) for _ in range(batch)]
+    on = [rng.choice(dates) for _ in range(batch)]
+    batches = -(-args.conversions // batch)
+    sample = min(batch, 20_000)
+    for target in ("EUR", "USD"):
+        start = time.perf_counter()
+        for _ in range(batches):
+            converted = table.convert_many(amounts, sources, target, on)
+        elapsed = time.perf_counter() - start
+        total = batches * batch
+
+        start = time.perf_counter()
+        single = [table.convert(amount, source, target, day)
+                  for amount, source, day in zip(amounts[:sample], sources[:sample], on[:sample])]
+        single_us = (time.perf_counter() - start) * 1e6 / sample
+        identical = single == converted[:sample]
+        ok = ok and identical
+        print(f"\n  → {target}: {total:,} conversions in {elapsed:.2f} s "
+              f"({elapsed * 1e6 / total:.2f} µs each, {total / elapsed:,.0f}/s)")
+        print(f"    per-amount convert(): {single_us:.2f} µs each "
+              f"({single_us * total / (elapsed * 1e6):.1f}x slower)")
+        print(f"    {'✅' if identical else '❌'} batch and per-amount results identical "
+              f"({sample:,} sampled)")
+
+    print(f"\n  cache: {table.stats()}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
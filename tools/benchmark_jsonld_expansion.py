@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark: JSON-LD expansion throughput with and without the context cache
+
+Expands a batch of credentials with JsonLdProcessor twice:
+- uncached: cache_size=0, every credential re-processes its contexts
+  (W3C credentials context, KTDDE context, type-scoped contexts)
+- cached: processed contexts are reused across the batch
+
+The batch is every SAPToVCMapper credential from the sample scenarios plus
+templates/examples/*.jsonld, repeated to --batch credentials. Both runs
+must produce identical output.
+
+Usage:
+    python3 tools/benchmark_jsonld_expansion.py [--batch 2000] [--cache-size 512]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from jsonld_processor import ContextDocumentLoader, JsonLdProcessor
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from data.sample_data import get_all_scenarios  # noqa: E402
+from mappings.sap_to_vc import convert_sap_scenario_to_vcs  # noqa: E402
+
+
+def load_credentials() -> list:
+    """Mapper output for every scenario plus the example templates"""
+    credentials = []
+    for scenario in get_all_scenarios():
+        credentials.extend(convert_sap_scenario_to_vcs(scenario).values())
+    for path in sorted((REPO_ROOT / 'templates' / 'examples').glob('*.jsonld')):
+        with open(path, 'r', encoding='utf-8') as f:
+            credentials.append(json.load(f))
+    return credentials
+
+
+def run(processor: JsonLdProcessor, batch: list) -> tuple:
+    start = time.perf_counter()
+    expanded = processor.expand_batch(batch)
+    return time.perf_counter() - start, expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--batch', type=int, default=2000)
+    parser.add_argument('--cache-size', type=int, default=512)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    loader = ContextDocumentLoader()
+    load_ms = (time.perf_counter() - start) * 1000
+
+    sources = load_credentials()
+    batch = [sources[i % len(sources)] for i in range(args.batch)]
+
+    print("=" * 60)
+    print("JSON-LD EXPANSION BENCHMARK")
+    print("=" * 60)
+    print(f"Loader: {len(loader)} context documents in memory ({load_ms:.1f} ms)")
+    print(f"Batch:  {len(batch)} credentials ({len(sources)} distinct)")
+
+    uncached = JsonLdProcessor(loader, cache_size=0)
+    uncached_s, uncached_out = run(uncached, batch)
+
+    cached = JsonLdProcessor(loader, cache_size=args.cache_size)
+    start = time.perf_counter()
+    warmed = cached.warm()
+    warm_ms = (time.perf_counter() - start) * 1000
+    cached_s, cached_out = run(cached, batch)
+
+    print(f"\n  {'mode':10s} {'total s':>9s} {'creds/s':>10s} {'ms/cred':>9s}")
+    for mode, elapsed in (('uncached', uncached_s), ('cached', cached_s)):
+        print(f"  {mode:10s} {elapsed:9.2f} {len(batch) / elapsed:10.0f} "
+              f"{elapsed * 1000 / len(batch):9.3f}")
+    print(f"\n  Speedup:        {uncached_s / cached_s:.1f}x")
+    print(f"  Warm-up:        {warmed} contexts pre-processed in {warm_ms:.1f} ms")
+    print(f"  Cache:          {len(cached.cache)} entries, "
+          f"{cached.cache.hits} hits / {cached.cache.misses} misses")
+
+    if uncached_out != cached_out:
+        print("  ❌ Cached and uncached expansion differ")
+        sys.exit(1)
+    print("  ✅ Cached and uncached expansion identical")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Benchmark: documentary credit examination (compliance/lc_examination.py)
+
+Examines --scenarios copies of the sample scenarios, a quarter of them
+with one injected discrepancy each (late shipment, invoice over the
+credit amount, a required document that is not issued, wrong Incoterms,
+a credit opened for another applicant), and reports:
+- every injected discrepancy found by the rule meant to catch it, and
+  no discrepancy in the other scenarios
+- throughput mapping + examining sequentially and with --workers
+  processes (results must be identical)
+- per-rule time across all examinations
+- examination time per line for 1 to 1000 line items (linear scaling)
+
+Usage:
+    python3 tools/benchmark_lc_compliance.py [--scenarios 400] [--workers 4]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from compliance.lc_examination import (  # noqa: E402
+    examine, examine_many, rule_timings,
+)
+from data.sample_data import get_all_scenarios  # noqa: E402
+from mappings.sap_to_vc import convert_sap_scenario_to_vcs  # noqa: E402
+
+
+def late_shipment(scenario):
+    lc = scenario["documentary_credit"]
+    shipped = scenario["delivery"]["header"].WADAT or scenario["delivery"]["header"].LFDAT
+    scenario["documentary_credit"] = dataclasses.replace(lc, LATEST_SHIP_DATE=shipped - timedelta(days=3))
+
+
+def overdrawn(scenario):
+    lc = scenario["documentary_credit"]
+    scenario["documentary_credit"] = dataclasses.replace(lc, LCAMOUNT=lc.LCAMOUNT - Decimal("1000.00"))
+
+
+def missing_document(scenario):
+    lc = scenario["documentary_credit"]
+    scenario["documentary_credit"] = dataclasses.replace(
+        lc, DOCS_REQUIRED=lc.DOCS_REQUIRED + ["Inspection Certificate"])
+
+
+def wrong_incoterms(scenario):
+    lc = scenario["documentary_credit"]
+    scenario["documentary_credit"] = dataclasses.replace(lc, INCO1="DAP")
+
+
+def other_applicant(scenario):
+    lc = scenario["documentary_credit"]
+    other = next(s["documentary_credit"].APPLICANT for s in get_all_scenarios()
+                 if s["documentary_credit"].APPLICANT != lc.APPLICANT)
+    scenario["documentary_credit"] = dataclasses.replace(lc, APPLICANT=other)
+
+
+# fault → rule expected to report it
+FAULTS = [
+    (late_shipment, "latest-shipment"),
+    (overdrawn, "invoice-amount"),
+    (missing_document, "documents-presented"),
+    (wrong_incoterms, "delivery-terms"),
+    (other_applicant, "invoice-parties"),
+]
+
+
+def build_scenarios(count: int) -> tuple:
+    """count scenarios; every fourth one gets a fault, cycling through FAULTS"""
+    samples = get_all_scenarios()
+    scenarios, expected = [], {}
+    for i in range(count):
+        scenario = dict(samples[i % len(samples)])
+        scenario["scenario"] = f"{scenario['scenario']}-{i:05d}"
+        if i % 4 == 3:
+            fault, rule_id = FAULTS[(i // 4) % len(FAULTS)]
+            fault(scenario)
+            expected[scenario["scenario"]] = rule_id
+        scenarios.append(scenario)
+    return scenarios, expected
+
+
+def scaled_scenario(lines: int) -> dict:
+    """Singapore scenario with `lines` distinct products on delivery and invoice"""
+    scenario = dict(get_all_scenarios()[0])
+    for document in ("delivery", "invoice"):
+        item = scenario[document]["items"][0]
+        scenario[document] = dict(scenario[document], items=[
+            dataclasses.replace(item, POSNR=f"{(i + 1) * 10:06d}", ARKTX=f"{item.ARKTX} / {i}")
+            for i in range(lines)])
+    return scenario
+
+
+def signature(examinations) -> list:
+    return [(e.scenario, [(d.rule, d.document, d.message) for d in e.discrepancies])
+            for e in examinations]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scenarios', type=int, default=400)
+    parser.add_argument('--workers', type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument('--lines', default='1,10,100,1000', help='comma-separated line item counts')
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"DOCUMENTARY CREDIT EXAMINATION: {args.scenarios} SCENARIOS")
+    print("=" * 72)
+    scenarios, expected = build_scenarios(args.scenarios)
+
+    runs = {}
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        runs[workers] = examine_many(scenarios, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"  workers={workers}: {elapsed:6.2f} s  ({args.scenarios / elapsed:7.1f} scenarios/s, "
+              f"mapping included)")
+    sequential = runs[1]
+    identical = all(signature(run) == signature(sequential) for run in runs.values())
+    print(f"  {'✅' if identical else '❌'} parallel and sequential reports identical "
+          f"(cpu_count={os.cpu_count()})")
+
+    missed = [name for name, rule_id in expected.items()
+              if rule_id not in {d.rule for e in sequential if e.scenario == name for d in e.discrepancies}]
+    print(f"  {'✅' if not missed else '❌'} injected discrepancies found: "
+          f"{len(expected) - len(missed)}/{len(expected)}")
+    for name in missed[:5]:
+        print(f"     missed {expected[name]} in {name}")
+    discrepant = [e for e in sequential if e.scenario not in expected and not e.complying]
+    print(f"  {'✅' if not discrepant else '❌'} scenarios without a fault comply: "
+          f"{len(sequential) - len(expected) - len(discrepant)}/{len(sequential) - len(expected)}")
+    for examination in discrepant[:5]:
+        print(f"     {examination.scenario}: {examination.discrepancies[0].message}")
+
+    print(f"\n  {'rule':28s} {'mean µs':>9s} {'total ms':>9s} {'found':>6s}")
+    for rule_id, timing in sorted(rule_timings(sequential).items(), key=lambda item: -item[1]["total_us"]):
+        print(f"  {rule_id:28s} {timing['mean_us']:9.1f} {timing['total_us'] / 1000:9.2f} "
+              f"{timing['discrepancies']:6d}")
+
+    print(f"\n  {'lines':>6s} {'index µs':>10s} {'rules µs':>10s} {'µs/line':>8s}")
+    for lines in (int(n) for n in args.lines.split(',')):
+        credentials = convert_sap_scenario_to_vcs(scaled_scenario(lines))
+        best = None
+        for _ in range(5):
+            examination = examine(credentials)
+            total = sum(examination.timings.values())
+            if best is None or total < sum(best.timings.values()):
+                best = examination
+        index_us = best.timings["index"] / 1000
+        rules_us = sum(ns for rule_id, ns in best.timings.items() if rule_id != "index") / 1000
+        print(f"  {lines:6d} {index_us:10.1f} {rules_us:10.1f} {(index_us + rules_us) / lines:8.2f}")
+
+    if missed or discrepant or not identical:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
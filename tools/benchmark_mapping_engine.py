@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled mapping specs versus the hand-written SAP → VC mappers
+
+Equivalence: every map_* method of SAPToVCMapper (compiled from
+mappings/mapping_specs.py) must serialize byte-for-byte like
+ReferenceSAPToVCMapper (the original hand-written code, kept in
+tools/sap_to_vc_reference.py) for both sample
+scenarios and for variants that blank each optional SAP field in turn
+(headers and line items), so every conditional branch is exercised.
+Variants whose output changed on purpose (INTENDED) are not compared;
+the output names each one and why.
+Amounts are compared by value: the compiled mappings emit exact decimal
+strings (mappings/amounts.py) where the hand-written ones emitted floats.
+
+Every spec is compiled up front (mappings compile lazily in the API),
+so a spec referring to an unknown SAP field fails here.
+
+Speed: time per document for both implementations on the sample
+scenarios, with line items repeated to --items; the best of --rounds
+timed loops counts. The compiled mapper caches each document's exact
+amounts with its SAP objects; the "first map" column is the compiled
+mapper without that cache, as when a document is mapped once.
+
+Usage:
+    python3 tools/benchmark_mapping_engine.py [--items 50] [--repeat 2000] [--rounds 5]
+"""
+
+import argparse
+import dataclasses
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+sys.path.insert(0, str(REPO_ROOT / 'tools'))
+
+from data.sample_data import get_all_scenarios  # noqa: E402
+from mappings.derived_data import DerivedDataCache  # noqa: E402
+from mappings.mapping_specs import COMPILED  # noqa: E402
+from mappings.sap_to_vc import SAPToVCMapper  # noqa: E402
+from sap_to_vc_reference import ReferenceSAPToVCMapper  # noqa: E402
+
+
+AMOUNT_KEYS = ("value", "amountValue")
+
+# Variants whose output changed on purpose → why
+INTENDED = {
+    ("map_purchase_order", "EKKO.KTWRT=None"):
+        "without a header total, orderAmount is the summed lines instead of 0.0",
+}
+
+
+def normalized(credential):
+    """Amount values as floats, so "125000.00" and 125000.0 compare equal"""
+    if isinstance(credential, dict):
+        return {key: float(value) if key in AMOUNT_KEYS and isinstance(value, str)
+                else normalized(value) for key, value in credential.items()}
+    if isinstance(credential, list):
+        return [normalized(value) for value in credential]
+    return credential
+
+
+def calls(scenario: dict) -> dict:
+    """method name → positional arguments, for every document in a scenario"""
+    delivery, invoice = scenario["delivery"], scenario["invoice"]
+    mapped = {}
+    if "purchase_order" in scenario:
+        mapped["map_purchase_order"] = (scenario["purchase_order"]["header"],
+                                        scenario["purchase_order"]["items"])
+    mapped["map_commercial_invoice"] = (invoice["header"], invoice["items"])
+    mapped["map_bill_of_lading"] = (delivery["header"], delivery["items"])
+    mapped["map_certificate_of_origin"] = (delivery["header"], delivery["items"], invoice["header"])
+    mapped["map_documentary_credit"] = (scenario["documentary_credit"],)
+    return mapped
+
+
+def blanked(record, name: str):
+    return dataclasses.replace(record, **{name: None})
+
+
+def optional_fields(record) -> list:
+    return [f.name for f in dataclasses.fields(record)
+            if f.default is None and getattr(record, f.name) is not None]
+
+
+def variants(args: tuple):
+    """The call itself, then one variant per optional field blanked"""
+    yield "as-is", args
+    for position, argument in enumerate(args):
+        if isinstance(argument, list):
+            for name in optional_fields(argument[0]):
+                rows = [blanked(row, name) for row in argument]
+                yield f"items.{name}=None", args[:position] + (rows,) + args[position + 1:]
+        else:
+            for name in optional_fields(argument):
+                yield f"{type(argument).__name__}.{name}=None", \
+                    args[:position] + (blanked(argument, name),) + args[position + 1:]
+
+
+def check_equivalence(compiled: SAPToVCMapper, reference: ReferenceSAPToVCMapper) -> tuple:
+    checked = mismatches = 0
+    excluded = []
+    for scenario in get_all_scenarios():
+        for method, args in calls(scenario).items():
+            for label, variant in variants(args):
+                if (method, label) in INTENDED:
+                    excluded.append(f"{scenario['scenario']} {method} [{label}]: {INTENDED[method, label]}")
+                    continue
+                expected = json.dumps(getattr(reference, method)(*variant))
+                actual = json.dumps(normalized(getattr(compiled, method)(*variant)))
+                checked += 1
+                if expected != actual:
+                    mismatches += 1
+                    print(f"  ❌ {scenario['scenario']} {method} [{label}]")
+    return checked, mismatches, excluded
+
+
+def scaled(args: tuple, items: int) -> tuple:
+    return tuple([argument[i % len(argument)] for i in range(items)]
+                 if isinstance(argument, list) else argument for argument in args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--items', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    COMPILED.compile_all()
+    compiled, reference = SAPToVCMapper(), ReferenceSAPToVCMapper()
+    uncached = SAPToVCMapper(derived_data=DerivedDataCache(max_entries=0))
+
+    print("=" * 72)
+    print("MAPPING ENGINE: COMPILED SPECS vs HAND-WRITTEN")
+    print("=" * 72)
+    checked, mismatches, excluded = check_equivalence(compiled, reference)
+    status = "✅" if not mismatches else "❌"
+    print(f"{status} Equivalence: {checked - mismatches}/{checked} credentials identical "
+          f"(sample scenarios × optional-field variants; {len(excluded)} of {checked + len(excluded)} "
+          f"not compared, changed on purpose)")
+    for variant in excluded:
+        print(f"   ⏭  {variant}")
+    print()
+
+    scenario = get_all_scenarios()[0]
+    print(f"  {'mapping':28s} {'items':>5s} {'hand-written µs':>16s} {'compiled µs':>12s} "
+          f"{'speedup':>8s} {'first map µs':>13s}")
+    for method, call in calls(scenario).items():
+        for items in (None, args.items):
+            call_args = scaled(call, items) if items else call
+            row_count = max((len(a) for a in call_args if isinstance(a, list)), default=0)
+            if items and not row_count:
+                continue
+            timings = []
+            for mapper in (reference, compiled, uncached):
+                function = getattr(mapper, method)
+                best = float("inf")
+                for _ in range(args.rounds):
+                    start = time.perf_counter()
+                    for _ in range(args.repeat):
+                        function(*call_args)
+                    best = min(best, time.perf_counter() - start)
+                timings.append(best * 1e6 / args.repeat)
+            print(f"  {method:28s} {row_count:5d} {timings[0]:16.1f} {timings[1]:12.1f} "
+                  f"{timings[0] / timings[1]:7.2f}x {timings[2]:13.1f}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Prometheus metrics recording overhead (sap-simulator/api/metrics.py)
+
+- Cost of Counter.inc, Histogram.observe and a Timer block
+- --threads threads recording concurrently: totals must be exact
+- short-lived threads (thread-per-request servers): shards are folded at
+  scrape time, totals stay exact and the shard list stays bounded
+- per-request overhead: a Flask app with and without instrument_app()
+- /metrics rendering time for many series, and a format check: every
+  sample line parses, buckets are cumulative, _count equals the +Inf
+  bucket
+
+Usage:
+    python3 tools/benchmark_metrics.py [--ops 1000000] [--threads 8]
+"""
+
+import argparse
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from api.metrics import Registry, instrument_app  # noqa: E402
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(?:[a-zA-Z_][a-zA-Z0-9_]*="(?:[^"\\]|\\.)*",?)*\})? '
+                    r'(-?[0-9.e+-]+|\+Inf|NaN)$')
+
+
+def per_op(function, ops: int) -> float:
+    start = time.perf_counter()
+    function(ops)
+    return (time.perf_counter() - start) * 1e9 / ops
+
+
+def check_exposition(text: str) -> list:
+    """Problems found in a text exposition (empty list: valid)"""
+    problems, buckets = [], {}
+    for line in text.splitlines():
+        if not line or line.startswith("# HELP ") or line.startswith("# TYPE "):
+            continue
+        match = SAMPLE.match(line)
+        if not match:
+            problems.append(f"unparseable: {line}")
+            continue
+        name, labels, value = match.group(1), match.group(2) or "", match.group(3)
+        series = re.sub(r',?le="[^"]*"', "", labels)
+        if name.endswith("_bucket"):
+            previous = buckets.get((name[:-7], series))
+            if previous is not None and float(value) < previous:
+                problems.append(f"buckets not cumulative: {line}")
+            buckets[(name[:-7], series)] = float(value)
+        elif name.endswith("_count") and (name[:-6], series) in buckets:
+            if float(value) != buckets[(name[:-6], series)]:
+                problems.append(f"_count differs from +Inf bucket: {line}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--ops', type=int, default=1_000_000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=5000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("PROMETHEUS METRICS: RECORDING OVERHEAD")
+    print("=" * 72)
+    registry = Registry()
+    counter = registry.counter("bench_total", "benchmark counter", ("route",))
+    histogram = registry.histogram("bench_seconds", "benchmark histogram", ("route",))
+    labels = ("/vc/api/v1/invoices/<vbeln>/vc",)
+
+    def incs(n):
+        for _ in range(n):
+            counter.inc(labels)
+
+    def observes(n):
+        for i in range(n):
+            histogram.observe(i * 1e-9, labels)
+
+    def timers(n):
+        for _ in range(n):
+            with histogram.time(labels):
+                pass
+
+    def empty(n):
+        for _ in range(n):
+            pass
+
+    loop = per_op(empty, args.ops)
+    for name, function in (("Counter.inc", incs), ("Histogram.observe", observes), ("with Histogram.time()", timers)):
+        print(f"  {name:24s} {per_op(function, args.ops) - loop:7.0f} ns/op")
+
+    # Concurrent writers
+    registry = Registry()
+    counter = registry.counter("bench_total", "benchmark counter", ("route",))
+    histogram = registry.histogram("bench_seconds", "benchmark histogram", ("route",))
+    per_thread = args.ops // args.threads
+
+    def work():
+        for _ in range(per_thread):
+            counter.inc(labels)
+            histogram.observe(0.001, labels)
+
+    threads = [threading.Thread(target=work) for _ in range(args.threads)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    expected = per_thread * args.threads
+    counted, observed = counter.samples()[labels], sum(histogram.samples()[labels][:-1])
+    exact = counted == expected and observed == expected
+    ok = ok and exact
+    print(f"\n  {'✅' if exact else '❌'} {args.threads} threads × {per_thread:,}: counter {counted:,.0f}, "
+          f"histogram {observed:,} of {expected:,} "
+          f"({elapsed * 1e9 / expected / 2:.0f} ns/op)")
+
+    # Thread churn
+    churn = 2000
+    for _ in range(churn // 100):
+        batch = [threading.Thread(target=counter.inc, args=(("churn",),)) for _ in range(100)]
+        for thread in batch:
+            thread.start()
+        for thread in batch:
+            thread.join()
+        counter.samples()  # a scrape folds finished threads
+    exact = counter.samples()[("churn",)] == churn and len(counter._shards) <= 2
+    ok = ok and exact
+    print(f"  {'✅' if exact else '❌'} {churn} short-lived threads: {counter.samples()[('churn',)]:,.0f} counted, "
+          f"{len(counter._shards)} live shards after scraping")
+
+    # Per-request overhead in Flask
+    from flask import Flask
+
+    def app(instrumented: bool):
+        application = Flask(f"bench_{instrumented}")
+        if instrumented:
+            instrument_app(application)
+
+        @application.route('/items/<item>')
+        def item(item):
+            return {"item": item}
+        return application.test_client()
+
+    timings = {}
+    for instrumented in (False, True, False, True):
+        client = app(instrumented)
+        start = time.perf_counter()
+        for i in range(args.requests):
+            client.get(f'/items/{i % 50}')
+        us = (time.perf_counter() - start) * 1e6 / args.requests
+        timings[instrumented] = min(us, timings.get(instrumented, us))
+    print(f"\n  Flask request: {timings[False]:.1f} µs plain, {timings[True]:.1f} µs instrumented "
+          f"(+{timings[True] - timings[False]:.1f} µs)")
+
+    # Rendering
+    registry = Registry()
+    counter = registry.counter("sap_api_requests_total", "requests", ("route", "method", "status"))
+    histogram = registry.histogram("sap_api_request_duration_seconds", "latency", ("route", "method"))
+    for route in range(60):
+        for status in ("200", "404", "500"):
+            counter.inc((f'/route/{route}/"quoted"\\', "GET", status))
+        for i in range(100):
+            histogram.observe(i / 1000, (f"/route/{route}", "GET"))
+    start = time.perf_counter()
+    text = registry.render()
+    render_ms = (time.perf_counter() - start) * 1000
+    problems = check_exposition(text)
+    ok = ok and not problems
+    print(f"  render: {len(text.splitlines()):,} lines in {render_ms:.2f} ms")
+    print(f"  {'✅' if not problems else '❌'} exposition format check")
+    for problem in problems[:5]:
+        print(f"     {problem}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: request profiling hooks and mapper spans (sap-simulator/api/profiling.py)
+
+- SAPToVCMapper.map_commercial_invoice for an --lines line invoice with
+  no span recorder, with the recorder but no profiled request (the
+  production setting with SAP_API_PROFILING=1), and inside a profile
+- the cost of one disabled span
+- invoice VC requests through the Flask test client: not profiled, and
+  profiled with each mode
+- checks: every mapper phase appears as a span, cProfile sees the
+  mapping functions, pstats exports load, a second concurrent cProfile
+  request falls back to spans
+
+Usage:
+    python3 tools/benchmark_profiling.py [--lines 50] [--requests 2000]
+"""
+
+import argparse
+import dataclasses
+import os
+import pstats
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+os.environ["SAP_API_PROFILING"] = "1"
+
+from api import profiling  # noqa: E402
+from api.sap_api import app  # noqa: E402
+from data.sample_data import scenario_eu_singapore_export  # noqa: E402
+from mappings.sap_to_vc import SAPToVCMapper  # noqa: E402
+
+INVOICE_URL = '/vc/api/v1/invoices/9000000789/vc'
+
+
+def best_of(function, repeat: int = 5) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=50)
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("REQUEST PROFILING: HOOK AND SPAN OVERHEAD")
+    print("=" * 72)
+    invoice = scenario_eu_singapore_export()["invoice"]
+    item = invoice["items"][0]
+    items = [dataclasses.replace(item, POSNR=f"{(i + 1) * 10:06d}") for i in range(args.lines)]
+    header = dataclasses.replace(invoice["header"], NETWR=item.NETWR * args.lines)
+
+    plain, recorded = SAPToVCMapper(), SAPToVCMapper(spans=profiling.SPANS)
+    plain.map_commercial_invoice(header, items)
+    recorded.map_commercial_invoice(header, items)
+
+    def calls(mapper):
+        return lambda: [mapper.map_commercial_invoice(header, items) for _ in range(args.calls)]
+
+    profile = profiling.Profile("spans", "GET", INVOICE_URL)
+    timings = {"no recorder": best_of(calls(plain)),
+               "recorder, not profiling": best_of(calls(recorded))}
+    token = profiling._current.set(profile)
+    timings["inside a profile"] = best_of(calls(recorded))
+    profiling._current.reset(token)
+    print(f"  map_commercial_invoice, {args.lines} lines:")
+    for label, elapsed in timings.items():
+        print(f"    {label:26s} {elapsed * 1e6 / args.calls:8.1f} µs/call")
+
+    null = nullcontext()
+    spans = 1_000_000
+
+    def disabled_spans():
+        for _ in range(spans):
+            with null:
+                pass
+
+    def empty_loop():
+        for _ in range(spans):
+            pass
+
+    span_ns = (best_of(disabled_spans, 3) - best_of(empty_loop, 3)) * 1e9 / spans
+    map_us = timings["no recorder"] * 1e6 / args.calls
+    # three phase spans per invoice (amounts, assembly, status)
+    print(f"  disabled span: {span_ns:.0f} ns; 3 per invoice = {3 * span_ns / (map_us * 10):.3f}% "
+          f"of a {map_us:.0f} µs mapping")
+
+    client = app.test_client()
+    client.get(INVOICE_URL)
+    print(f"\n  GET {INVOICE_URL}:")
+    for mode in (None, "spans", "cprofile", "sample"):
+        headers = {profiling.HEADER: mode} if mode else {}
+        count = args.requests if mode != "sample" else max(1, args.requests // 10)
+
+        def requests():
+            for _ in range(count):
+                client.get(INVOICE_URL, headers=headers)
+        print(f"    {mode or 'not profiled':14s} {best_of(requests, 3) * 1e6 / count:8.1f} µs/request")
+
+    print()
+    response = client.get(INVOICE_URL, headers={profiling.HEADER: "cprofile", "X-Request-ID": "bench-1"})
+    stored = profiling.get_profile(response.headers.get("X-Profile-Id", ""))
+    names = {span[0] for span in stored.spans} if stored else set()
+    expected = {"commercial_invoice.amounts", "commercial_invoice.assembly",
+                "commercial_invoice.status", "serialization.json"}
+    check = expected <= names
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} spans recorded: {', '.join(sorted(names))}")
+
+    functions = {row["function"].split(" ")[0] for row in stored.functions(top=500)} if stored else set()
+    # _amounts, not invoice_amounts: the mapper caches a document's amounts after its first request
+    check = {"map_commercial_invoice", "_amounts", "dumps"} <= functions
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} cProfile covers mapping and serialization "
+          f"({len(functions)} functions)")
+
+    with tempfile.NamedTemporaryFile(suffix=".prof") as file:
+        file.write(client.get(f"/admin/profiles/{stored.id}?format=pstats").data)
+        file.flush()
+        loaded = len(pstats.Stats(file.name).stats)
+    check = loaded == len(stored.profiler.stats)
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} pstats export loads ({loaded} entries)")
+
+    with profiling._cprofile_lock:  # as if another request were being profiled
+        response = client.get(INVOICE_URL, headers={profiling.HEADER: "cprofile"})
+    busy = profiling.get_profile(response.headers["X-Profile-Id"])
+    check = busy.profiler is None and busy.note is not None and busy.spans
+    ok = ok and bool(check)
+    print(f"  {'✅' if check else '❌'} concurrent cProfile request falls back to spans")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: RDFC-1.0 canonicalization of our credentials (eddsa-rdfc-2022 input)
+
+Canonicalizes credentials from every SAPToVCMapper map_* method (both
+sample scenarios) and every template under templates/examples, and reports
+per stage: JSON-LD expansion, JSON-LD → RDF, and RDFC-1.0 labelling.
+
+Also shows how many credentials took the fast path (no blank nodes, or
+every first-degree hash unique) versus Hash N-Degree Quads, and the
+effect of reusing processed contexts across the batch.
+
+If pyld is installed its URDNA2015 output is used as a cross-check
+(same offline loader).
+
+Usage:
+    python3 tools/benchmark_rdfc.py [--repeat 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from jsonld_processor import ContextDocumentLoader, JsonLdProcessor
+from rdf_canonicalize import Canonicalizer, to_quads
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from data.sample_data import get_all_scenarios  # noqa: E402
+from mappings.sap_to_vc import convert_sap_scenario_to_vcs  # noqa: E402
+
+
+def load_credentials() -> list:
+    """(name, credential) for every map_* output and example template"""
+    credentials = []
+    for scenario in get_all_scenarios():
+        for name, vc in convert_sap_scenario_to_vcs(scenario).items():
+            credentials.append((f"{scenario['scenario']}/{name}", vc))
+    for path in sorted((REPO_ROOT / 'templates' / 'examples').glob('*.jsonld')):
+        with open(path, 'r', encoding='utf-8') as f:
+            credentials.append((f"templates/examples/{path.name}", json.load(f)))
+    return credentials
+
+
+def canonicalize_timed(processor: JsonLdProcessor, credential: dict) -> tuple:
+    """Return (nquads, canonicalizer, expand_s, to_rdf_s, c14n_s)"""
+    start = time.perf_counter()
+    expanded = processor.expand(credential)
+    expanded_at = time.perf_counter()
+    quads = to_quads(expanded)
+    quads_at = time.perf_counter()
+    canonicalizer = Canonicalizer(quads)
+    nquads = canonicalizer.canonicalize()
+    done = time.perf_counter()
+    return (nquads, canonicalizer, expanded_at - start, quads_at - expanded_at,
+            done - quads_at)
+
+
+def cross_check(loader: ContextDocumentLoader, credentials: list,
+                processor: JsonLdProcessor) -> None:
+    try:
+        from pyld import jsonld
+    except ImportError:
+        print("\n(pyld not installed; skipping URDNA2015 cross-check)")
+        return
+    mismatches = 0
+    start = time.perf_counter()
+    for name, credential in credentials:
+        reference = jsonld.normalize(credential, {
+            'algorithm': 'URDNA2015', 'format': 'application/n-quads',
+            'documentLoader': loader, 'base': None,
+        })
+        if reference != canonicalize_timed(processor, credential)[0]:
+            mismatches += 1
+            print(f"  ❌ {name}: differs from pyld")
+    elapsed = time.perf_counter() - start
+    status = "✅" if not mismatches else "❌"
+    print(f"\n{status} pyld URDNA2015 cross-check: {len(credentials) - mismatches}/"
+          f"{len(credentials)} identical (pyld+ours {elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    loader = ContextDocumentLoader()
+    credentials = load_credentials()
+
+    print("=" * 72)
+    print("RDFC-1.0 CANONICALIZATION BENCHMARK")
+    print("=" * 72)
+    print(f"{len(credentials)} credentials, {args.repeat} repeats\n")
+
+    processor = JsonLdProcessor(loader)
+    fast_path = 0
+    print(f"  {'credential':52s} {'quads':>5s} {'bnodes':>6s} {'n-deg':>5s}")
+    for name, credential in credentials:
+        _, canonicalizer, _, _, _ = canonicalize_timed(processor, credential)
+        bnodes = len(canonicalizer.bnode_quads)
+        if not canonicalizer.ambiguous:
+            fast_path += 1
+        print(f"  {name[-52:]:52s} {len(canonicalizer.quads):5d} {bnodes:6d} "
+              f"{canonicalizer.ambiguous:5d}")
+    print(f"\n  Fast path (no Hash N-Degree Quads): {fast_path}/{len(credentials)}")
+
+    for mode, cache_size in (('contexts re-processed', 0), ('contexts cached', 512)):
+        processor = JsonLdProcessor(loader, cache_size=cache_size)
+        totals = [0.0, 0.0, 0.0]
+        for _ in range(args.repeat):
+            for _, credential in credentials:
+                timings = canonicalize_timed(processor, credential)[2:]
+                for i, value in enumerate(timings):
+                    totals[i] += value
+        count = args.repeat * len(credentials)
+        total = sum(totals)
+        print(f"\n{mode}: {count / total:.0f} credentials/s ({total * 1000 / count:.2f} ms each)")
+        for stage, value in zip(('expand', 'to RDF', 'RDFC-1.0'), totals):
+            print(f"  {stage:10s} {value * 1000 / count:7.3f} ms  ({value / total:5.1%})")
+
+    cross_check(loader, credentials, JsonLdProcessor(loader))
+
+
+if __name__ == '__main__':
+    main()
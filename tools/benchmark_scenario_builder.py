@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: building trade scenarios from inputs (scenario_gluelam_timber_full.TradeScenario)
+
+- importing the module builds nothing and prints nothing; the module
+  names (DOCUMENTS, TIMELINE, LC_AMOUNT, ...) are the default scenario's
+- a document is built on first access, alone; shared totals are computed
+  once, when a document needs them
+- the documents agree with each other: invoice and L/C amounts, weights
+  on the bill of lading, packing list and manifest, quantities
+- --count generated scenarios: distinct document numbers, timelines in
+  date order, the same scenarios for the same seed
+- scenarios per second: constructed with one document read, and with
+  every document built
+
+Usage:
+    python3 tools/benchmark_scenario_builder.py [--count 10000]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import scenario_gluelam_timber_full as scenario_module  # noqa: E402
+from scenario_gluelam_timber_full import DOCUMENT_TYPES, TradeScenario, scenarios  # noqa: E402
+
+
+def consistent(scenario: TradeScenario) -> bool:
+    """Amounts, weights and quantities agree across the documents"""
+    documents = scenario.documents
+    invoice = documents["commercial_invoice"]
+    lines = sum(line["lineTotal"]["value"] for line in invoice["invoiceLines"])
+    weights = {documents["bill_of_lading"]["grossWeight"]["value"],
+               documents["packing_list"]["totalGrossWeight"]["value"],
+               documents["sea_cargo_manifest"]["totalWeight"]["value"],
+               documents["warehouse_receipt"]["weight"]["value"]}
+    return (abs(invoice["totalAmount"]["value"] - (lines + scenario.freight_cost)) < 1e-6
+            and documents["documentary_credit"]["creditAmount"]["value"]
+            == invoice["totalAmount"]["value"] + scenario.insurance_cost
+            and documents["payment_confirmation"]["paymentAmount"]["value"] == invoice["totalAmount"]["value"]
+            and len(weights) == 1
+            and documents["warehouse_receipt"]["quantity"]["value"]
+            == sum(line["deliveredQuantity"]["value"] for line in documents["delivery_note"]["deliveryNoteLines"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--count', type=int, default=10_000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("TRADE SCENARIO BUILDER: LAZY DOCUMENTS, SHARED TOTALS")
+    print("=" * 72)
+
+    # Import
+    probe = ("import time; start = time.perf_counter(); import scenario_gluelam_timber_full as s; "
+             "elapsed = time.perf_counter() - start; "
+             "print(s._default is None and 'DOCUMENTS' not in vars(s), round(elapsed * 1000, 1))")
+    output = subprocess.run([sys.executable, "-c", probe], cwd=REPO_ROOT, capture_output=True, text=True).stdout
+    untouched, import_ms = output.split()
+    check = untouched == "True" and len(output.splitlines()) == 1
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} import: {import_ms} ms, nothing built, nothing printed")
+
+    default = scenario_module.default_scenario()
+    check = (scenario_module.DOCUMENTS == dict(default.documents) and scenario_module.TIMELINE == default.timeline
+             and scenario_module.LC_AMOUNT == default.lc_amount == 353000.0
+             and scenario_module.TOTAL_WEIGHT == 30400 and consistent(default))
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} module names are the default scenario's "
+          f"(L/C EUR {scenario_module.LC_AMOUNT:,.0f}, {scenario_module.TOTAL_WEIGHT:,} kg); documents agree")
+
+    # Laziness and memoized totals
+    scenario = TradeScenario()
+    before = [name for name in ("total_weight", "total_volume", "lc_amount") if name in vars(scenario)]
+    scenario.documents["purchase_order"]
+    after_order = [name for name in ("total_weight", "total_volume", "lc_amount") if name in vars(scenario)]
+    scenario.documents["bill_of_lading"]
+    weight = vars(scenario)["total_weight"]
+    scenario.documents["packing_list"]
+    check = (before == after_order == [] and scenario.documents.built() == ["purchase_order", "bill_of_lading",
+                                                                              "packing_list"]
+             and vars(scenario)["total_weight"] is weight and "lc_amount" not in vars(scenario))
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} built on access: {', '.join(scenario.documents.built())}; "
+          f"totals computed: {', '.join(name for name in ('total_weight', 'total_volume', 'lc_amount') if name in vars(scenario))}")
+
+    # Generated scenarios
+    generated = list(scenarios(args.count, seed=7))
+    numbers = [scenario.doc_ids[document] for scenario in generated for document in DOCUMENT_TYPES]
+    timelines_ordered = all([event["date"] for event in scenario.timeline]
+                            == sorted(event["date"] for event in scenario.timeline) for scenario in generated[:500])
+    again = next(scenarios(1, seed=7))
+    check = (len(set(numbers)) == len(numbers) and timelines_ordered
+             and dict(again.documents) == dict(generated[0].documents)
+             and all(consistent(scenario) for scenario in generated[:500]))
+    ok = ok and check
+    distinct_amounts = len({scenario.lc_amount for scenario in generated})
+    print(f"\n  {'✅' if check else '❌'} {args.count:,} generated scenarios: {len(numbers):,} distinct document "
+          f"numbers, {distinct_amounts:,} distinct L/C amounts, timelines in date order, same seed same scenarios")
+
+    # Throughput
+    timings = {}
+    for label, use in (("one document read", lambda scenario: scenario.documents["commercial_invoice"]),
+                       ("every document built", lambda scenario: dict(scenario.documents)),
+                       ("every document + timeline", lambda scenario: (dict(scenario.documents), scenario.timeline))):
+        start = time.perf_counter()
+        for scenario in scenarios(args.count, seed=1):
+            use(scenario)
+        timings[label] = args.count / (time.perf_counter() - start)
+    print(f"\n  scenarios per second ({args.count:,} generated):")
+    for label, rate in timings.items():
+        print(f"    {label:28s} {rate:10,.0f}/s")
+    check = timings["every document + timeline"] >= 1000
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} thousands of complete scenarios per second")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
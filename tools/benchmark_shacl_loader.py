@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: SHACL loading and shape extraction for shacl_to_sdjwt
+
+Compares the two SHACLToSDJWT backends:
+- rdflib: parse into an rdflib Graph, then ~12 graph.objects() queries per property
+- stream: single-pass Turtle reader, triples grouped into per-subject records
+
+Inputs:
+- WE BUILD shapes (analysis/*-shape.ttl)
+- KTDDE application profiles (shacl/*.jsonld), converted once to Turtle
+
+Requires rdflib (for the baseline backend and the JSON-LD → Turtle conversion).
+
+Usage:
+    python3 tools/benchmark_shacl_loader.py [--repeat N] [--profiles letter-of-credit,bill-of-lading]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from shacl_to_sdjwt import SHACLToSDJWT
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+WEBUILD_SHAPES = [
+    REPO_ROOT / 'analysis' / 'webuild-pda1-certificate-shape.ttl',
+    REPO_ROOT / 'analysis' / 'webuild-tax-debt-attestation-shape.ttl',
+]
+
+DEFAULT_PROFILES = [
+    'letter-of-credit-v0.0.1',
+    'bill-of-lading-v0.0.1',
+    'certificate-of-origin-v0.0.1',
+    'commercial-invoice-v0.0.2',
+]
+
+
+def profile_to_turtle(jsonld_path: Path, out_dir: Path) -> Path:
+    """Convert a KTDDE JSON-LD profile to Turtle (one-off, not timed)"""
+    from rdflib import Graph
+    graph = Graph()
+    graph.parse(str(jsonld_path), format='json-ld')
+    out_path = out_dir / (jsonld_path.stem + '.ttl')
+    graph.serialize(str(out_path), format='turtle')
+    return out_path
+
+
+def run_once(path: Path, backend: str) -> tuple:
+    """Load and extract every NodeShape; return (load_s, extract_s, shapes, properties)"""
+    start = time.perf_counter()
+    converter = SHACLToSDJWT(backend)
+    converter.load_shacl(str(path))
+    loaded = time.perf_counter()
+    shapes = converter.find_node_shapes()
+    properties = 0
+    for shape in shapes:
+        properties += len(converter.extract_shape_info(shape)['properties'])
+    done = time.perf_counter()
+    return loaded - start, done - loaded, len(shapes), properties
+
+
+def bench_file(path: Path, repeat: int):
+    """Print median timings for both backends on one file"""
+    results = {}
+    for backend in ('rdflib', 'stream'):
+        runs = [run_once(path, backend) for _ in range(repeat)]
+        load = statistics.median(r[0] for r in runs)
+        extract = statistics.median(r[1] for r in runs)
+        results[backend] = (load, extract, runs[0][2], runs[0][3])
+
+    rdf_load, rdf_extract, shapes, props = results['rdflib']
+    st_load, st_extract, st_shapes, st_props = results['stream']
+    if (shapes, props) != (st_shapes, st_props):
+        print(f"  ⚠️  Backends disagree: rdflib {shapes}/{props}, stream {st_shapes}/{st_props}")
+
+    size_kb = path.stat().st_size / 1024
+    print(f"\n{path.name} ({size_kb:.0f} KB, {shapes} shapes, {props} properties)")
+    print(f"  {'backend':8s} {'load ms':>10s} {'extract ms':>11s} {'total ms':>10s}")
+    for backend, (load, extract, _, _) in results.items():
+        print(f"  {backend:8s} {load * 1000:10.2f} {extract * 1000:11.2f} {(load + extract) * 1000:10.2f}")
+    print(f"  speedup: load {rdf_load / st_load:.1f}x, "
+          f"extract {rdf_extract / max(st_extract, 1e-9):.1f}x, "
+          f"total {(rdf_load + rdf_extract) / (st_load + st_extract):.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--profiles', default=','.join(DEFAULT_PROFILES),
+                        help='Comma-separated shacl/*.jsonld stems to include')
+    args = parser.parse_args()
+
+    try:
+        import rdflib  # noqa: F401
+    except ImportError:
+        print("❌ rdflib is required for the baseline backend: pip install rdflib")
+        sys.exit(1)
+
+    print("=" * 60)
+    print("SHACL LOADER BENCHMARK (median of {} runs)".format(args.repeat))
+    print("=" * 60)
+
+    for path in WEBUILD_SHAPES:
+        bench_file(path, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for stem in filter(None, args.profiles.split(',')):
+            jsonld_path = REPO_ROOT / 'shacl' / f'{stem}.jsonld'
+            if not jsonld_path.exists():
+                print(f"\n⚠️  Profile not found: {jsonld_path}")
+                continue
+            bench_file(profile_to_turtle(jsonld_path, Path(tmp)), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: discrete-event simulation of many shipments (tools/shipment_simulation.py)
+
+- --shipments shipments (default 100,000) through DOCUMENT_FLOW with the
+  default timing model, DualTrackIssuer driven for every --issue-every-th
+  credential: wall time against --budget-s, events per second
+- every shipment completes and each actor issues its documents of every
+  shipment, no more
+- the same seed gives the same report; a different seed does not (the
+  service times of these runs come from one calibration, not from
+  issuing for real)
+- the queues behave: doubling the carrier, customs and seller workers
+  cuts their p95 queueing delay, and sailing any day (no weekly vessel
+  cutoffs) cuts it more than fourfold
+- --issue-every 1 on a small run: every event issued for real, the
+  simulator's cost per event with and without the issuer
+
+Usage:
+    python3 tools/benchmark_shipment_simulation.py [--shipments 100000] [--budget-s 300] [--issue-every 1000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / 'tools'))
+
+from shipment_simulation import ShipmentSimulation, default_issuer, format_seconds, load_model, print_report  # noqa: E402
+
+PORT_ACTORS = ("carrier", "customs", "seller")  # the actors at the vessel cutoff
+
+
+def p95(report: dict, actor: str) -> float:
+    return report["actors"][actor]["queue_delay_s"]["p95"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--shipments', type=int, default=100_000)
+    parser.add_argument('--budget-s', type=float, default=300)
+    parser.add_argument('--issue-every', type=int, default=1000)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("SHIPMENT SIMULATION: ISSUANCE CAPACITY PER ACTOR")
+    print("=" * 72)
+    model = load_model()
+    issue = default_issuer()
+
+    calibration = ShipmentSimulation(model, issue=issue)
+    calibration.calibrate()
+
+    def simulate(shipments: int, seed: int = 0, issue_every: int = 0, **options) -> dict:
+        """A run; without real issuance the service times come from one shared calibration"""
+        if issue_every:
+            simulation = ShipmentSimulation(model, issue=issue, issue_every=issue_every, seed=seed, **options)
+            simulation.calibrate()
+        else:
+            simulation = ShipmentSimulation(model, seed=seed, **options)
+            simulation.measured.update({document: list(times) for document, times in calibration.measured.items()})
+        return simulation.run(shipments)
+
+    # The full run
+    report = simulate(args.shipments, issue_every=args.issue_every)
+    print_report(report)
+    per_actor = {}
+    for document, actor in model.creators.items():
+        per_actor[actor] = per_actor.get(actor, 0) + args.shipments
+    check = (report["completed"] == args.shipments
+             and all(row["issued"] == per_actor[actor] for actor, row in report["actors"].items()))
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} {report['completed']:,} of {args.shipments:,} shipments complete; "
+          f"every actor issued exactly its documents")
+    check = report["wall_s"] <= args.budget_s
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} {args.shipments:,} shipments in {report['wall_s']:.1f} s "
+          f"(budget {args.budget_s:.0f} s)")
+
+    # Determinism
+    small = max(1000, args.shipments // 50)
+    first, again, other = (simulate(small, seed=seed) for seed in (1, 1, 2))
+    check = first["actors"] == again["actors"] and first["actors"] != other["actors"]
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} {small:,} shipments: same seed, same report; another seed differs")
+
+    # Capacity changes move the queues
+    base = first
+    doubled = simulate(small, seed=1, workers={actor: 4 for actor in PORT_ACTORS})
+    daily = simulate(small, seed=1, sailing_days=0)
+    print(f"\n  {small:,} shipments, p95 queueing delay:")
+    print(f"    {'':24s}" + "".join(f"{actor:>12s}" for actor in PORT_ACTORS))
+    for label, result in (("2 workers, weekly sailing", base), ("4 workers", doubled), ("sailing any day", daily)):
+        print(f"    {label:24s}" + "".join(f"{format_seconds(p95(result, actor)):>12s}" for actor in PORT_ACTORS))
+    check = all(p95(doubled, actor) < p95(base, actor) and p95(daily, actor) < p95(base, actor) / 4
+                for actor in PORT_ACTORS if p95(base, actor) > 0)
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} more workers and spread sailings both cut the port actors' queueing delay")
+
+    # Driving the issuer for every event
+    full = simulate(1000, issue_every=1)
+    model_only = simulate(1000)
+    per_event_full = full["wall_s"] * 1e6 / full["events"]
+    per_event_model = model_only["wall_s"] * 1e6 / model_only["events"]
+    print(f"\n  1,000 shipments, every credential issued for real: {full['wall_s']:.1f} s "
+          f"({per_event_full:.0f} µs per event); timing model only: {model_only['wall_s']:.2f} s "
+          f"({per_event_model:.1f} µs per event)")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
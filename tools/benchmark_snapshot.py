@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory-mapped dataset snapshots versus building scenarios in every worker
+
+- a synthetic dataset of --scenarios scenarios (copies of the sample
+  scenarios with their own ids, document numbers and record objects)
+  written with data/snapshot.py; write time and file size
+- --workers processes holding the dataset at once, each either building
+  it from the sample_data constructors (today's SCENARIOS_DB) or mapping
+  the snapshot through DataStore, then serving --lookups random
+  scenarios: start-up time (spawn to dataset ready) and total RSS, PSS
+  (shared pages split between the processes sharing them) and private
+  memory, read from /proc/<pid>/smaps_rollup while all workers are alive
+- in one process: scenario lookup and decode cost against a dict, and
+  decoded scenarios equal to the originals
+- the CLI writes and verifies a snapshot of the sample data
+
+Usage:
+    python3 tools/benchmark_snapshot.py [--scenarios 20000] [--workers 8] [--lookups 200]
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SIMULATOR = REPO_ROOT / 'sap-simulator'
+sys.path.insert(0, str(SIMULATOR))
+
+from data import sample_data, snapshot  # noqa: E402
+from data.store import DataStore  # noqa: E402
+
+WORKER = """
+import json, random, sys, time
+sys.path[:0] = [{simulator!r}, {tools!r}]
+mode, count, path, lookups = sys.argv[1], int(sys.argv[2]), sys.argv[3], int(sys.argv[4])
+if mode == "constructors":
+    from benchmark_snapshot import scaled_scenarios
+    db = {{scenario["scenario"]: scenario for scenario in scaled_scenarios(count)}}
+elif mode == "snapshot":
+    from data.store import DataStore
+    db = DataStore(path).scenarios
+    len(db)
+else:
+    db = {{}}
+ready = time.time()
+ids = [f"SCENARIO_{{i:06d}}" for i in random.Random(0).sample(range(count), lookups)] if db else []
+total = sum(db[scenario_id]["invoice"]["header"].NETWR for scenario_id in ids)
+print(json.dumps({{"ready": ready}}), flush=True)
+sys.stdin.readline()  # measured by the parent while every worker is alive
+"""
+
+
+def scaled_scenarios(count: int) -> list:
+    """count scenarios built from the sample constructors, with distinct ids and document numbers"""
+    scenarios = []
+    while len(scenarios) < count:
+        for scenario in sample_data.get_all_scenarios():
+            if len(scenarios) == count:
+                break
+            i = len(scenarios)
+            scenario["scenario"] = f"SCENARIO_{i:06d}"
+            invoice = scenario["invoice"]
+            invoice["header"] = dataclasses.replace(invoice["header"], VBELN=f"{9100000000 + i}")
+            invoice["items"] = [dataclasses.replace(item, VBELN=f"{9100000000 + i}") for item in invoice["items"]]
+            scenarios.append(scenario)
+    return scenarios
+
+
+def memory_kb(pid: int) -> dict:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as rollup:
+        for line in rollup:
+            name, _, rest = line.partition(":")
+            if name in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                values[name] = int(rest.split()[0])
+    return {"rss": values["Rss"], "pss": values["Pss"],
+            "private": values["Private_Clean"] + values["Private_Dirty"]}
+
+
+def run_workers(mode: str, workers: int, count: int, path: str, lookups: int) -> dict:
+    code = WORKER.format(simulator=str(SIMULATOR), tools=str(REPO_ROOT / 'tools'))
+    processes, started = [], []
+    for _ in range(workers):
+        started.append(time.time())
+        processes.append(subprocess.Popen([sys.executable, "-c", code, mode, str(count), path, str(lookups)],
+                                          stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True))
+    ready = [json.loads(process.stdout.readline())["ready"] for process in processes]
+    memory = [memory_kb(process.pid) for process in processes]
+    for process in processes:
+        process.stdin.close()
+        process.wait()
+    startup = sorted((end - start) * 1000 for start, end in zip(started, ready))
+    return {"startup_ms": startup[len(startup) // 2],
+            **{key: sum(m[key] for m in memory) / 1024 for key in ("rss", "pss", "private")}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--scenarios', type=int, default=20000)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--lookups', type=int, default=200)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("DATASET SNAPSHOTS: MMAP VERSUS PER-WORKER CONSTRUCTION")
+    print("=" * 72)
+    directory = tempfile.mkdtemp(prefix="sap-sim-")
+    path = os.path.join(directory, "dataset.snap")
+    start = time.perf_counter()
+    scenarios = scaled_scenarios(args.scenarios)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    size = snapshot.write(path, scenarios, sample_data.PARTNERS, sample_data.MATERIALS)
+    write_s = time.perf_counter() - start
+    print(f"  {args.scenarios:,} scenarios: constructed in {build_s:.2f} s, "
+          f"snapshot written in {write_s:.2f} s ({size / 1e6:.1f} MB)")
+
+    print(f"\n  {args.workers} workers, {args.lookups} scenario lookups each:")
+    print(f"  {'dataset':14s} {'start-up ms':>11s} {'RSS MB':>8s} {'PSS MB':>8s} {'private MB':>11s}")
+    results = {}
+    for mode in ("none", "constructors", "snapshot"):
+        results[mode] = run_workers(mode, args.workers, args.scenarios, path, args.lookups)
+        result = results[mode]
+        print(f"  {mode:14s} {result['startup_ms']:11.0f} {result['rss']:8.1f} {result['pss']:8.1f} "
+              f"{result['private']:11.1f}")
+    baseline, built, mapped = results["none"], results["constructors"], results["snapshot"]
+    saved = (built["pss"] - baseline["pss"]) / max(mapped["pss"] - baseline["pss"], 0.1)
+    check = mapped["pss"] < built["pss"] and mapped["startup_ms"] < built["startup_ms"]
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} snapshot workers: dataset memory {mapped['pss'] - baseline['pss']:.1f} MB "
+          f"vs {built['pss'] - baseline['pss']:.1f} MB (PSS above an empty interpreter, {saved:.0f}x less), "
+          f"start-up {built['startup_ms'] / max(mapped['startup_ms'], 1):.0f}x faster")
+
+    # Lookup and decode cost
+    mapped_db = DataStore(path).scenarios
+    plain_db = {scenario["scenario"]: scenario for scenario in scenarios}
+    ids = [f"SCENARIO_{i:06d}" for i in random.Random(1).sample(range(args.scenarios), min(2000, args.scenarios))]
+    hot = ids[:100]  # fits the decoded-scenario LRU
+    timings = {}
+    for label, db, keys in (("dict", plain_db, ids), ("snapshot, decoded before", mapped_db, hot),
+                            ("snapshot, decode", snapshot.Snapshot(path, cache_size=0), ids)):
+        for scenario_id in hot:
+            db[scenario_id]
+        start = time.perf_counter()
+        for scenario_id in keys:
+            db[scenario_id]
+        timings[label] = (time.perf_counter() - start) * 1e6 / len(keys)
+    print("\n  scenario lookup: " + ", ".join(f"{label} {us:.1f} µs" for label, us in timings.items()))
+
+    start = time.perf_counter()
+    decoded = dict(snapshot.Snapshot(path, cache_size=0).items())
+    iterate_s = time.perf_counter() - start
+    check = decoded == plain_db
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} all {len(decoded):,} scenarios decode equal to the originals "
+          f"({iterate_s:.2f} s, {iterate_s * 1e6 / len(decoded):.0f} µs each)")
+
+    sample = os.path.join(directory, "sample.snap")
+    cli = [sys.executable, str(SIMULATOR / "data" / "snapshot.py")]
+    written = subprocess.run(cli + ["write", sample], capture_output=True, text=True)
+    verified = subprocess.run(cli + ["verify", sample, "--source", "data.sample_data:get_all_scenarios"],
+                              capture_output=True, text=True)
+    check = written.returncode == 0 and verified.returncode == 0
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} CLI: {verified.stdout.strip() or verified.stderr.strip()}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
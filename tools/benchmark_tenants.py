@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Benchmark: company-code tenants with their own indexes and cache quotas (sap-simulator/api/tenancy.py)
+
+- a snapshot (data/snapshot.py) holding a large tenant (--big scenarios,
+  company code 2000) and a small one (--small scenarios, 1000)
+- interleaved rounds: the small tenant issues packing lists for its
+  --hot deliveries while the large tenant issues them for --churn new
+  deliveries; the small tenant's derived data hit ratio and request time
+  with the caches shared (one snapshot LRU and one DerivedDataCache, as
+  before tenancy) versus partitioned with the default quotas
+- document lookup: the tenant index versus scanning every scenario (the
+  previous routes, even with the scenarios in a dict)
+- through the API: the tenant is resolved once per request, from the
+  header or from the routed document; another tenant's document and an
+  unknown company code are 404s; a company code confines list routes
+
+Usage:
+    python3 tools/benchmark_tenants.py [--big 5000] [--small 40] [--hot 20] [--churn 400] [--rounds 10]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+
+from data import sample_data, snapshot  # noqa: E402
+from data.store import DataStore, SNAPSHOT_ENV  # noqa: E402
+
+BIG, SMALL = "2000", "1000"
+
+
+def relabel(value, numbers: dict):
+    """Copy of a document (record, list of records or dict) with its number fields replaced"""
+    if isinstance(value, list):
+        return [relabel(item, numbers) for item in value]
+    if isinstance(value, dict):
+        return {key: relabel(item, numbers) for key, item in value.items()}
+    if dataclasses.is_dataclass(value):
+        fields = {name: number for name, number in numbers.items() if hasattr(value, name)}
+        return dataclasses.replace(value, **fields)
+    return value
+
+
+def tenant_scenarios(company_code: str, count: int, first: int) -> list:
+    """count sample scenarios of one company code, with distinct ids and document numbers"""
+    sample_data.SALES_ORGANIZATIONS[company_code] = company_code  # VKORG = BUKRS
+    scenarios = []
+    for i in range(first, first + count):
+        scenario = dict(sample_data.get_all_scenarios()[i % 2])
+        scenario["scenario"] = f"{scenario['scenario']}_{company_code}_{i:06d}"
+        organization = {"BUKRS": company_code, "VKORG": company_code}
+        for document, prefix in (("purchase_order", 45), ("sales_order", 1), ("delivery", 80), ("invoice", 90)):
+            if document in scenario:
+                number = {"EBELN" if document == "purchase_order" else "VBELN": f"{prefix:02d}{i:08d}"}
+                scenario[document] = relabel(scenario[document], {**number, **organization})
+        lc = f"LC-{company_code}-{i:06d}"
+        scenario["documentary_credit"] = dataclasses.replace(scenario["documentary_credit"], LCNUM=lc)
+        scenario["invoice"]["header"] = dataclasses.replace(scenario["invoice"]["header"], LCNUM=lc)
+        scenarios.append(scenario)
+    return scenarios
+
+
+def rounds(args, small: list, big: list, issue) -> dict:
+    """Interleave the two tenants; the small tenant's derived data hits and µs per request"""
+    hot = [scenario["delivery"]["header"].VBELN for scenario in small[:args.hot]]
+    churn = [scenario["delivery"]["header"].VBELN for scenario in big]
+    hits = requests = 0
+    elapsed = 0.0
+    for round_number in range(args.rounds):
+        for vbeln in hot:
+            start = time.perf_counter()
+            hit = issue(SMALL, vbeln)
+            if round_number:  # the first round fills the caches
+                elapsed += time.perf_counter() - start
+                hits += hit
+                requests += 1
+        for i in range(args.churn):
+            issue(BIG, churn[(round_number * args.churn + i) % len(churn)])
+    return {"hit_ratio": hits / max(requests, 1), "us": elapsed * 1e6 / max(requests, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--big', type=int, default=5000)
+    parser.add_argument('--small', type=int, default=40)
+    parser.add_argument('--hot', type=int, default=20)
+    parser.add_argument('--churn', type=int, default=400)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("COMPANY-CODE TENANTS: PARTITIONED INDEXES AND CACHE QUOTAS")
+    print("=" * 72)
+    small = tenant_scenarios(SMALL, args.small, 0)
+    big = tenant_scenarios(BIG, args.big, args.small)
+    path = os.path.join(tempfile.mkdtemp(prefix="sap-sim-"), "tenants.snap")
+    snapshot.write(path, small + big, sample_data.PARTNERS, sample_data.MATERIALS)
+    os.environ[SNAPSHOT_ENV] = path
+    from api import sap_api, tenancy
+    from mappings.derived_data import DerivedDataCache
+    from mappings.sap_to_vc import SAPToVCMapper
+
+    print(f"  snapshot: tenant {BIG} {args.big:,} scenarios, tenant {SMALL} {args.small:,} scenarios; "
+          f"each round {args.hot} hot {SMALL} deliveries, {args.churn} new {BIG} deliveries")
+
+    # Shared caches: one snapshot LRU and one derived data cache for every tenant
+    shared_store = DataStore(path)
+    shared_mapper = SAPToVCMapper(derived_data=DerivedDataCache())
+    by_delivery = {scenario["delivery"]["header"].VBELN: scenario["scenario"] for scenario in small + big}
+
+    def issue_shared(company_code: str, vbeln: str) -> bool:
+        scenario = shared_store.scenarios[by_delivery[vbeln]]
+        misses = shared_mapper.derived_data.misses
+        delivery, invoice = scenario["delivery"], scenario["invoice"]
+        shared_mapper.map_packing_list(delivery["header"], delivery["items"], invoice["header"], invoice["items"])
+        return shared_mapper.derived_data.misses == misses
+
+    # Partitioned: one TenantStore, per-tenant quotas
+    tenants = tenancy.TenantStore(DataStore(path))
+    start = time.perf_counter()
+    partitions = len(tenants.tenants)
+    index_ms = (time.perf_counter() - start) * 1000
+    mapper = SAPToVCMapper()
+    mapper.derived_data = tenancy.PartitionedDerivedData(mapper.derived_data, tenants)
+
+    def issue_partitioned(company_code: str, vbeln: str) -> bool:
+        tenant = tenants.tenant(company_code)
+        with tenancy.use(tenant):
+            scenario = tenants.find("delivery", vbeln)
+            misses = tenant.derived_data.misses
+            delivery, invoice = scenario["delivery"], scenario["invoice"]
+            mapper.map_packing_list(delivery["header"], delivery["items"], invoice["header"], invoice["items"])
+            return tenant.derived_data.misses == misses
+
+    results = {"shared": rounds(args, small, big, issue_shared),
+               "partitioned": rounds(args, small, big, issue_partitioned)}
+    print(f"  {partitions} tenants partitioned and indexed from the snapshot keys in {index_ms:.0f} ms")
+    print(f"\n  tenant {SMALL} packing lists while {BIG} churns:")
+    for label, result in results.items():
+        print(f"    {label:12s} derived data hit ratio {result['hit_ratio']:6.1%}, {result['us']:7.1f} µs/request")
+    shared, partitioned = results["shared"], results["partitioned"]
+    check = partitioned["hit_ratio"] == 1.0 and partitioned["us"] < shared["us"]
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} tenant {SMALL} keeps its hot credentials: "
+          f"{shared['us'] / partitioned['us']:.1f}x faster per request")
+    quota = tenants.tenant(BIG).stats()["caches"]
+    print(f"    tenant {BIG} within its quota: {quota['scenarios']['entries']} decoded scenarios, "
+          f"{quota['derived_data']['entries']} aggregates")
+
+    # Index lookup versus scanning every scenario
+    plain = {scenario["scenario"]: scenario for scenario in small + big}
+    last = big[-1]["invoice"]["header"].VBELN
+
+    def scan():
+        for scenario in plain.values():
+            if "invoice" in scenario and scenario["invoice"]["header"].VBELN == last:
+                return scenario
+
+    timings = {}
+    for label, lookup in (("index", lambda: tenants.find("invoice", last)), ("scan", scan)):
+        lookup()
+        calls = 20 if label == "scan" else 20_000
+        start = time.perf_counter()
+        for _ in range(calls):
+            lookup()
+        timings[label] = (time.perf_counter() - start) * 1e6 / calls
+    check = tenants.find("invoice", last) == scan()
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} invoice lookup: tenant index {timings['index']:.1f} µs, "
+          f"scan of {len(plain):,} scenarios in a dict {timings['scan']:.0f} µs")
+
+    # Through the API
+    client = sap_api.app.test_client()
+    small_invoice = small[0]["invoice"]["header"].VBELN
+    before = sap_api.tenants.resolutions
+    statuses = [
+        client.get(f"/vc/api/v1/invoices/{small_invoice}/vc").status_code,
+        client.get(f"/vc/api/v1/invoices/{small_invoice}/vc", headers={tenancy.HEADER: SMALL}).status_code,
+        client.get(f"/vc/api/v1/invoices/{small_invoice}/vc", headers={tenancy.HEADER: BIG}).status_code,
+        client.get(f"/vc/api/v1/invoices/{small_invoice}/vc?bukrs=9999").status_code,
+    ]
+    resolved = sap_api.tenants.resolutions - before
+    check = statuses == [200, 200, 404, 404] and resolved == len(statuses)
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} invoice VC: routed {statuses[0]}, own company code {statuses[1]}, "
+          f"other company code {statuses[2]}, unknown company code {statuses[3]}; "
+          f"{resolved} resolutions for {len(statuses)} requests")
+
+    listed = client.get("/sap/opu/odata/sap/api/v1/invoices", headers={tenancy.HEADER: SMALL}).get_json()
+    check = len(listed["d"]["results"]) == args.small
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} invoices listed for company code {SMALL}: {len(listed['d']['results'])}")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark: distributed tracing overhead and correctness (sap-simulator/api/tracing.py)
+
+- the hooks' cost on an unsampled request (root sampling decision and
+  the no-op map_* / lookup wrappers)
+- scenario VC requests (one route span, eight map_* spans, partner and
+  material lookups) through the Flask test client sampling nothing,
+  1% and every request
+- span structure of a traced request: one trace, map_* spans children
+  of the route span, lookups children of map_* spans
+- parent-based sampling follows an incoming traceparent; trace id ratio
+  sampling hits its ratio
+- DualTrackIssuer canonicalization and signing spans
+- OTLP/HTTP export into the collector stand-in; a full export queue
+  drops spans instead of blocking
+
+Usage:
+    python3 tools/benchmark_tracing.py [--requests 500] [--rounds 3]
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / 'sap-simulator'))
+sys.path.insert(0, str(REPO_ROOT / 'tools'))
+
+SCENARIO_URL = '/vc/api/v1/scenarios/EU_TO_SINGAPORE_MACHINERY_EXPORT/verifiable-credentials'
+
+RATIOS = [("ratio 0 (unsampled)", 0.0), ("ratio 0.01", 0.01), ("ratio 1 (all)", 1.0)]
+
+
+def request_timings(client, tracer, tracing, requests: int, rounds: int) -> dict:
+    """Best µs/request per sampling ratio, ratios interleaved in one process"""
+    best = {}
+    for _ in range(rounds):
+        for label, ratio in RATIOS:
+            tracer.sampler = tracing.Sampler(ratio)
+            start = time.perf_counter()
+            for _ in range(requests):
+                client.get(SCENARIO_URL)
+            us = (time.perf_counter() - start) * 1e6 / requests
+            best[label] = min(us, best.get(label, us))
+    return best
+
+
+def per_call_ns(function, calls: int = 200_000) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) * 1e9 / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+    ok = True
+
+    print("=" * 72)
+    print("DISTRIBUTED TRACING: OVERHEAD AND SPAN STRUCTURE")
+    print("=" * 72)
+    directory = tempfile.mkdtemp(prefix="traces-")
+    trace_file = os.path.join(directory, "traces.jsonl")
+    os.environ.update(OTEL_TRACES_EXPORTER="file", OTEL_TRACES_SAMPLER="parentbased_always_on",
+                      SAP_API_TRACE_FILE=trace_file)
+    from api import tracing
+    from api.sap_api import app, tracer
+    from data.sample_data import get_partner
+    client = app.test_client()
+    client.get(SCENARIO_URL)
+
+    # Cost of the hooks on an unsampled request
+    tracer.sampler = tracing.Sampler(0.0)
+    traced_lookup = tracer.traced("sap.get_partner")(get_partner)
+    root_ns = per_call_ns(lambda: tracer.start_trace("GET /route"))
+    wrapper_ns = per_call_ns(lambda: traced_lookup("0000100001")) - per_call_ns(lambda: get_partner("0000100001"))
+    timings = request_timings(client, tracer, tracing, args.requests, args.rounds)
+    unsampled = timings[RATIOS[0][0]]
+    hooks_us = (root_ns + 22 * wrapper_ns) / 1000  # 8 map_* calls, 14 lookups per scenario
+    print(f"  GET {SCENARIO_URL}")
+    print(f"    unsampled hooks: root decision {root_ns:.0f} ns + 22 no-op wrappers × {wrapper_ns:.0f} ns "
+          f"= {hooks_us:.1f} µs ({hooks_us / (unsampled - hooks_us):.1%} of the request)")
+    for label, us in timings.items():
+        print(f"    {label:20s} {us:8.1f} µs/request ({us / unsampled - 1:+6.1%})")
+    tracer.sampler = tracing.Sampler(1.0)
+    tracer.processor.force_flush()
+    print(f"    exporter: {tracer.processor.stats()}")
+
+    os.remove(trace_file)
+    client.get(SCENARIO_URL)
+    tracer.processor.force_flush()
+
+    spans = tracing.read_spans(trace_file)
+    by_id = {span["spanId"]: span for span in spans}
+    roots = [span for span in spans if "parentSpanId" not in span]
+    maps = [span for span in spans if span["name"].startswith("map_")]
+    lookups = [span for span in spans if span["name"].startswith("sap.get_")]
+    check = (len(roots) == 1 and len({span["traceId"] for span in spans}) == 1
+             and len(maps) == 8 and all(span["parentSpanId"] == roots[0]["spanId"] for span in maps)
+             and lookups and all(by_id[span["parentSpanId"]]["name"].startswith("map_") for span in lookups))
+    ok = ok and check
+    print(f"\n  {'✅' if check else '❌'} one trace: route span, {len(maps)} map_* children, "
+          f"{len(lookups)} lookups under map_* spans")
+
+    # Parent-based sampling
+    incoming = "0af7651916cd43dd8448eb211c80319c"
+    before = tracer.processor.stats()["exported"]
+    client.get(SCENARIO_URL, headers={"traceparent": f"00-{incoming}-b7ad6b7169203331-00"})
+    tracer.processor.force_flush()
+    unsampled = tracer.processor.stats()["exported"] - before
+    response = client.get(SCENARIO_URL, headers={"traceparent": f"00-{incoming}-b7ad6b7169203331-01"})
+    tracer.processor.force_flush()
+    root = [span for span in tracing.read_spans(trace_file)
+            if span["traceId"] == incoming and span.get("parentSpanId") == "b7ad6b7169203331"]
+    check = unsampled == 0 and len(root) == 1 and response.headers["traceresponse"].split("-")[1] == incoming
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} traceparent followed: unsampled caller → {unsampled} spans, "
+          f"sampled caller → trace {incoming[:8]}… continued")
+
+    rng = random.Random(1)
+    sampler = tracing.Sampler(0.1, parent_based=False)
+    decisions = 200_000
+    share = sum(sampler.sample(rng.getrandbits(128)) for _ in range(decisions)) / decisions
+    check = abs(share - 0.1) < 0.005
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} trace id ratio 0.1: {share:.4f} of {decisions:,} traces sampled")
+
+    # Issuer spans
+    from dual_track_issuer import DualTrackIssuer
+    from mappings.sap_to_vc import convert_sap_scenario_to_vcs
+    from data.sample_data import get_all_scenarios
+    credential = convert_sap_scenario_to_vcs(get_all_scenarios()[0])["commercial_invoice_vc"]
+    issuer = DualTrackIssuer("did:example:seller", "https://example.com/schemas",
+                             signer=lambda data: hashlib.sha512(data).digest(), tracer=tracer)
+    with tracer.trace("issue commercial invoice"):
+        issuer.issue_jsonld_vc(credential["credentialSubject"], "CommercialInvoice", credential["@context"][-1])
+    tracer.processor.force_flush()
+    names = {span["name"] for span in tracing.read_spans(trace_file)}
+    check = {"issue commercial invoice", "issuer.issue_jsonld_vc", "issuer.canonicalize", "issuer.sign"} <= names
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} issuer spans: issue_jsonld_vc, canonicalize, sign")
+
+    # OTLP/HTTP export into the collector stand-in
+    received = os.path.join(directory, "collector.jsonl")
+    server = tracing.collector(0, received)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    exporter = tracing.OTLPHttpExporter(f"http://127.0.0.1:{server.server_address[1]}")
+    otlp = tracing.Tracer(tracing.BatchProcessor(exporter, {"service.name": "benchmark"}, max_batch_size=64),
+                          tracing.Sampler(1.0))
+    for i in range(50):
+        with otlp.trace(f"job {i}"):
+            with otlp.span("step"):
+                pass
+    otlp.processor.force_flush()
+    server.shutdown()
+    collected = len(tracing.read_spans(received))
+    check = collected == 100 and otlp.processor.stats()["failed"] == 0
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} OTLP/HTTP export: {collected} of 100 spans received by the collector")
+
+    # Queue overflow
+    class Stalled:
+        def export(self, payload):
+            time.sleep(0.5)
+
+    full = tracing.Tracer(tracing.BatchProcessor(Stalled(), {}, schedule_delay=60, max_queue_size=100,
+                                                 max_batch_size=1000), tracing.Sampler(1.0))
+    start = time.perf_counter()
+    for _ in range(1000):
+        with full.trace("request"):
+            pass
+    elapsed_us = (time.perf_counter() - start) * 1e6 / 1000
+    stats = full.processor.stats()
+    check = stats["dropped"] == 900 and stats["queued"] == 100
+    ok = ok and check
+    print(f"  {'✅' if check else '❌'} full queue: {stats['dropped']} dropped, {stats['queued']} queued, "
+          f"{elapsed_us:.1f} µs per traced span")
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
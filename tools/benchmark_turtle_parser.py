@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Turtle parsing throughput for simple_shacl_to_sdjwt
+
+Generates a synthetic SHACL file (default 50 MB) with nested blank
+nodes, multi-line strings and sh:in lists, and reports parse throughput
+as library callers get it and with the garbage collector paused, as
+the command line runs. The request's goal is linear time rather than a
+throughput figure: a tenth of the file is parsed too, and the check
+fails if ten times the input takes more than fifteen times as long.
+The parser is pure Python, at roughly 2 MB/s; a 50 MB shape takes
+tens of seconds.
+
+The repository's shapes (well formed, and parsed as the regex parser
+did) are checked by sap-simulator/tests/test_turtle_parser.py.
+
+Usage:
+    python3 tools/benchmark_turtle_parser.py [--size-mb 50] [--keep path.ttl]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from simple_shacl_to_sdjwt import parse_shacl_shape
+
+SYNTHETIC_HEADER = '''@prefix sh: <http://www.w3.org/ns/shacl#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+@prefix dcterms: <http://purl.org/dc/terms/> .
+@prefix bench: <https://example.com/model/bench/> .
+@prefix bench-vocab: <https://example.com/terminology/bench/> .
+
+# Synthetic SHACL shape for parser throughput benchmarking
+
+bench:SyntheticShape
+  a sh:NodeShape ;
+  sh:targetClass bench:Synthetic ;
+  sh:name "Synthetic Shape"@en , "Synteettinen muoto"@fi ;
+  sh:description """Synthetic shape with many property constraints.
+                    Spans several lines and contains "quotes" and ; separators."""@en ;
+  dcterms:subject bench-vocab:c_synthetic ;
+'''
+
+SYNTHETIC_PROPERTY = '''
+  # Property {i}
+  sh:property [
+    sh:path bench:property{i} ;
+    sh:name "Property {i}"@en ;
+    sh:description """Multi-line description for property {i},
+                      including [brackets] and (parentheses)."""@en ;
+    dcterms:subject bench-vocab:c_property{i} ;
+    sh:datatype xsd:string ;
+    sh:minCount {min_count} ;
+    sh:maxCount 1 ;
+    sh:in ( "CODE_A" "CODE_B" "CODE_{i}" ) ;
+    sh:or (
+      [ sh:datatype xsd:string ; sh:pattern "^[A-Z]{{2}}-[0-9]+$" ]
+      [ sh:class bench:Nested{i} ; sh:node [ sh:closed true ] ]
+    ) ;
+  ] ;
+'''
+
+
+def write_synthetic(path: Path, size_mb: float) -> int:
+    """Write a synthetic shape of roughly size_mb megabytes; return property count"""
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        written += f.write(SYNTHETIC_HEADER)
+        while written < target:
+            count += 1
+            written += f.write(SYNTHETIC_PROPERTY.format(i=count, min_count=count % 2))
+        f.write('  .\n')
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--size-mb', type=float, default=50.0)
+    parser.add_argument('--keep', help='Write the synthetic file here instead of a temp file')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("TURTLE PARSER BENCHMARK")
+    print("=" * 60)
+    ok = True
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.keep) if args.keep else Path(tmp) / 'synthetic-shape.ttl'
+        start = time.perf_counter()
+        expected = write_synthetic(path, args.size_mb)
+        generated = time.perf_counter() - start
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        small_path = Path(tmp) / 'synthetic-shape-tenth.ttl'
+        small_expected = write_synthetic(small_path, args.size_mb / 10)
+        small_mb = small_path.stat().st_size / (1024 * 1024)
+
+        timings = {}
+        for label, shape, pause_gc in (("tenth", small_path, False), ("full", path, False),
+                                       ("full, gc paused (CLI)", path, True)):
+            start = time.perf_counter()
+            info = parse_shacl_shape(str(shape), pause_gc=pause_gc)
+            timings[label] = time.perf_counter() - start
+            if len(info['properties']) != (small_expected if shape == small_path else expected):
+                print(f"  ❌ Property count mismatch ({label})")
+                ok = False
+
+    print(f"\nSynthetic shape: {size_mb:.1f} MB, {expected} properties "
+          f"(generated in {generated:.1f}s)")
+    for label, elapsed in timings.items():
+        mb = small_mb if label == "tenth" else size_mb
+        print(f"  {label:24s} {mb:6.1f} MB  {elapsed:7.2f} s  {mb / elapsed:5.1f} MB/s")
+    growth = (timings["full"] / timings["tenth"]) / (size_mb / small_mb)
+    linear = growth <= 1.5
+    ok = ok and linear
+    print(f"  {'✅' if linear else '❌'} linear: 10x the input took {growth * 10:.1f}x the time "
+          f"(a pure Python parser, so throughput stays around a few MB/s)")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -9,12 +9,36 @@ Issues BOTH formats from the same SHACL source:
 Both maintain semantic integrity through different mechanisms:
 - JSON-LD: @context provides automatic semantic linking
 - SD-JWT: External semantic registry provides manual linking
+
+JSON-LD proofs follow eddsa-rdfc-2022: the proof configuration and the
+credential are canonicalized with RDFC-1.0 (rdf_canonicalize.py) and
+hashed; a signer callable, if given, signs the resulting hash data.
+A credential that cannot be canonicalized raises IssuanceError when a
+signer is set; without one it gets a placeholder proofValue and a
+logged warning.
+A StatusListService, if given, adds credentialStatus before signing.
+A tracer (sap-simulator/api/tracing.Tracer), if given, records spans
+for issuance, canonicalization and signing inside sampled traces.
 """
 
 import json
+import logging
 import time
 import hashlib
-from typing import Dict, Any, Optional
+import uuid
+from contextlib import nullcontext
+from typing import Callable, Dict, Any, Optional
+
+from jsonld_processor import JsonLdError, JsonLdProcessor, get_processor
+from rdf_canonicalize import CanonicalizationError, canonicalize_document
+from status_list import StatusListService
+from vc_cbor import get_codec
+
+_NO_SPAN = nullcontext()
+
+log = logging.getLogger(__name__)
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
 def camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case"""
@@ -23,12 +47,48 @@ def camel_to_snake(name: str) -> str:
     s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
     return s2.lower()
 
+def base58btc(data: bytes) -> str:
+    """Multibase base58-btc encoding ('z' prefix)"""
+    number = int.from_bytes(data, 'big')
+    encoded = ''
+    while number:
+        number, remainder = divmod(number, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    leading_zeros = len(data) - len(data.lstrip(b'\0'))
+    return 'z' + BASE58_ALPHABET[0] * leading_zeros + encoded
+
+class IssuanceError(ValueError):
+    """A credential that cannot be signed"""
+
 class DualTrackIssuer:
     """Issue credentials in both JSON-LD and SD-JWT formats"""
     
-    def __init__(self, issuer_did: str, schema_base_uri: str):
+    def __init__(self, issuer_did: str, schema_base_uri: str,
+                 signer: Optional[Callable[[bytes], bytes]] = None,
+                 processor: Optional[JsonLdProcessor] = None,
+                 status_service: Optional[StatusListService] = None,
+                 tracer=None):
         self.issuer_did = issuer_did
         self.schema_base_uri = schema_base_uri
+        self.signer = signer  # Ed25519 sign(hash_data) -> signature bytes
+        self.processor = processor or get_processor()
+        self.status_service = status_service  # credentialStatus (revocation/suspension)
+        self.tracer = tracer  # spans: tracer.span(name, attributes)
+    
+    def _span(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        return _NO_SPAN if self.tracer is None else self.tracer.span(name, attributes)
+    
+    def canonical_hash_data(self, vc: Dict[str, Any], proof_options: Dict[str, Any]) -> bytes:
+        """eddsa-rdfc-2022 hash data: SHA-256(proof config) + SHA-256(credential)"""
+        document = {k: v for k, v in vc.items() if k != 'proof'}
+        proof_config = {k: v for k, v in proof_options.items() if k != 'proofValue'}
+        proof_config['@context'] = vc['@context']
+        
+        proof_hash = hashlib.sha256(
+            canonicalize_document(proof_config, self.processor).encode('utf-8')).digest()
+        document_hash = hashlib.sha256(
+            canonicalize_document(document, self.processor).encode('utf-8')).digest()
+        return proof_hash + document_hash
     
     def issue_jsonld_vc(self, 
                        subject_data: Dict[str, Any],
@@ -36,9 +96,12 @@ class DualTrackIssuer:
                        context_uri: str,
                        subject_id: Optional[str] = None) -> Dict[str, Any]:
         """Issue W3C Verifiable Credential in JSON-LD format"""
-        
+        with self._span("issuer.issue_jsonld_vc", {"credential.type": credential_type}):
+            return self._issue_jsonld_vc(subject_data, credential_type, context_uri, subject_id)
+    
+    def _issue_jsonld_vc(self, subject_data, credential_type, context_uri, subject_id):
         now = int(time.time())
-        credential_id = f"urn:uuid:{hashlib.sha256(str(now).encode()).hexdigest()[:32]}"
+        credential_id = f"urn:uuid:{uuid.uuid4()}"  # status entries are allocated per id
         
         vc = {
             "@context": [
@@ -59,25 +122,52 @@ class DualTrackIssuer:
         if subject_id:
             vc["credentialSubject"]["id"] = subject_id
         
-        # Add proof placeholder (would be signed in production)
-        vc["proof"] = {
+        # Status entry is part of the signed document
+        if self.status_service:
+            self.status_service.attach(vc)
+        
+        proof = {
             "type": "DataIntegrityProof",
             "cryptosuite": "eddsa-rdfc-2022",
             "created": vc["issuanceDate"],
             "verificationMethod": f"{self.issuer_did}#key-1",
             "proofPurpose": "assertionMethod",
-            "proofValue": "z..." + "PLACEHOLDER" * 10  # Would be actual signature
         }
         
+        # Canonicalize (RDFC-1.0) and hash; contexts must be available offline
+        try:
+            with self._span("issuer.canonicalize", {"credential.type": credential_type}):
+                hash_data = self.canonical_hash_data(vc, proof)
+        except (JsonLdError, CanonicalizationError) as e:
+            if self.signer:
+                raise IssuanceError(f"Cannot canonicalize {credential_type}, so cannot sign it: {e}") from e
+            log.warning("Cannot canonicalize %s; its proof is a placeholder: %s", credential_type, e)
+            hash_data = None
+        
+        if self.signer:
+            with self._span("issuer.sign", {"proof.cryptosuite": proof["cryptosuite"]}):
+                proof["proofValue"] = base58btc(self.signer(hash_data))
+        else:
+            proof["proofValue"] = "z..." + "PLACEHOLDER" * 10  # Unsigned placeholder
+        
+        vc["proof"] = proof
+        
         return vc
     
+    def encode_cbor(self, credential: Dict[str, Any]) -> bytes:
+        """Compact transport encoding (application/cbor, see vc_cbor.py)"""
+        return get_codec().encode(credential)
+    
     def issue_sdjwt(self,
                    subject_data: Dict[str, Any],
                    credential_type: str,
                    registry_uri: str,
                    subject_id: Optional[str] = None) -> Dict[str, Any]:
         """Issue IETF SD-JWT format"""
-        
+        with self._span("issuer.issue_sdjwt", {"credential.type": credential_type}):
+            return self._issue_sdjwt(subject_data, credential_type, registry_uri, subject_id)
+    
+    def _issue_sdjwt(self, subject_data, credential_type, registry_uri, subject_id):
         now = int(time.time())
         
         # Convert camelCase data to snake_case for SD-JWT
@@ -89,7 +179,7 @@ class DualTrackIssuer:
         # SD-JWT structure (no @context!)
         sdjwt = {
             "iss": self.issuer_did,
-            "sub": subject_id or f"urn:uuid:{hashlib.sha256(str(now).encode()).hexdigest()[:16]}",
+            "sub": subject_id or f"urn:uuid:{uuid.uuid4()}",
             "iat": now,
             "exp": now + 86400,
             "type": credential_type,
@@ -211,13 +301,17 @@ def main():
         json.dump(result, f, indent=2)
     
     print(f"✅ Dual-track credentials generated: {output_file}")
+    
+    jsonld_vc = result['formats']['json-ld']['credential']
+    json_size = len(json.dumps(jsonld_vc, separators=(',', ':')).encode('utf-8'))
+    cbor_size = len(get_codec().encode(jsonld_vc))
+    print(f"   JSON-LD VC: {json_size} bytes as JSON, {cbor_size} bytes as CBOR")
     print()
     print("="*70)
     print("COMPARISON")
     print("="*70)
     print()
     
-    jsonld_vc = result['formats']['json-ld']['credential']
     sdjwt = result['formats']['sd-jwt']['credential']
     
     print("JSON-LD W3C VC:")
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Document Flow Scheduler
+
+Issues a shipment's documents in the order DOCUMENT_FLOW (scenario_flow.py)
+prescribes, as fast as its dependency structure allows:
+
+- FlowGraph: the flow as a DAG. A document waits for its `dependencies`
+  and for every document whose `triggers` name it. Unknown documents and
+  cycles are rejected (FlowError names the cycle). Gives the topological
+  order, the levels (documents issuable together) and the critical path
+  for given per-document durations.
+- FlowScheduler: calls issue(document, inputs) for each document as soon
+  as everything it waits for is issued, with up to max_workers issuing at
+  once, so independent branches (regulatory and phytosanitary
+  certificates, packing list and certificate of origin) overlap. inputs
+  maps each prerequisite to its issued credential. When more documents
+  are ready than workers are free, the one with the longest remaining
+  path to the end of the flow goes first. A failed document skips
+  everything downstream of it; the rest of the flow still runs.
+- FlowRun: credentials, per-document start/end, and wall time against
+  the serial time (sum of durations) and the critical path (the longest
+  chain of measured durations, the lower bound for any schedule).
+
+Issuing is usually waiting on someone else (an actor's system, a remote
+signer, an HSM), so the workers are threads.
+
+Usage:
+    python3 tools/flow_scheduler.py plan
+    python3 tools/flow_scheduler.py issue [--workers 4] [--latency-ms 20]
+
+    from flow_scheduler import FlowGraph, FlowScheduler, credential_issuer
+    graph = FlowGraph.from_flow(DOCUMENT_FLOW)
+    run = FlowScheduler(graph, credential_issuer(issuer, DOCUMENTS), max_workers=4).run()
+    run.credentials["bill_of_lading"], run.critical_path, run.wall_time
+"""
+
+import copy
+import heapq
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FlowError(ValueError):
+    """Invalid document flow (unknown document, cycle)"""
+
+
+# ============================================================================
+# Graph
+# ============================================================================
+
+class FlowGraph:
+    """Documents and what each waits for; validated acyclic on construction"""
+
+    def __init__(self, prerequisites: Mapping[str, Iterable[str]]):
+        self.prerequisites: Dict[str, Tuple[str, ...]] = {
+            document: tuple(dict.fromkeys(waits_for)) for document, waits_for in prerequisites.items()}
+        self.dependents: Dict[str, List[str]] = {document: [] for document in self.prerequisites}
+        for document, waits_for in self.prerequisites.items():
+            for prerequisite in waits_for:
+                if prerequisite not in self.dependents:
+                    raise FlowError(f"{document} waits for unknown document {prerequisite}")
+                self.dependents[prerequisite].append(document)
+        self.order = self._topological_order()
+
+    @classmethod
+    def from_flow(cls, flow: Mapping[str, Mapping[str, Any]]) -> 'FlowGraph':
+        """DOCUMENT_FLOW: dependencies, plus an edge for every trigger"""
+        prerequisites = {document: list(info.get("dependencies", ())) for document, info in flow.items()}
+        for document, info in flow.items():
+            for triggered in info.get("triggers", ()):
+                if triggered not in prerequisites:
+                    raise FlowError(f"{document} triggers unknown document {triggered}")
+                prerequisites[triggered].append(document)
+        # Keep the flow's own order among documents that are ready together
+        ranked = sorted(prerequisites, key=lambda document: flow[document].get("order", 0))
+        return cls({document: prerequisites[document] for document in ranked})
+
+    def _topological_order(self) -> List[str]:
+        waiting = {document: len(waits_for) for document, waits_for in self.prerequisites.items()}
+        ready = [document for document, count in waiting.items() if count == 0]
+        order = []
+        while ready:
+            document = ready.pop(0)
+            order.append(document)
+            for dependent in self.dependents[document]:
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) < len(self.prerequisites):
+            raise FlowError(f"document flow has a cycle: {' → '.join(self._cycle(waiting))}")
+        return order
+
+    def _cycle(self, waiting: Dict[str, int]) -> List[str]:
+        """One cycle among the documents never reached by the topological sort"""
+        # Every unreached document waits for another unreached one; follow
+        # those edges until a document repeats
+        path: List[str] = []
+        seen: Dict[str, int] = {}
+        document = next(document for document, count in waiting.items() if count > 0)
+        while document not in seen:
+            seen[document] = len(path)
+            path.append(document)
+            document = next(prerequisite for prerequisite in self.prerequisites[document]
+                            if waiting[prerequisite] > 0)
+        cycle = path[seen[document]:] + [document]
+        return cycle[::-1]  # prerequisite first
+
+    def __len__(self) -> int:
+        return len(self.prerequisites)
+
+    def levels(self) -> List[List[str]]:
+        """Documents grouped by longest prerequisite chain (each level issuable together)"""
+        depth: Dict[str, int] = {}
+        for document in self.order:
+            depth[document] = max((depth[p] + 1 for p in self.prerequisites[document]), default=0)
+        levels: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for document in self.order:
+            levels[depth[document]].append(document)
+        return levels
+
+    def remaining(self, durations: Optional[Mapping[str, float]] = None) -> Dict[str, float]:
+        """Longest path from each document to the end of the flow, its own duration included"""
+        durations = durations or {}
+        remaining: Dict[str, float] = {}
+        for document in reversed(self.order):
+            remaining[document] = durations.get(document, 1.0) + max(
+                (remaining[d] for d in self.dependents[document]), default=0.0)
+        return remaining
+
+    def critical_path(self, durations: Mapping[str, float]) -> Tuple[float, List[str]]:
+        """(length, documents) of the longest chain of durations"""
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for document in self.order:
+            before = max(self.prerequisites[document], key=finish.__getitem__, default=None)
+            previous[document] = before
+            finish[document] = (finish[before] if before else 0.0) + durations.get(document, 0.0)
+        if not finish:
+            return 0.0, []
+        document: Optional[str] = max(finish, key=finish.__getitem__)
+        length, path = finish[document], []
+        while document is not None:
+            path.append(document)
+            document = previous[document]
+        return length, path[::-1]
+
+
+# ============================================================================
+# Scheduler
+# ============================================================================
+
+@dataclass
+class FlowRun:
+    """Outcome of one scheduled flow"""
+    credentials: Dict[str, Any] = field(default_factory=dict)
+    times: Dict[str, Tuple[float, float]] = field(default_factory=dict)  # seconds from run start
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)  # downstream of a failure
+    wall_time: float = 0.0
+    serial_time: float = 0.0  # sum of durations
+    critical_path_time: float = 0.0
+    critical_path: List[str] = field(default_factory=list)
+    max_concurrency: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed and not self.skipped
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        return {document: end - start for document, (start, end) in self.times.items()}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "issued": len(self.credentials),
+            "failed": sorted(self.failed),
+            "skipped": self.skipped,
+            "wall_ms": round(self.wall_time * 1000, 1),
+            "serial_ms": round(self.serial_time * 1000, 1),
+            "critical_path_ms": round(self.critical_path_time * 1000, 1),
+            "critical_path": self.critical_path,
+            "max_concurrency": self.max_concurrency,
+        }
+
+
+class FlowScheduler:
+    """Issue every document of a FlowGraph once its prerequisites are issued"""
+
+    def __init__(self, graph: FlowGraph, issue: Callable[[str, Dict[str, Any]], Any],
+                 max_workers: int = 4, estimates: Optional[Mapping[str, float]] = None):
+        self.graph = graph
+        self.issue = issue  # issue(document, {prerequisite: credential}) -> credential
+        self.max_workers = max(1, max_workers)
+        # Priority among ready documents: longest remaining path (estimated durations)
+        self.priority = graph.remaining(estimates)
+
+    def run(self) -> FlowRun:
+        graph, run = self.graph, FlowRun()
+        waiting = {document: len(waits_for) for document, waits_for in graph.prerequisites.items()}
+        position = {document: i for i, document in enumerate(graph.order)}
+        ready = [(-self.priority[d], position[d], d) for d in graph.order if waiting[d] == 0]
+        heapq.heapify(ready)
+        running: Dict[Any, str] = {}
+        lock = threading.Lock()
+        active = [0]
+        start = time.perf_counter()
+
+        def issue(document: str, inputs: Dict[str, Any]):
+            began = time.perf_counter()
+            with lock:
+                active[0] += 1
+                run.max_concurrency = max(run.max_concurrency, active[0])
+            try:
+                return self.issue(document, inputs)
+            finally:
+                with lock:
+                    active[0] -= 1
+                run.times[document] = (began - start, time.perf_counter() - start)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="flow") as pool:
+            while ready or running:
+                while ready and len(running) < self.max_workers:
+                    document = heapq.heappop(ready)[2]
+                    inputs = {p: run.credentials[p] for p in graph.prerequisites[document]}
+                    running[pool.submit(issue, document, inputs)] = document
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    document = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        run.failed[document] = error
+                        continue
+                    run.credentials[document] = future.result()
+                    for dependent in graph.dependents[document]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            heapq.heappush(ready, (-self.priority[dependent], position[dependent], dependent))
+
+        run.wall_time = time.perf_counter() - start
+        run.skipped = [d for d in graph.order if d not in run.credentials and d not in run.failed]
+        durations = run.durations
+        run.serial_time = sum(durations.values())
+        run.critical_path_time, run.critical_path = graph.critical_path(durations)
+        return run
+
+
+def credential_issuer(issuer, documents: Mapping[str, Dict[str, Any]],
+                      context_base_url: Optional[str] = None) -> Callable[[str, Dict[str, Any]], Dict[str, Any]]:
+    """issue() for FlowScheduler: a DualTrackIssuer JSON-LD VC of documents[document]
+
+    The context is the document type's (contexts/<type>-context.jsonld).
+    """
+    if context_base_url is None:
+        from jsonld_processor import CONTEXT_BASE_URL as context_base_url
+
+    def issue(document: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        subject = copy.deepcopy(documents[document])
+        credential_type = subject["@type"]
+        return issuer.issue_jsonld_vc(subject, credential_type,
+                                      f"{context_base_url}{credential_type.lower()}-context.jsonld")
+    return issue
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def main():
+    import argparse
+    import hashlib
+
+    parser = argparse.ArgumentParser(description="Plan or run the scenario document flow as a dependency graph")
+    parser.add_argument("command", choices=("plan", "issue"))
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=0,
+                        help="simulated signer round trip per document")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    from scenario_flow import DOCUMENT_FLOW
+    try:
+        graph = FlowGraph.from_flow(DOCUMENT_FLOW)
+    except FlowError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.command == "plan":
+        print(f"{len(graph)} documents in {len(graph.levels())} levels:")
+        for number, level in enumerate(graph.levels(), 1):
+            print(f"  {number:2d}. {', '.join(level)}")
+        length, path = graph.critical_path({document: 1.0 for document in graph.order})
+        print(f"critical path ({length:.0f} documents): {' → '.join(path)}")
+        return
+
+    from dual_track_issuer import DualTrackIssuer
+    from scenario_gluelam_timber_full import DOCUMENTS
+
+    def signer(data: bytes) -> bytes:
+        time.sleep(args.latency_ms / 1000)
+        return hashlib.sha512(data).digest()
+
+    issuer = DualTrackIssuer("did:example:gluelam-trade", "https://example.com/schemas", signer=signer)
+    run = FlowScheduler(graph, credential_issuer(issuer, DOCUMENTS), max_workers=args.workers).run()
+    for document in graph.order:
+        if document in run.times:
+            began, ended = run.times[document]
+            print(f"  {began * 1000:8.1f} → {ended * 1000:8.1f} ms  {document}")
+    summary = run.summary()
+    print(f"{summary['issued']} credentials in {summary['wall_ms']} ms "
+          f"(serial {summary['serial_ms']} ms, critical path {summary['critical_path_ms']} ms, "
+          f"up to {summary['max_concurrency']} at once)")
+    print(f"critical path: {' → '.join(run.critical_path)}")
+    if not run.complete:
+        print(f"failed: {', '.join(f'{d} ({e})' for d, e in run.failed.items())}; skipped: {', '.join(run.skipped)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
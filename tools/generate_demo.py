@@ -1,290 +1,305 @@
 #!/usr/bin/env python3
 """
-Generate demo/demo.js from scenario_gluelam_timber_full.py
+Generate the demo's data payload (demo/demo-data.js) from the trade scenario
+
+demo/demo.js is the demo application and holds no shipment data: the
+documents, document numbers, actor views, timeline and document flow it
+shows come from demoData, which demo-data.js defines in one line of
+minified JSON. index.html loads it with a <script> tag before demo.js,
+so the demo still opens from file:// without a server.
+
+- the payload is encoded entry by entry, document by document, and
+  streamed into the file and, precompressed, into demo-data.js.gz (gzip level 9, mtime 0, as
+  sap-simulator/api/compression.py precompresses static files)
+- ChangedFileWriter compares the stream with the file on disk as it
+  goes: a file whose content is unchanged is not touched, a changed one
+  is replaced atomically
+- --count writes a bundle per generated scenario (scenarios() of
+  scenario_gluelam_timber_full.py): <out>/po-<purchase order>/ with
+  index.html, demo.js and that scenario's payload, ready to serve
+
+Usage:
+    python3 tools/generate_demo.py
+    python3 tools/generate_demo.py --count 1000 [--seed 1] [--out demo/scenarios]
 """
 
-import sys
+import argparse
+import contextlib
+import functools
+import gzip
 import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from scenario_flow import ACTOR_COLORS, DOCUMENT_FLOW, PROCESS_STAGES  # noqa: E402
+from scenario_gluelam_timber_full import ACTOR_VIEWS, TradeScenario, default_scenario, scenarios  # noqa: E402
+
+DEMO_DIR = REPO_ROOT / 'demo'
+PAYLOAD_NAME = 'demo-data.js'
+APP_FILES = ('index.html', 'demo.js')  # copied into each scenario bundle
+CHUNK_SIZE = 64 * 1024
+
+PAYLOAD_PREFIX = ("// Generated by tools/generate_demo.py from scenario_gluelam_timber_full.py - do not edit\n"
+                  "const demoData = ")
+PAYLOAD_SUFFIX = ";\n"
+ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# Entries of every payload that do not depend on the scenario
+SHARED = {"actorViews": ACTOR_VIEWS, "documentFlow": DOCUMENT_FLOW, "actorColors": ACTOR_COLORS,
+          "processStages": PROCESS_STAGES}
+
+# Document metadata; descriptions are formatted with the scenario
+DOC_INFO = {
+    "purchase_order": ("Purchase Order", "📝", "Buyer's order for gluelam timber beams"),
+    "documentary_credit": ("Documentary Credit (L/C)", "🏦",
+                           "Confirmed irrevocable letter of credit from MUFG Bank"),
+    "bill_of_lading": ("Bill of Lading", "🚢", "Ocean transport document from FESCO"),
+    "commercial_invoice": ("Commercial Invoice", "📄", "Seller's invoice for EUR {scenario.total_goods_value:,.0f}"),
+    "certificate_of_origin": ("Certificate of Origin", "📜", "Finnish Chamber of Commerce certificate"),
+    "packing_list": ("Packing List", "📦", "Detailed packing information for {scenario.packages} bundles"),
+    "insurance_certificate": ("Insurance Certificate", "🛡️", "All Risks marine cargo insurance"),
+    "phytosanitary_certificate": ("Phytosanitary Certificate", "🌲", "ISPM-15 compliant wood treatment certificate"),
+    "customs_declaration_export": ("Customs Declaration (Export)", "🛃", "Finnish export customs clearance"),
+    "customs_declaration_import": ("Customs Declaration (Import)", "🛃", "Japanese import customs clearance"),
+    "delivery_note": ("Delivery Note", "🚚", "Final delivery to construction site"),
+    "regulatory_certificate": ("Regulatory Certificate (CE)", "✅", "CE marking for structural timber (EN 14080)"),
+    "sea_cargo_manifest": ("Sea Cargo Manifest", "📋", "Vessel manifest for MV Baltic Express"),
+    "warehouse_receipt": ("Warehouse Receipt", "🏭", "Rauma Port warehouse receipt"),
+    "payment_confirmation": ("Payment Confirmation", "💰", "Bank payment confirmation via L/C"),
+}
+
+
+class Output(NamedTuple):
+    path: Path
+    size: int
+    changed: bool
+
+
+class ChangedFileWriter:
+    """
+    Binary file writer that leaves the file alone if its content does not
+    change. Written bytes are compared with the file on disk as they
+    arrive; at the first difference the matching prefix is copied to a
+    temporary file beside it and the rest streams there. close() moves
+    the temporary file into place and returns whether the file changed.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.size = 0
+        self.changed = False
+        self._old = open(self.path, 'rb') if self.path.is_file() else None
+        self._new = None
+        self._temporary = self.path.with_name(f'.{self.path.name}.{os.getpid()}.tmp')
+
+    def _diverge(self) -> None:
+        """Start the new file with the self.size bytes that matched"""
+        self._new = open(self._temporary, 'wb')
+        if self._old is not None:
+            self._old.seek(0)
+            remaining = self.size
+            while remaining:
+                chunk = self._old.read(min(remaining, CHUNK_SIZE))
+                self._new.write(chunk)
+                remaining -= len(chunk)
+            self._old.close()
+            self._old = None
+
+    def write(self, data: bytes) -> int:
+        if self._new is None:
+            if self._old is not None and self._old.read(len(data)) == data:
+                self.size += len(data)
+                return len(data)
+            self._diverge()
+        self._new.write(data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> bool:
+        if self._new is None:
+            if self._old is not None and not self._old.read(1):  # same bytes, same length
+                self._old.close()
+                self._old = None
+                return False
+            self._diverge()  # the old file is longer, or there was none
+        self._new.close()
+        self._new = None
+        os.replace(self._temporary, self.path)
+        self.changed = True
+        return True
+
+    def discard(self) -> None:
+        for handle in (self._old, self._new):
+            if handle is not None:
+                handle.close()
+        if self._new is not None:
+            self._temporary.unlink(missing_ok=True)
+        self._old = self._new = None
+
+    def __enter__(self) -> 'ChangedFileWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def doc_info(scenario: TradeScenario) -> Dict[str, Dict[str, str]]:
+    return {document: {"title": title, "icon": icon, "description": description.format(scenario=scenario)}
+            for document, (title, icon, description) in DOC_INFO.items()}
+
+
+def demo_data(scenario: TradeScenario) -> Dict[str, Any]:
+    """Everything demo.js shows about a scenario (the demoData names)"""
+    return {
+        "docInfo": doc_info(scenario),
+        "documents": dict(scenario.documents),
+        "docIds": scenario.doc_ids,
+        "actorViews": ACTOR_VIEWS,
+        "timeline": scenario.timeline,
+        "documentFlow": DOCUMENT_FLOW,
+        "actorColors": ACTOR_COLORS,
+        "processStages": PROCESS_STAGES,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def shared_json(name: str) -> str:
+    """The JSON of an entry every scenario shares, encoded once"""
+    return ENCODER.encode(SHARED[name])
+
+
+def iter_json(data: Dict[str, Any]) -> Iterator[str]:
+    """
+    The payload's JSON in pieces: each top-level entry, and each document,
+    encoded on its own. json.JSONEncoder.iterencode would stream finer but
+    falls back to the pure Python encoder, several times slower.
+    """
+    yield '{'
+    for position, (name, value) in enumerate(data.items()):
+        yield f'{"," if position else ""}{ENCODER.encode(name)}:'
+        if value is SHARED.get(name):
+            yield shared_json(name)
+        elif name == 'documents':
+            yield '{'
+            for index, (document, content) in enumerate(value.items()):
+                yield f'{"," if index else ""}{ENCODER.encode(document)}:{ENCODER.encode(content)}'
+            yield '}'
+        else:
+            yield ENCODER.encode(value)
+    yield '}'
+
+
+def iter_payload(data: Dict[str, Any]) -> Iterator[bytes]:
+    """demo-data.js, encoded as it is produced, in chunks of about CHUNK_SIZE"""
+    parts, size = [PAYLOAD_PREFIX], len(PAYLOAD_PREFIX)
+    for part in iter_json(data):
+        parts.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield ''.join(parts).encode('utf-8')
+            parts, size = [], 0
+    parts.append(PAYLOAD_SUFFIX)
+    yield ''.join(parts).encode('utf-8')
+
+
+def write_payload(data: Dict[str, Any], directory: Path, compress: bool = True) -> List[Output]:
+    """Stream demo-data.js (and demo-data.js.gz) into directory"""
+    directory.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        writers = [stack.enter_context(ChangedFileWriter(directory / PAYLOAD_NAME))]
+        zipped: Optional[gzip.GzipFile] = None
+        if compress:
+            writers.append(stack.enter_context(ChangedFileWriter(directory / f'{PAYLOAD_NAME}.gz')))
+            zipped = stack.enter_context(gzip.GzipFile(filename='', mode='wb', fileobj=writers[1],
+                                                       compresslevel=9, mtime=0))
+        for chunk in iter_payload(data):
+            writers[0].write(chunk)
+            if zipped is not None:
+                zipped.write(chunk)
+    return [Output(writer.path, writer.size, writer.changed) for writer in writers]
+
+
+def copy_file(source: Path, directory: Path) -> Output:
+    with open(source, 'rb') as input_file, ChangedFileWriter(directory / source.name) as writer:
+        for chunk in iter(lambda: input_file.read(CHUNK_SIZE), b''):
+            writer.write(chunk)
+    return Output(writer.path, writer.size, writer.changed)
+
+
+def bundle_name(scenario: TradeScenario) -> str:
+    return f"po-{scenario.doc_ids['purchase_order']}"
+
+
+def write_bundle(scenario: TradeScenario, directory: Path, compress: bool = True) -> List[Output]:
+    """A scenario's demo, ready to serve: the app files and its payload"""
+    outputs = write_payload(demo_data(scenario), directory, compress)
+    outputs.extend(copy_file(DEMO_DIR / name, directory) for name in APP_FILES)
+    return outputs
+
+
+def relative(path: Path) -> str:
+    try:
+        return str(path.resolve().relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
 
-# Import the scenario
-sys.path.insert(0, '.')
-from scenario_gluelam_timber_full import DOCUMENTS, ACTOR_VIEWS, TIMELINE, DOC_IDS
-
-def generate_demo_js():
-    """Generate demo.js with all documents and actor views"""
-    
-    # Convert documents to JavaScript format
-    documents_json = json.dumps(DOCUMENTS, indent=2, ensure_ascii=False)
-    actor_views_json = json.dumps(ACTOR_VIEWS, indent=2, ensure_ascii=False)
-    timeline_json = json.dumps(TIMELINE, indent=2, ensure_ascii=False)
-    doc_ids_json = json.dumps(DOC_IDS, indent=2, ensure_ascii=False)
-    
-    js_content = f'''// demo.js - Finnish Gluelam Timber to Japan Trade Demo
-// All 15 relevant KTDDE documents for the trade
-// Generated from scenario_gluelam_timber_full.py
-
-// Document metadata
-const docInfo = {{
-  purchase_order: {{
-    title: "Purchase Order",
-    icon: "📝",
-    description: "Buyer's order for gluelam timber beams"
-  }},
-  documentary_credit: {{
-    title: "Documentary Credit (L/C)",
-    icon: "🏦",
-    description: "Confirmed irrevocable letter of credit from MUFG Bank"
-  }},
-  bill_of_lading: {{
-    title: "Bill of Lading",
-    icon: "🚢",
-    description: "Ocean transport document from FESCO"
-  }},
-  commercial_invoice: {{
-    title: "Commercial Invoice",
-    icon: "📄",
-    description: "Seller's invoice for EUR 339,000"
-  }},
-  certificate_of_origin: {{
-    title: "Certificate of Origin",
-    icon: "📜",
-    description: "Finnish Chamber of Commerce certificate"
-  }},
-  packing_list: {{
-    title: "Packing List",
-    icon: "📦",
-    description: "Detailed packing information for 8 bundles"
-  }},
-  insurance_certificate: {{
-    title: "Insurance Certificate",
-    icon: "🛡️",
-    description: "All Risks marine cargo insurance"
-  }},
-  phytosanitary_certificate: {{
-    title: "Phytosanitary Certificate",
-    icon: "🌲",
-    description: "ISPM-15 compliant wood treatment certificate"
-  }},
-  customs_declaration_export: {{
-    title: "Customs Declaration (Export)",
-    icon: "🛃",
-    description: "Finnish export customs clearance"
-  }},
-  customs_declaration_import: {{
-    title: "Customs Declaration (Import)",
-    icon: "🛃",
-    description: "Japanese import customs clearance"
-  }},
-  delivery_note: {{
-    title: "Delivery Note",
-    icon: "🚚",
-    description: "Final delivery to construction site"
-  }},
-  regulatory_certificate: {{
-    title: "Regulatory Certificate",
-    icon: "✅",
-    description: "CE marking for structural timber (EN 14080)"
-  }},
-  sea_cargo_manifest: {{
-    title: "Sea Cargo Manifest",
-    icon: "📋",
-    description: "Vessel manifest for MV Baltic Express"
-  }},
-  warehouse_receipt: {{
-    title: "Warehouse Receipt",
-    icon: "🏭",
-    description: "Rauma Port warehouse receipt"
-  }},
-  payment_confirmation: {{
-    title: "Payment Confirmation",
-    icon: "💰",
-    description: "Bank payment confirmation via L/C"
-  }}
-}};
-
-// All documents (SHACL-based JSON)
-const documents = {documents_json};
-
-// Document IDs for reference
-const docIds = {doc_ids_json};
-
-// Actor views (which documents each actor sees)
-const actorViews = {actor_views_json};
-
-// Timeline events
-const timeline = {timeline_json};
-
-// Actor information
-const actors = [
-  {{ id: 'buyer', name: 'Buyer', icon: '🏢', description: 'Tokyo Construction Materials Ltd' }},
-  {{ id: 'seller', name: 'Seller', icon: '🏭', description: 'Nordic Timber Oy' }},
-  {{ id: 'bank', name: 'Bank', icon: '🏦', description: 'MUFG Tokyo / Nordea Finland' }},
-  {{ id: 'carrier', name: 'Carrier', icon: '🚢', description: 'FESCO Shipping' }},
-  {{ id: 'customs', name: 'Customs', icon: '🛃', description: 'Finnish & Japanese Customs' }},
-  {{ id: 'chamber', name: 'Chamber', icon: '📜', description: 'Finnish Chamber of Commerce' }},
-  {{ id: 'certifier', name: 'Certifier', icon: '✅', description: 'TÜV SÜD & Food Authority' }}
-];
-
-// Current state
-let currentActor = 'buyer';
-let currentDoc = null;
-
-// Initialize demo
-function initDemo() {{
-  renderActorTabs();
-  renderDocuments(currentActor);
-  renderTimeline();
-}}
-
-// Render actor tabs
-function renderActorTabs() {{
-  const container = document.getElementById('actor-tabs');
-  if (!container) return;
-  
-  container.innerHTML = actors.map(actor => `
-    <button class="actor-tab ${{actor.id === currentActor ? 'active' : ''}}"
-            onclick="switchActor('${{actor.id}}')">
-      <span class="actor-icon">${{actor.icon}}</span>
-      <span class="actor-name">${{actor.name}}</span>
-      <small>${{actor.description}}</small>
-    </button>
-  `).join('');
-}}
-
-// Switch actor view
-function switchActor(actorId) {{
-  currentActor = actorId;
-  renderActorTabs();
-  renderDocuments(actorId);
-}}
-
-// Render documents for actor
-function renderDocuments(actorId) {{
-  const container = document.getElementById('documents-grid');
-  if (!container) return;
-  
-  const actorDocs = actorViews[actorId] || [];
-  
-  if (actorDocs.length === 0) {{
-    container.innerHTML = '<p class="no-docs">No documents for this actor</p>';
-    return;
-  }}
-  
-  container.innerHTML = actorDocs.map(docKey => {{
-    const info = docInfo[docKey];
-    const doc = documents[docKey];
-    
-    if (!info || !doc) return '';
-    
-    return `
-      <div class="document-card" onclick="showDocument('${{docKey}}')">
-        <div class="doc-icon">${{info.icon}}</div>
-        <div class="doc-title">${{info.title}}</div>
-        <div class="doc-description">${{info.description}}</div>
-      </div>
-    `;
-  }}).join('');
-}}
-
-// Show document modal
-function showDocument(docKey) {{
-  currentDoc = docKey;
-  const info = docInfo[docKey];
-  const doc = documents[docKey];
-  
-  if (!info || !doc) return;
-  
-  const modal = document.getElementById('doc-modal');
-  const title = document.getElementById('doc-modal-title');
-  const content = document.getElementById('doc-modal-content');
-  
-  title.innerHTML = `${{info.icon}} ${{info.title}}`;
-  content.innerHTML = `<pre class="json-display">${{syntaxHighlight(JSON.stringify(doc, null, 2))}}</pre>`;
-  
-  modal.style.display = 'flex';
-}}
-
-// Close modal
-function closeModal() {{
-  document.getElementById('doc-modal').style.display = 'none';
-  currentDoc = null;
-}}
-
-// Syntax highlighting for JSON
-function syntaxHighlight(json) {{
-  json = json.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
-  return json.replace(/("(\\\\u[a-zA-Z0-9]{{4}}|\\\\[^u]|[^\\\\"])*"(\\s*:)?|\\b(true|false|null)\\b|-?\\d+(?:\\\\.\\d*)?(?:[eE][+\\\\-]?\\d+)?)/g, function (match) {{
-    let cls = 'json-number';
-    if (/^"/.test(match)) {{
-      if (/:$/.test(match)) {{
-        cls = 'json-key';
-      }} else {{
-        cls = 'json-string';
-      }}
-    }} else if (/true|false/.test(match)) {{
-      cls = 'json-boolean';
-    }} else if (/null/.test(match)) {{
-      cls = 'json-null';
-    }}
-    return '<span class="' + cls + '">' + match + '</span>';
-  }});
-}}
-
-// Render timeline
-function renderTimeline() {{
-  const container = document.getElementById('timeline-view');
-  if (!container) return;
-  
-  container.innerHTML = timeline.map(event => `
-    <div class="timeline-event ${{event.doc ? 'clickable' : ''}}" 
-         ${{event.doc ? `onclick="showDocument('${{event.doc}}')"` : ''}}>
-      <div class="timeline-date">${{event.date}}</div>
-      <div class="timeline-marker"></div>
-      <div class="timeline-content">
-        <strong>${{event.event}}</strong>
-        <small>${{event.actor}}</small>
-      </div>
-    </div>
-  `).join('');
-}}
-
-// Close modal on escape
-document.addEventListener('keydown', (e) => {{
-  if (e.key === 'Escape' && currentDoc) {{
-    closeModal();
-  }}
-}});
-
-// Close modal on click outside
-document.getElementById('doc-modal')?.addEventListener('click', (e) => {{
-  if (e.target.id === 'doc-modal') {{
-    closeModal();
-  }}
-}});
-
-// Initialize when DOM is ready
-if (document.readyState === 'loading') {{
-  document.addEventListener('DOMContentLoaded', initDemo);
-}} else {{
-  initDemo();
-}}
-'''
-    
-    return js_content
 
 def main():
-    """Generate demo.js"""
-    print("Generating demo/demo.js...")
-    
-    js_content = generate_demo_js()
-    
-    with open('demo/demo.js', 'w', encoding='utf-8') as f:
-        f.write(js_content)
-    
-    print(f"✅ Generated demo/demo.js ({len(js_content)} bytes)")
-    print(f"   📦 {len(DOCUMENTS)} documents")
-    print(f"   👥 {len(ACTOR_VIEWS)} actors")
-    print(f"   ⏱️  {len(TIMELINE)} timeline events")
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--count', type=int, default=0, help='write a bundle per generated scenario instead')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', type=Path, help='default: demo/, or demo/scenarios/ with --count')
+    parser.add_argument('--no-gzip', action='store_true', help='skip the precompressed demo-data.js.gz')
+    args = parser.parse_args()
+    compress = not args.no_gzip
+
+    if not args.count:
+        out = args.out or DEMO_DIR
+        print(f"Generating {relative(out / PAYLOAD_NAME)}...")
+        start = time.perf_counter()
+        scenario = default_scenario()
+        outputs = write_payload(demo_data(scenario), out, compress)
+        elapsed = time.perf_counter() - start
+        for output in outputs:
+            print(f"{'✅ Wrote' if output.changed else '✅ Unchanged'} {relative(output.path)} ({output.size:,} bytes)")
+        print(f"   📦 {len(scenario.documents)} documents")
+        print(f"   👥 {len(ACTOR_VIEWS)} actors")
+        print(f"   ⏱️  {len(scenario.timeline)} timeline events")
+        print(f"   🔄 {len(DOCUMENT_FLOW)} flow definitions")
+        print(f"   📊 {len(PROCESS_STAGES)} process stages")
+        print(f"   ⚡ {elapsed * 1000:.1f} ms")
+        return
+
+    out = args.out or DEMO_DIR / 'scenarios'
+    print(f"Generating {args.count:,} scenario bundles in {relative(out)}...")
+    written = unchanged = 0
+    sizes: Dict[str, int] = {}
+    start = time.perf_counter()
+    for scenario in scenarios(args.count, seed=args.seed):
+        for output in write_bundle(scenario, out / bundle_name(scenario), compress):
+            sizes[output.path.name] = sizes.get(output.path.name, 0) + output.size
+            if output.changed:
+                written += 1
+            else:
+                unchanged += 1
+    elapsed = time.perf_counter() - start
+    print(f"✅ {args.count:,} bundles, {written + unchanged:,} files: {written:,} written, {unchanged:,} unchanged")
+    for name, size in sizes.items():
+        print(f"   {name:20s} {size / args.count / 1024:8.1f} KB per bundle, {size / 1024 / 1024:8.1f} MB in all")
+    print(f"   ⚡ {elapsed:.2f} s ({args.count / elapsed:,.0f} bundles/s, {elapsed * 1000 / args.count:.2f} ms each)")
+
 
 if __name__ == "__main__":
     main()
@@ -15,6 +15,8 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime, date
 
+from shacl_profile_index import ProfileIndex
+
 
 def load_shacl(filepath: str) -> Dict:
     """Load SHACL JSON-LD file"""
@@ -57,7 +59,8 @@ class VCTemplateGenerator:
     
     def __init__(self, shacl_data: Dict):
         self.data = shacl_data
-        self.graph = {item['@id']: item for item in shacl_data['@graph']}
+        self.index = ProfileIndex(shacl_data)
+        self.graph = self.index.by_id
         self.context = shacl_data.get('@context', {})
         
         # Find the ontology/profile metadata
@@ -68,23 +71,15 @@ class VCTemplateGenerator:
         
     def _find_profile(self) -> Dict:
         """Find the main ontology/application profile"""
-        for item in self.graph.values():
-            if 'suomi-meta:ApplicationProfile' in item.get('@type', []):
-                return item
-        return {}
+        return self.index.find_profile()
     
     def find_node_shapes(self) -> List[Dict]:
         """Find all NodeShapes (document types)"""
-        shapes = []
-        for item in self.graph.values():
-            if 'sh:NodeShape' in item.get('@type', []):
-                if 'sh:targetClass' in item:  # Main document shapes
-                    shapes.append(item)
-        return shapes
+        return list(self.index.node_shapes)
     
     def get_property_details(self, prop_id: str) -> Optional[Dict]:
         """Get PropertyShape details"""
-        return self.graph.get(prop_id)
+        return self.index.get(prop_id)
     
     def generate_empty_template(self, node_shape: Dict, context_base: str) -> Dict[str, Any]:
         """Generate empty VC template with placeholders"""
@@ -113,20 +108,7 @@ class VCTemplateGenerator:
         }
         
         # Add properties with placeholders
-        properties = node_shape.get('sh:property', [])
-        if isinstance(properties, dict):
-            properties = [properties]
-        
-        for prop_ref in properties:
-            if isinstance(prop_ref, str):
-                prop_id = prop_ref
-            else:
-                prop_id = prop_ref.get('@id')
-            
-            prop = self.get_property_details(prop_id)
-            if not prop:
-                continue
-            
+        for prop_id, prop in self.index.resolve_properties(node_shape):
             _, prop_name = extract_prefix_from_id(prop_id)
             prop_label = get_label(prop) or prop_name
             min_count = get_value(prop.get('sh:minCount'), 0)
@@ -198,20 +180,7 @@ class VCTemplateGenerator:
         }
         
         # Add properties with example values
-        properties = node_shape.get('sh:property', [])
-        if isinstance(properties, dict):
-            properties = [properties]
-        
-        for prop_ref in properties:
-            if isinstance(prop_ref, str):
-                prop_id = prop_ref
-            else:
-                prop_id = prop_ref.get('@id')
-            
-            prop = self.get_property_details(prop_id)
-            if not prop:
-                continue
-            
+        for prop_id, prop in self.index.resolve_properties(node_shape):
             _, prop_name = extract_prefix_from_id(prop_id)
             prop_label = get_label(prop) or prop_name
             
@@ -0,0 +1,962 @@
+#!/usr/bin/env python3
+"""
+Offline JSON-LD Expansion with a Processed-Context Cache (no dependencies)
+
+Credentials produced by SAPToVCMapper and the VC templates reference our
+contexts by URL (https://github.com/jgmikael/trade-automation/contexts/...)
+plus the W3C credentials context. This module:
+
+- serves every file in contexts/ (and the vendored W3C contexts in
+  contexts/w3c/) from memory through an offline document loader
+- processes each context into an immutable active context once and keeps
+  processed contexts in a bounded LRU cache keyed by (active context,
+  local context), so type- and property-scoped contexts are not
+  re-processed per credential
+- expands JSON-LD 1.1 documents (scoped contexts, @protected, @propagate,
+  @import, @vocab, type coercion, @list/@set/@graph/@language/@index
+  containers, @reverse, @nest) for single credentials or batches
+
+Usage:
+    from jsonld_processor import JsonLdProcessor
+    processor = JsonLdProcessor()
+    expanded = processor.expand(credential)
+    expanded_batch = processor.expand_batch(credentials)
+
+    python3 tools/jsonld_processor.py credential.jsonld [...]
+"""
+
+import itertools
+import json
+import re
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONTEXTS_DIR = REPO_ROOT / 'contexts'
+CONTEXT_BASE_URL = "https://github.com/jgmikael/trade-automation/contexts/"
+
+# Well-known remote contexts vendored under contexts/
+KNOWN_CONTEXTS = {
+    "https://www.w3.org/2018/credentials/v1": "w3c/credentials-v1.jsonld",
+    "https://www.w3.org/ns/credentials/v2": "w3c/credentials-v2.jsonld",
+}
+
+DEFAULT_CACHE_SIZE = 512
+MAX_REMOTE_CONTEXTS = 32
+
+KEYWORDS = {
+    '@base', '@container', '@context', '@default', '@direction', '@embed',
+    '@explicit', '@graph', '@id', '@import', '@included', '@index', '@json',
+    '@language', '@list', '@nest', '@none', '@omitDefault', '@prefix',
+    '@preserve', '@propagate', '@protected', '@requireAll', '@reverse',
+    '@set', '@type', '@value', '@version', '@vocab',
+}
+CONTEXT_KEYWORDS = ('@base', '@direction', '@import', '@language', '@propagate',
+                    '@protected', '@version', '@vocab')
+TERM_KEYS = {'@id', '@reverse', '@container', '@context', '@direction', '@index',
+             '@language', '@nest', '@prefix', '@protected', '@type'}
+VALID_CONTAINERS = {'@list', '@set', '@index', '@language', '@graph', '@id', '@type'}
+GEN_DELIMS = (':', '/', '?', '#', '[', ']', '@')
+
+_KEYWORD_FORM = re.compile(r'^@[a-zA-Z]+$')
+_ABSOLUTE_IRI = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*:')
+
+
+class JsonLdError(ValueError):
+    """JSON-LD processing error; `code` is the spec error code"""
+
+    def __init__(self, code: str, message: str = ''):
+        super().__init__(f"{code}: {message}" if message else code)
+        self.code = code
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+def _is_absolute_iri(value: str) -> bool:
+    return bool(_ABSOLUTE_IRI.match(value))
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, (str, int, float, bool))
+
+
+def _context_key(context: Any) -> str:
+    """Stable cache key for a local context (URL or inline JSON)"""
+    if isinstance(context, str):
+        return context
+    return json.dumps(context, sort_keys=True, separators=(',', ':'))
+
+
+# ============================================================================
+# Document loader
+# ============================================================================
+
+class ContextDocumentLoader:
+    """Offline loader serving contexts/ from memory
+
+    Every top-level contexts/*.jsonld file is registered under
+    CONTEXT_BASE_URL + filename, vendored well-known contexts under their
+    canonical URL. Unknown URLs raise JsonLdError instead of going to the
+    network. Instances are callable with the pyld documentLoader signature.
+    """
+
+    def __init__(self, contexts_dir: Path = CONTEXTS_DIR,
+                 base_urls: Iterable[str] = (CONTEXT_BASE_URL,),
+                 extra: Optional[Dict[str, Path]] = None):
+        self.documents: Dict[str, Any] = {}
+        contexts_dir = Path(contexts_dir)
+        for path in sorted(contexts_dir.glob('*.jsonld')):
+            document = self._read(path)
+            for base_url in base_urls:
+                self.documents[base_url.rstrip('/') + '/' + path.name] = document
+        for url, relative in KNOWN_CONTEXTS.items():
+            path = contexts_dir / relative
+            if path.exists():
+                self.documents[url] = self._read(path)
+        for url, path in (extra or {}).items():
+            self.documents[url] = self._read(Path(path))
+
+    @staticmethod
+    def _read(path: Path) -> Any:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self, url: str) -> Any:
+        """Parsed JSON document for a URL"""
+        document = self.documents.get(url)
+        if document is None:
+            # Tolerate a trailing fragment or slash variant
+            document = self.documents.get(url.split('#', 1)[0].rstrip('/'))
+        if document is None:
+            raise JsonLdError('loading document failed',
+                              f"{url} is not available offline")
+        return document
+
+    def __call__(self, url: str, options: Optional[Dict] = None) -> Dict[str, Any]:
+        return {'contextUrl': None, 'documentUrl': url, 'document': self.load(url)}
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.documents
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+
+# ============================================================================
+# Active context
+# ============================================================================
+
+_context_ids = itertools.count(1)
+
+
+class ActiveContext:
+    """Processed JSON-LD context; treated as immutable once built
+
+    `uid` identifies the context in the processed-context cache.
+    """
+    __slots__ = ('terms', 'base', 'original_base', 'vocab', 'language',
+                 'direction', 'previous', 'uid')
+
+    def __init__(self, base: Optional[str] = None):
+        self.terms: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.base = base
+        self.original_base = base
+        self.vocab: Optional[str] = None
+        self.language: Optional[str] = None
+        self.direction: Optional[str] = None
+        self.previous: Optional['ActiveContext'] = None
+        self.uid = next(_context_ids)
+
+    def copy(self) -> 'ActiveContext':
+        clone = ActiveContext.__new__(ActiveContext)
+        clone.terms = dict(self.terms)
+        clone.base = self.base
+        clone.original_base = self.original_base
+        clone.vocab = self.vocab
+        clone.language = self.language
+        clone.direction = self.direction
+        clone.previous = self.previous
+        clone.uid = next(_context_ids)
+        return clone
+
+    def has_protected_terms(self) -> bool:
+        return any(d and d.get('protected') for d in self.terms.values())
+
+
+class ContextCache:
+    """Bounded LRU cache of processed contexts (shared by issuing threads)"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[tuple, ActiveContext]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[ActiveContext]:
+        with self._lock:
+            context = self._entries.get(key)
+            if context is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return context
+
+    def put(self, key: tuple, context: ActiveContext):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = context
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# ============================================================================
+# Processor
+# ============================================================================
+
+class JsonLdProcessor:
+    """JSON-LD 1.1 context processing and expansion"""
+
+    def __init__(self, loader: Optional[ContextDocumentLoader] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
+        self.loader = loader or ContextDocumentLoader()
+        self.cache = ContextCache(cache_size)
+        self.initial_context = ActiveContext()
+        self._base_contexts: Dict[str, ActiveContext] = {}
+
+    # ------------------------------------------------------------------
+    # Context processing
+    # ------------------------------------------------------------------
+
+    def process_context(self, active: ActiveContext, local: Any,
+                        base_url: Optional[str] = None,
+                        override_protected: bool = False,
+                        propagate: bool = True) -> ActiveContext:
+        """Apply a local context (URL, inline object or list), using the cache"""
+        key = (active.uid, _context_key(local), base_url, override_protected, propagate)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._process_context(active, local, base_url, [],
+                                           override_protected, propagate, True)
+            self.cache.put(key, result)
+        return result
+
+    def warm(self, urls: Optional[Iterable[str]] = None) -> int:
+        """Pre-process contexts (default: every loadable context); return count"""
+        count = 0
+        for url in (urls if urls is not None else list(self.loader.documents)):
+            self.process_context(self.initial_context, url)
+            count += 1
+        return count
+
+    def _process_context(self, active: ActiveContext, local: Any,
+                         base_url: Optional[str], remote_contexts: List[str],
+                         override_protected: bool, propagate: bool,
+                         validate_scoped: bool) -> ActiveContext:
+        result = active.copy()
+        if isinstance(local, dict) and '@propagate' in local:
+            propagate = local['@propagate']
+            if not isinstance(propagate, bool):
+                raise JsonLdError('invalid @propagate value')
+        if not propagate and result.previous is None:
+            result.previous = active
+
+        for context in _as_list(local):
+            if context is None:
+                if not override_protected and result.has_protected_terms():
+                    raise JsonLdError('invalid context nullification')
+                previous = result.previous
+                result = ActiveContext(active.original_base)
+                if not propagate:
+                    result.previous = previous
+                continue
+
+            if isinstance(context, str):
+                url = urljoin(base_url, context) if base_url else context
+                if not validate_scoped and url in remote_contexts:
+                    continue
+                if len(remote_contexts) > MAX_REMOTE_CONTEXTS:
+                    raise JsonLdError('context overflow', url)
+                document = self.loader.load(url)
+                if not isinstance(document, dict) or '@context' not in document:
+                    raise JsonLdError('invalid remote context', url)
+                result = self._process_context(
+                    result, document['@context'], url, remote_contexts + [url],
+                    False, True, validate_scoped)
+                continue
+
+            if not isinstance(context, dict):
+                raise JsonLdError('invalid local context', repr(context))
+
+            if '@version' in context and context['@version'] != 1.1:
+                raise JsonLdError('invalid @version value', repr(context['@version']))
+
+            if '@import' in context:
+                import_url = context['@import']
+                if not isinstance(import_url, str):
+                    raise JsonLdError('invalid @import value')
+                import_url = urljoin(base_url, import_url) if base_url else import_url
+                imported = self.loader.load(import_url)
+                imported = imported.get('@context') if isinstance(imported, dict) else None
+                if not isinstance(imported, dict):
+                    raise JsonLdError('invalid remote context', import_url)
+                if '@import' in imported:
+                    raise JsonLdError('invalid context entry', '@import in imported context')
+                merged = dict(imported)
+                merged.update(context)
+                context = merged
+
+            if '@base' in context and not remote_contexts:
+                value = context['@base']
+                if value is None:
+                    result.base = None
+                elif isinstance(value, str):
+                    result.base = urljoin(result.base, value) if result.base else value
+                else:
+                    raise JsonLdError('invalid base IRI')
+
+            if '@vocab' in context:
+                value = context['@vocab']
+                if value is None:
+                    result.vocab = None
+                elif isinstance(value, str):
+                    result.vocab = self._expand_iri(result, value, document_relative=True,
+                                                    vocab=True)
+                else:
+                    raise JsonLdError('invalid vocab mapping')
+
+            if '@language' in context:
+                value = context['@language']
+                if value is not None and not isinstance(value, str):
+                    raise JsonLdError('invalid default language')
+                result.language = value.lower() if value else None
+
+            if '@direction' in context:
+                value = context['@direction']
+                if value not in (None, 'ltr', 'rtl'):
+                    raise JsonLdError('invalid base direction')
+                result.direction = value
+
+            if '@protected' in context and not isinstance(context['@protected'], bool):
+                raise JsonLdError('invalid @protected value')
+
+            defined: Dict[str, bool] = {}
+            for term in context:
+                if term in CONTEXT_KEYWORDS:
+                    continue
+                self._create_term_definition(
+                    result, context, term, defined, base_url,
+                    context.get('@protected', False), override_protected,
+                    remote_contexts, validate_scoped)
+        return result
+
+    def _create_term_definition(self, active: ActiveContext, local: Dict, term: str,
+                                defined: Dict[str, bool], base_url: Optional[str],
+                                protected: Optional[bool] = None,
+                                override_protected: bool = False,
+                                remote_contexts: Optional[List[str]] = None,
+                                validate_scoped: bool = True):
+        if term in defined:
+            if defined[term]:
+                return
+            raise JsonLdError('cyclic IRI mapping', term)
+        if term == '':
+            raise JsonLdError('invalid term definition', 'empty term')
+        defined[term] = False
+        value = local[term]
+        if protected is None:
+            protected = local.get('@protected', False)
+
+        if term == '@type' and isinstance(value, dict) and value and \
+                set(value) <= {'@container', '@protected'} and \
+                value.get('@container', '@set') == '@set':
+            pass
+        elif term in KEYWORDS:
+            raise JsonLdError('keyword redefinition', term)
+        elif _KEYWORD_FORM.match(term):
+            return
+
+        previous = active.terms.pop(term, None)
+
+        if value is None:
+            value = {'@id': None}
+            simple_term = False
+        elif isinstance(value, str):
+            value = {'@id': value}
+            simple_term = True
+        elif isinstance(value, dict):
+            simple_term = False
+        else:
+            raise JsonLdError('invalid term definition', term)
+
+        unknown = set(value) - TERM_KEYS
+        if unknown:
+            raise JsonLdError('invalid term definition', f"{term}: {sorted(unknown)}")
+
+        definition: Dict[str, Any] = {
+            'reverse': False,
+            'prefix': False,
+            'protected': value.get('@protected', protected),
+        }
+
+        if '@type' in value:
+            type_mapping = value['@type']
+            if not isinstance(type_mapping, str):
+                raise JsonLdError('invalid type mapping', term)
+            type_mapping = self._expand_iri(active, type_mapping, vocab=True,
+                                            local=local, defined=defined)
+            if type_mapping not in ('@id', '@json', '@none', '@vocab') and \
+                    not _is_absolute_iri(type_mapping or ''):
+                raise JsonLdError('invalid type mapping', f"{term}: {type_mapping}")
+            definition['@type'] = type_mapping
+
+        if '@reverse' in value:
+            if '@id' in value or '@nest' in value:
+                raise JsonLdError('invalid reverse property', term)
+            reverse = value['@reverse']
+            if not isinstance(reverse, str):
+                raise JsonLdError('invalid IRI mapping', term)
+            if _KEYWORD_FORM.match(reverse):
+                return
+            iri = self._expand_iri(active, reverse, vocab=True, local=local, defined=defined)
+            if not iri or not (_is_absolute_iri(iri) or iri.startswith('_:')):
+                raise JsonLdError('invalid IRI mapping', term)
+            definition['@id'] = iri
+            definition['reverse'] = True
+        elif '@id' in value and value['@id'] != term:
+            iri = value['@id']
+            if iri is None:
+                definition['@id'] = None
+            else:
+                if not isinstance(iri, str):
+                    raise JsonLdError('invalid IRI mapping', term)
+                if iri not in KEYWORDS and _KEYWORD_FORM.match(iri):
+                    return
+                iri = self._expand_iri(active, iri, vocab=True, local=local, defined=defined)
+                if iri not in KEYWORDS and not _is_absolute_iri(iri or '') and \
+                        not (iri or '').startswith('_:'):
+                    raise JsonLdError('invalid IRI mapping', f"{term}: {iri}")
+                if iri == '@context':
+                    raise JsonLdError('invalid keyword alias', term)
+                if ':' in term[1:-1] or '/' in term:
+                    defined[term] = True
+                    if self._expand_iri(active, term, vocab=True, local=local,
+                                        defined=defined) != iri:
+                        raise JsonLdError('invalid IRI mapping', term)
+                definition['@id'] = iri
+                if ':' not in term and '/' not in term and simple_term and \
+                        (iri.endswith(GEN_DELIMS) or iri.startswith('_:')):
+                    definition['prefix'] = True
+        elif ':' in term[1:]:
+            prefix, suffix = term.split(':', 1)
+            if prefix in local:
+                self._create_term_definition(active, local, prefix, defined, base_url,
+                                             protected, override_protected,
+                                             remote_contexts, validate_scoped)
+            prefix_definition = active.terms.get(prefix)
+            if prefix_definition and prefix_definition.get('@id'):
+                definition['@id'] = prefix_definition['@id'] + suffix
+            else:
+                definition['@id'] = term
+        elif '/' in term:
+            definition['@id'] = self._expand_iri(active, term, vocab=True)
+        elif term == '@type':
+            definition['@id'] = '@type'
+        else:
+            if active.vocab is None:
+                raise JsonLdError('invalid IRI mapping', f"{term}: no @vocab")
+            definition['@id'] = active.vocab + term
+
+        if '@container' in value:
+            container = _as_list(value['@container'])
+            if not all(isinstance(c, str) and c in VALID_CONTAINERS for c in container):
+                raise JsonLdError('invalid container mapping', term)
+            if '@list' in container and len(container) > 1:
+                raise JsonLdError('invalid container mapping', term)
+            if definition['reverse'] and not set(container) <= {'@index', '@set'}:
+                raise JsonLdError('invalid reverse property', term)
+            definition['@container'] = sorted(container)
+            if '@type' in container:
+                if '@type' not in definition:
+                    definition['@type'] = '@id'
+                elif definition['@type'] not in ('@id', '@vocab'):
+                    raise JsonLdError('invalid type mapping', term)
+
+        if '@index' in value:
+            if '@index' not in definition.get('@container', []) or \
+                    not isinstance(value['@index'], str):
+                raise JsonLdError('invalid term definition', f"{term}: @index")
+            definition['@index'] = value['@index']
+
+        if '@context' in value:
+            scoped = value['@context']
+            try:
+                self._process_context(active, scoped, base_url, list(remote_contexts or []),
+                                      True, True, False)
+            except JsonLdError as e:
+                raise JsonLdError('invalid scoped context', f"{term}: {e}") from e
+            definition['@context'] = scoped
+            definition['context_key'] = _context_key(scoped)
+            definition['base_url'] = base_url
+
+        if '@language' in value and '@type' not in value:
+            language = value['@language']
+            if language is not None and not isinstance(language, str):
+                raise JsonLdError('invalid language mapping', term)
+            definition['@language'] = language.lower() if language else None
+
+        if '@direction' in value and '@type' not in value:
+            if value['@direction'] not in (None, 'ltr', 'rtl'):
+                raise JsonLdError('invalid base direction', term)
+            definition['@direction'] = value['@direction']
+
+        if '@nest' in value:
+            nest = value['@nest']
+            if not isinstance(nest, str) or (nest in KEYWORDS and nest != '@nest'):
+                raise JsonLdError('invalid @nest value', term)
+            definition['@nest'] = nest
+
+        if '@prefix' in value:
+            if ':' in term or '/' in term or not isinstance(value['@prefix'], bool):
+                raise JsonLdError('invalid term definition', f"{term}: @prefix")
+            definition['prefix'] = value['@prefix']
+            if definition['prefix'] and definition.get('@id') in KEYWORDS:
+                raise JsonLdError('invalid term definition', term)
+
+        if not override_protected and previous and previous.get('protected'):
+            if _strip_protected(previous) != _strip_protected(definition):
+                raise JsonLdError('protected term redefinition', term)
+            definition = previous
+
+        active.terms[term] = definition
+        defined[term] = True
+
+    # ------------------------------------------------------------------
+    # IRI and value expansion
+    # ------------------------------------------------------------------
+
+    def _expand_iri(self, active: ActiveContext, value: Optional[str],
+                    document_relative: bool = False, vocab: bool = False,
+                    local: Optional[Dict] = None,
+                    defined: Optional[Dict[str, bool]] = None) -> Optional[str]:
+        if value is None or value in KEYWORDS:
+            return value
+        if _KEYWORD_FORM.match(value):
+            return None
+        if local is not None and value in local and defined.get(value) is not True:
+            self._create_term_definition(active, local, value, defined, None)
+
+        if vocab and value in active.terms:
+            definition = active.terms[value]
+            return definition.get('@id') if definition else None
+
+        if ':' in value[1:]:
+            prefix, suffix = value.split(':', 1)
+            if prefix == '_' or suffix.startswith('//'):
+                return value
+            if local is not None and prefix in local and not defined.get(prefix):
+                self._create_term_definition(active, local, prefix, defined, None)
+            definition = active.terms.get(prefix)
+            if definition and definition.get('@id') and definition.get('prefix'):
+                return definition['@id'] + suffix
+            if _is_absolute_iri(value):
+                return value
+
+        if vocab and active.vocab is not None:
+            return active.vocab + value
+        if document_relative and active.base:
+            return urljoin(active.base, value)
+        return value
+
+    def _expand_value(self, active: ActiveContext, active_property: Optional[str],
+                      value: Any) -> Dict[str, Any]:
+        definition = active.terms.get(active_property) or {}
+        type_mapping = definition.get('@type')
+        if type_mapping == '@id' and isinstance(value, str):
+            return {'@id': self._expand_iri(active, value, document_relative=True)}
+        if type_mapping == '@vocab' and isinstance(value, str):
+            return {'@id': self._expand_iri(active, value, document_relative=True, vocab=True)}
+
+        result: Dict[str, Any] = {'@value': value}
+        if type_mapping not in (None, '@id', '@vocab', '@none'):
+            result['@type'] = type_mapping
+        elif isinstance(value, str):
+            language = definition['@language'] if '@language' in definition else active.language
+            direction = definition['@direction'] if '@direction' in definition else active.direction
+            if language is not None:
+                result['@language'] = language
+            if direction is not None:
+                result['@direction'] = direction
+        return result
+
+    # ------------------------------------------------------------------
+    # Expansion
+    # ------------------------------------------------------------------
+
+    def expand(self, document: Any, base: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Expand a JSON-LD document; always returns a list of node objects"""
+        active = self.initial_context
+        if base:
+            active = self._base_contexts.get(base)
+            if active is None:
+                active = self._base_contexts[base] = ActiveContext(base)
+        expanded = self._expand(active, None, document, base)
+        if isinstance(expanded, dict) and len(expanded) == 1 and '@graph' in expanded:
+            expanded = expanded['@graph']
+        if expanded is None:
+            return []
+        return _as_list(expanded)
+
+    def expand_batch(self, documents: Iterable[Any],
+                     base: Optional[str] = None) -> List[List[Dict[str, Any]]]:
+        """Expand several documents, sharing processed contexts"""
+        return [self.expand(document, base) for document in documents]
+
+    def _expand(self, active: ActiveContext, active_property: Optional[str],
+                element: Any, base_url: Optional[str], from_map: bool = False) -> Any:
+        if element is None:
+            return None
+
+        property_definition = active.terms.get(active_property) if active_property else None
+        property_scoped = property_definition.get('@context') if property_definition else None
+
+        if _is_scalar(element):
+            if active_property is None or active_property == '@graph':
+                return None
+            if property_scoped is not None:
+                active = self._scoped(active, property_definition, override_protected=True)
+            return self._expand_value(active, active_property, element)
+
+        if isinstance(element, list):
+            result = []
+            container = property_definition.get('@container', []) if property_definition else []
+            for item in element:
+                expanded = self._expand(active, active_property, item, base_url, from_map)
+                if '@list' in container and isinstance(expanded, list):
+                    expanded = {'@list': expanded}
+                if isinstance(expanded, list):
+                    result.extend(expanded)
+                elif expanded is not None:
+                    result.append(expanded)
+            return result
+
+        if not isinstance(element, dict):
+            raise JsonLdError('invalid JSON-LD syntax', repr(element))
+
+        # Type-scoped contexts do not propagate into nested node objects
+        if active.previous is not None and not from_map:
+            revert = True
+            for key in element:
+                expanded_key = self._expand_iri(active, key, vocab=True)
+                if expanded_key == '@value' or (expanded_key == '@id' and len(element) == 1):
+                    revert = False
+                    break
+            if revert:
+                active = active.previous
+
+        if property_scoped is not None:
+            active = self._scoped(active, property_definition, override_protected=True)
+
+        if '@context' in element:
+            active = self.process_context(active, element['@context'], base_url)
+
+        type_scoped = active
+        for key in element:
+            if self._expand_iri(active, key, vocab=True) != '@type':
+                continue
+            for type_value in sorted(v for v in _as_list(element[key]) if isinstance(v, str)):
+                definition = type_scoped.terms.get(type_value)
+                if definition and definition.get('@context') is not None:
+                    active = self._scoped(active, definition, propagate=False)
+
+        result: Dict[str, Any] = {}
+        self._expand_object(active, type_scoped, active_property, element, result, base_url)
+
+        if '@value' in result:
+            allowed = {'@value', '@type', '@language', '@direction', '@index'}
+            if set(result) - allowed or ('@type' in result and '@language' in result):
+                raise JsonLdError('invalid value object', repr(result))
+            if result.get('@type') == '@json':
+                pass
+            elif result['@value'] is None:
+                return None
+            elif '@language' in result and not isinstance(result['@value'], str):
+                raise JsonLdError('invalid language-tagged value', repr(result))
+            elif '@type' in result and (not isinstance(result['@type'], str) or
+                                        not _is_absolute_iri(result['@type'])):
+                raise JsonLdError('invalid typed value', repr(result))
+        elif '@type' in result and not isinstance(result['@type'], list):
+            result['@type'] = [result['@type']]
+        elif '@set' in result or '@list' in result:
+            if set(result) - {'@set', '@list', '@index'}:
+                raise JsonLdError('invalid set or list object', repr(result))
+            if '@set' in result:
+                result = result['@set']
+
+        if isinstance(result, dict) and set(result) == {'@language'}:
+            return None
+
+        if active_property is None or active_property == '@graph':
+            if isinstance(result, dict) and (not result or '@value' in result or '@list' in result):
+                return None
+            if isinstance(result, dict) and set(result) == {'@id'}:
+                return None
+        return result
+
+    def _scoped(self, active: ActiveContext, definition: Dict[str, Any],
+                override_protected: bool = False, propagate: bool = True) -> ActiveContext:
+        """Apply a term's scoped context through the cache"""
+        key = (active.uid, definition['context_key'], override_protected, propagate)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._process_context(active, definition['@context'],
+                                           definition.get('base_url'), [],
+                                           override_protected, propagate, True)
+            self.cache.put(key, result)
+        return result
+
+    def _expand_object(self, active: ActiveContext, type_scoped: ActiveContext,
+                       active_property: Optional[str], element: Dict[str, Any],
+                       result: Dict[str, Any], base_url: Optional[str]):
+        nests: List[str] = []
+        for key, value in element.items():
+            if key == '@context':
+                continue
+            expanded_property = self._expand_iri(active, key, vocab=True)
+            if expanded_property is None or \
+                    (':' not in expanded_property and expanded_property not in KEYWORDS):
+                continue
+
+            if expanded_property in KEYWORDS:
+                if active_property == '@reverse':
+                    raise JsonLdError('invalid reverse property map', key)
+                if expanded_property in result and expanded_property not in ('@included', '@type'):
+                    raise JsonLdError('colliding keywords', expanded_property)
+                expanded_value = self._expand_keyword(
+                    active, type_scoped, active_property, expanded_property,
+                    value, result, base_url)
+                if expanded_property == '@nest':
+                    nests.append(key)
+                    continue
+                if expanded_value is _SKIP:
+                    continue
+                if expanded_property == '@reverse':
+                    continue
+                result[expanded_property] = expanded_value
+                continue
+
+            definition = active.terms.get(key) or {}
+            container = definition.get('@container', [])
+
+            if definition.get('@type') == '@json':
+                expanded_value = {'@value': value, '@type': '@json'}
+            elif '@language' in container and isinstance(value, dict):
+                expanded_value = []
+                direction = definition.get('@direction', active.direction)
+                for language, items in value.items():
+                    for item in _as_list(items):
+                        if item is None:
+                            continue
+                        if not isinstance(item, str):
+                            raise JsonLdError('invalid language map value', repr(item))
+                        entry = {'@value': item}
+                        if self._expand_iri(active, language, vocab=True) != '@none':
+                            entry['@language'] = language.lower()
+                        if direction is not None:
+                            entry['@direction'] = direction
+                        expanded_value.append(entry)
+            elif isinstance(value, dict) and \
+                    {'@index', '@type', '@id'} & set(container):
+                expanded_value = self._expand_map(active, key, definition, container,
+                                                  value, base_url)
+            else:
+                expanded_value = self._expand(active, key, value, base_url)
+
+            if expanded_value is None:
+                continue
+            if '@list' in container and not (isinstance(expanded_value, dict)
+                                             and '@list' in expanded_value):
+                expanded_value = {'@list': _as_list(expanded_value)}
+            if '@graph' in container and '@id' not in container and '@index' not in container:
+                expanded_value = [{'@graph': _as_list(v)} for v in _as_list(expanded_value)]
+
+            if definition.get('reverse'):
+                reverse_map = result.setdefault('@reverse', {})
+                for item in _as_list(expanded_value):
+                    if isinstance(item, dict) and ('@value' in item or '@list' in item):
+                        raise JsonLdError('invalid reverse property value', key)
+                    reverse_map.setdefault(expanded_property, []).append(item)
+            else:
+                result.setdefault(expanded_property, []).extend(_as_list(expanded_value))
+
+        for nesting_key in nests:
+            for nested in _as_list(element[nesting_key]):
+                if not isinstance(nested, dict) or any(
+                        self._expand_iri(active, k, vocab=True) == '@value' for k in nested):
+                    raise JsonLdError('invalid @nest value', nesting_key)
+                self._expand_object(active, type_scoped, active_property, nested,
+                                    result, base_url)
+
+    def _expand_keyword(self, active: ActiveContext, type_scoped: ActiveContext,
+                        active_property: Optional[str], keyword: str, value: Any,
+                        result: Dict[str, Any], base_url: Optional[str]) -> Any:
+        if keyword == '@id':
+            if not isinstance(value, str):
+                raise JsonLdError('invalid @id value', repr(value))
+            return self._expand_iri(active, value, document_relative=True)
+
+        if keyword == '@type':
+            if isinstance(value, str):
+                expanded = self._expand_iri(type_scoped, value, document_relative=True,
+                                            vocab=True)
+            elif isinstance(value, list) and all(isinstance(v, str) for v in value):
+                expanded = [self._expand_iri(type_scoped, v, document_relative=True, vocab=True)
+                            for v in value]
+            else:
+                raise JsonLdError('invalid type value', repr(value))
+            if '@type' in result:
+                return _as_list(result['@type']) + _as_list(expanded)
+            return expanded
+
+        if keyword == '@graph':
+            return _as_list(self._expand(active, '@graph', value, base_url))
+
+        if keyword == '@included':
+            included = _as_list(self._expand(active, None, value, base_url))
+            return _as_list(result.get('@included', [])) + included
+
+        if keyword == '@value':
+            if value is not None and not _is_scalar(value):
+                raise JsonLdError('invalid value object value', repr(value))
+            return value
+
+        if keyword == '@language':
+            if not isinstance(value, str):
+                raise JsonLdError('invalid language-tagged string', repr(value))
+            return value.lower()
+
+        if keyword == '@direction':
+            if value not in ('ltr', 'rtl'):
+                raise JsonLdError('invalid base direction', repr(value))
+            return value
+
+        if keyword == '@index':
+            if not isinstance(value, str):
+                raise JsonLdError('invalid @index value', repr(value))
+            return value
+
+        if keyword == '@list':
+            if active_property is None or active_property == '@graph':
+                return _SKIP
+            return _as_list(self._expand(active, active_property, value, base_url))
+
+        if keyword == '@set':
+            return self._expand(active, active_property, value, base_url)
+
+        if keyword == '@reverse':
+            if not isinstance(value, dict):
+                raise JsonLdError('invalid @reverse value', repr(value))
+            expanded = self._expand(active, '@reverse', value, base_url)
+            if '@reverse' in expanded:
+                for prop, items in expanded['@reverse'].items():
+                    result.setdefault(prop, []).extend(_as_list(items))
+            reverse_map = result.setdefault('@reverse', {})
+            for prop, items in expanded.items():
+                if prop == '@reverse':
+                    continue
+                for item in _as_list(items):
+                    if isinstance(item, dict) and ('@value' in item or '@list' in item):
+                        raise JsonLdError('invalid reverse property value', prop)
+                    reverse_map.setdefault(prop, []).append(item)
+            return _SKIP
+
+        # @nest and framing keywords are handled by the caller / ignored
+        return _SKIP
+
+    def _expand_map(self, active: ActiveContext, key: str, definition: Dict[str, Any],
+                    container: List[str], value: Dict[str, Any],
+                    base_url: Optional[str]) -> List[Any]:
+        """Expand an @index, @id or @type map"""
+        expanded_value: List[Any] = []
+        index_key = definition.get('@index', '@index')
+        for map_key, items in value.items():
+            map_context = active
+            if '@type' in container:
+                type_definition = active.terms.get(map_key)
+                if type_definition and type_definition.get('@context') is not None:
+                    map_context = self._scoped(active, type_definition, propagate=False)
+            expanded_key = self._expand_iri(active, map_key, vocab=True)
+            items = self._expand(map_context, key, _as_list(items), base_url, from_map=True)
+            for item in _as_list(items):
+                if '@graph' in container and not (isinstance(item, dict) and '@graph' in item):
+                    item = {'@graph': _as_list(item)}
+                if '@index' in container and expanded_key != '@none':
+                    if index_key == '@index':
+                        item.setdefault('@index', map_key)
+                    else:
+                        prop = self._expand_iri(active, index_key, vocab=True)
+                        index_value = self._expand_value(active, index_key, map_key)
+                        item[prop] = [index_value] + _as_list(item.get(prop, []))
+                elif '@id' in container and expanded_key != '@none':
+                    item.setdefault('@id', self._expand_iri(active, map_key,
+                                                            document_relative=True))
+                elif '@type' in container and expanded_key != '@none':
+                    item['@type'] = [expanded_key] + _as_list(item.get('@type', []))
+                expanded_value.append(item)
+        return expanded_value
+
+
+_SKIP = object()
+
+
+def _strip_protected(definition: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in definition.items() if k != 'protected'}
+
+
+_default_processor: Optional[JsonLdProcessor] = None
+
+
+def get_processor() -> JsonLdProcessor:
+    """Shared processor with the repository's offline loader"""
+    global _default_processor
+    if _default_processor is None:
+        _default_processor = JsonLdProcessor()
+    return _default_processor
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    processor = get_processor()
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        try:
+            expanded = processor.expand(document)
+        except JsonLdError as e:
+            print(f"❌ {path}: {e}")
+            continue
+        print(json.dumps(expanded, indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
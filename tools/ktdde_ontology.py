@@ -0,0 +1,781 @@
+#!/usr/bin/env python3
+"""
+KTDDE Ontology Service (no dependencies)
+
+Resolves KTDDE terms (classes and properties of ontology/ktdde-v0.0.5.rdf)
+by IRI or local name: labels per language, kind, domains/ranges,
+super/equivalent terms, class restrictions and SKOS/terminology links.
+
+The RDF/XML is parsed once into a compact binary snapshot next to the
+source file. Later starts memory-map the snapshot and answer lookups
+through on-disk hash tables, so nothing is parsed or deserialized up
+front; the snapshot is rebuilt automatically when the RDF changes.
+
+Usage:
+    python3 tools/ktdde_ontology.py build [--rdf path] [--snapshot path]
+    python3 tools/ktdde_ontology.py lookup <IRI or local name> [...]
+    python3 tools/ktdde_ontology.py stats
+
+    from ktdde_ontology import get_ontology
+    ontology = get_ontology()
+    ontology.label('invoiceNumber')        # 'Invoice Number'
+    ontology.term('MonetaryAmount')        # dict with all facts
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from turtle_stream import BNode, Literal, RDF, RDF_TYPE, RDF_FIRST, RDF_REST, RDF_NIL
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_RDF = REPO_ROOT / 'ontology' / 'ktdde-v0.0.5.rdf'
+
+RDFS = "http://www.w3.org/2000/01/rdf-schema#"
+OWL = "http://www.w3.org/2002/07/owl#"
+SKOS = "http://www.w3.org/2004/02/skos/core#"
+DCTERMS = "http://purl.org/dc/terms/"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+Triple = Tuple[str, str, str]
+
+
+# ============================================================================
+# RDF/XML reader
+# ============================================================================
+
+class RDFXMLReader:
+    """Reads the RDF/XML syntax subset used by suomi.fi exports into triples
+
+    Handles typed node elements, rdf:about / rdf:nodeID / rdf:ID, nested
+    nodes, rdf:resource, rdf:parseType Collection / Resource / Literal,
+    property attributes, xml:lang inheritance and rdf:datatype.
+    """
+
+    def __init__(self, base: str = ''):
+        self.base = base
+        self.triples: List[Triple] = []
+        self._bnode_count = 0
+
+    @staticmethod
+    def _iri(tag: str) -> str:
+        """'{namespace}local' → 'namespacelocal'"""
+        if tag.startswith('{'):
+            namespace, _, local = tag[1:].partition('}')
+            return namespace + local
+        return tag
+
+    def _fresh_bnode(self) -> BNode:
+        self._bnode_count += 1
+        return BNode(f"b{self._bnode_count}")
+
+    def _subject(self, element: ET.Element) -> str:
+        about = element.get(f'{{{RDF}}}about')
+        if about is not None:
+            return about
+        node_id = element.get(f'{{{RDF}}}nodeID')
+        if node_id is not None:
+            return BNode(f"_:{node_id}")
+        rdf_id = element.get(f'{{{RDF}}}ID')
+        if rdf_id is not None:
+            return f"{self.base}#{rdf_id}"
+        return self._fresh_bnode()
+
+    def read(self, root: ET.Element) -> List[Triple]:
+        """Read all top-level node elements of an rdf:RDF root"""
+        for child in root:
+            self._node(child, root.get(XML_LANG))
+        return self.triples
+
+    def _node(self, element: ET.Element, lang: Optional[str]) -> str:
+        lang = element.get(XML_LANG, lang)
+        subject = self._subject(element)
+        node_type = self._iri(element.tag)
+        if node_type != RDF + 'Description':
+            self.triples.append((subject, RDF_TYPE, node_type))
+
+        for name, value in element.attrib.items():
+            predicate = self._iri(name)
+            if predicate.startswith(RDF) or name == XML_LANG:
+                if predicate == RDF_TYPE:
+                    self.triples.append((subject, RDF_TYPE, value))
+                continue
+            self.triples.append((subject, predicate, Literal(value, language=lang)))
+
+        for child in element:
+            self._property(subject, child, lang)
+        return subject
+
+    def _property(self, subject: str, element: ET.Element, lang: Optional[str]):
+        lang = element.get(XML_LANG, lang)
+        predicate = self._iri(element.tag)
+        resource = element.get(f'{{{RDF}}}resource')
+        node_id = element.get(f'{{{RDF}}}nodeID')
+        parse_type = element.get(f'{{{RDF}}}parseType')
+
+        if resource is not None:
+            obj = resource
+        elif node_id is not None:
+            obj = BNode(f"_:{node_id}")
+        elif parse_type == 'Collection':
+            obj = self._collection([self._node(child, lang) for child in element])
+        elif parse_type == 'Resource':
+            obj = self._fresh_bnode()
+            for child in element:
+                self._property(obj, child, lang)
+        elif parse_type == 'Literal':
+            inner = (element.text or '') + ''.join(
+                ET.tostring(child, encoding='unicode') for child in element)
+            obj = Literal(inner, datatype=RDF + 'XMLLiteral')
+        elif len(element):
+            obj = self._node(element[0], lang)
+        else:
+            datatype = element.get(f'{{{RDF}}}datatype')
+            text = element.text or ''
+            obj = Literal(text, datatype=datatype) if datatype else Literal(text, language=lang)
+        self.triples.append((subject, predicate, obj))
+
+    def _collection(self, items: List[str]) -> str:
+        if not items:
+            return RDF_NIL
+        head = node = self._fresh_bnode()
+        for i, item in enumerate(items):
+            self.triples.append((node, RDF_FIRST, item))
+            rest = self._fresh_bnode() if i + 1 < len(items) else RDF_NIL
+            self.triples.append((node, RDF_REST, rest))
+            node = rest
+        return head
+
+
+def read_rdfxml(file_path: str) -> List[Triple]:
+    """Parse an RDF/XML file into a list of triples"""
+    root = ET.parse(file_path).getroot()
+    return RDFXMLReader().read(root)
+
+
+# ============================================================================
+# Ontology model
+# ============================================================================
+
+# Term kinds
+KIND_CLASS = 1
+KIND_OBJECT_PROPERTY = 2
+KIND_DATATYPE_PROPERTY = 3
+KIND_ANNOTATION_PROPERTY = 4
+KIND_PROPERTY = 5
+
+KIND_NAMES = {
+    KIND_CLASS: 'class',
+    KIND_OBJECT_PROPERTY: 'objectProperty',
+    KIND_DATATYPE_PROPERTY: 'datatypeProperty',
+    KIND_ANNOTATION_PROPERTY: 'annotationProperty',
+    KIND_PROPERTY: 'property',
+}
+
+TYPE_KINDS = {
+    OWL + 'Class': KIND_CLASS,
+    RDFS + 'Class': KIND_CLASS,
+    OWL + 'ObjectProperty': KIND_OBJECT_PROPERTY,
+    OWL + 'DatatypeProperty': KIND_DATATYPE_PROPERTY,
+    OWL + 'AnnotationProperty': KIND_ANNOTATION_PROPERTY,
+    RDF + 'Property': KIND_PROPERTY,
+}
+
+# Fact fields; `aux` is the language (labels, comments), the value class
+# (restrictions) or the SKOS relation (concepts)
+FIELD_LABEL = 1
+FIELD_COMMENT = 2
+FIELD_DOMAIN = 3
+FIELD_RANGE = 4
+FIELD_SUPER = 5
+FIELD_EQUIVALENT = 6
+FIELD_RESTRICTION = 7
+FIELD_CONCEPT = 8
+
+LABEL_PREDICATES = (RDFS + 'label', SKOS + 'prefLabel')
+COMMENT_PREDICATES = (RDFS + 'comment', SKOS + 'definition')
+SUPER_PREDICATES = (RDFS + 'subClassOf', RDFS + 'subPropertyOf')
+EQUIVALENT_PREDICATES = (OWL + 'equivalentClass', OWL + 'equivalentProperty')
+CONCEPT_PREDICATES = (
+    DCTERMS + 'subject',
+    SKOS + 'exactMatch', SKOS + 'closeMatch', SKOS + 'broadMatch',
+    SKOS + 'narrowMatch', SKOS + 'relatedMatch',
+    SKOS + 'broader', SKOS + 'narrower', SKOS + 'related',
+)
+RESTRICTION_VALUES = (OWL + 'someValuesFrom', OWL + 'allValuesFrom',
+                      OWL + 'hasValue', OWL + 'onClass', OWL + 'onDataRange')
+
+
+def local_name(iri: str) -> str:
+    """Last segment of an IRI (after '#' or '/')"""
+    return iri.rstrip('/#').rsplit('#', 1)[-1].rsplit('/', 1)[-1]
+
+
+def _group_by_subject(triples: List[Triple]) -> Dict[str, Dict[str, List[str]]]:
+    records: Dict[str, Dict[str, List[str]]] = {}
+    for subject, predicate, obj in triples:
+        records.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+    return records
+
+
+def _list_items(records: Dict, node: str) -> Iterator[str]:
+    while node != RDF_NIL and node in records:
+        record = records[node]
+        yield from record.get(RDF_FIRST, [])
+        node = record.get(RDF_REST, [RDF_NIL])[0]
+
+
+def _restrictions(records: Dict, node: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (property, value class) pairs from a class expression"""
+    record = records.get(node)
+    if record is None or not isinstance(node, BNode):
+        return
+    for prop in record.get(OWL + 'onProperty', []):
+        values = [v for p in RESTRICTION_VALUES for v in record.get(p, [])
+                  if not isinstance(v, BNode)]
+        if values:
+            for value in values:
+                yield prop, value
+        else:
+            yield prop, None
+    for operand_list in record.get(OWL + 'intersectionOf', []):
+        for operand in _list_items(records, operand_list):
+            yield from _restrictions(records, operand)
+
+
+def build_terms(triples: List[Triple]) -> Tuple[str, List[Dict]]:
+    """Collect named classes and properties; return (ontology IRI, terms)
+
+    Each term is {'iri', 'name', 'kind', 'defined', 'facts': [(field, aux, value)]}.
+    Property domains are taken from rdfs:domain and, since KTDDE models
+    them as class restrictions, from every class restricting the property.
+    """
+    records = _group_by_subject(triples)
+    ontology_iri = next((s for s, p, o in triples
+                         if p == RDF_TYPE and o == OWL + 'Ontology'), '')
+
+    terms: Dict[str, Dict] = {}
+    for subject, record in records.items():
+        if isinstance(subject, BNode):
+            continue
+        kinds = [TYPE_KINDS[t] for t in record.get(RDF_TYPE, []) if t in TYPE_KINDS]
+        if not kinds:
+            continue
+        identifier = record.get(DCTERMS + 'identifier')
+        defined_by = record.get(RDFS + 'isDefinedBy', [])
+        terms[subject] = {
+            'iri': subject,
+            'name': str(identifier[0]) if identifier else local_name(subject),
+            'kind': min(kinds),
+            'defined': ontology_iri in defined_by,
+            'facts': [],
+        }
+
+    derived_domains: Dict[str, List[str]] = {}
+    for iri, term in terms.items():
+        record = records[iri]
+        facts = term['facts']
+        for predicate in LABEL_PREDICATES:
+            for label in record.get(predicate, []):
+                facts.append((FIELD_LABEL, getattr(label, 'language', None) or '', str(label)))
+        for predicate in COMMENT_PREDICATES:
+            for comment in record.get(predicate, []):
+                facts.append((FIELD_COMMENT, getattr(comment, 'language', None) or '', str(comment)))
+        for domain in record.get(RDFS + 'domain', []):
+            if not isinstance(domain, BNode):
+                facts.append((FIELD_DOMAIN, None, domain))
+        for range_ in record.get(RDFS + 'range', []):
+            if not isinstance(range_, BNode):
+                facts.append((FIELD_RANGE, None, range_))
+        for predicate in SUPER_PREDICATES + EQUIVALENT_PREDICATES:
+            field = FIELD_SUPER if predicate in SUPER_PREDICATES else FIELD_EQUIVALENT
+            for target in record.get(predicate, []):
+                if not isinstance(target, BNode):
+                    facts.append((field, None, target))
+                    continue
+                for prop, value in _restrictions(records, target):
+                    facts.append((FIELD_RESTRICTION, value, prop))
+                    derived_domains.setdefault(prop, []).append(iri)
+        for predicate in CONCEPT_PREDICATES:
+            for concept in record.get(predicate, []):
+                facts.append((FIELD_CONCEPT, predicate, str(concept)))
+
+    for prop, classes in derived_domains.items():
+        term = terms.get(prop)
+        if term is None:
+            continue
+        known = {v for f, _, v in term['facts'] if f == FIELD_DOMAIN}
+        for cls in dict.fromkeys(classes):
+            if cls not in known:
+                term['facts'].append((FIELD_DOMAIN, None, cls))
+
+    for term in terms.values():
+        term['facts'] = list(dict.fromkeys(term['facts']))
+
+    # Ontology-defined terms first, so they win local-name lookups
+    ordered = sorted(terms.values(), key=lambda t: (not t['defined'], t['iri']))
+    return ontology_iri, ordered
+
+
+# ============================================================================
+# Binary snapshot
+# ============================================================================
+#
+# All integers little-endian; strings are referenced by index into the
+# string table.
+#
+#   header   MAGIC, version, sha256(source), ontology IRI sid,
+#            counts and section offsets (see HEADER)
+#   strings  u32 offsets[n + 1] followed by the UTF-8 blob
+#   terms    TERM records: iri sid, name sid, kind, flags, first fact, fact count
+#   facts    FACT records: field, aux sid (or NONE), value sid
+#   tables   two open-addressing hash tables (IRI, local name) of u32 slots
+#            holding term index + 1 (0 = empty); CRC32 hash, linear probing
+
+MAGIC = b'KTDDEONT'
+FORMAT_VERSION = 1
+NONE = 0xFFFFFFFF
+
+HEADER = struct.Struct('<8sI32sI11I')
+TERM = struct.Struct('<IIBBxxII')
+FACT = struct.Struct('<BxxxII')
+SLOT = struct.Struct('<I')
+
+FLAG_DEFINED = 1
+
+
+def source_digest(file_path: str) -> bytes:
+    """SHA-256 of the source file (snapshot validity key)"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _hash_key(key: str) -> int:
+    return zlib.crc32(key.encode('utf-8'))
+
+
+def _table_size(count: int) -> int:
+    size = 8
+    while size < count * 2:
+        size *= 2
+    return size
+
+
+def _build_table(keys: List[Tuple[str, int]]) -> List[int]:
+    slots = [0] * _table_size(len(keys))
+    mask = len(slots) - 1
+    for key, term_index in keys:
+        slot = _hash_key(key) & mask
+        while slots[slot]:
+            slot = (slot + 1) & mask
+        slots[slot] = term_index + 1
+    return slots
+
+
+def build_snapshot(rdf_path: str) -> bytes:
+    """Parse the RDF/XML source and serialize it to snapshot bytes"""
+    digest = source_digest(rdf_path)
+    ontology_iri, terms = build_terms(read_rdfxml(rdf_path))
+
+    strings: Dict[str, int] = {}
+
+    def sid(value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    ontology_sid = sid(ontology_iri)
+    term_bytes = bytearray()
+    fact_bytes = bytearray()
+    fact_count = 0
+    iri_keys = []
+    name_keys = []
+    for index, term in enumerate(terms):
+        flags = FLAG_DEFINED if term['defined'] else 0
+        term_bytes += TERM.pack(sid(term['iri']), sid(term['name']), term['kind'],
+                                flags, fact_count, len(term['facts']))
+        for field, aux, value in term['facts']:
+            fact_bytes += FACT.pack(field, sid(aux), sid(value))
+        fact_count += len(term['facts'])
+        iri_keys.append((term['iri'], index))
+        if term['defined']:
+            name_keys.append((term['name'], index))
+            if term['name'] != local_name(term['iri']):
+                name_keys.append((local_name(term['iri']), index))
+
+    blob = bytearray()
+    offsets = [0]
+    for value in strings:
+        blob += value.encode('utf-8')
+        offsets.append(len(blob))
+    string_offsets = struct.pack(f'<{len(offsets)}I', *offsets)
+
+    iri_table = _build_table(iri_keys)
+    name_table = _build_table(name_keys)
+
+    sections = [
+        string_offsets, bytes(blob), bytes(term_bytes), bytes(fact_bytes),
+        struct.pack(f'<{len(iri_table)}I', *iri_table),
+        struct.pack(f'<{len(name_table)}I', *name_table),
+    ]
+    position = HEADER.size
+    section_offsets = []
+    for section in sections:
+        section_offsets.append(position)
+        position += len(section)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, digest, ontology_sid,
+                         len(strings), len(terms), fact_count,
+                         len(iri_table), len(name_table), *section_offsets)
+    return header + b''.join(sections)
+
+
+def default_snapshot_path(rdf_path: str) -> str:
+    return str(rdf_path) + '.snapshot'
+
+
+def write_snapshot(rdf_path: str, snapshot_path: str) -> bytes:
+    """Build the snapshot and write it atomically; return its bytes"""
+    data = build_snapshot(rdf_path)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(snapshot_path) + '.', suffix='.tmp',
+                                    dir=os.path.dirname(os.path.abspath(snapshot_path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates it 0600; the snapshot is a shared cache
+        os.replace(tmp_path, snapshot_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return data
+
+
+# ============================================================================
+# Service
+# ============================================================================
+
+class KTDDEOntology:
+    """Lookups over a memory-mapped ontology snapshot
+
+    Nothing is read until the first lookup. The snapshot is reused while
+    its recorded SHA-256 matches the RDF source, otherwise it is rebuilt
+    (in memory only, if the snapshot location is not writable).
+    """
+
+    def __init__(self, rdf_path: str = str(DEFAULT_RDF), snapshot_path: Optional[str] = None):
+        self.rdf_path = str(rdf_path)
+        self.snapshot_path = snapshot_path or default_snapshot_path(self.rdf_path)
+        self._buffer = None
+        self._mmap = None
+        self.rebuilt = False
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _open(self):
+        if self._buffer is not None:
+            return
+        mapped = self._map_snapshot(source_digest(self.rdf_path))
+        if mapped is not None:
+            self._attach(mapped)
+            return
+
+        self.rebuilt = True
+        try:
+            write_snapshot(self.rdf_path, self.snapshot_path)
+        except OSError:
+            self._attach(build_snapshot(self.rdf_path))
+            return
+        with open(self.snapshot_path, 'rb') as f:
+            self._attach(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _map_snapshot(self, digest: bytes):
+        """The snapshot file, memory-mapped, if it is complete and built from this source"""
+        try:
+            f = open(self.snapshot_path, 'rb')
+        except OSError:
+            return None
+        with f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:  # empty or cut short; mmap of 0 bytes fails
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._valid(mapped, digest):
+            return mapped
+        mapped.close()
+        return None
+
+    @staticmethod
+    def _valid(buffer, digest: bytes) -> bool:
+        if len(buffer) < HEADER.size:
+            return False
+        header = HEADER.unpack_from(buffer, 0)
+        magic, version, snapshot_digest = header[:3]
+        name_slots, name_at = header[8], header[14]  # the last section ends the file
+        return (magic == MAGIC and version == FORMAT_VERSION and snapshot_digest == digest
+                and len(buffer) == name_at + SLOT.size * name_slots)
+
+    def _attach(self, buffer):
+        header = HEADER.unpack_from(buffer, 0)
+        (_, _, _, self._ontology_sid, self._n_strings, self.term_count, _,
+         self._iri_slots, self._name_slots, self._strings_at, self._blob_at,
+         self._terms_at, self._facts_at, self._iri_at, self._name_at) = header
+        if isinstance(buffer, mmap.mmap):
+            self._mmap = buffer
+        self._buffer = buffer
+
+    def close(self):
+        """Release the memory map"""
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = None
+        self._buffer = None
+
+    # ------------------------------------------------------------------
+    # Raw access
+    # ------------------------------------------------------------------
+
+    def _string(self, string_id: int) -> Optional[str]:
+        if string_id == NONE:
+            return None
+        start, end = struct.unpack_from('<II', self._buffer, self._strings_at + 4 * string_id)
+        return bytes(self._buffer[self._blob_at + start:self._blob_at + end]).decode('utf-8')
+
+    def _term_record(self, index: int) -> Tuple[int, int, int, int, int, int]:
+        return TERM.unpack_from(self._buffer, self._terms_at + TERM.size * index)
+
+    def _probe(self, table_at: int, slots: int, key: str, name_sid_field: int) -> Iterator[int]:
+        """Yield term indexes whose key (IRI or name) equals `key`"""
+        mask = slots - 1
+        slot = _hash_key(key) & mask
+        encoded = key.encode('utf-8')
+        while True:
+            entry = SLOT.unpack_from(self._buffer, table_at + 4 * slot)[0]
+            if not entry:
+                return
+            record = self._term_record(entry - 1)
+            string_id = record[name_sid_field]
+            start, end = struct.unpack_from('<II', self._buffer, self._strings_at + 4 * string_id)
+            if self._buffer[self._blob_at + start:self._blob_at + end] == encoded:
+                yield entry - 1
+            elif name_sid_field == 1 and local_name(self._string(record[0])) == key:
+                yield entry - 1
+            slot = (slot + 1) & mask
+
+    def _find(self, key: str) -> Optional[int]:
+        self._open()
+        for index in self._probe(self._iri_at, self._iri_slots, key, 0):
+            return index
+        for index in self._probe(self._name_at, self._name_slots, key, 1):
+            return index
+        return None
+
+    def _facts(self, index: int, field: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        record = self._term_record(index)
+        first, count = record[4], record[5]
+        for i in range(first, first + count):
+            fact = FACT.unpack_from(self._buffer, self._facts_at + FACT.size * i)
+            if field is None or fact[0] == field:
+                yield fact
+
+    def _values(self, key: str, field: int) -> List[str]:
+        index = self._find(key)
+        if index is None:
+            return []
+        return [self._string(value) for _, _, value in self._facts(index, field)]
+
+    # ------------------------------------------------------------------
+    # Public lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def ontology_iri(self) -> str:
+        self._open()
+        return self._string(self._ontology_sid)
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) is not None
+
+    def __len__(self) -> int:
+        self._open()
+        return self.term_count
+
+    def resolve(self, key: str) -> Optional[str]:
+        """Full IRI for an IRI or local name, or None if unknown"""
+        index = self._find(key)
+        return None if index is None else self._string(self._term_record(index)[0])
+
+    def kind(self, key: str) -> Optional[str]:
+        """'class', 'objectProperty', 'datatypeProperty', ..."""
+        index = self._find(key)
+        return None if index is None else KIND_NAMES.get(self._term_record(index)[2])
+
+    def label(self, key: str, lang: str = 'en') -> Optional[str]:
+        """Label in `lang`, else an untagged or any label"""
+        index = self._find(key)
+        if index is None:
+            return None
+        fallback = None
+        for _, aux, value in self._facts(index, FIELD_LABEL):
+            language = self._string(aux)
+            if language == lang:
+                return self._string(value)
+            if fallback is None or not language:
+                fallback = value
+        return None if fallback is None else self._string(fallback)
+
+    def domains(self, key: str) -> List[str]:
+        return self._values(key, FIELD_DOMAIN)
+
+    def ranges(self, key: str) -> List[str]:
+        return self._values(key, FIELD_RANGE)
+
+    def super_terms(self, key: str) -> List[str]:
+        return self._values(key, FIELD_SUPER)
+
+    def concepts(self, key: str) -> List[str]:
+        """Linked terminology / SKOS concepts"""
+        return self._values(key, FIELD_CONCEPT)
+
+    def term(self, key: str) -> Optional[Dict]:
+        """All facts about a term as a JSON-serializable dict"""
+        index = self._find(key)
+        if index is None:
+            return None
+        iri_sid, name_sid, kind, flags, _, _ = self._term_record(index)
+        result = {
+            'iri': self._string(iri_sid),
+            'name': self._string(name_sid),
+            'kind': KIND_NAMES.get(kind),
+            'definedInOntology': bool(flags & FLAG_DEFINED),
+            'labels': {},
+            'comments': {},
+            'domains': [],
+            'ranges': [],
+            'superTerms': [],
+            'equivalents': [],
+            'restrictions': [],
+            'concepts': [],
+        }
+        list_fields = {FIELD_DOMAIN: 'domains', FIELD_RANGE: 'ranges',
+                       FIELD_SUPER: 'superTerms', FIELD_EQUIVALENT: 'equivalents'}
+        for field, aux, value in self._facts(index):
+            if field in (FIELD_LABEL, FIELD_COMMENT):
+                key_name = 'labels' if field == FIELD_LABEL else 'comments'
+                result[key_name].setdefault(self._string(aux), self._string(value))
+            elif field in list_fields:
+                result[list_fields[field]].append(self._string(value))
+            elif field == FIELD_RESTRICTION:
+                result['restrictions'].append({'property': self._string(value),
+                                               'valuesFrom': self._string(aux)})
+            elif field == FIELD_CONCEPT:
+                result['concepts'].append({'relation': self._string(aux),
+                                           'iri': self._string(value)})
+        return result
+
+    def iter_terms(self) -> Iterator[Tuple[str, str, str]]:
+        """Yield (iri, name, kind) for every term"""
+        self._open()
+        for index in range(self.term_count):
+            iri_sid, name_sid, kind = self._term_record(index)[:3]
+            yield self._string(iri_sid), self._string(name_sid), KIND_NAMES.get(kind)
+
+
+_default_ontology: Optional[KTDDEOntology] = None
+
+
+def get_ontology() -> KTDDEOntology:
+    """Shared service for the default KTDDE ontology (opened on first lookup)"""
+    global _default_ontology
+    if _default_ontology is None:
+        _default_ontology = KTDDEOntology()
+    return _default_ontology
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0] not in ('build', 'lookup', 'stats'):
+        print(__doc__)
+        sys.exit(1)
+
+    command, args = args[0], args[1:]
+    rdf_path = str(DEFAULT_RDF)
+    snapshot_path = None
+    keys = []
+    while args:
+        arg = args.pop(0)
+        if arg == '--rdf' and args:
+            rdf_path = args.pop(0)
+        elif arg == '--snapshot' and args:
+            snapshot_path = args.pop(0)
+        else:
+            keys.append(arg)
+    snapshot_path = snapshot_path or default_snapshot_path(rdf_path)
+
+    if command == 'build':
+        start = time.perf_counter()
+        data = write_snapshot(rdf_path, snapshot_path)
+        elapsed = time.perf_counter() - start
+        ontology = KTDDEOntology(rdf_path, snapshot_path)
+        print(f"✅ {snapshot_path}")
+        print(f"   {len(ontology)} terms, {len(data) / 1024:.0f} KB, built in {elapsed * 1000:.0f} ms")
+        return
+
+    if command == 'lookup':
+        ontology = KTDDEOntology(rdf_path, snapshot_path)
+        for key in keys:
+            term = ontology.term(key)
+            if term is None:
+                print(f"❌ Unknown term: {key}")
+                continue
+            print(json.dumps(term, indent=2, ensure_ascii=False))
+        return
+
+    # stats: cold parse vs snapshot open, and lookup cost
+    start = time.perf_counter()
+    _, terms = build_terms(read_rdfxml(rdf_path))
+    parse_ms = (time.perf_counter() - start) * 1000
+
+    ontology = KTDDEOntology(rdf_path, snapshot_path)
+    start = time.perf_counter()
+    ontology._open()
+    open_ms = (time.perf_counter() - start) * 1000
+    state = 'rebuilt' if ontology.rebuilt else 'memory-mapped'
+
+    names = [name for _, name, _ in ontology.iter_terms()]
+    start = time.perf_counter()
+    for name in names:
+        ontology.label(name)
+    lookup_us = (time.perf_counter() - start) * 1e6 / max(len(names), 1)
+
+    kinds: Dict[str, int] = {}
+    for term in terms:
+        kinds[KIND_NAMES[term['kind']]] = kinds.get(KIND_NAMES[term['kind']], 0) + 1
+
+    print(f"Ontology:        {ontology.ontology_iri}")
+    print(f"Terms:           {len(ontology)} " +
+          ', '.join(f"{count} {kind}" for kind, count in sorted(kinds.items())))
+    print(f"Snapshot:        {snapshot_path} "
+          f"({os.path.getsize(snapshot_path) / 1024:.0f} KB)")
+    print(f"RDF/XML parse:   {parse_ms:.1f} ms")
+    print(f"Snapshot open:   {open_ms:.1f} ms ({state})")
+    print(f"label() lookup:  {lookup_us:.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
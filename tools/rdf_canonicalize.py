@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+RDF Dataset Canonicalization (RDFC-1.0) for Data Integrity proofs (no dependencies)
+
+Turns a JSON-LD credential into canonical N-Quads, the input that the
+eddsa-rdfc-2022 cryptosuite hashes and signs:
+
+1. Expansion through JsonLdProcessor, so processed contexts are reused
+   across credentials (see jsonld_processor.py)
+2. JSON-LD → RDF deserialization (node map generation, lists, literals)
+3. RDFC-1.0 blank node labelling and canonical N-Quads serialization
+
+Tuned for credential-shaped graphs:
+- No blank nodes: the quads are serialized and sorted directly
+- All first-degree hashes unique (the common case): canonical labels are
+  issued straight from the sorted hashes; Hash N-Degree Quads never runs
+- Otherwise Hash N-Degree Quads results are memoized per (blank node,
+  issuer state), and a call budget guards against poison graphs
+
+Terms are kept in their N-Quads form ('<iri>', '_:b0', '"lit"^^<dt>')
+so quads are serialized and hashed without re-encoding.
+
+Usage:
+    from rdf_canonicalize import canonicalize_document
+    nquads = canonicalize_document(credential)
+
+    python3 tools/rdf_canonicalize.py credential.jsonld
+"""
+
+import hashlib
+import json
+import re
+import sys
+from itertools import permutations
+from typing import Any, Dict, List, Optional, Tuple
+
+from jsonld_processor import JsonLdProcessor, get_processor
+
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+RDF_TYPE = f"<{RDF}type>"
+RDF_FIRST = f"<{RDF}first>"
+RDF_REST = f"<{RDF}rest>"
+RDF_NIL = f"<{RDF}nil>"
+RDF_LANG_STRING = f"{RDF}langString"
+RDF_JSON = f"{RDF}JSON"
+XSD_STRING = f"{XSD}string"
+XSD_BOOLEAN = f"{XSD}boolean"
+XSD_INTEGER = f"{XSD}integer"
+XSD_DOUBLE = f"{XSD}double"
+
+# Upper bound on Hash N-Degree Quads calls per dataset
+DEFAULT_MAX_CALLS = 10000
+
+Quad = Tuple[str, str, str, str]  # subject, predicate, object, graph ('' = default)
+
+_ABSOLUTE_IRI = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*:')
+_NEEDS_ESCAPE = re.compile(r'[\x00-\x1f\x7f"\\]')
+_ECHARS = {'\b': '\\b', '\t': '\\t', '\n': '\\n', '\f': '\\f', '\r': '\\r',
+           '"': '\\"', '\\': '\\\\'}
+
+
+class CanonicalizationError(ValueError):
+    """Raised when a dataset exceeds the canonicalization call budget"""
+
+
+def _escape_char(match: 're.Match') -> str:
+    char = match.group(0)
+    return _ECHARS.get(char) or f"\\u{ord(char):04X}"
+
+
+def literal(value: str, datatype: str = XSD_STRING, language: Optional[str] = None) -> str:
+    """N-Quads form of a literal"""
+    if _NEEDS_ESCAPE.search(value):
+        value = _NEEDS_ESCAPE.sub(_escape_char, value)
+    if language:
+        return f'"{value}"@{language}'
+    if datatype == XSD_STRING:
+        return f'"{value}"'
+    return f'"{value}"^^<{datatype}>'
+
+
+def serialize_quad(quad: Quad) -> str:
+    subject, predicate, obj, graph = quad
+    if graph:
+        return f"{subject} {predicate} {obj} {graph} .\n"
+    return f"{subject} {predicate} {obj} .\n"
+
+
+def _canonical_double(value: float) -> str:
+    return re.sub(r'(\d)0*E\+?(-)?0*(\d)', r'\1E\2\3', f'{value:1.15E}')
+
+
+# ============================================================================
+# JSON-LD → RDF
+# ============================================================================
+
+class _LabelIssuer:
+    """Blank node labeller for deserialization (_:b0, _:b1, ...)"""
+
+    def __init__(self):
+        self.labels: Dict[str, str] = {}
+        self.counter = 0
+
+    def __call__(self, existing: Optional[str] = None) -> str:
+        if existing is not None and existing in self.labels:
+            return self.labels[existing]
+        label = f"_:b{self.counter}"
+        self.counter += 1
+        if existing is not None:
+            self.labels[existing] = label
+        return label
+
+
+def _add_unique(values: List[Any], item: Any):
+    if item not in values:
+        values.append(item)
+
+
+def _node_map(element: Any, graphs: Dict[str, Dict], issuer: _LabelIssuer,
+              graph: str = '@default', subject: Any = None,
+              prop: Optional[str] = None, list_: Optional[Dict] = None):
+    """JSON-LD 1.1 Node Map Generation"""
+    if isinstance(element, list):
+        for item in element:
+            _node_map(item, graphs, issuer, graph, subject, prop, list_)
+        return
+
+    graph_map = graphs.setdefault(graph, {})
+    subject_node = graph_map.get(subject) if isinstance(subject, str) else None
+
+    if '@value' in element:
+        if list_ is None:
+            _add_unique(subject_node.setdefault(prop, []), element)
+        else:
+            list_['@list'].append(element)
+        return
+
+    if '@list' in element:
+        result = {'@list': []}
+        _node_map(element['@list'], graphs, issuer, graph, subject, prop, result)
+        if list_ is None:
+            subject_node.setdefault(prop, []).append(result)
+        else:
+            list_['@list'].append(result)
+        return
+
+    node_id = element.get('@id')
+    if node_id is None:
+        node_id = issuer()
+    elif node_id.startswith('_:'):
+        node_id = issuer(node_id)
+    node = graph_map.setdefault(node_id, {'@id': node_id})
+
+    if isinstance(subject, dict):
+        # Reverse property: the referenced node points at the active subject
+        _add_unique(node.setdefault(prop, []), subject)
+    elif prop is not None:
+        reference = {'@id': node_id}
+        if list_ is None:
+            _add_unique(subject_node.setdefault(prop, []), reference)
+        else:
+            list_['@list'].append(reference)
+
+    for node_type in element.get('@type', []):
+        if node_type.startswith('_:'):
+            node_type = issuer(node_type)
+        _add_unique(node.setdefault('@type', []), node_type)
+
+    if '@reverse' in element:
+        referenced = {'@id': node_id}
+        for reverse_prop, values in element['@reverse'].items():
+            for value in values:
+                _node_map(value, graphs, issuer, graph, referenced, reverse_prop)
+
+    if '@graph' in element:
+        _node_map(element['@graph'], graphs, issuer, node_id)
+
+    if '@included' in element:
+        _node_map(element['@included'], graphs, issuer, graph)
+
+    for key, value in element.items():
+        if key.startswith('@'):
+            continue
+        if key.startswith('_:'):
+            key = issuer(key)
+        node.setdefault(key, [])
+        _node_map(value, graphs, issuer, graph, node_id, key)
+
+
+def _iri_term(iri: str) -> Optional[str]:
+    if iri.startswith('_:'):
+        return iri
+    if _ABSOLUTE_IRI.match(iri):
+        return f"<{iri}>"
+    return None
+
+
+def _object_term(item: Dict[str, Any], quads: List[Quad], graph: str,
+                 issuer: _LabelIssuer) -> Optional[str]:
+    if '@id' in item and '@value' not in item:
+        return _iri_term(item['@id'])
+
+    if '@list' in item:
+        return _list_term(item['@list'], quads, graph, issuer)
+
+    value = item['@value']
+    datatype = item.get('@type')
+    if datatype is not None and not _ABSOLUTE_IRI.match(datatype) and datatype != '@json':
+        return None
+    if datatype == '@json':
+        return literal(json.dumps(value, sort_keys=True, separators=(',', ':'),
+                                  ensure_ascii=False), RDF_JSON)
+    if isinstance(value, bool):
+        return literal('true' if value else 'false', datatype or XSD_BOOLEAN)
+    if isinstance(value, float) and not value.is_integer():
+        return literal(_canonical_double(value), datatype or XSD_DOUBLE)
+    if isinstance(value, (int, float)):
+        if abs(value) >= 1e21:
+            return literal(_canonical_double(value), datatype or XSD_DOUBLE)
+        if datatype == XSD_DOUBLE:
+            return literal(_canonical_double(value), datatype)
+        return literal(str(int(value)), datatype or XSD_INTEGER)
+    if '@language' in item:
+        return literal(value, RDF_LANG_STRING, item['@language'])
+    if datatype == XSD_DOUBLE:
+        try:
+            return literal(_canonical_double(float(value)), datatype)
+        except ValueError:
+            pass
+    return literal(value, datatype or XSD_STRING)
+
+
+def _list_term(items: List[Dict], quads: List[Quad], graph: str,
+               issuer: _LabelIssuer) -> str:
+    if not items:
+        return RDF_NIL
+    head = node = issuer()
+    for i, item in enumerate(items):
+        obj = _object_term(item, quads, graph, issuer)
+        if obj is not None:
+            quads.append((node, RDF_FIRST, obj, graph))
+        rest = issuer() if i + 1 < len(items) else RDF_NIL
+        quads.append((node, RDF_REST, rest, graph))
+        node = rest
+    return head
+
+
+def to_quads(expanded: List[Dict[str, Any]]) -> List[Quad]:
+    """Deserialize expanded JSON-LD into a list of unique quads"""
+    issuer = _LabelIssuer()
+    graphs: Dict[str, Dict] = {'@default': {}}
+    _node_map(expanded, graphs, issuer)
+
+    quads: List[Quad] = []
+    for graph_name, graph in graphs.items():
+        if graph_name == '@default':
+            graph_term = ''
+        else:
+            graph_term = _iri_term(graph_name)
+            if graph_term is None:
+                continue
+        for subject_id, node in graph.items():
+            subject = _iri_term(subject_id)
+            if subject is None:
+                continue
+            for prop, values in node.items():
+                if prop == '@type':
+                    for node_type in values:
+                        obj = _iri_term(node_type)
+                        if obj is not None:
+                            quads.append((subject, RDF_TYPE, obj, graph_term))
+                    continue
+                if prop.startswith('@') or prop.startswith('_:'):
+                    continue
+                predicate = _iri_term(prop)
+                if predicate is None:
+                    continue
+                for item in values:
+                    obj = _object_term(item, quads, graph_term, issuer)
+                    if obj is not None:
+                        quads.append((subject, predicate, obj, graph_term))
+    return list(dict.fromkeys(quads))
+
+
+# ============================================================================
+# RDFC-1.0
+# ============================================================================
+
+class IdentifierIssuer:
+    """Issues sequential identifiers (prefix + counter), remembering order"""
+    __slots__ = ('prefix', 'issued')
+
+    def __init__(self, prefix: str, issued: Optional[Dict[str, str]] = None):
+        self.prefix = prefix
+        self.issued: Dict[str, str] = dict(issued) if issued else {}
+
+    def issue(self, existing: str) -> str:
+        issued = self.issued.get(existing)
+        if issued is None:
+            issued = self.issued[existing] = f"{self.prefix}{len(self.issued)}"
+        return issued
+
+    def copy(self) -> 'IdentifierIssuer':
+        return IdentifierIssuer(self.prefix, self.issued)
+
+
+def _sha256(data: str) -> str:
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class Canonicalizer:
+    """RDFC-1.0 canonicalization of one dataset
+
+    After canonicalize(), `ambiguous` counts the blank nodes that needed
+    Hash N-Degree Quads and `calls` the (non-memoized) calls it made.
+    """
+
+    def __init__(self, quads: List[Quad], max_calls: int = DEFAULT_MAX_CALLS,
+                 memoize: bool = True):
+        self.quads = quads
+        self.max_calls = max_calls
+        self.memoize = memoize
+        self.calls = 0
+        self.ambiguous = 0
+        self.canonical = IdentifierIssuer('_:c14n')
+        self.bnode_quads: Dict[str, List[Quad]] = {}
+        self._first_degree: Dict[str, str] = {}
+        self._memo: Dict[tuple, Tuple[str, IdentifierIssuer]] = {}
+
+    def _hash_first_degree(self, bnode: str) -> str:
+        lines = []
+        for quad in self.bnode_quads[bnode]:
+            lines.append(serialize_quad(tuple(
+                term if not term.startswith('_:') else ('_:a' if term == bnode else '_:z')
+                for term in quad)))
+        lines.sort()
+        return _sha256(''.join(lines))
+
+    def _hash_related(self, related: str, quad: Quad, issuer: IdentifierIssuer,
+                      position: str) -> str:
+        identifier = self.canonical.issued.get(related) or issuer.issued.get(related) \
+            or self._first_degree[related]
+        data = position
+        if position != 'g':
+            data += quad[1]
+        return _sha256(data + identifier)
+
+    def _hash_n_degree(self, identifier: str,
+                       issuer: IdentifierIssuer) -> Tuple[str, IdentifierIssuer]:
+        key = None
+        if self.memoize:
+            key = (identifier, len(self.canonical.issued), tuple(issuer.issued.items()))
+            cached = self._memo.get(key)
+            if cached is not None:
+                return cached[0], cached[1].copy()
+
+        self.calls += 1
+        if self.calls > self.max_calls:
+            raise CanonicalizationError(
+                f"Hash N-Degree Quads exceeded {self.max_calls} calls")
+
+        related_by_hash: Dict[str, List[str]] = {}
+        for quad in self.bnode_quads[identifier]:
+            for term, position in ((quad[0], 's'), (quad[2], 'o'), (quad[3], 'g')):
+                if term.startswith('_:') and term != identifier:
+                    related_hash = self._hash_related(term, quad, issuer, position)
+                    related_by_hash.setdefault(related_hash, []).append(term)
+
+        data = ''
+        for related_hash in sorted(related_by_hash):
+            data += related_hash
+            chosen_path = ''
+            chosen_issuer = None
+            for permutation in permutations(related_by_hash[related_hash]):
+                issuer_copy = issuer.copy()
+                path = ''
+                recursion = []
+                skip = False
+                for related in permutation:
+                    if related in self.canonical.issued:
+                        path += self.canonical.issued[related]
+                    else:
+                        if related not in issuer_copy.issued:
+                            recursion.append(related)
+                        path += issuer_copy.issue(related)
+                    if chosen_path and len(path) >= len(chosen_path) and path > chosen_path:
+                        skip = True
+                        break
+                if skip:
+                    continue
+                for related in recursion:
+                    result_hash, result_issuer = self._hash_n_degree(related, issuer_copy)
+                    path += issuer_copy.issue(related)
+                    path += f"<{result_hash}>"
+                    issuer_copy = result_issuer
+                    if chosen_path and len(path) >= len(chosen_path) and path > chosen_path:
+                        skip = True
+                        break
+                if skip:
+                    continue
+                if not chosen_path or path < chosen_path:
+                    chosen_path = path
+                    chosen_issuer = issuer_copy
+            data += chosen_path
+            issuer = chosen_issuer
+
+        result = (_sha256(data), issuer)
+        if key is not None:
+            self._memo[key] = (result[0], issuer.copy())
+        return result
+
+    def canonical_labels(self) -> Dict[str, str]:
+        """Map every blank node to its canonical _:c14nN label"""
+        for quad in self.quads:
+            for term in (quad[0], quad[2], quad[3]):
+                if term.startswith('_:'):
+                    quads = self.bnode_quads.setdefault(term, [])
+                    if not quads or quads[-1] is not quad:
+                        quads.append(quad)
+        if not self.bnode_quads:
+            return {}
+
+        by_hash: Dict[str, List[str]] = {}
+        for bnode in self.bnode_quads:
+            first_degree = self._hash_first_degree(bnode)
+            self._first_degree[bnode] = first_degree
+            by_hash.setdefault(first_degree, []).append(bnode)
+
+        shared = []
+        for first_degree in sorted(by_hash):
+            bnodes = by_hash[first_degree]
+            if len(bnodes) == 1:
+                self.canonical.issue(bnodes[0])
+            else:
+                shared.append(bnodes)
+
+        self.ambiguous = sum(len(bnodes) for bnodes in shared)
+        for bnodes in shared:
+            results = []
+            for bnode in bnodes:
+                if bnode in self.canonical.issued:
+                    continue
+                temporary = IdentifierIssuer('_:b')
+                temporary.issue(bnode)
+                results.append(self._hash_n_degree(bnode, temporary))
+            for _, issuer in sorted(results, key=lambda r: r[0]):
+                for existing in issuer.issued:
+                    self.canonical.issue(existing)
+        return self.canonical.issued
+
+    def canonicalize(self) -> str:
+        """Canonical N-Quads document"""
+        labels = self.canonical_labels()
+        if not labels:
+            return ''.join(sorted(serialize_quad(q) for q in self.quads))
+        lines = []
+        for quad in self.quads:
+            lines.append(serialize_quad(tuple(
+                labels[term] if term.startswith('_:') else term for term in quad)))
+        lines.sort()
+        return ''.join(lines)
+
+
+def canonicalize_quads(quads: List[Quad], max_calls: int = DEFAULT_MAX_CALLS,
+                       memoize: bool = True) -> str:
+    """RDFC-1.0 canonical N-Quads for a list of unique quads"""
+    return Canonicalizer(quads, max_calls, memoize).canonicalize()
+
+
+def canonicalize_document(document: Dict[str, Any],
+                          processor: Optional[JsonLdProcessor] = None,
+                          max_calls: int = DEFAULT_MAX_CALLS) -> str:
+    """Expand a JSON-LD document and return its canonical N-Quads"""
+    expanded = (processor or get_processor()).expand(document)
+    return canonicalize_quads(to_quads(expanded), max_calls)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        document = json.load(f)
+    sys.stdout.write(canonicalize_document(document))
+
+
+if __name__ == '__main__':
+    main()
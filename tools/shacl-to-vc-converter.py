@@ -15,6 +15,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from urllib.parse import urlparse
 
+from shacl_profile_index import ProfileIndex
+
 def load_shacl(filepath: str) -> Dict:
     """Load SHACL JSON-LD file"""
     with open(filepath, 'r') as f:
@@ -67,7 +69,8 @@ def get_datatype_json_type(xsd_type: str) -> tuple[str, Optional[str]]:
 class SHACLToVCConverter:
     def __init__(self, shacl_data: Dict):
         self.data = shacl_data
-        self.graph = {item['@id']: item for item in shacl_data['@graph']}
+        self.index = ProfileIndex(shacl_data)
+        self.graph = self.index.by_id
         self.context = shacl_data.get('@context', {})
         
         # Find the ontology/profile metadata
@@ -78,23 +81,15 @@ class SHACLToVCConverter:
         
     def _find_profile(self) -> Dict:
         """Find the main ontology/application profile"""
-        for item in self.graph.values():
-            if 'suomi-meta:ApplicationProfile' in item.get('@type', []):
-                return item
-        return {}
+        return self.index.find_profile()
     
     def find_node_shapes(self) -> List[Dict]:
         """Find all NodeShapes (document types)"""
-        shapes = []
-        for item in self.graph.values():
-            if 'sh:NodeShape' in item.get('@type', []):
-                if 'sh:targetClass' in item:  # Main document shapes
-                    shapes.append(item)
-        return shapes
+        return list(self.index.node_shapes)
     
     def get_property_details(self, prop_id: str) -> Optional[Dict]:
         """Get PropertyShape details"""
-        return self.graph.get(prop_id)
+        return self.index.get(prop_id)
     
     def generate_jsonld_context(self, node_shape: Dict) -> Dict:
         """Generate JSON-LD context for a NodeShape"""
@@ -115,21 +110,8 @@ class SHACLToVCConverter:
             }
         }
         
-        # Process properties (handle both array and single object)
-        properties = node_shape.get('sh:property', [])
-        if isinstance(properties, dict):
-            properties = [properties]
-        
-        for prop_ref in properties:
-            # Handle both {"@id": "..."} and direct string references
-            if isinstance(prop_ref, str):
-                prop_id = prop_ref
-            else:
-                prop_id = prop_ref.get('@id')
-            prop = self.get_property_details(prop_id)
-            if not prop:
-                continue
-            
+        # Resolve property references through the profile index
+        for prop_id, prop in self.index.resolve_properties(node_shape):
             _, prop_name = extract_prefix_from_id(prop_id)
             path = prop.get('sh:path', {}).get('@id', '')
             
@@ -225,22 +207,9 @@ class SHACLToVCConverter:
             }
         }
         
-        # Process properties (handle both array and single object)
         required_props = ["type"]
-        properties = node_shape.get('sh:property', [])
-        if isinstance(properties, dict):
-            properties = [properties]
-        
-        for prop_ref in properties:
-            # Handle both {"@id": "..."} and direct string references
-            if isinstance(prop_ref, str):
-                prop_id = prop_ref
-            else:
-                prop_id = prop_ref.get('@id')
-            prop = self.get_property_details(prop_id)
-            if not prop:
-                continue
-            
+        # Resolve property references through the profile index
+        for prop_id, prop in self.index.resolve_properties(node_shape):
             _, prop_name = extract_prefix_from_id(prop_id)
             label = get_label(prop)
             
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SHACL Application Profile Index
+
+Builds lookup tables over the @graph of a SHACL JSON-LD profile in a single
+pass, so the converter and template generator resolve shapes and properties
+in constant time instead of rescanning the graph for every query.
+
+Indexes:
+- items by @id
+- items by @type
+- NodeShapes by sh:targetClass
+- PropertyShapes by sh:path
+- reverse index: PropertyShape @id → NodeShapes that reference it
+"""
+
+from typing import Dict, List, Any, Optional, Tuple
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Normalize a JSON-LD value that may be a single item or a list"""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+def _ref_id(ref: Any) -> Optional[str]:
+    """Extract @id from a reference ({"@id": ...} or plain string)"""
+    if isinstance(ref, str):
+        return ref
+    if isinstance(ref, dict):
+        return ref.get('@id')
+    return None
+
+
+class ProfileIndex:
+    """Single-pass index over a SHACL JSON-LD profile graph"""
+
+    def __init__(self, shacl_data: Dict):
+        self.by_id: Dict[str, Dict] = {}
+        self.by_type: Dict[str, List[Dict]] = {}
+        self.node_shapes_by_target: Dict[str, List[Dict]] = {}
+        self.property_shapes_by_path: Dict[str, List[Dict]] = {}
+        self.shapes_using_property: Dict[str, List[Dict]] = {}
+        self._property_refs: Dict[str, List[str]] = {}
+
+        for item in shacl_data.get('@graph', []):
+            item_id = item.get('@id')
+            if item_id is not None:
+                self.by_id[item_id] = item
+
+            types = _as_list(item.get('@type'))
+            for item_type in types:
+                self.by_type.setdefault(item_type, []).append(item)
+
+            if 'sh:NodeShape' in types:
+                target = _ref_id(item.get('sh:targetClass'))
+                if target:
+                    self.node_shapes_by_target.setdefault(target, []).append(item)
+
+                refs = [ref_id for ref_id in map(_ref_id, _as_list(item.get('sh:property')))
+                        if ref_id]
+                self._property_refs[item_id] = refs
+                for ref_id in refs:
+                    self.shapes_using_property.setdefault(ref_id, []).append(item)
+
+            if 'sh:PropertyShape' in types:
+                path = _ref_id(item.get('sh:path'))
+                if path:
+                    self.property_shapes_by_path.setdefault(path, []).append(item)
+
+        # Main document shapes, in graph order
+        self.node_shapes: List[Dict] = [
+            shape for shape in self.by_type.get('sh:NodeShape', [])
+            if 'sh:targetClass' in shape
+        ]
+
+    def get(self, item_id: str) -> Optional[Dict]:
+        """Get any graph item by @id"""
+        return self.by_id.get(item_id)
+
+    def items_of_type(self, item_type: str) -> List[Dict]:
+        """Get all graph items with the given @type"""
+        return self.by_type.get(item_type, [])
+
+    def find_profile(self) -> Dict:
+        """Get the ApplicationProfile metadata item"""
+        profiles = self.by_type.get('suomi-meta:ApplicationProfile')
+        return profiles[0] if profiles else {}
+
+    def shapes_for_class(self, target_class: str) -> List[Dict]:
+        """Get NodeShapes targeting a class"""
+        return self.node_shapes_by_target.get(target_class, [])
+
+    def properties_for_path(self, path: str) -> List[Dict]:
+        """Get PropertyShapes constraining a path"""
+        return self.property_shapes_by_path.get(path, [])
+
+    def shapes_using(self, prop_id: str) -> List[Dict]:
+        """Get NodeShapes that reference a PropertyShape"""
+        return self.shapes_using_property.get(prop_id, [])
+
+    def resolve_properties(self, node_shape: Dict) -> List[Tuple[str, Dict]]:
+        """Resolve a NodeShape's sh:property references to (id, PropertyShape) pairs
+
+        References that do not resolve to an item in the graph are skipped.
+        """
+        refs = self._property_refs.get(node_shape.get('@id'))
+        if refs is None:
+            refs = [ref_id for ref_id in map(_ref_id, _as_list(node_shape.get('sh:property')))
+                    if ref_id]
+        resolved = []
+        for prop_id in refs:
+            prop = self.by_id.get(prop_id)
+            if prop:
+                resolved.append((prop_id, prop))
+        return resolved
@@ -21,13 +21,15 @@ Output:
 import json
 import re
 from typing import Dict, List, Any, Optional
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, SH, DCTERMS, SKOS
+
+from turtle_stream import iter_file_triples, RDF_TYPE, RDF_FIRST, RDF_REST, RDF_NIL
 
 # Namespaces
-KTDDECV = Namespace("https://iri.suomi.fi/model/ktddecv/")
-KTDDE = Namespace("https://iri.suomi.fi/terminology/ktdde/")
-XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
+KTDDECV = "https://iri.suomi.fi/model/ktddecv/"
+KTDDE = "https://iri.suomi.fi/terminology/ktdde/"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+SH = "http://www.w3.org/ns/shacl#"
+DCTERMS = "http://purl.org/dc/terms/"
 
 
 def camel_to_snake(name: str) -> str:
@@ -38,7 +40,7 @@ def camel_to_snake(name: str) -> str:
     return s2.lower()
 
 
-def extract_local_name(uri: URIRef) -> str:
+def extract_local_name(uri: str) -> str:
     """Extract local name from URI"""
     uri_str = str(uri)
     if '#' in uri_str:
@@ -48,40 +50,123 @@ def extract_local_name(uri: URIRef) -> str:
     return uri_str
 
 
-def get_datatype_for_sdjwt(xsd_type: Optional[URIRef]) -> str:
+def get_datatype_for_sdjwt(xsd_type: Optional[str]) -> str:
     """Map XSD datatype to SD-JWT JSON type"""
     if not xsd_type:
         return "string"
     
     type_map = {
-        str(XSD.string): "string",
-        str(XSD.boolean): "boolean",
-        str(XSD.integer): "integer",
-        str(XSD.int): "integer",
-        str(XSD.decimal): "number",
-        str(XSD.float): "number",
-        str(XSD.double): "number",
-        str(XSD.date): "string",  # ISO 8601 date
-        str(XSD.dateTime): "string",  # ISO 8601 datetime
-        str(XSD.time): "string",
-        str(XSD.anyURI): "string",
+        XSD + "string": "string",
+        XSD + "boolean": "boolean",
+        XSD + "integer": "integer",
+        XSD + "int": "integer",
+        XSD + "decimal": "number",
+        XSD + "float": "number",
+        XSD + "double": "number",
+        XSD + "date": "string",  # ISO 8601 date
+        XSD + "dateTime": "string",  # ISO 8601 datetime
+        XSD + "time": "string",
+        XSD + "anyURI": "string",
     }
     
     return type_map.get(str(xsd_type), "string")
 
 
+def load_shape_records(file_path: str, bnode_prefix: str = '') -> Dict[str, Dict[str, List[Any]]]:
+    """Read a Turtle file once and group its triples by subject
+    
+    Returns {subject: {predicate: [objects in document order]}}. Statements
+    about the same subject spread over several blocks are merged. Blank
+    nodes are prefixed with bnode_prefix, so records of several files can
+    be merged without their blank nodes colliding.
+    """
+    records: Dict[str, Dict[str, List[Any]]] = {}
+    for subject, predicate, obj in iter_file_triples(file_path, bnode_prefix):
+        record = records.get(subject)
+        if record is None:
+            record = records[subject] = {}
+        objects = record.get(predicate)
+        if objects is None:
+            record[predicate] = [obj]
+        else:
+            objects.append(obj)
+    return records
+
+
 class SHACLToSDJWT:
-    """Convert SHACL shapes to SD-JWT schema with semantic mapping"""
+    """Convert SHACL shapes to SD-JWT schema with semantic mapping
+    
+    Backends:
+    - 'stream' (default): single-pass Turtle reader, triples grouped into
+      per-subject records; no dependencies
+    - 'rdflib': full rdflib Graph, queried per property (requires rdflib)
+    """
     
-    def __init__(self):
-        self.graph = Graph()
+    def __init__(self, backend: str = 'stream'):
+        if backend not in ('stream', 'rdflib'):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
+        self.graph = None
+        if backend == 'rdflib':
+            from rdflib import Graph
+            self.graph = Graph()
+        self.records: Dict[str, Dict[str, List[Any]]] = {}
         self.semantic_registry = {}
+        self._loads = 0
         
     def load_shacl(self, file_path: str):
-        """Load SHACL shape from file"""
-        self.graph.parse(file_path, format='turtle')
+        """Load SHACL shapes from file; shapes of earlier loads are kept"""
+        if self.graph is not None:
+            self.graph.parse(file_path, format='turtle')
+        else:
+            self._loads += 1
+            bnode_prefix = f"f{self._loads}."  # blank nodes are local to their file
+            for subject, record in load_shape_records(file_path, bnode_prefix).items():
+                existing = self.records.get(subject)
+                if existing is None:
+                    self.records[subject] = record
+                else:
+                    for predicate, objects in record.items():
+                        existing.setdefault(predicate, []).extend(objects)
+    
+    def _objects(self, subject: Any, predicate: str) -> List[Any]:
+        """Objects of (subject, predicate), in document order for 'stream'"""
+        if self.graph is not None:
+            from rdflib import URIRef
+            return list(self.graph.objects(subject, URIRef(predicate)))
+        record = self.records.get(subject)
+        if record is None:
+            return []
+        return record.get(predicate, [])
+    
+    def _first(self, subject: Any, predicate: str) -> Optional[Any]:
+        """First object of (subject, predicate), or None"""
+        objects = self._objects(subject, predicate)
+        return objects[0] if objects else None
+    
+    def _list_items(self, head: Any) -> List[Any]:
+        """Items of an RDF collection (rdf:first / rdf:rest chain)"""
+        items = []
+        node = head
+        seen = set()
+        while node is not None and str(node) != RDF_NIL and node not in seen:
+            seen.add(node)
+            first = self._first(node, RDF_FIRST)
+            if first is not None:
+                items.append(first)
+            node = self._first(node, RDF_REST)
+        return items
+    
+    def find_node_shapes(self) -> List[Any]:
+        """Find all SHACL NodeShapes in the loaded file"""
+        if self.graph is not None:
+            from rdflib import URIRef
+            return list(self.graph.subjects(URIRef(RDF_TYPE), URIRef(SH + "NodeShape")))
+        node_shape = SH + "NodeShape"
+        return [subject for subject, record in self.records.items()
+                if node_shape in record.get(RDF_TYPE, ())]
         
-    def extract_shape_info(self, shape_uri: URIRef) -> Dict[str, Any]:
+    def extract_shape_info(self, shape_uri: Any) -> Dict[str, Any]:
         """Extract information from SHACL shape"""
         info = {
             'uri': str(shape_uri),
@@ -93,32 +178,32 @@ class SHACLToSDJWT:
         }
         
         # Get basic info
-        for label in self.graph.objects(shape_uri, SH.name):
+        label = self._first(shape_uri, SH + "name")
+        if label is not None:
             info['label'] = str(label)
-            break
         
-        for desc in self.graph.objects(shape_uri, SH.description):
+        desc = self._first(shape_uri, SH + "description")
+        if desc is not None:
             info['description'] = str(desc)
-            break
             
-        for target in self.graph.objects(shape_uri, SH.targetClass):
+        target = self._first(shape_uri, SH + "targetClass")
+        if target is not None:
             info['target_class'] = str(target)
-            break
             
         # Get SKOS concept link
-        for concept in self.graph.objects(shape_uri, DCTERMS.subject):
+        concept = self._first(shape_uri, DCTERMS + "subject")
+        if concept is not None:
             info['skos_concept'] = str(concept)
-            break
         
         # Get properties
-        for prop_shape in self.graph.objects(shape_uri, SH.property):
+        for prop_shape in self._objects(shape_uri, SH + "property"):
             prop_info = self._extract_property_info(prop_shape)
             if prop_info:
                 info['properties'].append(prop_info)
         
         return info
     
-    def _extract_property_info(self, prop_shape: URIRef) -> Dict[str, Any]:
+    def _extract_property_info(self, prop_shape: Any) -> Dict[str, Any]:
         """Extract property constraint information"""
         info = {
             'path': None,
@@ -135,56 +220,37 @@ class SHACLToSDJWT:
         }
         
         # Get path (the OWL property)
-        for path in self.graph.objects(prop_shape, SH.path):
+        path = self._first(prop_shape, SH + "path")
+        if path is not None:
             info['path_uri'] = str(path)
             info['path'] = extract_local_name(path)
-            break
         
-        # Get name
-        for name in self.graph.objects(prop_shape, SH.name):
-            info['name'] = str(name)
-            break
-        
-        # Get description
-        for desc in self.graph.objects(prop_shape, SH.description):
-            info['description'] = str(desc)
-            break
-        
-        # Get datatype
-        for dtype in self.graph.objects(prop_shape, SH.datatype):
-            info['datatype'] = str(dtype)
-            break
-        
-        # Get class (for object properties)
-        for cls in self.graph.objects(prop_shape, SH['class']):
-            info['class'] = str(cls)
-            break
+        # Get name, description, datatype and class (for object properties)
+        for key, predicate in (('name', SH + "name"),
+                               ('description', SH + "description"),
+                               ('datatype', SH + "datatype"),
+                               ('class', SH + "class"),
+                               ('pattern', SH + "pattern"),
+                               ('skos_concept', DCTERMS + "subject")):
+            value = self._first(prop_shape, predicate)
+            if value is not None:
+                info[key] = str(value)
         
         # Get cardinality
-        for min_count in self.graph.objects(prop_shape, SH.minCount):
+        min_count = self._first(prop_shape, SH + "minCount")
+        if min_count is not None:
             info['min_count'] = int(min_count)
-            break
         
-        for max_count in self.graph.objects(prop_shape, SH.maxCount):
+        max_count = self._first(prop_shape, SH + "maxCount")
+        if max_count is not None:
             info['max_count'] = int(max_count)
-            break
-        
-        # Get pattern
-        for pattern in self.graph.objects(prop_shape, SH.pattern):
-            info['pattern'] = str(pattern)
-            break
         
         # Get enumeration
-        for in_list in self.graph.objects(prop_shape, SH['in']):
+        for in_list in self._objects(prop_shape, SH + "in"):
             # Parse RDF list
-            for item in self.graph.items(in_list):
+            for item in self._list_items(in_list):
                 info['in'].append(str(item))
         
-        # Get SKOS concept link
-        for concept in self.graph.objects(prop_shape, DCTERMS.subject):
-            info['skos_concept'] = str(concept)
-            break
-        
         return info
     
     def generate_sdjwt_schema(self, shape_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -213,7 +279,7 @@ class SHACLToSDJWT:
             # Determine JSON type
             json_type = "string"
             if prop['datatype']:
-                json_type = get_datatype_for_sdjwt(URIRef(prop['datatype']))
+                json_type = get_datatype_for_sdjwt(prop['datatype'])
             elif prop['class']:
                 json_type = "object"
             
@@ -482,7 +548,7 @@ def main():
         sys.exit(1)
     
     # Find NodeShapes
-    shapes = list(converter.graph.subjects(RDF.type, SH.NodeShape))
+    shapes = converter.find_node_shapes()
     
     if not shapes:
         print("❌ No SHACL NodeShapes found in file")
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Discrete-Event Shipment Simulation
+
+Capacity planning for credential issuance: many shipments run through
+the trade flow at once, and each actor's issuance service queues the
+documents it has to issue.
+
+- Shipments start (purchase order) at Poisson arrivals over --days.
+- Each document is due at its TIMELINE offset from the purchase order
+  (scenario_gluelam_timber_full.py), stretched per shipment by a
+  lognormal factor, at a random time in business hours. Documents dated
+  the sailing day (bill of lading, invoice, packing list, export customs,
+  manifest) are due at the cutoff of the shipment's sailing. Sailings
+  leave every --sailing-days, and documents dated the arrival day are
+  due when that vessel arrives. Whole vessels therefore reach the
+  carrier and customs at once.
+- A document is queued at its creator (DOCUMENT_FLOW `creator`: bank,
+  customs, carrier, ...) once it is due and everything it waits for
+  (tools/flow_scheduler.FlowGraph) is issued. Each actor has --workers
+  issuance workers and serves its queue first come, first served.
+- Service time is the actual issuance time plus --signer-ms. Every
+  --issue-every-th document is issued for real (DualTrackIssuer: RDFC
+  canonicalization and signing), and its measured time is used.
+  Documents not issued for real draw a time from the measured ones of
+  their type, so a large run keeps the real cost profile without
+  canonicalizing millions of credentials. --issue-every 1 drives the
+  issuer for every event.
+
+The report gives, per actor: credentials issued, utilization (overall
+and in the busiest minute), throughput per active hour and in the peak
+hour, queueing delay (p50 / p95 / p99 / max) and peak queue length.
+Overall it gives shipment lead times and the simulator's own speed.
+
+Usage:
+    python3 tools/shipment_simulation.py [--shipments 100000] [--days 30] [--workers 2]
+                                         [--workers bank=4,customs=3] [--signer-ms 20]
+                                         [--issue-every 1000] [--seed 0] [--json report.json]
+
+    from shipment_simulation import ShipmentSimulation, load_model  # repository root on sys.path
+    report = ShipmentSimulation(load_model(), workers={"bank": 4}).run(100_000)
+"""
+
+import heapq
+import math
+import random
+import sys
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from flow_scheduler import FlowGraph
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DAY = 86400.0
+HOUR = 3600.0
+BUSINESS_HOURS = (8, 17)
+CUTOFF_HOUR = 16  # vessel documentation cutoff on the sailing day
+ARRIVAL_HOUR = 6
+
+# Event kinds
+DUE, DONE = 0, 1
+
+
+@dataclass
+class FlowModel:
+    """Documents, what each waits for, who issues it and when it is due"""
+    graph: FlowGraph
+    creators: Dict[str, str]  # document → actor
+    offsets: Dict[str, float]  # document → days after the purchase order
+    sailing: float  # days after the purchase order
+    arrival: float
+    documents: Dict[str, Dict[str, Any]]  # credential subjects
+
+
+def load_model() -> FlowModel:
+    """The gluelam timber trade: DOCUMENT_FLOW, TIMELINE and DOCUMENTS (from the repository root)"""
+    from scenario_flow import DOCUMENT_FLOW
+    from scenario_gluelam_timber_full import DOCUMENTS, TIMELINE
+
+    dates = {entry["doc"]: datetime.strptime(entry["date"], "%Y-%m-%d") for entry in TIMELINE if entry["doc"]}
+    start = dates["purchase_order"]
+    offsets = {document: (date - start).days for document, date in dates.items()}
+    # The vessel arrives on the one timeline date without a document
+    arrival = next((datetime.strptime(entry["date"], "%Y-%m-%d") - start).days
+                   for entry in TIMELINE if not entry["doc"])
+    return FlowModel(
+        graph=FlowGraph.from_flow(DOCUMENT_FLOW),
+        creators={document: info["creator"] for document, info in DOCUMENT_FLOW.items()},
+        offsets=offsets,
+        sailing=offsets["bill_of_lading"],
+        arrival=arrival,
+        documents=DOCUMENTS,
+    )
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass
+class ActorStats:
+    """One actor's issuance service over a run"""
+    workers: int
+    issued: int = 0
+    busy: float = 0.0  # worker-seconds
+    peak_queue: int = 0
+    delays: List[float] = field(default_factory=list)  # queueing, seconds
+    hourly: Dict[int, int] = field(default_factory=lambda: defaultdict(int))  # hour → completions
+    busy_by_minute: Dict[int, float] = field(default_factory=lambda: defaultdict(float))  # minute → worker-seconds
+
+    def serve(self, now: float, service: float, delay: float) -> None:
+        self.busy += service
+        self.busy_by_minute[int(now // 60)] += service
+        self.delays.append(delay)
+
+    def report(self, span: float) -> Dict[str, Any]:
+        delays = sorted(self.delays)
+        active_hours = max(len(self.hourly), 1)
+        return {
+            "workers": self.workers,
+            "issued": self.issued,
+            "utilization": self.busy / (self.workers * span) if span else 0.0,
+            "peak_minute_utilization": min(1.0, max(self.busy_by_minute.values(), default=0.0) / (self.workers * 60)),
+            "per_active_hour": self.issued / active_hours,
+            "peak_hour": max(self.hourly.values(), default=0),
+            "queue_delay_s": {"mean": sum(delays) / len(delays) if delays else 0.0,
+                              "p50": percentile(delays, 0.50), "p95": percentile(delays, 0.95),
+                              "p99": percentile(delays, 0.99), "max": delays[-1] if delays else 0.0},
+            "peak_queue": self.peak_queue,
+        }
+
+
+class ShipmentSimulation:
+    """Event-driven run of many shipments through one FlowModel"""
+
+    def __init__(self, model: FlowModel, workers: Optional[Mapping[str, int]] = None,
+                 default_workers: int = 2, days: float = 30, sailing_days: float = 7,
+                 signer_ms: float = 20, issue_every: int = 1000,
+                 issue: Optional[Callable[[str, Dict[str, Any]], Any]] = None, seed: int = 0):
+        self.model = model
+        actors = sorted(set(model.creators.values()))
+        self.workers = {actor: max(1, (workers or {}).get(actor, default_workers)) for actor in actors}
+        self.days = days
+        self.sailing_days = sailing_days
+        self.signer_s = signer_ms / 1000
+        self.issue_every = max(0, issue_every)
+        self.issue = issue  # issue(document, inputs) -> credential; None: service times only
+        self.random = random.Random(seed)
+        self.measured: Dict[str, List[float]] = defaultdict(list)  # document → real issuance seconds
+
+    def calibrate(self, rounds: int = 3) -> None:
+        """Issue every document type a few times to seed the service-time samples"""
+        if self.issue is None:
+            return
+        for _ in range(rounds):
+            for document in self.model.graph.order:
+                self._issue(document)
+
+    def _issue(self, document: str) -> float:
+        start = time.perf_counter()
+        self.issue(document, {})
+        elapsed = time.perf_counter() - start
+        self.measured[document].append(elapsed)
+        return elapsed
+
+    def _service_time(self, document: str, count: int) -> float:
+        if self.issue is not None and self.issue_every and count % self.issue_every == 0:
+            return self._issue(document) + self.signer_s
+        samples = self.measured.get(document)
+        return (self.random.choice(samples) if samples else 0.0) + self.signer_s
+
+    def _due_times(self, start: float) -> List[float]:
+        """Due time of each document (graph order) for a shipment starting at start"""
+        model, rng = self.model, self.random
+        stretch = rng.lognormvariate(0.0, 0.25)
+        sailing_day = start / DAY + model.sailing * stretch
+        if self.sailing_days:
+            sailing_day = math.ceil(sailing_day / self.sailing_days) * self.sailing_days
+        sailing = math.floor(sailing_day) * DAY + CUTOFF_HOUR * HOUR
+        arrival = math.floor(sailing_day + model.arrival - model.sailing) * DAY + ARRIVAL_HOUR * HOUR
+        due = []
+        for document in model.graph.order:
+            offset = model.offsets.get(document, 0.0)
+            if offset == model.sailing:
+                due.append(sailing)
+            elif offset == model.arrival:
+                due.append(arrival)
+            else:
+                if offset < model.sailing:
+                    day = math.floor(start / DAY + offset * stretch)
+                else:
+                    day = math.floor(sailing_day + (offset - model.sailing) * rng.lognormvariate(0.0, 0.15))
+                due.append(day * DAY + rng.uniform(*BUSINESS_HOURS) * HOUR)
+        due[0] = max(due[0], start)
+        return due
+
+    def run(self, shipments: int) -> Dict[str, Any]:
+        model, rng = self.model, self.random
+        order = model.graph.order
+        index = {document: i for i, document in enumerate(order)}
+        prerequisites = [len(model.graph.prerequisites[document]) for document in order]
+        dependents = [[index[d] for d in model.graph.dependents[document]] for document in order]
+        actor_of = [model.creators[document] for document in order]
+        stats = {actor: ActorStats(workers) for actor, workers in self.workers.items()}
+        free = dict(self.workers)
+        queues: Dict[str, deque] = {actor: deque() for actor in self.workers}
+
+        waiting: Dict[int, List[int]] = {}  # shipment → prerequisites left per document
+        due_at: Dict[int, List[float]] = {}
+        issued_docs: Dict[int, int] = {}
+        started: List[float] = []
+        lead_times: List[float] = []
+        events: List[Tuple[float, int, int, int, int]] = []  # (time, sequence, kind, shipment, document)
+        sequence = 0
+
+        starts = sorted(rng.uniform(0, self.days * DAY) for _ in range(shipments))
+        for shipment, start in enumerate(starts):
+            started.append(start)
+            heapq.heappush(events, (start, sequence, -1, shipment, 0))  # shipment start
+            sequence += 1
+
+        count = 0
+        processed = 0
+        wall = time.perf_counter()
+        now = 0.0
+        while events:
+            now, _, kind, shipment, document = heapq.heappop(events)
+            processed += 1
+            if kind == -1:  # purchase order about to be raised: shipment becomes live
+                waiting[shipment] = list(prerequisites)
+                due_at[shipment] = due = self._due_times(now)
+                issued_docs[shipment] = 0
+                for i, left in enumerate(prerequisites):
+                    if left == 0:
+                        heapq.heappush(events, (due[i], sequence, DUE, shipment, i))
+                        sequence += 1
+                continue
+            actor = actor_of[document]
+            if kind == DUE:
+                if free[actor]:
+                    free[actor] -= 1
+                    count += 1
+                    service = self._service_time(order[document], count)
+                    stats[actor].serve(now, service, 0.0)
+                    heapq.heappush(events, (now + service, sequence, DONE, shipment, document))
+                    sequence += 1
+                else:
+                    queue = queues[actor]
+                    queue.append((now, shipment, document))
+                    if len(queue) > stats[actor].peak_queue:
+                        stats[actor].peak_queue = len(queue)
+                continue
+
+            # DONE: the worker takes the next queued document
+            actor_stats = stats[actor]
+            actor_stats.issued += 1
+            actor_stats.hourly[int(now // HOUR)] += 1
+            queue = queues[actor]
+            if queue:
+                queued_at, next_shipment, next_document = queue.popleft()
+                count += 1
+                service = self._service_time(order[next_document], count)
+                actor_stats.serve(now, service, now - queued_at)
+                heapq.heappush(events, (now + service, sequence, DONE, next_shipment, next_document))
+                sequence += 1
+            else:
+                free[actor] += 1
+
+            issued_docs[shipment] += 1
+            if issued_docs[shipment] == len(order):
+                lead_times.append(now - started[shipment])
+                del waiting[shipment], due_at[shipment], issued_docs[shipment]
+                continue
+            left, due = waiting[shipment], due_at[shipment]
+            for dependent in dependents[document]:
+                left[dependent] -= 1
+                if left[dependent] == 0:
+                    heapq.heappush(events, (max(now, due[dependent]), sequence, DUE, shipment, dependent))
+                    sequence += 1
+
+        wall = time.perf_counter() - wall
+        span = now - (starts[0] if starts else 0.0)
+        lead_times.sort()
+        return {
+            "shipments": shipments,
+            "completed": len(lead_times),
+            "documents": sum(s.issued for s in stats.values()),
+            "simulated_days": span / DAY,
+            "lead_time_days": {"p50": percentile(lead_times, 0.5) / DAY, "p95": percentile(lead_times, 0.95) / DAY,
+                               "max": (lead_times[-1] if lead_times else 0.0) / DAY},
+            "actors": {actor: s.report(span) for actor, s in sorted(stats.items())},
+            "real_issuances": sum(len(samples) for samples in self.measured.values()),
+            "real_issuance_ms": (1000 * sum(map(sum, self.measured.values()))
+                                 / max(1, sum(map(len, self.measured.values())))),
+            "events": processed,
+            "wall_s": wall,
+        }
+
+
+def parse_workers(specs: List[str]) -> Tuple[int, Dict[str, int]]:
+    """["2", "bank=4,customs=3"] → (2, {"bank": 4, "customs": 3})"""
+    default, per_actor = 2, {}
+    for spec in specs:
+        for part in spec.split(","):
+            if "=" in part:
+                actor, count = part.split("=", 1)
+                per_actor[actor.strip()] = int(count)
+            elif part.strip():
+                default = int(part)
+    return default, per_actor
+
+
+def default_issuer() -> Callable[[str, Dict[str, Any]], Any]:
+    """flow_scheduler.credential_issuer over DualTrackIssuer with a local (instant) signer"""
+    import hashlib
+
+    from dual_track_issuer import DualTrackIssuer
+    from flow_scheduler import credential_issuer
+
+    issuer = DualTrackIssuer("did:example:trade-simulation", "https://example.com/schemas",
+                             signer=lambda data: hashlib.sha512(data).digest())
+    return credential_issuer(issuer, load_model().documents)
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"  {report['shipments']:,} shipments, {report['documents']:,} credentials over "
+          f"{report['simulated_days']:.0f} simulated days; lead time p50 {report['lead_time_days']['p50']:.1f} d, "
+          f"p95 {report['lead_time_days']['p95']:.1f} d")
+    print(f"  {'actor':10s} {'workers':>7s} {'issued':>9s} {'peak use':>8s} {'/active h':>9s} {'peak h':>7s} "
+          f"{'wait p50':>9s} {'p95':>9s} {'p99':>9s} {'max':>9s} {'peak q':>7s}")
+    for actor, row in report["actors"].items():
+        delay = row["queue_delay_s"]
+        print(f"  {actor:10s} {row['workers']:7d} {row['issued']:9,} {row['peak_minute_utilization']:8.0%} "
+              f"{row['per_active_hour']:9.0f} {row['peak_hour']:7,} "
+              + " ".join(f"{format_seconds(delay[key]):>9s}" for key in ("p50", "p95", "p99", "max"))
+              + f" {row['peak_queue']:7,}")
+    print(f"  simulator: {report['events']:,} events in {report['wall_s']:.1f} s "
+          f"({report['events'] / max(report['wall_s'], 1e-9):,.0f}/s), {report['real_issuances']:,} credentials "
+          f"issued for real ({report['real_issuance_ms']:.2f} ms each)")
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    if seconds < 120:
+        return f"{seconds:.1f} s"
+    if seconds < 2 * HOUR:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / HOUR:.1f} h"
+
+
+def main():
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Simulate many shipments through the trade flow's issuance services")
+    parser.add_argument("--shipments", type=int, default=100_000)
+    parser.add_argument("--days", type=float, default=30, help="window in which shipments start")
+    parser.add_argument("--sailing-days", type=float, default=7, help="days between sailings (0: sail any day)")
+    parser.add_argument("--workers", action="append", default=[],
+                        help="issuance workers: a default count and/or actor=count pairs")
+    parser.add_argument("--signer-ms", type=float, default=20)
+    parser.add_argument("--issue-every", type=int, default=1000,
+                        help="issue every n-th credential for real (0: calibration only)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write the report as JSON")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    default, per_actor = parse_workers(args.workers)
+    simulation = ShipmentSimulation(load_model(), per_actor, default, args.days, args.sailing_days,
+                                    args.signer_ms, args.issue_every, default_issuer(), args.seed)
+    simulation.calibrate()
+    report = simulation.run(args.shipments)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,21 @@
 """
 Simple SHACL to SD-JWT converter (no dependencies)
 Parses Turtle SHACL shapes and generates SD-JWT schemas + semantic registry
+
+Parsing is a single linear pass over the file (see turtle_stream.py), so
+nested blank nodes, multi-line strings and lists are handled without
+backtracking regexes over the whole document.
 """
 
+import gc
 import json
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+from turtle_stream import TurtleParser, Literal, RDF_TYPE, RDF_FIRST, RDF_REST, RDF_NIL
+
+SH = "http://www.w3.org/ns/shacl#"
+DCTERMS = "http://purl.org/dc/terms/"
 
 def camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case"""
@@ -14,144 +24,157 @@ def camel_to_snake(name: str) -> str:
     s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
     return s2.lower()
 
-def extract_value(line: str) -> str:
-    """Extract value from RDF triple line"""
-    if '"' in line:
-        match = re.search(r'"([^"]+)"', line)
-        return match.group(1) if match else ""
-    elif '<' in line and '>' in line:
-        match = re.search(r'<([^>]+)>', line)
-        return match.group(1) if match else ""
-    return line.split()[-1].strip(' ;.')
+def compact_iri(term: Optional[Any], prefixes: Dict[str, str]) -> Optional[str]:
+    """Shorten a full IRI to prefix:local using the file's prefixes"""
+    if term is None:
+        return None
+    iri = str(term)
+    best = None
+    for prefix, namespace in prefixes.items():
+        if iri.startswith(namespace) and (best is None or len(namespace) > len(prefixes[best])):
+            best = prefix
+    if best is None:
+        return iri
+    return f"{best}:{iri[len(prefixes[best]):]}"
+
+def local_name(term: str) -> str:
+    """Local part of a prefixed name or IRI"""
+    if '#' in term:
+        return term.rsplit('#', 1)[-1]
+    if ':' in term and '/' not in term:
+        return term.split(':', 1)[-1]
+    return term.rstrip('/').rsplit('/', 1)[-1]
 
-def parse_shacl_shape(turtle_file: str) -> Dict[str, Any]:
-    """Parse SHACL shape from Turtle file (simple parser)"""
+def load_records(turtle_file: str, pause_gc: bool = False) -> tuple:
+    """Read the file once; group triples by subject
+
+    Returns ({subject: {predicate: [objects]}}, prefixes).
+
+    pause_gc turns off the cyclic garbage collector for the parse. Only
+    acyclic containers are created, and on large files the collector's
+    repeated passes over the growing record tables cost about a fifth of
+    the parse time. gc.disable() is process-wide, so only the command
+    line, which owns its interpreter, asks for it; the previous state is
+    restored afterwards.
+    """
     with open(turtle_file, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    # Find shape definition
-    shape_match = re.search(r'(\w+:\w+Shape)\s+a\s+sh:NodeShape', content)
-    if not shape_match:
+    parser = TurtleParser(content)
+    records: Dict[str, Dict[str, List[Any]]] = {}
+    gc_was_enabled = gc.isenabled()
+    if pause_gc:
+        gc.disable()
+    try:
+        for subject, predicate, obj in parser.triples():
+            records.setdefault(subject, {}).setdefault(predicate, []).append(obj)
+    finally:
+        if pause_gc and gc_was_enabled:
+            gc.enable()
+    return records, parser.prefixes
+
+def _first(record: Dict[str, List[Any]], predicate: str) -> Optional[Any]:
+    objects = record.get(predicate)
+    return objects[0] if objects else None
+
+def _english(record: Dict[str, List[Any]], predicate: str) -> Optional[str]:
+    """Prefer the @en literal, else the first value"""
+    objects = record.get(predicate)
+    if not objects:
+        return None
+    for obj in objects:
+        if isinstance(obj, Literal) and obj.language == 'en':
+            return str(obj)
+    return str(objects[0])
+
+def _list_items(records: Dict[str, Dict[str, List[Any]]], head: str) -> List[Any]:
+    """Items of an RDF collection"""
+    items = []
+    seen = set()
+    node = head
+    while node is not None and node != RDF_NIL and node not in seen:
+        seen.add(node)
+        record = records.get(node, {})
+        first = _first(record, RDF_FIRST)
+        if first is not None:
+            items.append(first)
+        node = _first(record, RDF_REST)
+    return items
+
+def parse_shacl_shape(turtle_file: str, pause_gc: bool = False) -> Dict[str, Any]:
+    """Parse SHACL shape from Turtle file (simple parser); pause_gc: see load_records"""
+    records, prefixes = load_records(turtle_file, pause_gc)
+    
+    # Find shape definition (first NodeShape in the document)
+    node_shape = SH + "NodeShape"
+    shape_uri = next(
+        (subject for subject, record in records.items()
+         if node_shape in record.get(RDF_TYPE, ())),
+        None
+    )
+    if shape_uri is None:
         raise ValueError("No SHACL NodeShape found")
     
-    shape_uri = shape_match.group(1)
+    shape = records[shape_uri]
     
     # Extract basic info
+    description = _english(shape, SH + "description")
     info = {
-        'uri': shape_uri,
-        'label': None,
-        'description': None,
-        'target_class': None,
-        'skos_concept': None,
+        'uri': compact_iri(shape_uri, prefixes),
+        'label': _english(shape, SH + "name"),
+        'description': description.strip() if description else None,
+        'target_class': compact_iri(_first(shape, SH + "targetClass"), prefixes),
+        'skos_concept': compact_iri(_first(shape, DCTERMS + "subject"), prefixes),
         'properties': []
     }
     
-    # Find shape block
-    shape_block_match = re.search(
-        rf'{re.escape(shape_uri)}.*?sh:targetClass.*?;(.*?)^\s*\.',
-        content,
-        re.MULTILINE | re.DOTALL
-    )
-    
-    if not shape_block_match:
-        return info
-    
-    shape_block = shape_block_match.group(1)
-    
-    # Extract labels
-    label_match = re.search(r'sh:name\s+"([^"]+)"@en', shape_block)
-    if label_match:
-        info['label'] = label_match.group(1)
-    
-    # Extract description
-    desc_match = re.search(r'sh:description\s+"""([^"]+)"""@en', shape_block, re.DOTALL)
-    if desc_match:
-        info['description'] = desc_match.group(1).strip()
-    
-    # Extract target class
-    target_match = re.search(r'sh:targetClass\s+(\S+)', content)
-    if target_match:
-        info['target_class'] = target_match.group(1)
-    
-    # Extract SKOS concept
-    skos_match = re.search(r'dcterms:subject\s+(\S+)', shape_block)
-    if skos_match:
-        info['skos_concept'] = skos_match.group(1)
-    
-    # Extract properties
-    prop_blocks = re.findall(
-        r'sh:property\s+\[(.*?)\]',
-        shape_block,
-        re.DOTALL
-    )
-    
-    for prop_block in prop_blocks:
-        prop_info = parse_property(prop_block)
+    # Extract properties (blank nodes or named PropertyShapes)
+    for prop_node in shape.get(SH + "property", []):
+        prop_info = parse_property(records, prop_node, prefixes)
         if prop_info:
             info['properties'].append(prop_info)
     
     return info
 
-def parse_property(prop_block: str) -> Dict[str, Any]:
-    """Parse property constraint block"""
+def parse_property(records: Dict[str, Dict[str, List[Any]]], prop_node: str,
+                   prefixes: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Parse property constraint record"""
+    record = records.get(prop_node)
+    if not record:
+        return None
+    
     info = {
         'path': None,
         'path_uri': None,
-        'name': None,
-        'description': None,
-        'datatype': None,
-        'class': None,
+        'name': _english(record, SH + "name"),
+        'description': _english(record, SH + "description"),
+        'datatype': compact_iri(_first(record, SH + "datatype"), prefixes),
+        'class': compact_iri(_first(record, SH + "class"), prefixes),
         'min_count': 0,
         'max_count': None,
         'in': [],
-        'skos_concept': None
+        'skos_concept': compact_iri(_first(record, DCTERMS + "subject"), prefixes)
     }
     
     # Extract path
-    path_match = re.search(r'sh:path\s+(\S+)', prop_block)
-    if path_match:
-        info['path_uri'] = path_match.group(1)
-        info['path'] = path_match.group(1).split(':')[-1] if ':' in path_match.group(1) else path_match.group(1)
-    
-    # Extract name
-    name_match = re.search(r'sh:name\s+"([^"]+)"@en', prop_block)
-    if name_match:
-        info['name'] = name_match.group(1)
-    
-    # Extract description
-    desc_match = re.search(r'sh:description\s+"([^"]+)"@en', prop_block)
-    if desc_match:
-        info['description'] = desc_match.group(1)
-    
-    # Extract datatype
-    dtype_match = re.search(r'sh:datatype\s+(\S+)', prop_block)
-    if dtype_match:
-        info['datatype'] = dtype_match.group(1)
-    
-    # Extract class
-    class_match = re.search(r'sh:class\s+(\S+)', prop_block)
-    if class_match:
-        info['class'] = class_match.group(1)
+    path = _first(record, SH + "path")
+    if path is not None:
+        info['path_uri'] = compact_iri(path, prefixes)
+        info['path'] = local_name(info['path_uri'])
     
     # Extract cardinality
-    min_match = re.search(r'sh:minCount\s+(\d+)', prop_block)
-    if min_match:
-        info['min_count'] = int(min_match.group(1))
+    min_count = _first(record, SH + "minCount")
+    if min_count is not None:
+        info['min_count'] = int(min_count)
     
-    max_match = re.search(r'sh:maxCount\s+(\d+)', prop_block)
-    if max_match:
-        info['max_count'] = int(max_match.group(1))
+    max_count = _first(record, SH + "maxCount")
+    if max_count is not None:
+        info['max_count'] = int(max_count)
     
     # Extract enumeration
-    in_match = re.search(r'sh:in\s+\(\s*([^)]+)\s*\)', prop_block)
-    if in_match:
-        values = re.findall(r'"([^"]+)"', in_match.group(1))
-        info['in'] = values
-    
-    # Extract SKOS concept
-    skos_match = re.search(r'dcterms:subject\s+(\S+)', prop_block)
-    if skos_match:
-        info['skos_concept'] = skos_match.group(1)
+    in_list = _first(record, SH + "in")
+    if in_list is not None:
+        info['in'] = [str(item) for item in _list_items(records, in_list)]
     
     return info
 
@@ -267,7 +290,7 @@ def main():
     
     # Parse SHACL
     try:
-        shape_info = parse_shacl_shape(shacl_file)
+        shape_info = parse_shacl_shape(shacl_file, pause_gc=True)
         print(f"✅ Found shape: {shape_info.get('label', 'N/A')}")
         print(f"   Properties: {len(shape_info['properties'])}")
     except Exception as e:
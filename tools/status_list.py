@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Bitstring Status List service (no dependencies)
+
+Revocation and suspension for issued trade credentials, following
+W3C Bitstring Status List v1.0:
+
+- StatusList: the bitstring itself (index 0 = left-most bit), encoded as
+  multibase base64url of the GZIP-compressed bytes
+- StatusListService: allocates a status list index for every issued
+  credential, flips bits in bulk (revoke / suspend / reinstate thousands
+  of credentials in one call) and renders the BitstringStatusListCredential
+  for each list; rendered credentials are cached until a bit changes
+- StatusListVerifier: checks credentialStatus entries, caching fetched
+  status lists (decoded) for their ttl
+
+Indexes are handed out in a pseudo-random order inside each list (odd
+stride over a power-of-two length), so neighbouring indexes do not reveal
+issuance order.
+
+Usage:
+    python3 tools/status_list.py decode <encodedList>
+    python3 tools/status_list.py demo [--credentials 10000] [--revoke 2500]
+
+    from status_list import StatusListService, StatusListVerifier
+    service = StatusListService("https://example.com/vc/api/v1/status-lists",
+                                issuer_did="did:example:seller")
+    service.attach(credential)                  # adds credentialStatus
+    service.update(credential_ids, 'revoke')    # bulk
+    service.status_list_credential('revocation', 0)
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_LIST_LENGTH = 131072  # 16 KB, the spec minimum for herd privacy
+DEFAULT_TTL_MS = 300000
+STATUS_PURPOSES = ('revocation', 'suspension')
+
+# action → (statusPurpose, bit value)
+ACTIONS = {
+    'revoke': ('revocation', True),
+    'suspend': ('suspension', True),
+    'reinstate': ('suspension', False),
+}
+
+
+class StatusListError(ValueError):
+    """Invalid status list, entry or action"""
+
+
+# ============================================================================
+# Bitstring
+# ============================================================================
+
+class StatusList:
+    """Fixed-length bitstring of credential statuses"""
+
+    def __init__(self, length: int = DEFAULT_LIST_LENGTH, bits: Optional[bytearray] = None):
+        if length <= 0 or length % 8:
+            raise StatusListError(f"Status list length must be a positive multiple of 8: {length}")
+        self.length = length
+        self.bits = bits if bits is not None else bytearray(length // 8)
+        self.version = 0
+        self._encoded: Optional[Tuple[int, str]] = None
+
+    def _check(self, index: int) -> None:
+        if not 0 <= index < self.length:
+            raise StatusListError(f"Status list index {index} out of range 0..{self.length - 1}")
+
+    def get(self, index: int) -> bool:
+        self._check(index)
+        return bool(self.bits[index >> 3] & (0x80 >> (index & 7)))
+
+    def set(self, index: int, value: bool = True) -> None:
+        self.set_many((index,), value)
+
+    def set_many(self, indexes: Iterable[int], value: bool = True) -> int:
+        """Set every index to value; returns how many bits changed"""
+        bits = self.bits
+        changed = 0
+        for index in indexes:
+            self._check(index)
+            position, mask = index >> 3, 0x80 >> (index & 7)
+            if bool(bits[position] & mask) != value:
+                bits[position] ^= mask
+                changed += 1
+        if changed:
+            self.version += 1
+        return changed
+
+    def count(self) -> int:
+        """Number of set bits"""
+        return bin(int.from_bytes(self.bits, 'big')).count('1')
+
+    def encode(self) -> str:
+        """Multibase base64url (no padding) of the GZIP-compressed bitstring"""
+        if self._encoded is None or self._encoded[0] != self.version:
+            compressed = gzip.compress(bytes(self.bits), mtime=0)
+            encoded = 'u' + base64.urlsafe_b64encode(compressed).rstrip(b'=').decode('ascii')
+            self._encoded = (self.version, encoded)
+        return self._encoded[1]
+
+    @classmethod
+    def decode(cls, encoded_list: str) -> 'StatusList':
+        """Inverse of encode(); also accepts StatusList2021 lists without the 'u' prefix"""
+        data = encoded_list[1:] if encoded_list.startswith('u') else encoded_list
+        try:
+            raw = gzip.decompress(base64.urlsafe_b64decode(data + '=' * (-len(data) % 4)))
+        except (ValueError, OSError) as e:
+            raise StatusListError(f"Cannot decode encodedList: {e}") from e
+        return cls(len(raw) * 8, bytearray(raw))
+
+
+# ============================================================================
+# Issuer side
+# ============================================================================
+
+class _AllocatedList:
+    """A status list plus its index allocator"""
+
+    def __init__(self, purpose: str, number: int, length: int, rng: random.Random):
+        self.purpose = purpose
+        self.number = number
+        self.status = StatusList(length)
+        self.allocated = 0
+        self._start = rng.randrange(length)
+        self._stride = rng.randrange(1, length, 2) if length & (length - 1) == 0 else 1
+        self._rendered: Optional[Tuple[int, bytes, str]] = None  # (version, body, etag)
+
+    @property
+    def full(self) -> bool:
+        return self.allocated >= self.status.length
+
+    def allocate(self) -> int:
+        index = (self._start + self.allocated * self._stride) % self.status.length
+        self.allocated += 1
+        return index
+
+
+class StatusListService:
+    """Allocates status entries at issuance and publishes status list credentials"""
+
+    def __init__(self, base_url: str, issuer_did: str = "did:example:issuer",
+                 purposes: Tuple[str, ...] = STATUS_PURPOSES,
+                 list_length: int = DEFAULT_LIST_LENGTH, ttl_ms: int = DEFAULT_TTL_MS,
+                 seed: Optional[int] = None):
+        self.base_url = base_url.rstrip('/')
+        self.issuer_did = issuer_did
+        self.purposes = purposes
+        self.list_length = list_length
+        self.ttl_ms = ttl_ms
+        self._rng = random.Random(seed) if seed is not None else random.SystemRandom()
+        self._lists: Dict[str, List[_AllocatedList]] = {purpose: [] for purpose in purposes}
+        self._entries: Dict[str, List[Dict[str, str]]] = {}  # credential id → entries
+        self._lock = threading.Lock()
+
+    def list_url(self, purpose: str, number: int) -> str:
+        return f"{self.base_url}/{purpose}/{number}"
+
+    def _current_list(self, purpose: str) -> _AllocatedList:
+        lists = self._lists[purpose]
+        if not lists or lists[-1].full:
+            lists.append(_AllocatedList(purpose, len(lists), self.list_length, self._rng))
+        return lists[-1]
+
+    def _get_list(self, purpose: str, number: int) -> Optional[_AllocatedList]:
+        lists = self._lists.get(purpose, [])
+        return lists[number] if 0 <= number < len(lists) else None
+
+    def allocate(self, credential_id: str) -> List[Dict[str, str]]:
+        """
+        BitstringStatusListEntry per purpose; stable for a credential id, so
+        the id must name one credential (DualTrackIssuer uses a UUID per
+        issuance, the SAP mapper the document number)
+        """
+        with self._lock:
+            entries = self._entries.get(credential_id)
+            if entries is None:
+                entries = []
+                for purpose in self.purposes:
+                    status_list = self._current_list(purpose)
+                    index = status_list.allocate()
+                    url = self.list_url(purpose, status_list.number)
+                    entries.append({
+                        "id": f"{url}#{index}",
+                        "type": "BitstringStatusListEntry",
+                        "statusPurpose": purpose,
+                        "statusListIndex": str(index),
+                        "statusListCredential": url,
+                    })
+                self._entries[credential_id] = entries
+            return entries
+
+    def attach(self, credential: Dict[str, Any]) -> Dict[str, Any]:
+        """Add credentialStatus to a credential (before it is signed)"""
+        if 'id' not in credential:
+            raise StatusListError("Credential needs an id to be given a status entry")
+        entries = self.allocate(credential['id'])
+        credential["credentialStatus"] = [dict(entry) for entry in entries] \
+            if len(entries) > 1 else dict(entries[0])
+        return credential
+
+    def update(self, credential_ids: Iterable[str], action: str) -> Dict[str, Any]:
+        """Revoke, suspend or reinstate many credentials in one operation
+
+        Indexes are grouped per status list so every list is touched (and
+        its cached encoding invalidated) once.
+        """
+        if action not in ACTIONS:
+            raise StatusListError(f"Unknown status action {action!r} (expected one of {sorted(ACTIONS)})")
+        purpose, value = ACTIONS[action]
+        if purpose not in self.purposes:
+            raise StatusListError(f"This service does not track {purpose} status")
+
+        grouped: Dict[str, List[int]] = {}
+        unknown = []
+        with self._lock:
+            for credential_id in credential_ids:
+                entries = self._entries.get(credential_id)
+                if entries is None:
+                    unknown.append(credential_id)
+                    continue
+                for entry in entries:
+                    if entry["statusPurpose"] == purpose:
+                        grouped.setdefault(entry["statusListCredential"], []).append(
+                            int(entry["statusListIndex"]))
+            changed = 0
+            for url, indexes in grouped.items():
+                number = int(url.rsplit('/', 1)[1])
+                changed += self._lists[purpose][number].status.set_many(indexes, value)
+        return {
+            "action": action,
+            "statusPurpose": purpose,
+            "updated": sum(len(indexes) for indexes in grouped.values()),
+            "changed": changed,
+            "unknown": unknown,
+        }
+
+    def status(self, credential_id: str) -> Optional[Dict[str, bool]]:
+        """Current {statusPurpose: bit} for a credential, None if never allocated"""
+        entries = self._entries.get(credential_id)
+        if entries is None:
+            return None
+        result = {}
+        for entry in entries:
+            number = int(entry["statusListCredential"].rsplit('/', 1)[1])
+            status_list = self._lists[entry["statusPurpose"]][number]
+            result[entry["statusPurpose"]] = status_list.status.get(int(entry["statusListIndex"]))
+        return result
+
+    def status_list_credential(self, purpose: str, number: int) -> Optional[Dict[str, Any]]:
+        """BitstringStatusListCredential for one list"""
+        status_list = self._get_list(purpose, number)
+        if status_list is None:
+            return None
+        url = self.list_url(purpose, number)
+        return {
+            "@context": ["https://www.w3.org/ns/credentials/v2"],
+            "id": url,
+            "type": ["VerifiableCredential", "BitstringStatusListCredential"],
+            "issuer": self.issuer_did,
+            "validFrom": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "credentialSubject": {
+                "id": f"{url}#list",
+                "type": "BitstringStatusList",
+                "statusPurpose": purpose,
+                "encodedList": status_list.status.encode(),
+                "ttl": self.ttl_ms,
+            },
+        }
+
+    def published(self, purpose: str, number: int) -> Optional[Tuple[bytes, str]]:
+        """Serialized status list credential and its ETag
+
+        Re-rendered only when the list's bits have changed since the last
+        request, so polling verifiers are served from memory.
+        """
+        status_list = self._get_list(purpose, number)
+        if status_list is None:
+            return None
+        with self._lock:
+            rendered = status_list._rendered
+            if rendered is None or rendered[0] != status_list.status.version:
+                body = json.dumps(self.status_list_credential(purpose, number)).encode('utf-8')
+                etag = hashlib.sha256(status_list.status.encode().encode('ascii')).hexdigest()[:32]
+                rendered = (status_list.status.version, body, etag)
+                status_list._rendered = rendered
+        return rendered[1], rendered[2]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            purpose: [{
+                "url": self.list_url(purpose, status_list.number),
+                "allocated": status_list.allocated,
+                "set": status_list.status.count(),
+                "length": status_list.status.length,
+            } for status_list in lists]
+            for purpose, lists in self._lists.items()
+        }
+
+
+# ============================================================================
+# Verifier side
+# ============================================================================
+
+def fetch_json(url: str) -> Dict[str, Any]:
+    """GET a status list credential over HTTP(S)"""
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.load(response)
+
+
+class StatusListVerifier:
+    """Checks credentialStatus entries with a cache of decoded status lists"""
+
+    def __init__(self, fetch: Callable[[str], Dict[str, Any]] = fetch_json,
+                 default_ttl_ms: int = DEFAULT_TTL_MS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.fetch = fetch
+        self.default_ttl_ms = default_ttl_ms
+        self.clock = clock
+        self._cache: Dict[str, Tuple[float, str, StatusList]] = {}  # url → (expires, purpose, list)
+        self.hits = 0
+        self.misses = 0
+
+    def status_list(self, url: str) -> Tuple[str, StatusList]:
+        """(statusPurpose, decoded list) for a status list credential URL"""
+        now = self.clock()
+        cached = self._cache.get(url)
+        if cached is not None and cached[0] > now:
+            self.hits += 1
+            return cached[1], cached[2]
+        self.misses += 1
+
+        credential = self.fetch(url)
+        subject = credential.get("credentialSubject", {})
+        if "encodedList" not in subject:
+            raise StatusListError(f"{url} is not a BitstringStatusListCredential")
+        status_list = StatusList.decode(subject["encodedList"])
+        purpose = subject.get("statusPurpose", "")
+        ttl_ms = subject.get("ttl", self.default_ttl_ms)
+        self._cache[url] = (now + ttl_ms / 1000, purpose, status_list)
+        return purpose, status_list
+
+    def check(self, credential: Dict[str, Any]) -> Dict[str, bool]:
+        """{statusPurpose: bit} for every entry in credentialStatus"""
+        entries = credential.get("credentialStatus") or []
+        if isinstance(entries, dict):
+            entries = [entries]
+        result = {}
+        for entry in entries:
+            if entry.get("type") != "BitstringStatusListEntry":
+                continue
+            purpose, status_list = self.status_list(entry["statusListCredential"])
+            if purpose != entry.get("statusPurpose"):
+                raise StatusListError(
+                    f"statusPurpose {entry.get('statusPurpose')!r} does not match "
+                    f"status list {entry['statusListCredential']} ({purpose!r})")
+            result[purpose] = status_list.get(int(entry["statusListIndex"]))
+        return result
+
+    def is_valid(self, credential: Dict[str, Any]) -> bool:
+        """Neither revoked nor suspended"""
+        return not any(self.check(credential).values())
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        if url is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(url, None)
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def demo(credentials: int, revoke: int) -> None:
+    service = StatusListService("https://example.com/vc/api/v1/status-lists",
+                                issuer_did="did:example:seller")
+    verifier = StatusListVerifier(fetch=lambda url: _fetch_local(service, url))
+
+    start = time.perf_counter()
+    issued = [service.attach({"id": f"urn:uuid:credential-{i}"}) for i in range(credentials)]
+    allocate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = service.update((vc["id"] for vc in issued[:revoke]), 'revoke')
+    update_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    body, _ = service.published('revocation', 0)
+    publish_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    revoked = sum(not verifier.is_valid(vc) for vc in issued)
+    verify_s = time.perf_counter() - start
+
+    print(f"Allocated {credentials} status entries in {allocate_s * 1000:.1f} ms")
+    print(f"Revoked {result['changed']} credentials in {update_s * 1000:.1f} ms")
+    print(f"Published revocation list 0 ({len(body)} bytes) in {publish_s * 1000:.1f} ms")
+    print(f"Verified {credentials} credentials ({revoked} revoked) in {verify_s * 1000:.1f} ms, "
+          f"{verifier.misses} list fetches / {verifier.hits} cache hits")
+
+
+def _fetch_local(service: StatusListService, url: str) -> Dict[str, Any]:
+    purpose, number = url.rsplit('/', 2)[1:]
+    published = service.published(purpose, int(number))
+    if published is None:
+        raise StatusListError(f"No status list at {url}")
+    return json.loads(published[0])
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('decode', 'demo'):
+        print(__doc__)
+        sys.exit(1)
+
+    if sys.argv[1] == 'decode':
+        status_list = StatusList.decode(sys.argv[2])
+        set_bits = [i for i in range(status_list.length) if status_list.get(i)]
+        print(f"{status_list.length} entries, {len(set_bits)} set")
+        if set_bits:
+            print(f"Set indexes: {set_bits[:50]}{' ...' if len(set_bits) > 50 else ''}")
+        return
+
+    import argparse
+    parser = argparse.ArgumentParser(prog='status_list.py demo')
+    parser.add_argument('--credentials', type=int, default=10000)
+    parser.add_argument('--revoke', type=int, default=2500)
+    args = parser.parse_args(sys.argv[2:])
+    demo(args.credentials, args.revoke)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Streaming Turtle Triple Reader (no dependencies)
+
+Reads Turtle (RDF 1.1) and yields (subject, predicate, object) triples in
+document order, one statement at a time, without building an RDF graph.
+Covers the Turtle used by our SHACL shapes and OWL proposals:
+
+- @prefix / @base and SPARQL-style PREFIX / BASE
+- IRIs, prefixed names, the `a` keyword
+- Short and long (multi-line) strings with language tags or datatypes
+- Integers, decimals, doubles and booleans
+- Blank node labels, nested blank node property lists `[ ... ]`
+- Collections `( ... )`, expanded to rdf:first / rdf:rest chains
+- Comments and trailing `;` before `]` or `.`
+
+Terms are plain strings so they compare and hash like IRIs:
+- IRI: str
+- Blank node: BNode (str subclass); labels from the document keep their
+  `_:` prefix, generated nodes do not, so the two never collide. Blank
+  nodes are scoped to their document: give each parse whose triples end
+  up together a distinct bnode_prefix, or `_:b` / generated `b1` of one
+  file would be taken for those of another
+- Literal: Literal (str subclass carrying `language` and `datatype`)
+
+Usage:
+    from turtle_stream import iter_triples
+    for s, p, o in iter_triples(text):
+        ...
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+RDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+XSD = "http://www.w3.org/2001/XMLSchema#"
+
+RDF_TYPE = RDF + "type"
+RDF_FIRST = RDF + "first"
+RDF_REST = RDF + "rest"
+RDF_NIL = RDF + "nil"
+
+
+class TurtleSyntaxError(ValueError):
+    """Raised when the input is not valid Turtle (for the supported subset)"""
+
+
+class BNode(str):
+    """Blank node identifier"""
+    __slots__ = ()
+
+
+class Literal(str):
+    """RDF literal; the string value is the lexical form"""
+    __slots__ = ('language', 'datatype')
+
+    def __new__(cls, value: str, language: Optional[str] = None,
+                datatype: Optional[str] = None):
+        literal = super().__new__(cls, value)
+        literal.language = language
+        literal.datatype = datatype
+        return literal
+
+
+Triple = Tuple[str, str, str]
+
+# Leading whitespace/comments, then one alternation per token kind; every
+# branch is linear in its match length, so tokenizing is a single pass
+_TOKEN_RE = re.compile(r'''
+    (?:[ \t\r\n]|\#[^\r\n]*(?=[\r\n]|\Z))*
+    (?:
+        (?P<iri><[^<>"{}|^`\\\x00-\x20]*>)
+      | (?P<long_string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\')
+      | (?P<string>"(?:[^"\\\r\n]|\\.)*"|'(?:[^'\\\r\n]|\\.)*')
+      | (?P<bnode>_:[\w](?:[\w.-]*[\w-])?)
+      | (?P<pname>(?:[^\W\d_](?:[\w.-]*[\w-])?)?:(?:(?:[\w:%-]|\\.)(?:(?:[\w.:%-]|\\.)*(?:[\w:%-]|\\.))?)?)
+      | (?P<number>[+-]?(?:\d*\.\d+(?:[eE][+-]?\d+)?|\d+(?:\.\d*)?[eE][+-]?\d+|\d+))
+      | (?P<at>@[A-Za-z]+(?:-[A-Za-z0-9]+)*)
+      | (?P<word>[A-Za-z]+)
+      | (?P<punct>\^\^|[\[\]();,.])
+      | (?P<eof>\Z)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+_ECHAR_RE = re.compile(r'\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))', re.DOTALL)
+_ECHARS = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f',
+           '"': '"', "'": "'", '\\': '\\'}
+
+
+def _unescape_char(match: 're.Match') -> str:
+    if match.group(1) or match.group(2):
+        return chr(int(match.group(1) or match.group(2), 16))
+    char = match.group(3)
+    if char not in _ECHARS:
+        raise TurtleSyntaxError(f"Invalid escape sequence: \\{char}")
+    return _ECHARS[char]
+
+
+def unescape_string(value: str) -> str:
+    """Decode Turtle string escapes (\\n, \\", \\uXXXX, ...)"""
+    if '\\' not in value:
+        return value
+    return _ECHAR_RE.sub(_unescape_char, value)
+
+
+def tokenize(text: str) -> Iterator[Tuple[str, str, int]]:
+    """Yield (kind, text, offset) tokens, skipping whitespace and comments"""
+    match = _TOKEN_RE.match
+    pos = 0
+    while True:
+        m = match(text, pos)
+        if m is None:
+            pos += len(text[pos:]) - len(text[pos:].lstrip())
+            line = text.count('\n', 0, pos) + 1
+            raise TurtleSyntaxError(
+                f"Unexpected character {text[pos]!r} at line {line}"
+            )
+        kind = m.lastgroup
+        yield kind, m.group(kind), m.start(kind)
+        if kind == 'eof':
+            return
+        pos = m.end()
+
+
+class TurtleParser:
+    """Recursive-descent Turtle parser emitting triples statement by statement"""
+
+    def __init__(self, text: str, base: str = '', bnode_prefix: str = ''):
+        self.text = text
+        self.base = base
+        self.bnode_prefix = bnode_prefix
+        self.prefixes: Dict[str, str] = {}
+        self._tokens = tokenize(text)
+        self._next = next(self._tokens)
+        self._out: List[Triple] = []
+        self._bnode_count = 0
+
+    # ------------------------------------------------------------------
+    # Token helpers
+    # ------------------------------------------------------------------
+
+    def _advance(self) -> Tuple[str, str, int]:
+        token = self._next
+        self._next = next(self._tokens, token)  # past the end: eof again, for the caller to report
+        return token
+
+    def _error(self, message: str, pos: Optional[int] = None) -> TurtleSyntaxError:
+        if pos is None:
+            pos = self._next[2]
+        line = self.text.count('\n', 0, pos) + 1
+        return TurtleSyntaxError(f"{message} at line {line}")
+
+    def _expect(self, punct: str):
+        kind, value, pos = self._advance()
+        if kind != 'punct' or value != punct:
+            raise self._error(f"Expected {punct!r}, found {value or 'end of input'!r}", pos)
+
+    def _fresh_bnode(self) -> BNode:
+        self._bnode_count += 1
+        return BNode(f"{self.bnode_prefix}b{self._bnode_count}")
+
+    def _labeled_bnode(self, label: str) -> BNode:
+        return BNode(f"_:{self.bnode_prefix}{label[2:]}") if self.bnode_prefix else BNode(label)
+
+    # ------------------------------------------------------------------
+    # Terms
+    # ------------------------------------------------------------------
+
+    def _iri(self, token: str) -> str:
+        iri = unescape_string(token[1:-1])
+        if self.base and ':' not in iri:
+            return urljoin(self.base, iri)
+        return iri
+
+    def _pname(self, token: str, pos: int) -> str:
+        prefix, _, local = token.partition(':')
+        if prefix not in self.prefixes:
+            raise self._error(f"Undefined prefix {prefix!r}", pos)
+        if '\\' in local:
+            local = re.sub(r'\\(.)', r'\1', local)
+        return self.prefixes[prefix] + local
+
+    def _iri_or_pname(self) -> str:
+        kind, value, pos = self._advance()
+        if kind == 'iri':
+            return self._iri(value)
+        if kind == 'pname':
+            return self._pname(value, pos)
+        raise self._error(f"Expected IRI, found {value!r}", pos)
+
+    def _literal(self, kind: str, value: str) -> Literal:
+        if kind == 'long_string':
+            lexical = unescape_string(value[3:-3])
+        else:
+            lexical = unescape_string(value[1:-1])
+        next_kind, next_value, _ = self._next
+        if next_kind == 'at':
+            self._advance()
+            return Literal(lexical, language=next_value[1:].lower())
+        if next_kind == 'punct' and next_value == '^^':
+            self._advance()
+            return Literal(lexical, datatype=self._iri_or_pname())
+        return Literal(lexical)
+
+    def _object(self) -> str:
+        kind, value, pos = self._advance()
+        if kind == 'iri':
+            return self._iri(value)
+        if kind == 'pname':
+            return self._pname(value, pos)
+        if kind == 'bnode':
+            return self._labeled_bnode(value)
+        if kind in ('string', 'long_string'):
+            return self._literal(kind, value)
+        if kind == 'number':
+            if 'e' in value or 'E' in value:
+                return Literal(value, datatype=XSD + "double")
+            if '.' in value:
+                return Literal(value, datatype=XSD + "decimal")
+            return Literal(value, datatype=XSD + "integer")
+        if kind == 'word' and value in ('true', 'false'):
+            return Literal(value, datatype=XSD + "boolean")
+        if kind == 'punct' and value == '[':
+            return self._blank_node_property_list()
+        if kind == 'punct' and value == '(':
+            return self._collection()
+        raise self._error(f"Unexpected token {value or 'end of input'!r}", pos)
+
+    def _blank_node_property_list(self) -> BNode:
+        node = self._fresh_bnode()
+        kind, value, _ = self._next
+        if not (kind == 'punct' and value == ']'):
+            self._predicate_object_list(node)
+        self._expect(']')
+        return node
+
+    def _collection(self) -> str:
+        items = []
+        while not (self._next[0] == 'punct' and self._next[1] == ')'):
+            if self._next[0] == 'eof':
+                raise self._error("Unterminated collection")
+            items.append(self._object())
+        self._advance()
+        if not items:
+            return RDF_NIL
+        head = self._fresh_bnode()
+        node = head
+        for i, item in enumerate(items):
+            self._out.append((node, RDF_FIRST, item))
+            rest = self._fresh_bnode() if i + 1 < len(items) else RDF_NIL
+            self._out.append((node, RDF_REST, rest))
+            node = rest
+        return head
+
+    # ------------------------------------------------------------------
+    # Statements
+    # ------------------------------------------------------------------
+
+    def _verb(self) -> str:
+        kind, value, pos = self._next
+        if kind == 'word' and value == 'a':
+            self._advance()
+            return RDF_TYPE
+        return self._iri_or_pname()
+
+    def _predicate_object_list(self, subject: str):
+        out = self._out
+        while True:
+            predicate = self._verb()
+            out.append((subject, predicate, self._object()))
+            while self._next[0] == 'punct' and self._next[1] == ',':
+                self._advance()
+                out.append((subject, predicate, self._object()))
+            # One or more ';', optionally trailing before ']' or '.'
+            if not (self._next[0] == 'punct' and self._next[1] == ';'):
+                return
+            while self._next[0] == 'punct' and self._next[1] == ';':
+                self._advance()
+            kind, value, _ = self._next
+            if kind == 'punct' and value in ('.', ']'):
+                return
+
+    def _directive(self, keyword: str, sparql: bool):
+        if keyword == 'prefix':
+            kind, value, pos = self._advance()
+            if kind != 'pname' or not value.endswith(':'):
+                raise self._error(f"Expected prefix name, found {value!r}", pos)
+            kind, iri, pos = self._advance()
+            if kind != 'iri':
+                raise self._error(f"Expected IRI, found {iri!r}", pos)
+            self.prefixes[value[:-1]] = self._iri(iri)
+        else:
+            kind, iri, pos = self._advance()
+            if kind != 'iri':
+                raise self._error(f"Expected IRI, found {iri!r}", pos)
+            self.base = self._iri(iri)
+        if not sparql:
+            self._expect('.')
+
+    def _statement(self):
+        kind, value, pos = self._next
+        if kind == 'at' and value in ('@prefix', '@base'):
+            self._advance()
+            self._directive(value[1:], sparql=False)
+            return
+        if kind == 'word' and value.lower() in ('prefix', 'base'):
+            self._advance()
+            self._directive(value.lower(), sparql=True)
+            return
+
+        if kind == 'punct' and value == '[':
+            self._advance()
+            subject = self._blank_node_property_list()
+            if self._next[0] == 'punct' and self._next[1] == '.':
+                self._advance()
+                return
+        elif kind == 'punct' and value == '(':
+            self._advance()
+            subject = self._collection()
+        elif kind == 'bnode':
+            self._advance()
+            subject = self._labeled_bnode(value)
+        else:
+            subject = self._iri_or_pname()
+
+        self._predicate_object_list(subject)
+        self._expect('.')
+
+    def triples(self) -> Iterator[Triple]:
+        """Yield triples in document order, flushing after each statement"""
+        out = self._out
+        while self._next[0] != 'eof':
+            self._statement()
+            if out:
+                yield from out
+                out.clear()
+
+
+def iter_triples(text: str, base: str = '', bnode_prefix: str = '') -> Iterator[Triple]:
+    """Parse Turtle text and yield (subject, predicate, object) triples"""
+    return TurtleParser(text, base, bnode_prefix).triples()
+
+
+def iter_file_triples(file_path: str, bnode_prefix: str = '') -> Iterator[Triple]:
+    """Parse a Turtle file and yield its triples"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    return iter_triples(text, bnode_prefix=bnode_prefix)
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Compact CBOR encoding for trade credentials (no dependencies)
+
+Serializes JSON credentials as CBOR (RFC 8949) with a term dictionary so
+they fit constrained links to port systems:
+
+- Object keys that are JSON-LD terms (from contexts/*.jsonld, including
+  the vendored W3C contexts) are written as small integers
+- Values of "type", "@type" and "@context" are compressed the same way,
+  including our context URLs
+- Everything else is plain CBOR: integers, float32 when exact, text
+
+Dictionary codes are ordered by how often each term is used in
+templates/examples, so the most frequent keys (type, id, quantityValue,
+currencyCode, ...) get 1-byte codes. The encoded document is a CBOR array
+[dictionary id, payload]; a decoder built from different contexts rejects
+it instead of mis-decoding.
+
+Usage:
+    python3 tools/vc_cbor.py encode <credential.json> [output.cbor]
+    python3 tools/vc_cbor.py decode <credential.cbor>
+    python3 tools/vc_cbor.py dictionary
+
+    from vc_cbor import get_codec
+    data = get_codec().encode(credential)
+    credential = get_codec().decode(data)
+"""
+
+import hashlib
+import json
+import struct
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from jsonld_processor import CONTEXT_BASE_URL, CONTEXTS_DIR, KNOWN_CONTEXTS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+EXAMPLES_DIR = REPO_ROOT / 'templates' / 'examples'
+
+MEDIA_TYPE = 'application/cbor'
+
+# Keys whose string values are terms or context URLs
+TERM_VALUED_KEYS = ('@context', 'type', '@type')
+
+# Always in the dictionary, even if no context defines them
+CORE_TERMS = ('@context', '@id', '@type', '@value', '@language', '@list', '@graph')
+
+
+# Initial byte → (struct format, size) for half/single/double floats
+_FLOATS = {0xf9: ('>e', 2), 0xfa: ('>f', 4), 0xfb: ('>d', 8)}
+_SIMPLE_VALUES = {20: False, 21: True, 22: None}
+
+
+class CBORError(ValueError):
+    """Malformed CBOR or unknown dictionary"""
+
+
+# ============================================================================
+# Term dictionary
+# ============================================================================
+
+def _context_terms(context: Any, terms: Counter) -> None:
+    """Count term definitions in a context (including scoped contexts)"""
+    if isinstance(context, list):
+        for item in context:
+            _context_terms(item, terms)
+    elif isinstance(context, dict):
+        for term, definition in context.items():
+            terms[term] += 1
+            if isinstance(definition, dict) and '@context' in definition:
+                _context_terms(definition['@context'], terms)
+
+
+def _usage(document: Any, usage: Counter) -> None:
+    """Count key (and type value) occurrences in an example document"""
+    if isinstance(document, list):
+        for item in document:
+            _usage(item, usage)
+    elif isinstance(document, dict):
+        for key, value in document.items():
+            usage[key] += 1
+            if key in TERM_VALUED_KEYS:
+                for item in (value if isinstance(value, list) else [value]):
+                    if isinstance(item, str):
+                        usage[item] += 1
+            _usage(value, usage)
+
+
+class TermDictionary:
+    """Ordered term ↔ integer code table"""
+
+    def __init__(self, terms: Iterable[str]):
+        self.terms: List[str] = list(terms)
+        self.codes: Dict[str, int] = {term: code for code, term in enumerate(self.terms)}
+        if len(self.codes) != len(self.terms):
+            raise CBORError("Duplicate terms in dictionary")
+        digest = hashlib.sha256('\n'.join(self.terms).encode('utf-8')).digest()
+        self.id = digest[:4]
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @classmethod
+    def from_contexts(cls, contexts_dir: Path = CONTEXTS_DIR,
+                      examples_dir: Optional[Path] = EXAMPLES_DIR) -> 'TermDictionary':
+        """Terms from every context, most used first
+
+        Ranking: occurrences in the example templates, then the number of
+        contexts defining the term, then name. Class terms also get a
+        '<Class>Credential' entry (our credential type names), and every
+        local context URL is included for @context values.
+        """
+        defined: Counter = Counter()
+        urls = []
+        for path in sorted(contexts_dir.glob('*.jsonld')):
+            with open(path, 'r', encoding='utf-8') as f:
+                _context_terms(json.load(f).get('@context', {}), defined)
+            urls.append(CONTEXT_BASE_URL + path.name)
+        for url, relative in KNOWN_CONTEXTS.items():
+            with open(contexts_dir / relative, 'r', encoding='utf-8') as f:
+                _context_terms(json.load(f).get('@context', {}), defined)
+            urls.append(url)
+
+        for term in list(defined):
+            if term[:1].isupper() and not term.endswith('Credential'):
+                defined[term + 'Credential'] += 0
+        for term in CORE_TERMS:
+            defined[term] += 0
+
+        usage: Counter = Counter()
+        if examples_dir is not None:
+            for path in sorted(examples_dir.glob('*.jsonld')):
+                with open(path, 'r', encoding='utf-8') as f:
+                    _usage(json.load(f), usage)
+
+        ranked = sorted(defined, key=lambda term: (-usage[term], -defined[term], term))
+        return cls(ranked + [url for url in urls if url not in defined])
+
+
+# ============================================================================
+# CBOR codec
+# ============================================================================
+
+def _head(major: int, value: int) -> bytes:
+    """Initial byte(s) for a major type and argument"""
+    if value < 24:
+        return bytes((major << 5 | value,))
+    if value < 0x100:
+        return bytes((major << 5 | 24, value))
+    if value < 0x10000:
+        return bytes((major << 5 | 25,)) + value.to_bytes(2, 'big')
+    if value < 0x100000000:
+        return bytes((major << 5 | 26,)) + value.to_bytes(4, 'big')
+    if value < 0x10000000000000000:
+        return bytes((major << 5 | 27,)) + value.to_bytes(8, 'big')
+    raise CBORError(f"Integer {value} does not fit in 64 bits")
+
+
+class CBORCodec:
+    """Encodes/decodes JSON values as CBOR using a TermDictionary"""
+
+    def __init__(self, dictionary: TermDictionary):
+        self.dictionary = dictionary
+        # Pre-encoded code heads: one bytes object per term
+        self._term_bytes = {term: _head(0, code) for term, code in dictionary.codes.items()}
+        self._term_valued = {self._term_bytes[key] for key in TERM_VALUED_KEYS
+                             if key in self._term_bytes}
+
+    # ------------------------------------------------------------------ encode
+
+    def encode(self, document: Any) -> bytes:
+        out = bytearray(b'\x82')  # array(2)
+        out += _head(2, len(self.dictionary.id)) + self.dictionary.id
+        self._encode(document, out, False)
+        return bytes(out)
+
+    def _encode(self, value: Any, out: bytearray, term_valued: bool) -> None:
+        if isinstance(value, str):
+            if term_valued:
+                code = self._term_bytes.get(value)
+                if code is not None:
+                    out += code
+                    return
+            data = value.encode('utf-8')
+            out += _head(3, len(data))
+            out += data
+        elif isinstance(value, dict):
+            out += _head(5, len(value))
+            term_bytes = self._term_bytes
+            for key, item in value.items():
+                code = term_bytes.get(key)
+                if code is not None:
+                    out += code
+                else:
+                    data = key.encode('utf-8')
+                    out += _head(3, len(data))
+                    out += data
+                self._encode(item, out, code in self._term_valued)
+        elif isinstance(value, list):
+            out += _head(4, len(value))
+            for item in value:
+                self._encode(item, out, term_valued)
+        elif value is True:
+            out.append(0xf5)
+        elif value is False:
+            out.append(0xf4)
+        elif value is None:
+            out.append(0xf6)
+        elif isinstance(value, int):
+            out += _head(0, value) if value >= 0 else _head(1, -1 - value)
+        elif isinstance(value, float):
+            single = struct.pack('>f', value)
+            if struct.unpack('>f', single)[0] == value:
+                out.append(0xfa)
+                out += single
+            else:
+                out.append(0xfb)
+                out += struct.pack('>d', value)
+        else:
+            raise CBORError(f"Cannot encode {type(value).__name__} as CBOR")
+
+    # ------------------------------------------------------------------ decode
+
+    def decode(self, data: bytes) -> Any:
+        if data[:1] != b'\x82':
+            raise CBORError("Not a dictionary-encoded credential")
+        dictionary_id, offset = self._decode(data, 1, False)
+        if dictionary_id != self.dictionary.id:
+            raise CBORError(f"Encoded with term dictionary {bytes(dictionary_id).hex()}, "
+                            f"expected {self.dictionary.id.hex()}")
+        document, offset = self._decode(data, offset, False)
+        if offset != len(data):
+            raise CBORError(f"{len(data) - offset} trailing bytes")
+        return document
+
+    def _argument(self, data: bytes, offset: int) -> Tuple[int, int, int]:
+        """(major type, argument, next offset)"""
+        try:
+            initial = data[offset]
+        except IndexError:
+            raise CBORError("Unexpected end of CBOR data") from None
+        major, info = initial >> 5, initial & 0x1f
+        offset += 1
+        if info < 24:
+            return major, info, offset
+        if info > 27:
+            raise CBORError(f"Unsupported additional info {info} (indefinite lengths are not used)")
+        size = 1 << (info - 24)
+        if offset + size > len(data):
+            raise CBORError("Unexpected end of CBOR data")
+        return major, int.from_bytes(data[offset:offset + size], 'big'), offset + size
+
+    def _decode(self, data: bytes, offset: int, term_valued: bool) -> Tuple[Any, int]:
+        if offset >= len(data):
+            raise CBORError("Unexpected end of CBOR data")
+        initial = data[offset]
+        if initial in _FLOATS:
+            fmt, size = _FLOATS[initial]
+            end = offset + 1 + size
+            return struct.unpack(fmt, data[offset + 1:end])[0], end
+
+        major = initial >> 5
+        if initial & 0x1f < 24:
+            argument, offset = initial & 0x1f, offset + 1
+        else:
+            major, argument, offset = self._argument(data, offset)
+        if major == 0:
+            if term_valued:
+                return self._term(argument), offset
+            return argument, offset
+        if major == 1:
+            return -1 - argument, offset
+        if major in (2, 3):
+            end = offset + argument
+            if end > len(data):
+                raise CBORError("Unexpected end of CBOR data")
+            chunk = data[offset:end]
+            return (chunk.decode('utf-8') if major == 3 else bytes(chunk)), end
+        if major == 4:
+            items = []
+            for _ in range(argument):
+                item, offset = self._decode(data, offset, term_valued)
+                items.append(item)
+            return items, offset
+        if major == 5:
+            result = {}
+            for _ in range(argument):
+                key_initial = data[offset] if offset < len(data) else 0xff
+                if key_initial < 24:
+                    key, offset = self._term(key_initial), offset + 1
+                else:
+                    major_key, key, key_end = self._argument(data, offset)
+                    if major_key == 0:
+                        key, offset = self._term(key), key_end
+                    else:
+                        key, offset = self._decode(data, offset, False)
+                result[key], offset = self._decode(data, offset, key in TERM_VALUED_KEYS)
+            return result, offset
+        if major == 7 and argument in _SIMPLE_VALUES:
+            return _SIMPLE_VALUES[argument], offset
+        raise CBORError(f"Unsupported CBOR item (major type {major}, argument {argument})")
+
+    def _term(self, code: int) -> str:
+        try:
+            return self.dictionary.terms[code]
+        except IndexError:
+            raise CBORError(f"Unknown term code {code}") from None
+
+
+_default_codec: Optional[CBORCodec] = None
+
+
+def get_codec() -> CBORCodec:
+    """Shared codec for the repository contexts (dictionary built on first use)"""
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = CBORCodec(TermDictionary.from_contexts())
+    return _default_codec
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('encode', 'decode', 'dictionary'):
+        print(__doc__)
+        sys.exit(1)
+
+    codec = get_codec()
+    command = sys.argv[1]
+
+    if command == 'dictionary':
+        print(f"Dictionary {codec.dictionary.id.hex()}: {len(codec.dictionary)} terms")
+        for code, term in enumerate(codec.dictionary.terms[:40]):
+            print(f"  {code:4d}  {term}")
+        return
+
+    if command == 'encode':
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        data = codec.encode(document)
+        compact = json.dumps(document, separators=(',', ':')).encode('utf-8')
+        if len(sys.argv) > 3:
+            with open(sys.argv[3], 'wb') as f:
+                f.write(data)
+            print(f"✅ Wrote {sys.argv[3]}")
+        print(f"JSON {len(compact)} bytes → CBOR {len(data)} bytes "
+              f"({len(data) / len(compact):.0%})")
+        return
+
+    with open(sys.argv[2], 'rb') as f:
+        print(json.dumps(codec.decode(f.read()), indent=2, ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()